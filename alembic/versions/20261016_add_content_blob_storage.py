@@ -0,0 +1,83 @@
+"""Add content-addressed blob storage for scraped content
+
+Revision ID: 20261016_add_content_blob_storage
+Revises: 20250312_add_email_delivery
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_content_blob_storage'
+down_revision = '20250312_add_email_delivery'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create blob and observation tables and link versions to blobs."""
+
+    # Create content_blobs table (keyed by SHA-256 of uncompressed bytes)
+    op.create_table(
+        'content_blobs',
+        sa.Column('content_hash', sa.String(64), primary_key=True),
+        sa.Column('kind', sa.String(20), nullable=False),  # html, text, screenshot
+        sa.Column('bucket', sa.String(100), nullable=False),
+        sa.Column('storage_path', sa.String(1000), nullable=False),
+        sa.Column('compression', sa.String(10), nullable=False, server_default='none'),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('stored_size_bytes', sa.Integer(), nullable=False),
+        sa.Column('perceptual_hash', sa.String(16), nullable=True),  # dHash of screenshots
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Reference blobs from versions instead of embedding content
+    op.add_column('scraped_content', sa.Column(
+        'html_blob_hash', sa.String(64), sa.ForeignKey('content_blobs.content_hash'), nullable=True
+    ))
+    op.add_column('scraped_content', sa.Column(
+        'text_blob_hash', sa.String(64), sa.ForeignKey('content_blobs.content_hash'), nullable=True
+    ))
+    op.add_column('scraped_content', sa.Column(
+        'screenshot_blob_hash', sa.String(64), sa.ForeignKey('content_blobs.content_hash'), nullable=True
+    ))
+    op.add_column('scraped_content', sa.Column(
+        'seen_count', sa.Integer(), nullable=False, server_default='1'
+    ))
+    op.add_column('scraped_content', sa.Column('last_seen_at', sa.DateTime(), nullable=True))
+
+    # Create content_observations table for unchanged re-scrapes
+    op.create_table(
+        'content_observations',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('scraped_content_id', sa.Integer(), sa.ForeignKey('scraped_content.id'), nullable=False),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('scrape_duration_ms', sa.Float(), nullable=True),
+        sa.Column(
+            'screenshot_blob_hash', sa.String(64),
+            sa.ForeignKey('content_blobs.content_hash'), nullable=True
+        ),
+        sa.Column('seen_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+
+    # Create indexes
+    op.create_index(
+        'ix_content_observations_scraped_content_id', 'content_observations', ['scraped_content_id']
+    )
+    op.create_index('ix_scraped_content_url_version', 'scraped_content', ['url', 'version'])
+
+
+def downgrade() -> None:
+    """Drop blob storage tables and columns."""
+    op.drop_index('ix_scraped_content_url_version', 'scraped_content')
+    op.drop_index('ix_content_observations_scraped_content_id', 'content_observations')
+    op.drop_table('content_observations')
+
+    op.drop_column('scraped_content', 'last_seen_at')
+    op.drop_column('scraped_content', 'seen_count')
+    op.drop_column('scraped_content', 'screenshot_blob_hash')
+    op.drop_column('scraped_content', 'text_blob_hash')
+    op.drop_column('scraped_content', 'html_blob_hash')
+
+    op.drop_table('content_blobs')
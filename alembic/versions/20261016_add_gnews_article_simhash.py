@@ -0,0 +1,26 @@
+"""Add SimHash column to gnews_articles for near-duplicate detection
+
+Revision ID: 20261016_add_gnews_article_simhash
+Revises: 20261016_add_whoapi_facet_cache
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_gnews_article_simhash'
+down_revision = '20261016_add_whoapi_facet_cache'
+branch_labels = None
+# gnews_articles is created on the other branch
+depends_on = ('20251221_add_external_api_tables',)
+
+
+def upgrade() -> None:
+    """Add the simhash column used to skip syndicated copies."""
+    op.add_column('gnews_articles', sa.Column('simhash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the simhash column."""
+    op.drop_column('gnews_articles', 'simhash')
@@ -0,0 +1,121 @@
+"""Add normalized URL and host columns to links for scalable deduplication
+
+Revision ID: 20261016_add_link_normalized_url
+Revises: 20261016_add_gnews_article_simhash
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_link_normalized_url'
+down_revision = '20261016_add_gnews_article_simhash'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Frozen copy of src.utils.url_normalization as of this revision, so the
+# backfill does not change (or break) when that module does.
+
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', '_ga', 'mc_cid', 'mc_eid'
+}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for comparison."""
+    try:
+        parsed = urlparse(url.lower().strip())
+
+        query_params = parse_qs(parsed.query)
+        filtered_params = {
+            k: v for k, v in query_params.items()
+            if k.lower() not in TRACKING_PARAMS
+        }
+        sorted_query = urlencode(sorted(filtered_params.items()), doseq=True)
+
+        netloc = parsed.netloc
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+
+        path = parsed.path.rstrip('/')
+        if not path:
+            path = '/'
+
+        return urlunparse((
+            parsed.scheme or 'https',
+            netloc,
+            path,
+            parsed.params,
+            sorted_query,
+            ''
+        ))
+
+    except Exception:
+        return url.lower().strip()
+
+
+def url_host(normalized_url: str) -> str:
+    """Get the host (netloc) of a normalized URL."""
+    try:
+        return urlparse(normalized_url).netloc
+    except ValueError:
+        return ''
+
+
+def upgrade() -> None:
+    """Add the columns, backfill existing links and index them."""
+    op.add_column('links', sa.Column('normalized_url', sa.String(), nullable=True))
+    op.add_column('links', sa.Column('host', sa.String(), nullable=True))
+
+    links = sa.table(
+        'links',
+        sa.column('id', sa.Integer),
+        sa.column('url', sa.String),
+        sa.column('normalized_url', sa.String),
+        sa.column('host', sa.String),
+    )
+    bind = op.get_bind()
+    update = (
+        links.update()
+        .where(links.c.id == sa.bindparam('link_id'))
+        .values(normalized_url=sa.bindparam('norm'), host=sa.bindparam('link_host'))
+    )
+
+    # Normalization is done in Python so stored values match the model at
+    # this revision
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(links.c.id, links.c.url)
+            .where(links.c.id > last_id)
+            .order_by(links.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        params = []
+        for link_id, url in rows:
+            normalized = normalize_url(url)
+            params.append({'link_id': link_id, 'norm': normalized, 'link_host': url_host(normalized)})
+        bind.execute(update, params)
+        last_id = rows[-1][0]
+
+    op.create_index('ix_links_normalized_url', 'links', ['normalized_url'])
+    op.create_index(
+        'ix_links_host_normalized_url', 'links', ['host', 'normalized_url'],
+        postgresql_ops={'normalized_url': 'varchar_pattern_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Drop the indexes and columns."""
+    op.drop_index('ix_links_host_normalized_url', 'links')
+    op.drop_index('ix_links_normalized_url', 'links')
+    op.drop_column('links', 'host')
+    op.drop_column('links', 'normalized_url')
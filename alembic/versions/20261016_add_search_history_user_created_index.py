@@ -0,0 +1,26 @@
+"""Add composite user/created_at index to search_history for analytics
+
+Revision ID: 20261016_add_search_history_user_created_index
+Revises: 20261016_add_link_normalized_url
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_search_history_user_created_index'
+down_revision = '20261016_add_link_normalized_url'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index searches by user and time so analytics only read the window."""
+    op.create_index(
+        'ix_search_history_user_id_created_at', 'search_history', ['user_id', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite index."""
+    op.drop_index('ix_search_history_user_id_created_at', 'search_history')
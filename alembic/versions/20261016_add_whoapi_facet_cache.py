@@ -0,0 +1,40 @@
+"""Add per-facet cache table for WhoAPI domain intelligence
+
+Revision ID: 20261016_add_whoapi_facet_cache
+Revises: 20261016_add_content_blob_storage
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_whoapi_facet_cache'
+down_revision = '20261016_add_content_blob_storage'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the whoapi_facet_cache table."""
+
+    # One row per domain and facet (whois, ssl, dns, tech), each with its own expiry
+    op.create_table(
+        'whoapi_facet_cache',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('domain_name', sa.String(255), nullable=False),
+        sa.Column('facet', sa.String(20), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint('domain_name', 'facet', name='uq_whoapi_facet_cache_domain_facet'),
+    )
+
+    # Create indexes
+    op.create_index('ix_whoapi_facet_cache_expires_at', 'whoapi_facet_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Drop the whoapi_facet_cache table."""
+    op.drop_index('ix_whoapi_facet_cache_expires_at', 'whoapi_facet_cache')
+    op.drop_table('whoapi_facet_cache')
@@ -0,0 +1,70 @@
+"""Add full-text and trigram search indexes
+
+Revision ID: 20261017_add_full_text_search_indexes
+Revises: 20261016_add_search_history_user_created_index
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261017_add_full_text_search_indexes'
+down_revision = '20261016_add_search_history_user_created_index'
+branch_labels = None
+# ipinfo_records and whois_records are created on the other branch
+depends_on = ('20251221_add_external_api_tables',)
+
+# Text search configuration the indexes are built with; must equal
+# src.services.full_text_search.SEARCH_CONFIG
+SEARCH_CONFIG = 'english'
+
+# Expressions must match src.services.full_text_search.search_document
+# exactly, or the planner will not use the indexes
+SEARCH_DOCUMENTS = {
+    'ix_links_search': (
+        'links',
+        "coalesce(title, '') || ' ' || coalesce(description, '')"
+    ),
+    'ix_scraped_content_search': (
+        'scraped_content',
+        "coalesce(title, '') || ' ' || coalesce(meta_description, '') "
+        "|| ' ' || coalesce(meta_keywords, '')"
+    ),
+    'ix_competitors_search': (
+        'competitors',
+        "coalesce(name, '') || ' ' || coalesce(description, '')"
+    ),
+}
+
+# Columns filtered with ILIKE '%term%'
+TRIGRAM_COLUMNS = {
+    'ix_scraped_content_domain_trgm': ('scraped_content', 'domain'),
+    'ix_competitors_domain_trgm': ('competitors', 'domain'),
+    'ix_ipinfo_records_organization_trgm': ('ipinfo_records', 'organization'),
+    'ix_whois_records_registrar_trgm': ('whois_records', 'registrar'),
+}
+
+
+def upgrade() -> None:
+    """Create GIN tsvector indexes and pg_trgm substring indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for index_name, (table, document) in SEARCH_DOCUMENTS.items():
+        op.execute(f"""
+            CREATE INDEX {index_name}
+            ON {table}
+            USING gin(to_tsvector('{SEARCH_CONFIG}', {document}))
+        """)
+
+    for index_name, (table, column) in TRIGRAM_COLUMNS.items():
+        op.execute(f"""
+            CREATE INDEX {index_name}
+            ON {table}
+            USING gin({column} gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    """Drop the search indexes (the pg_trgm extension is left installed)."""
+    for index_name in [*TRIGRAM_COLUMNS, *SEARCH_DOCUMENTS]:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -10,8 +10,6 @@ import json
 import hashlib
 
 # Web scraping imports
-from bs4 import BeautifulSoup
-import aiohttp
 from playwright.async_api import async_playwright
 
 # NLP and keyword extraction
@@ -53,6 +51,8 @@ from src.api.v1.websockets import (
 from src.services.web_scraping import (
     EnhancedWebScrapingService,
     ScrapingConfig,
+    SiteCrawler,
+    CrawlConfig,
 )
 
 # Error handling and validation
@@ -132,6 +132,7 @@ class SEOContentWalkerAgent:
         self.db = db
         self.cache = cache
         self.max_pages_per_domain = 10
+        self.crawl_concurrency = 3
         self.max_keywords = 50
         self.max_competitors = 15
 
@@ -325,58 +326,32 @@ class SEOContentWalkerAgent:
                 logger.info(f"Cache hit for website crawl: {url}")
                 return cached_result
 
-        pages_content = []
-        visited_urls = set()
-        to_visit = [url]
         base_domain = urlparse(url).netloc
 
-        async with aiohttp.ClientSession() as session:
-            while to_visit and len(visited_urls) < self.max_pages_per_domain:
-                current_url = to_visit.pop(0)
-
-                if current_url in visited_urls:
-                    continue
-
-                try:
-                    async with session.get(
-                        current_url,
-                        timeout=aiohttp.ClientTimeout(total=30)
-                    ) as response:
-                        if response.status != 200:
-                            continue
-
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        # Extract text content
-                        for script in soup(["script", "style"]):
-                            script.decompose()
-                        text = soup.get_text()
-                        text = ' '.join(text.split())  # Clean whitespace
-
-                        pages_content.append({
-                            'url': current_url,
-                            'title': soup.find('title').string if soup.find('title') else '',
-                            'content': text,
-                            'meta_description': self._extract_meta_description(soup),
-                            'headings': self._extract_headings(soup),
-                        })
-
-                        visited_urls.add(current_url)
-
-                        # Find more links to crawl
-                        for link in soup.find_all('a', href=True):
-                            href = link['href']
-                            full_url = urljoin(current_url, href)
-
-                            # Only crawl same domain
-                            if urlparse(full_url).netloc == base_domain:
-                                if full_url not in visited_urls and full_url not in to_visit:
-                                    to_visit.append(full_url)
-
-                except Exception as e:
-                    logger.warning(f"Error crawling {current_url}: {str(e)}")
-                    continue
+        crawler = SiteCrawler(
+            self.enhanced_scraper,
+            CrawlConfig(
+                max_pages=self.max_pages_per_domain,
+                max_workers=self.crawl_concurrency,
+                concurrency_per_domain=self.crawl_concurrency,
+            )
+        )
+        crawled_pages = await crawler.crawl(url)
+
+        pages_content = [
+            {
+                'url': page.url,
+                'title': page.title,
+                'content': page.text,
+                'meta_description': page.meta_description,
+                'headings': [
+                    heading
+                    for tag in ('h1', 'h2', 'h3')
+                    for heading in page.headings.get(tag, [])
+                ],
+            }
+            for page in crawled_pages
+        ]
 
         result = {
             'pages': pages_content,
@@ -463,54 +438,15 @@ class SEOContentWalkerAgent:
 
         serp_results = {}
 
-        # Use the SERP analyzer to get real data
+        # Fan keywords out concurrently through the SERP analyzer
         async with self.serp_analyzer as analyzer:
-            for kw_data in keywords:
-                keyword = kw_data['keyword']
-
-                try:
-                    # Get SERP results for this keyword
-                    serp_data = await analyzer.get_serp_results(
-                        keyword,
-                        location="United States"
-                    )
-
-                    # Extract domains from results
-                    ranking_domains = analyzer.extract_domains_from_serp(serp_data)
-
-                    # Calculate keyword difficulty
-                    difficulty = analyzer.calculate_keyword_difficulty(serp_data)
+            async for analysis in analyzer.iter_keyword_analyses(
+                [kw_data['keyword'] for kw_data in keywords],
+                location="United States"
+            ):
+                keyword = analysis['keyword']
 
-                    # Get search volume
-                    search_volume = await analyzer.get_search_volume(keyword)
-
-                    # Identify SERP features
-                    serp_features = analyzer.identify_serp_features(serp_data)
-
-                    # Compile comprehensive results
-                    serp_results[keyword] = {
-                        'keyword': keyword,
-                        'search_volume': search_volume,
-                        'difficulty': difficulty,
-                        'ranking_domains': [d['domain'] for d in ranking_domains[:10]],
-                        'domain_data': ranking_domains[:10],  # Include full domain data
-                        'serp_features': serp_features,
-                        'top_3_urls': [
-                            r.get('link', '') for r in
-                            serp_data.get('organic_results', [])[:3]
-                        ],
-                        'related_searches': serp_features.get('related_searches', []),
-                        'people_also_ask': serp_features.get('paa_questions', []),
-                        'analyzed_at': datetime.utcnow().isoformat()
-                    }
-
-                    logger.info(
-                        f"SERP analysis complete for '{keyword}': "
-                        f"volume={search_volume}, difficulty={difficulty:.1f}"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error analyzing SERP for '{keyword}': {str(e)}")
+                if 'error' in analysis:
                     # Fallback to estimates if SERP API fails
                     serp_results[keyword] = {
                         'keyword': keyword,
@@ -518,8 +454,26 @@ class SEOContentWalkerAgent:
                         'difficulty': self._estimate_difficulty(keyword),
                         'ranking_domains': self._get_placeholder_domains(),
                         'serp_features': {'has_featured_snippet': False, 'total_features': 0},
-                        'error': str(e)
+                        'error': analysis['error']
                     }
+                    continue
+
+                ranking_domains = analysis['ranking_domains']
+                serp_features = analysis['serp_features']
+
+                # Compile comprehensive results
+                serp_results[keyword] = {
+                    'keyword': keyword,
+                    'search_volume': analysis['search_volume'],
+                    'difficulty': analysis['difficulty'],
+                    'ranking_domains': [d['domain'] for d in ranking_domains[:10]],
+                    'domain_data': ranking_domains[:10],  # Include full domain data
+                    'serp_features': serp_features,
+                    'top_3_urls': analysis['top_urls'],
+                    'related_searches': serp_features.get('related_searches', []),
+                    'people_also_ask': serp_features.get('paa_questions', []),
+                    'analyzed_at': analysis['analyzed_at']
+                }
 
         return serp_results
 
@@ -796,21 +750,6 @@ class SEOContentWalkerAgent:
             logger.warning(f"Error in phrase extraction: {str(e)}")
             return []
 
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
-        """Extract meta description from HTML."""
-        meta = soup.find('meta', attrs={'name': 'description'})
-        return meta['content'] if meta and meta.get('content') else ''
-
-    def _extract_headings(self, soup: BeautifulSoup) -> List[str]:
-        """Extract all headings from HTML."""
-        headings = []
-        for tag in ['h1', 'h2', 'h3']:
-            for heading in soup.find_all(tag):
-                text = heading.get_text().strip()
-                if text:
-                    headings.append(text)
-        return headings
-
     def _estimate_search_volume(self, keyword: str) -> int:
         """Estimate search volume (placeholder)."""
         # In production, use actual API data
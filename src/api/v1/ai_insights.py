@@ -174,6 +174,48 @@ async def calculate_affinity(
             detail=f"Error calculating content affinity: {str(e)}"
         )
 
+@router.get("/affinity/similar/{content_id}", response_model=Dict[str, Any], summary="Find Similar Content", description="Find the most similar content in the owner's library using the content vector index")
+async def find_similar_content(
+    content_id: int,
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Find the content most similar to a content item within its owner's library.
+
+    - **content_id**: ID of the content to find similar content for
+    - **limit**: Maximum number of results (default: 10)
+    """
+    try:
+        result = await db.execute(
+            select(Content).where(Content.id == content_id)
+        )
+        content = result.scalar_one_or_none()
+        if not content:
+            raise HTTPException(status_code=404, detail="Content not found")
+
+        matches = await affinity_service.find_similar_content(content, db, limit=limit)
+
+        return {
+            "content_id": content_id,
+            "similar_content": [
+                {
+                    "content_id": match["content"].id,
+                    "title": match["content"].title,
+                    "score": match["score"],
+                    "explanation": match["explanation"]
+                }
+                for match in matches
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error finding similar content: {str(e)}"
+        )
+
 @router.post("/engagement/predict/{content_id}", response_model=Dict[str, Any])
 async def predict_engagement(
     content_id: int,
@@ -4,6 +4,7 @@ This module provides REST API endpoints for the conversational AI brand
 discovery process.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 import uuid
@@ -13,6 +14,7 @@ from src.database import get_db
 from src.auth.security import get_current_user
 from src.models.user import User
 from src.services.ai.brand_discovery_chat import BrandDiscoveryChatService
+from src.services.ai.llm_streaming import sse_event
 from src.schemas.brand_discovery_chat import (
     ChatStartResponse,
     UserMessageRequest,
@@ -106,6 +108,69 @@ async def send_message(
         )
 
 
+@router.post("/{session_id}/message/stream")
+def stream_message(
+    session_id: uuid.UUID,
+    message_request: UserMessageRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Send a message to the chat session and stream the AI response.
+
+    Same as POST /{session_id}/message, but the AI response is sent as
+    Server-Sent Events while it is generated:
+    - "token": {"content": ...} for each piece of the AI response
+    - "reset": {} when the text received so far must be discarded
+    - "done": ChatMessageResponse with progress and extracted data
+    - "error": {"detail": ...} if the turn could not be completed
+
+    Args:
+        session_id: UUID of the chat session
+        message_request: User's message
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: If session not found or not active
+    """
+    try:
+        service = BrandDiscoveryChatService(db)
+        events = service.stream_message(
+            session_id=session_id,
+            user_message=message_request.message
+        )
+    except ValueError as e:
+        logger.warning(f"Invalid session access: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    async def event_stream():
+        try:
+            async for event in events:
+                if event["type"] == "done":
+                    response = event["message"]
+                    logger.info(
+                        f"User {current_user.id} streamed message to session {session_id}, "
+                        f"progress: {response.progress_pct}%"
+                    )
+                    yield sse_event("done", response.dict())
+                else:
+                    yield sse_event(event["type"], {k: v for k, v in event.items() if k != "type"})
+        except Exception as e:
+            logger.error(f"Error streaming message: {str(e)}")
+            yield sse_event("error", {"detail": f"Failed to process message: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so tokens reach the client immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{session_id}/status", response_model=ChatStatusResponse)
 def get_session_status(
     session_id: uuid.UUID,
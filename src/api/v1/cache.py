@@ -16,6 +16,7 @@ import logging
 from src.auth.security import get_current_user, require_admin
 from src.models.user import User
 from src.services.cache_service import get_cache_service, AsyncCacheService
+from src.services.ai.llm_response_cache import get_llm_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,21 @@ async def get_cache_statistics(
         )
 
 
+@router.get("/cache/llm/stats", tags=["cache"])
+async def get_llm_cache_statistics(
+    current_user: User = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Get LLM response cache statistics.
+
+    Requires admin privileges.
+
+    Returns:
+        Hits, misses, coalesced in-flight requests and hit rate
+    """
+    return get_llm_response_cache().get_stats()
+
+
 @router.get("/cache/health", response_model=CacheHealthResponse, tags=["cache"])
 async def check_cache_health(
     current_user: User = Depends(get_current_user)
@@ -231,6 +247,7 @@ async def reset_cache_statistics(
             await cache.initialize()
 
         cache.reset_statistics()
+        get_llm_response_cache().reset_stats()
 
         logger.info(f"Cache statistics reset by user {current_user.email}")
 
@@ -58,6 +58,7 @@ async def get_competitor(
 async def list_competitors(
     skip: int = 0,
     limit: int = 100,
+    search: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ) -> List[CompetitorResponse]:
     """List all competitors with pagination.
@@ -65,13 +66,15 @@ async def list_competitors(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
+        search: Optional full-text search over name and description,
+            ranked by relevance
         db: Database session
         
     Returns:
         List of competitors
     """
     service = CompetitorService(db)
-    return await service.list_competitors(skip=skip, limit=limit)
+    return await service.list_competitors(skip=skip, limit=limit, search=search)
 
 @router.put("/{competitor_id}", response_model=CompetitorResponse)
 async def update_competitor(
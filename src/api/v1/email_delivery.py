@@ -7,13 +7,14 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_
 from datetime import datetime
 
 from src.database.config import get_db
 from src.auth.security import get_current_user
 from src.models.user import User
 from src.models.email_delivery import EmailRecipient, EmailDelivery, EmailStatus
+from src.services.advanced_filtering import CountMode, InvalidCursorError, paginate
 from src.schemas.email_delivery import (
     EmailRecipientCreate,
     EmailRecipientUpdate,
@@ -87,6 +88,8 @@ async def list_email_recipients(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -103,30 +106,15 @@ async def list_email_recipients(
         if filters:
             query = query.where(and_(*filters))
 
-        query = query.order_by(desc(EmailRecipient.created_at))
-
-        # Get total
-        count_query = select(EmailRecipient)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-
-        count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
-
-        # Paginate
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await db.execute(query)
-        recipients = result.scalars().all()
+        recipients, page_info = await paginate(
+            db, query, EmailRecipient, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "recipients": recipients,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"recipients": recipients, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing email recipients: {str(e)}")
         raise HTTPException(
@@ -221,6 +209,8 @@ async def list_email_deliveries(
     report_id: Optional[int] = Query(None, description="Filter by report ID"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -237,30 +227,15 @@ async def list_email_deliveries(
         if filters:
             query = query.where(and_(*filters))
 
-        query = query.order_by(desc(EmailDelivery.created_at))
-
-        # Get total
-        count_query = select(EmailDelivery)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-
-        count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
-
-        # Paginate
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await db.execute(query)
-        deliveries = result.scalars().all()
+        deliveries, page_info = await paginate(
+            db, query, EmailDelivery, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "deliveries": deliveries,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"deliveries": deliveries, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing email deliveries: {str(e)}")
         raise HTTPException(
@@ -89,6 +89,10 @@ class GeographicDistributionResponse(BaseModel):
         default_factory=dict,
         description="IP count by city"
     )
+    country_regions: dict = Field(
+        default_factory=dict,
+        description="IP count by region within each country code"
+    )
     total_ips: int = Field(
         default=0,
         description="Total number of IPs analyzed"
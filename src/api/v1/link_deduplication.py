@@ -25,6 +25,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/links", tags=["link-deduplication"])
 
 
+def _format_group(group: dict) -> dict:
+    """Format a duplicate group of Link objects for the API response."""
+    links = [group["canonical"], *group["duplicates"]]
+    return {
+        "normalized_url": group["normalized_url"],
+        "similarity_score": group["similarity"],
+        "link_ids": [link.id for link in links],
+        "urls": [link.url for link in links],
+        "titles": [link.title for link in links]
+    }
+
+
 @router.post("/detect-duplicates", response_model=DetectDuplicatesResponse)
 async def detect_duplicate_links(
     request: DetectDuplicatesRequest,
@@ -46,36 +58,23 @@ async def detect_duplicate_links(
             similarity_threshold=request.similarity_threshold
         )
 
-        # Get links to analyze
-        query = select(Link)
-
-        if request.company_id:
-            query = query.where(Link.company_id == request.company_id)
-
-        if not request.include_inactive:
-            query = query.where(Link.is_active == True)
-
-        result = await db.execute(query)
-        links = result.scalars().all()
+        def detect(session):
+            groups, total = dedup_service.scan_duplicates(
+                session,
+                company_id=request.company_id,
+                active_only=not request.include_inactive
+            )
+            return dedup_service.attach_links(session, groups), total
 
-        # Detect duplicates
-        duplicate_groups_dict = await dedup_service.detect_duplicates(db, list(links))
+        # Links are streamed in chunks on the sync side of the session
+        groups, total_links = await db.run_sync(detect)
 
-        # Format response
-        duplicate_groups = []
-        for normalized_url, group_info in duplicate_groups_dict.items():
-            duplicate_groups.append({
-                "normalized_url": normalized_url,
-                "similarity_score": group_info.get("similarity_score", 1.0),
-                "link_ids": group_info["link_ids"],
-                "urls": group_info["urls"],
-                "titles": group_info["titles"]
-            })
+        duplicate_groups = [_format_group(group) for group in groups]
 
         logger.info(f"Detected {len(duplicate_groups)} duplicate link groups")
 
         return {
-            "total_links_analyzed": len(links),
+            "total_links_analyzed": total_links,
             "duplicate_groups_found": len(duplicate_groups),
             "duplicate_groups": duplicate_groups
         }
@@ -179,58 +178,31 @@ async def generate_duplicate_report(
         Duplicate links report
     """
     try:
-        from datetime import datetime
-
         dedup_service = LinkDeduplicationService(
             similarity_threshold=similarity_threshold
         )
 
-        # Get all links
-        query = select(Link)
-        if company_id:
-            query = query.where(Link.company_id == company_id)
-
-        result = await db.execute(query)
-        all_links = result.scalars().all()
-
-        # Detect duplicates
-        duplicate_groups_dict = await dedup_service.detect_duplicates(db, list(all_links))
-
-        # Calculate statistics
-        total_links = len(all_links)
-        duplicate_link_ids = set()
-        for group_info in duplicate_groups_dict.values():
-            duplicate_link_ids.update(group_info["link_ids"])
-
-        duplicate_links = len(duplicate_link_ids)
-        unique_links = total_links - duplicate_links
-        duplication_rate = (duplicate_links / total_links * 100) if total_links > 0 else 0.0
-
-        # Format duplicate groups
-        duplicate_groups = []
-        for normalized_url, group_info in duplicate_groups_dict.items():
-            duplicate_groups.append({
-                "normalized_url": normalized_url,
-                "similarity_score": group_info.get("similarity_score", 1.0),
-                "link_ids": group_info["link_ids"],
-                "urls": group_info["urls"],
-                "titles": group_info["titles"]
-            })
+        report = await db.run_sync(
+            lambda session: dedup_service.generate_duplicate_report(session, company_id)
+        )
+        summary = report["summary"]
+        duplicate_groups = [_format_group(group) for group in report["duplicate_groups"]]
+        duplication_rate = summary["savings_percentage"]
 
         # Generate recommendations
         recommendations = []
         if duplication_rate > 20:
             recommendations.append("High duplication rate detected. Consider running merge operations.")
-        if len(duplicate_groups) > 10:
+        if len(report["recommendations"]) > 10:
             recommendations.append("Multiple duplicate groups found. Review and consolidate links.")
         if duplication_rate < 5:
             recommendations.append("Low duplication rate. Link management is healthy.")
 
         return {
-            "generated_at": datetime.utcnow().isoformat(),
-            "total_links": total_links,
-            "unique_links": unique_links,
-            "duplicate_links": duplicate_links,
+            "generated_at": report["generated_at"],
+            "total_links": summary["total_links"],
+            "unique_links": summary["unique_links"],
+            "duplicate_links": summary["total_duplicates"],
             "duplication_rate": duplication_rate,
             "duplicate_groups": duplicate_groups,
             "recommendations": recommendations
@@ -7,13 +7,14 @@ import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_
 from datetime import datetime
 
 from src.database.config import get_db
 from src.auth.security import get_current_user
 from src.models.user import User
 from src.models.report_schedule import ReportSchedule, ScheduleExecution
+from src.services.advanced_filtering import CountMode, InvalidCursorError, paginate
 from src.schemas.report_schedule import (
     ReportScheduleCreate,
     ReportScheduleUpdate,
@@ -97,6 +98,8 @@ async def list_report_schedules(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -108,6 +111,8 @@ async def list_report_schedules(
         is_active: Optional active status filter
         page: Page number
         page_size: Items per page
+        cursor: Cursor from the previous page
+        count: How the total is computed
         db: Database session
         current_user: Authenticated user
 
@@ -126,36 +131,15 @@ async def list_report_schedules(
         if is_active is not None:
             query = query.where(ReportSchedule.is_active == is_active)
 
-        # Order by created_at descending
-        query = query.order_by(desc(ReportSchedule.created_at))
-
-        # Get total count
-        count_query = select(ReportSchedule).where(ReportSchedule.user_id == current_user.id)
-        if company_id:
-            count_query = count_query.where(ReportSchedule.company_id == company_id)
-        if report_type:
-            count_query = count_query.where(ReportSchedule.report_type == report_type)
-        if is_active is not None:
-            count_query = count_query.where(ReportSchedule.is_active == is_active)
-
-        result = await db.execute(count_query)
-        total = len(result.scalars().all())
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        # Execute query
-        result = await db.execute(query)
-        schedules = result.scalars().all()
+        schedules, page_info = await paginate(
+            db, query, ReportSchedule, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "schedules": schedules,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"schedules": schedules, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing report schedules: {str(e)}")
         raise HTTPException(
@@ -449,6 +433,8 @@ async def get_schedule_executions(
     schedule_id: int = Path(..., description="Schedule ID"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -458,6 +444,8 @@ async def get_schedule_executions(
         schedule_id: Schedule ID
         page: Page number
         page_size: Items per page
+        cursor: Cursor from the previous page
+        count: How the total is computed
         db: Database session
         current_user: Authenticated user
 
@@ -488,28 +476,17 @@ async def get_schedule_executions(
         # Get executions
         query = select(ScheduleExecution).where(
             ScheduleExecution.schedule_id == schedule_id
-        ).order_by(desc(ScheduleExecution.started_at))
-
-        # Get total count
-        count_result = await db.execute(
-            select(ScheduleExecution).where(ScheduleExecution.schedule_id == schedule_id)
         )
-        total = len(count_result.scalars().all())
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await db.execute(query)
-        executions = result.scalars().all()
+        executions, page_info = await paginate(
+            db, query, ScheduleExecution, sort="-started_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "executions": executions,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"executions": executions, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -12,7 +12,10 @@ from sqlalchemy import select, and_, desc
 from src.database.config import get_db
 from src.auth.security import get_current_user
 from src.models.user import User
-from src.models.scraped_content import ScrapedContent, ScrapingSchedule, ContentChange
+from src.models.scraped_content import ScrapedContent, ScrapingSchedule, ContentChange, ContentBlob
+from src.services.advanced_filtering import CountMode, InvalidCursorError, paginate
+from src.services.full_text_search import search_columns, text_match
+from src.services.content_blob_store import ContentBlobStore
 from src.services.web_scraping_service import WebScrapingService
 from src.schemas.web_scraping import (
     ScrapeRequest,
@@ -56,6 +59,32 @@ async def scrape_url_task(
         logger.error(f"Error scraping URL {url}: {str(e)}")
 
 
+async def load_blob_content(db: AsyncSession, content: ScrapedContent) -> ScrapedContent:
+    """Fill html_content/text_content of a version from its content blobs.
+
+    The instance is detached first so the loaded content is never written
+    back to the row.
+    """
+    blob_hashes = [h for h in (content.html_blob_hash, content.text_blob_hash) if h]
+    if not blob_hashes:
+        return content
+
+    result = await db.execute(
+        select(ContentBlob).where(ContentBlob.content_hash.in_(blob_hashes))
+    )
+    blobs = {blob.content_hash: blob for blob in result.scalars().all()}
+
+    store = ContentBlobStore()
+    db.expunge(content)
+
+    if content.html_blob_hash in blobs:
+        content.html_content = await store.read_text(blobs[content.html_blob_hash])
+    if content.text_blob_hash in blobs:
+        content.text_content = await store.read_text(blobs[content.text_blob_hash])
+
+    return content
+
+
 @router.post("/scrape", response_model=ScrapedContentResponse, status_code=status.HTTP_202_ACCEPTED)
 async def initiate_scraping(
     scrape_request: ScrapeRequest,
@@ -109,8 +138,11 @@ async def list_scraped_content(
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
     competitor_id: Optional[int] = Query(None, description="Filter by competitor ID"),
     domain: Optional[str] = Query(None, description="Filter by domain"),
+    search: Optional[str] = Query(None, description="Full-text search in title, description and keywords"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -120,8 +152,11 @@ async def list_scraped_content(
         company_id: Optional company ID filter
         competitor_id: Optional competitor ID filter
         domain: Optional domain filter
+        search: Optional full-text search; matches keep the newest-first order
         page: Page number
         page_size: Items per page
+        cursor: Cursor from the previous page
+        count: How the total is computed
         db: Database session
         current_user: Authenticated user
 
@@ -140,36 +175,21 @@ async def list_scraped_content(
             filters.append(ScrapedContent.competitor_id == competitor_id)
         if domain:
             filters.append(ScrapedContent.domain.ilike(f"%{domain}%"))
+        if search:
+            filters.append(text_match(search, *search_columns(ScrapedContent)))
 
         if filters:
             query = query.where(and_(*filters))
 
-        # Order by created_at descending
-        query = query.order_by(desc(ScrapedContent.created_at))
-
-        # Get total count
-        count_query = select(ScrapedContent)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-
-        count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        # Execute query
-        result = await db.execute(query)
-        content = result.scalars().all()
+        content, page_info = await paginate(
+            db, query, ScrapedContent, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "content": content,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"content": content, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing scraped content: {str(e)}")
         raise HTTPException(
@@ -209,7 +229,7 @@ async def get_scraped_content(
                 detail="Scraped content not found"
             )
 
-        return content
+        return await load_blob_content(db, content)
 
     except HTTPException:
         raise
@@ -415,6 +435,8 @@ async def list_scraping_schedules(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -425,6 +447,8 @@ async def list_scraping_schedules(
         is_active: Optional active status filter
         page: Page number
         page_size: Items per page
+        cursor: Cursor from the previous page
+        count: How the total is computed
         db: Database session
         current_user: Authenticated user
 
@@ -444,30 +468,15 @@ async def list_scraping_schedules(
         if filters:
             query = query.where(and_(*filters))
 
-        query = query.order_by(desc(ScrapingSchedule.created_at))
-
-        # Get total
-        count_query = select(ScrapingSchedule)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-
-        count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
-
-        # Paginate
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await db.execute(query)
-        schedules = result.scalars().all()
+        schedules, page_info = await paginate(
+            db, query, ScrapingSchedule, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
+        )
 
-        return {
-            "schedules": schedules,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"schedules": schedules, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing scraping schedules: {str(e)}")
         raise HTTPException(
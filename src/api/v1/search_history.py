@@ -4,16 +4,19 @@ This module provides REST API endpoints for tracking and analyzing search histor
 including search analytics and cleanup operations.
 """
 import logging
-from typing import Optional
+import os
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, and_, desc, distinct, extract, func
 from datetime import datetime, timedelta
 
 from src.database.config import get_db
 from src.auth.security import get_current_user
 from src.models.user import User
 from src.models.search_history import SearchHistory
+from src.services.advanced_filtering import CountMode, InvalidCursorError, paginate
+from src.services.cache_service import get_cache_service
 from src.schemas.search_history import (
     SearchHistoryListResponse,
     SearchHistoryResponse,
@@ -24,6 +27,13 @@ from src.schemas.search_history import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/search-history", tags=["search-history"])
 
+TOP_QUERIES_LIMIT = 10
+
+# Analytics are cached briefly so dashboards polling the endpoint do not
+# re-aggregate the same window on every request
+ANALYTICS_CACHE_TTL = int(os.getenv("SEARCH_ANALYTICS_CACHE_TTL", "60"))
+ANALYTICS_CACHE_CATEGORY = "search_analytics"
+
 
 @router.get("", response_model=SearchHistoryListResponse)
 async def list_search_history(
@@ -32,6 +42,8 @@ async def list_search_history(
     days: int = Query(30, ge=1, le=365, description="Number of days to retrieve"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides page"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -43,6 +55,8 @@ async def list_search_history(
         days: Number of days to retrieve
         page: Page number
         page_size: Items per page
+        cursor: Cursor from the previous page
+        count: How the total is computed
         db: Database session
         current_user: Authenticated user
 
@@ -67,39 +81,16 @@ async def list_search_history(
         if search_type:
             query = query.where(SearchHistory.search_type == search_type)
 
-        # Order by created_at descending
-        query = query.order_by(desc(SearchHistory.created_at))
-
-        # Get total count
-        count_query = select(func.count()).select_from(SearchHistory).where(
-            and_(
-                SearchHistory.user_id == current_user.id,
-                SearchHistory.created_at >= date_threshold
-            )
+        # Newest first, paged on the (user_id, created_at) index
+        searches, page_info = await paginate(
+            db, query, SearchHistory, sort="-created_at",
+            page=page, page_size=page_size, cursor=cursor, count=count
         )
-        if company_id:
-            count_query = count_query.where(SearchHistory.company_id == company_id)
-        if search_type:
-            count_query = count_query.where(SearchHistory.search_type == search_type)
-
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
 
-        # Execute query
-        result = await db.execute(query)
-        searches = result.scalars().all()
-
-        return {
-            "searches": searches,
-            "total": total,
-            "page": page,
-            "page_size": page_size
-        }
+        return {"searches": searches, **page_info}
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing search history: {str(e)}")
         raise HTTPException(
@@ -108,18 +99,123 @@ async def list_search_history(
         )
 
 
+async def compute_search_analytics(
+    db: AsyncSession,
+    user_id: str,
+    company_id: Optional[int] = None,
+    days: int = 30
+) -> Dict[str, Any]:
+    """Compute search analytics with grouped SQL aggregates.
+
+    Counts and distributions are aggregated by the database over the
+    (user_id, created_at) index, so only summary rows are returned no
+    matter how many searches fall in the window.
+
+    Args:
+        db: Database session
+        user_id: ID of the user whose searches are analyzed
+        company_id: Optional company ID filter
+        days: Number of days to analyze
+
+    Returns:
+        Search analytics data
+    """
+    date_threshold = datetime.utcnow() - timedelta(days=days)
+
+    conditions = [
+        SearchHistory.user_id == user_id,
+        SearchHistory.created_at >= date_threshold
+    ]
+    if company_id:
+        conditions.append(SearchHistory.company_id == company_id)
+    window = and_(*conditions)
+
+    # Totals and averages (AVG skips NULLs; unrecorded execution times of 0 are left out too)
+    summary = (await db.execute(
+        select(
+            func.count(SearchHistory.id),
+            func.count(distinct(SearchHistory.query)),
+            func.avg(func.nullif(SearchHistory.execution_time_ms, 0)),
+            func.avg(SearchHistory.results_count)
+        ).where(window)
+    )).one()
+    total_searches, unique_queries, avg_execution_time, avg_results = summary
+
+    if not total_searches:
+        return {
+            "total_searches": 0,
+            "unique_queries": 0,
+            "avg_execution_time_ms": 0.0,
+            "top_queries": [],
+            "search_types_distribution": {},
+            "searches_by_hour": {},
+            "searches_by_day": {},
+            "avg_results_count": 0.0
+        }
+
+    # Top queries (most frequent)
+    query_count = func.count(SearchHistory.id).label("count")
+    top_result = await db.execute(
+        select(SearchHistory.query, query_count)
+        .where(window)
+        .group_by(SearchHistory.query)
+        .order_by(desc(query_count), SearchHistory.query)
+        .limit(TOP_QUERIES_LIMIT)
+    )
+    top_queries = [{"query": query, "count": count} for query, count in top_result.all()]
+
+    # Search types distribution
+    types_result = await db.execute(
+        select(SearchHistory.search_type, func.count(SearchHistory.id))
+        .where(window)
+        .group_by(SearchHistory.search_type)
+    )
+    search_types_dist = {search_type: count for search_type, count in types_result.all()}
+
+    # Searches by day and hour in one pass; at most days * 24 rows
+    day = func.date(SearchHistory.created_at)
+    hour = extract("hour", SearchHistory.created_at)
+    buckets_result = await db.execute(
+        select(day, hour, func.count(SearchHistory.id))
+        .where(window)
+        .group_by(day, hour)
+    )
+    searches_by_hour: Dict[int, int] = {}
+    searches_by_day: Dict[str, int] = {}
+    for bucket_day, bucket_hour, count in buckets_result.all():
+        bucket_hour = int(bucket_hour)
+        searches_by_hour[bucket_hour] = searches_by_hour.get(bucket_hour, 0) + count
+        bucket_day = str(bucket_day)
+        searches_by_day[bucket_day] = searches_by_day.get(bucket_day, 0) + count
+
+    return {
+        "total_searches": total_searches,
+        "unique_queries": unique_queries,
+        "avg_execution_time_ms": float(avg_execution_time or 0.0),
+        "top_queries": top_queries,
+        "search_types_distribution": search_types_dist,
+        "searches_by_hour": dict(sorted(searches_by_hour.items())),
+        "searches_by_day": dict(sorted(searches_by_day.items())),
+        "avg_results_count": float(avg_results or 0.0)
+    }
+
+
 @router.get("/analytics", response_model=SearchAnalyticsResponse)
 async def get_search_analytics(
     company_id: Optional[int] = Query(None, description="Filter by company ID"),
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
+    use_cache: bool = Query(True, description="Whether to use recently cached analytics"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get search analytics for the current user.
 
+    Results are cached for ANALYTICS_CACHE_TTL seconds (0 disables caching).
+
     Args:
         company_id: Optional company ID filter
         days: Number of days to analyze
+        use_cache: Whether to use recently cached analytics
         db: Database session
         current_user: Authenticated user
 
@@ -127,73 +223,18 @@ async def get_search_analytics(
         Search analytics data
     """
     try:
-        # Calculate date threshold
-        date_threshold = datetime.utcnow() - timedelta(days=days)
-
-        # Build base query
-        base_query = select(SearchHistory).where(
-            and_(
-                SearchHistory.user_id == current_user.id,
-                SearchHistory.created_at >= date_threshold
+        if not use_cache or ANALYTICS_CACHE_TTL <= 0:
+            return await compute_search_analytics(db, current_user.id, company_id, days)
+
+        cache = get_cache_service()
+        cache_key = f"{current_user.id}:{company_id or 'all'}:{days}"
+        analytics = await cache.get(cache_key, category=ANALYTICS_CACHE_CATEGORY)
+        if analytics is None:
+            analytics = await compute_search_analytics(db, current_user.id, company_id, days)
+            await cache.set(
+                cache_key, analytics, ttl=ANALYTICS_CACHE_TTL, category=ANALYTICS_CACHE_CATEGORY
             )
-        )
-
-        if company_id:
-            base_query = base_query.where(SearchHistory.company_id == company_id)
-
-        # Get all searches
-        result = await db.execute(base_query)
-        searches = result.scalars().all()
-
-        # Calculate analytics
-        total_searches = len(searches)
-        unique_queries = len(set(s.query for s in searches))
-
-        # Average execution time
-        execution_times = [s.execution_time_ms for s in searches if s.execution_time_ms]
-        avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0.0
-
-        # Top queries (most frequent)
-        query_counts = {}
-        for search in searches:
-            query_counts[search.query] = query_counts.get(search.query, 0) + 1
-
-        top_queries = [
-            {"query": query, "count": count}
-            for query, count in sorted(query_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
-
-        # Search types distribution
-        search_types_dist = {}
-        for search in searches:
-            search_types_dist[search.search_type] = search_types_dist.get(search.search_type, 0) + 1
-
-        # Searches by hour
-        searches_by_hour = {}
-        for search in searches:
-            hour = search.created_at.hour
-            searches_by_hour[hour] = searches_by_hour.get(hour, 0) + 1
-
-        # Searches by day
-        searches_by_day = {}
-        for search in searches:
-            day = search.created_at.strftime('%Y-%m-%d')
-            searches_by_day[day] = searches_by_day.get(day, 0) + 1
-
-        # Average results count
-        results_counts = [s.results_count for s in searches if s.results_count is not None]
-        avg_results = sum(results_counts) / len(results_counts) if results_counts else 0.0
-
-        return {
-            "total_searches": total_searches,
-            "unique_queries": unique_queries,
-            "avg_execution_time_ms": avg_execution_time,
-            "top_queries": top_queries,
-            "search_types_distribution": search_types_dist,
-            "searches_by_hour": searches_by_hour,
-            "searches_by_day": searches_by_day,
-            "avg_results_count": avg_results
-        }
+        return analytics
 
     except Exception as e:
         logger.error(f"Error getting search analytics: {str(e)}")
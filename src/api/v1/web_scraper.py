@@ -6,6 +6,7 @@ from sqlalchemy import select, desc
 
 from src.models import Link, LinkSnapshot
 from src.database.config import get_db
+from src.services.advanced_filtering import CountMode, InvalidCursorError, paginate
 from src.services.jobs import JobManager
 from src.services.web_scraper.web_scraper import WebScraperService
 
@@ -137,6 +138,8 @@ async def get_link_versions(
     link_id: int,
     limit: int = Query(20, gt=0),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page; overrides offset"),
+    count: CountMode = Query(CountMode.EXACT, description="How the total is computed"),
     session: AsyncSession = Depends(get_db)
 ):
     """Get all versions of scraped content for a link."""
@@ -152,28 +155,23 @@ async def get_link_versions(
         )
     
     # Get the snapshots
-    result = await session.execute(
-        select(LinkSnapshot)
-        .where(LinkSnapshot.link_id == link_id)
-        .order_by(desc(LinkSnapshot.created_at))
-        .offset(offset)
-        .limit(limit)
-    )
-    snapshots = result.scalars().all()
-    
-    # Count total snapshots
-    result = await session.execute(
-        select(LinkSnapshot)
-        .where(LinkSnapshot.link_id == link_id)
-    )
-    total = len(result.scalars().all())
+    try:
+        snapshots, page_info = await paginate(
+            session, select(LinkSnapshot).where(LinkSnapshot.link_id == link_id), LinkSnapshot,
+            sort="-created_at", page_size=limit, offset=offset, cursor=cursor, count=count
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     # Return the versions
     return {
         "link_id": link_id,
-        "total": total,
+        "total": page_info["total"],
+        "total_is_estimate": page_info["total_is_estimate"],
         "limit": limit,
         "offset": offset,
+        "has_next": page_info["has_next"],
+        "next_cursor": page_info["next_cursor"],
         "snapshots": [
             {
                 "snapshot_id": snapshot.id,
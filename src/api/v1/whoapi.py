@@ -10,6 +10,7 @@ Endpoints:
 - GET /api/v1/whoapi/tech/{domain} - Technology stack detection
 - GET /api/v1/whoapi/age/{domain} - Domain age calculation
 - GET /api/v1/whoapi/availability/{domain} - Domain availability check
+- GET /api/v1/whoapi/profile/{domain} - Combined domain profile
 - GET /api/v1/whoapi/expiring - Domains expiring soon
 """
 import logging
@@ -31,6 +32,7 @@ from src.services.external_api.whoapi_service import (
     TechStackInfo,
     DomainAge,
     DomainAvailability,
+    PROFILE_FACETS,
 )
 
 logger = logging.getLogger(__name__)
@@ -120,6 +122,16 @@ class DomainAvailabilityResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
+class DomainProfileResponse(BaseModel):
+    """Response model for a combined domain profile."""
+
+    success: bool = Field(..., description="Whether the request was successful")
+    data: Optional[Dict[str, Any]] = Field(
+        None, description="Domain profile data"
+    )
+    error: Optional[str] = Field(None, description="Error message if failed")
+
+
 class ExpiringDomainsResponse(BaseModel):
     """Response model for expiring domains list."""
 
@@ -484,6 +496,58 @@ async def check_availability(
         )
 
 
+@router.get(
+    "/profile/{domain}",
+    response_model=DomainProfileResponse,
+    summary="Get domain profile",
+    description="Retrieve WHOIS, SSL, DNS and technology data for a domain in one call.",
+    responses={
+        200: {"description": "Domain profile retrieved successfully"},
+        400: {"description": "Unknown facet requested"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def get_domain_profile(
+    domain: str,
+    facets: List[str] = Query(
+        default=list(PROFILE_FACETS),
+        description="Facets to include (whois, ssl, dns, tech)",
+    ),
+    service: WhoAPIService = Depends(get_whoapi_service),
+) -> DomainProfileResponse:
+    """Get a combined intelligence profile for a domain.
+
+    Facets that fail are reported in the profile's errors field.
+
+    Args:
+        domain: The domain to profile (e.g., "example.com").
+        facets: Facets to include.
+        service: WhoAPI service instance.
+
+    Returns:
+        DomainProfileResponse with the profile data.
+    """
+    try:
+        async with service:
+            profile = await service.get_domain_profile(domain, facets)
+            return DomainProfileResponse(
+                success=True,
+                data=profile.dict(),
+                error=None,
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.exception(f"Unexpected error for domain profile: {domain}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}",
+        )
+
+
 @router.get(
     "/expiring",
     response_model=ExpiringDomainsResponse,
@@ -8,11 +8,38 @@ This module configures Celery for handling background tasks including:
 - Email delivery
 - Scheduled analytics calculations
 """
+import asyncio
+import logging
 import os
+from typing import Awaitable, Optional, TypeVar
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 from kombu import Exchange, Queue
 from src.core.config import settings
+from src.core.http_pool import get_http_pool
+from src.services.web_scraping.browser_pool import get_browser_pool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Event loop reused by every task in a worker process. The database engine,
+# HTTP and browser pools and Redis clients are bound to the loop they were
+# first used in, so each task must not start a fresh one.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the worker's persistent event loop."""
+    global _worker_loop
+
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+
+    return _worker_loop.run_until_complete(coro)
+
 
 # Create Celery application
 celery_app = Celery(
@@ -116,6 +143,20 @@ celery_app.conf.beat_schedule = {
         "options": {"queue": "data_ingestion"},
     },
 
+    # Incremental competitor news ingestion every 4 hours
+    "ingest-competitor-news": {
+        "task": "src.tasks.data_ingestion_tasks.ingest_competitor_news",
+        "schedule": crontab(hour="*/4", minute=30),
+        "options": {"queue": "data_ingestion"},
+    },
+
+    # Persist API usage counted in Redis every minute
+    "flush-api-usage": {
+        "task": "src.tasks.maintenance_tasks.flush_api_usage",
+        "schedule": 60.0,
+        "options": {"queue": "default"},
+    },
+
     # Clean up old task results every day at 4 AM UTC
     "cleanup-old-results": {
         "task": "src.tasks.maintenance_tasks.cleanup_old_results",
@@ -140,5 +181,57 @@ celery_app.conf.task_annotations = {
     },
 }
 
+
+@worker_process_init.connect
+def reset_http_pool(**kwargs):
+    """Drop HTTP sessions inherited from the parent process after fork."""
+    get_http_pool().reset()
+
+
+@worker_process_init.connect
+def reset_browser_pool(**kwargs):
+    """Drop the browser inherited from the parent process after fork."""
+    get_browser_pool().reset()
+
+
+@worker_process_init.connect
+def start_cache_invalidation(**kwargs):
+    """Drop near-cache entries that other processes overwrite or delete."""
+    from src.services.caching.cache_manager import get_cache_manager
+
+    try:
+        get_cache_manager().start_invalidation_thread()
+    except Exception as e:
+        logger.error(f"Error starting cache invalidation listener: {e}")
+
+
+@worker_process_init.connect
+def register_content_index(**kwargs):
+    """Index Content rows committed by tasks, as the API process does."""
+    from src.services.ai.vector_index import register_content_index_hooks
+
+    register_content_index_hooks()
+
+
+@worker_process_shutdown.connect
+def save_content_index(**kwargs):
+    """Write the worker's unsaved content vector index changes."""
+    from src.services.ai.vector_index import get_content_vector_index
+
+    try:
+        get_content_vector_index().flush()
+    except Exception as e:
+        logger.error(f"Error saving content vector index: {e}")
+
+
+@worker_process_shutdown.connect
+def close_http_pool(**kwargs):
+    """Close the worker's pooled HTTP sessions."""
+    try:
+        get_http_pool().reset()
+    except Exception as e:
+        logger.error(f"Error closing HTTP session pool: {e}")
+
+
 if __name__ == "__main__":
     celery_app.start()
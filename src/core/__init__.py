@@ -6,10 +6,14 @@ including caching, configuration, and other utilities.
 """
 
 from .cache import Cache, cache, get_cache, cached
+from .http_pool import HTTPPoolConfig, HTTPSessionPool, get_http_pool
 
 __all__ = [
     'Cache',
     'cache',
     'get_cache',
     'cached',
+    'HTTPPoolConfig',
+    'HTTPSessionPool',
+    'get_http_pool',
 ]
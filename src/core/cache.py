@@ -2,6 +2,8 @@
 Cache Module
 
 This module provides caching functionality for the application using Redis or an in-memory cache.
+Both backends sit behind a bounded in-process LRU (see ``src.core.local_cache``): with Redis it
+serves hot keys without a network round trip, without Redis it is the cache itself.
 """
 import logging
 from typing import Any, Optional, Union, Callable, TypeVar, cast
@@ -11,6 +13,8 @@ import pickle
 from datetime import datetime, timedelta
 import hashlib
 
+from src.core.local_cache import LocalCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,6 +47,7 @@ class Cache:
         if not hasattr(self, '_initialized'):
             self._backend = backend
             self._prefix = kwargs.get('prefix', 'onside_')
+            self._local = LocalCache(f"core_cache:{self._prefix}")
             self._initialized = True
             
             if backend == 'redis':
@@ -65,6 +70,10 @@ class Cache:
             # Test connection
             self._client.ping()
             self._backend = 'redis'
+            try:
+                self._local.start_invalidation_thread(self._client)
+            except Exception as e:
+                logger.warning("Cache invalidation listener unavailable: %s", e)
             logger.info("Redis cache initialized successfully")
         except ImportError:
             logger.warning("Redis not installed, falling back to in-memory cache")
@@ -75,8 +84,8 @@ class Cache:
             self._init_memory()
     
     def _init_memory(self):
-        """Initialize in-memory cache."""
-        self._client = {}
+        """Initialize in-memory cache (the bounded local cache holds all entries)."""
+        self._client = None
         self._backend = 'memory'
         logger.info("In-memory cache initialized")
     
@@ -102,31 +111,33 @@ class Cache:
             The cached value or default if not found
         """
         cache_key = self._make_key(key)
-        
+
+        # In front of Redis the local tier holds serialized values, so every
+        # caller gets its own copy
+        value = self._local.get(cache_key)
+        if value is not None:
+            return self._decode(value) if self._backend == 'redis' else value
+
         try:
             if self._backend == 'redis':
-                value = self._client.get(cache_key)
-                if value is None:
-                    return default
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return pickle.loads(value) if value else default
-            else:
-                if cache_key not in self._client:
-                    return default
-                
-                # Check if the item has expired
-                item = self._client[cache_key]
-                if item['expires'] is not None and item['expires'] < datetime.utcnow():
-                    del self._client[cache_key]
+                raw = self._client.get(cache_key)
+                if raw is None:
                     return default
-                    
-                return item['value']
+                self._local.set(cache_key, raw, ttl=self._local.near_ttl(), size=len(raw))
+                return self._decode(raw)
+            return default
         except Exception as e:
             logger.error("Error getting value from cache: %s", e)
             return default
     
+    @staticmethod
+    def _decode(raw: Union[str, bytes]) -> Any:
+        """Deserialize a value stored in Redis."""
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return pickle.loads(raw)
+
     def set(self, key: str, value: Any, ttl: Optional[Union[int, timedelta]] = None) -> bool:
         """Store an item in the cache.
         
@@ -153,7 +164,9 @@ class Cache:
             return False
             
         cache_key = self._make_key(key)
-        
+        if isinstance(ttl, timedelta):
+            ttl = int(ttl.total_seconds())
+
         try:
             if self._backend == 'redis':
                 try:
@@ -169,30 +182,31 @@ class Cache:
                         return False
                 
                 try:
+                    if ttl is not None and ttl <= 0:
+                        logger.warning("TTL must be positive, got: %s", ttl)
+                        return False
+
+                    # Write and tell other processes to drop their local copy in one round trip
+                    pipe = self._client.pipeline(transaction=False)
                     if ttl is not None:
-                        if isinstance(ttl, timedelta):
-                            ttl = int(ttl.total_seconds())
-                        if ttl <= 0:
-                            logger.warning("TTL must be positive, got: %s", ttl)
-                            return False
-                        return bool(self._client.setex(cache_key, ttl, serialized))
-                    return bool(self._client.set(cache_key, serialized))
+                        pipe.setex(cache_key, ttl, serialized)
+                    else:
+                        pipe.set(cache_key, serialized)
+                    pipe.publish(
+                        self._local.config.invalidation_channel,
+                        self._local.invalidation_message(keys=[cache_key])
+                    )
+                    stored = bool(pipe.execute()[0])
                 except Exception as e:
                     logger.error("Redis error in cache.set(): %s", e)
                     return False
+
+                if stored:
+                    self._local.set(cache_key, serialized, ttl=self._local.near_ttl(ttl), size=len(serialized))
+                return stored
             else:
                 # In-memory cache
-                expires = None
-                if ttl is not None:
-                    if isinstance(ttl, timedelta):
-                        expires = datetime.utcnow() + ttl
-                    else:
-                        expires = datetime.utcnow() + timedelta(seconds=ttl)
-                
-                self._client[cache_key] = {
-                    'value': value,
-                    'expires': expires
-                }
+                self._local.set(cache_key, value, ttl=ttl)
                 return True
         except Exception as e:
             logger.error("Error setting value in cache: %s", e)
@@ -225,25 +239,18 @@ class Cache:
             return 0
             
         cache_keys = [self._make_key(key) for key in valid_keys]
-        
+
         try:
+            deleted = self._local.delete(*cache_keys)
             if self._backend == 'redis':
-                try:
-                    return self._client.delete(*cache_keys)
-                except TypeError:
-                    # Handle case where no keys were provided after filtering
-                    return 0
-            else:
-                deleted = 0
-                for key in cache_keys:
-                    try:
-                        if key in self._client:
-                            del self._client[key]
-                            deleted += 1
-                    except KeyError:
-                        # Key might have been deleted by another operation
-                        continue
-                return deleted
+                pipe = self._client.pipeline(transaction=False)
+                pipe.delete(*cache_keys)
+                pipe.publish(
+                    self._local.config.invalidation_channel,
+                    self._local.invalidation_message(keys=cache_keys)
+                )
+                return pipe.execute()[0]
+            return deleted
         except Exception as e:
             logger.error("Error deleting keys from cache: %s", e)
             return 0
@@ -277,18 +284,7 @@ class Cache:
                 return bool(self._client.exists(cache_key))
             else:
                 # For in-memory cache, check both existence and expiration
-                if cache_key not in self._client:
-                    return False
-                    
-                item = self._client[cache_key]
-                if item['expires'] is not None and item['expires'] < datetime.utcnow():
-                    # Clean up expired item
-                    try:
-                        del self._client[cache_key]
-                    except KeyError:
-                        pass  # Already deleted by another operation
-                    return False
-                return True
+                return cache_key in self._local
         except Exception as e:
             logger.error("Error checking if key exists in cache: %s", e)
             return False
@@ -298,7 +294,6 @@ class Cache:
         
         Args:
             pattern: Optional pattern to match keys against. If None, all keys will be cleared.
-                    Only supported with Redis backend. For in-memory cache, this will clear all keys.
                     
         Returns:
             True if operation was successful, False otherwise
@@ -319,26 +314,42 @@ class Cache:
             True
         """
         try:
-            if self._backend == 'redis':
-                if pattern:
-                    # Delete keys matching pattern
-                    keys = self._client.keys(self._make_key(pattern))
-                    if keys:
-                        return bool(self._client.delete(*keys) > 0)
-                    return True
-                else:
-                    # Clear entire database
-                    return self._client.flushdb()
-            else:
-                # In-memory cache - clear everything
-                # Note: We don't support pattern matching for in-memory cache
-                # as it would be inefficient for large caches
-                self._client.clear()
+            if pattern:
+                self.delete_pattern(pattern)
                 return True
+
+            self._local.clear()
+            if self._backend == 'redis':
+                # Clear entire database
+                self._local.publish_invalidation_sync(self._client, clear=True)
+                return self._client.flushdb()
+            return True
         except Exception as e:
             logger.error("Error clearing cache: %s", e)
             return False
     
+    def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern (e.g. ``user:*``).
+
+        Args:
+            pattern: Pattern to match, without the cache prefix
+
+        Returns:
+            Number of keys deleted
+        """
+        full_pattern = self._make_key(pattern)
+
+        try:
+            deleted = self._local.delete_pattern(full_pattern)
+            if self._backend == 'redis':
+                keys = list(self._client.scan_iter(match=full_pattern, count=500))
+                deleted = self._client.delete(*keys) if keys else 0
+                self._local.publish_invalidation_sync(self._client, patterns=[full_pattern])
+            return deleted
+        except Exception as e:
+            logger.error("Error deleting keys matching %s: %s", pattern, e)
+            return 0
+
     def get_or_set(self, key: str, default: Any, ttl: Optional[Union[int, timedelta]] = None) -> Any:
         """Get a value from the cache, or set it if it doesn't exist.
         
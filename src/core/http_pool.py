@@ -0,0 +1,242 @@
+"""
+Shared HTTP Session Pool
+
+This module provides a process-wide registry of HTTP sessions so that scrapers
+and external API clients reuse pooled, keep-alive connections (and their TLS
+sessions and DNS lookups) instead of opening a new session per call.
+
+Sessions are bound to the event loop that created them, so the pool keeps one
+set of sessions per running loop. Each Celery worker process shares a set on
+its persistent loop, while the FastAPI app shares a single set for its lifetime.
+
+Borrowed sessions are owned by the pool: services must not close them.
+
+Example:
+    pool = get_http_pool()
+    session = pool.get_session()
+    async with session.get("https://example.com") as response:
+        html = await response.text()
+"""
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the event loop running in this thread, if any."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool limits shared by all pooled sessions."""
+
+    max_connections: int = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+    max_connections_per_host: int = int(os.getenv("HTTP_POOL_MAX_PER_HOST", "10"))
+    keepalive_timeout: float = float(os.getenv("HTTP_POOL_KEEPALIVE_TIMEOUT", "30"))
+    dns_cache_ttl: int = int(os.getenv("HTTP_POOL_DNS_CACHE_TTL", "300"))
+    default_timeout: float = float(os.getenv("HTTP_POOL_DEFAULT_TIMEOUT", "30"))
+
+
+class HTTPSessionPool:
+    """Registry of pooled aiohttp sessions and httpx clients.
+
+    Each named session is created lazily on first use in a given event loop
+    and reused for every later call in that loop.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        """Initialize the pool.
+
+        Args:
+            config: Pool limits (uses defaults if not provided)
+        """
+        self.config = config or HTTPPoolConfig()
+        self._sessions: Dict[Tuple[int, str], aiohttp.ClientSession] = {}
+        self._clients: Dict[Tuple[int, str], httpx.AsyncClient] = {}
+        self._loops: Dict[int, asyncio.AbstractEventLoop] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self._pid = os.getpid()
+
+    def _loop_key(self) -> int:
+        """Register the running loop and drop sessions of closed loops."""
+        loop = asyncio.get_running_loop()
+        loop_id = id(loop)
+
+        stale = [
+            key for key, known in self._loops.items()
+            if known.is_closed() or (key == loop_id and known is not loop)
+        ]
+        for key in stale:
+            self._forget_loop(key)
+
+        self._loops[loop_id] = loop
+        return loop_id
+
+    def _forget_loop(self, loop_id: int, close: bool = True):
+        """Remove the sessions bound to a loop from the pool.
+
+        Args:
+            loop_id: ID of the loop the sessions are bound to
+            close: Whether to close the removed sessions
+        """
+        loop = self._loops.pop(loop_id, None)
+        sessions = [self._sessions.pop(key) for key in list(self._sessions) if key[0] == loop_id]
+        clients = [self._clients.pop(key) for key in list(self._clients) if key[0] == loop_id]
+
+        if close and loop is not None and (sessions or clients):
+            self._close_on_loop(loop, sessions, clients)
+
+    def _close_on_loop(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        sessions: List[aiohttp.ClientSession],
+        clients: List[httpx.AsyncClient]
+    ):
+        """Close sessions and clients on the loop they are bound to.
+
+        The close is scheduled if the loop is running and run to completion
+        if it is idle. A closed loop cannot run it, so the connections of
+        its sessions are closed when their transports are garbage collected.
+        """
+        if loop.is_closed():
+            logger.debug("Dropped pooled HTTP sessions of a closed event loop")
+            return
+
+        closing = self._close_all(sessions, clients)
+        running = _running_loop()
+        if not loop.is_running():
+            if running is None:
+                loop.run_until_complete(closing)
+                return
+            # Another loop is running in this thread, so this one cannot
+            closing.close()
+            logger.debug("Dropped pooled HTTP sessions of an idle event loop")
+        elif loop is running:
+            task = loop.create_task(closing)
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(closing, loop)
+
+    @staticmethod
+    async def _close_all(
+        sessions: List[aiohttp.ClientSession],
+        clients: List[httpx.AsyncClient]
+    ):
+        """Close sessions and clients that are still open."""
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+
+    def get_session(self, name: str = "default") -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session for the running event loop.
+
+        Args:
+            name: Session name; use separate names only when callers need
+                isolated cookie jars
+
+        Returns:
+            Shared aiohttp ClientSession (do not close it)
+        """
+        key = (self._loop_key(), name)
+        session = self._sessions.get(key)
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+                keepalive_timeout=self.config.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.default_timeout),
+            )
+            self._sessions[key] = session
+            logger.debug(f"Created pooled aiohttp session '{name}'")
+
+        return session
+
+    def get_client(self, name: str = "default") -> httpx.AsyncClient:
+        """Get the pooled httpx client for the running event loop.
+
+        Args:
+            name: Client name; use separate names only when callers need
+                isolated cookie jars
+
+        Returns:
+            Shared httpx AsyncClient (do not close it)
+        """
+        key = (self._loop_key(), name)
+        client = self._clients.get(key)
+
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.config.default_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections_per_host,
+                    keepalive_expiry=self.config.keepalive_timeout,
+                ),
+            )
+            self._clients[key] = client
+            logger.debug(f"Created pooled httpx client '{name}'")
+
+        return client
+
+    async def close(self):
+        """Close all sessions bound to the running event loop."""
+        loop_id = id(asyncio.get_running_loop())
+
+        await self._close_all(
+            [self._sessions.pop(key) for key in list(self._sessions) if key[0] == loop_id],
+            [self._clients.pop(key) for key in list(self._clients) if key[0] == loop_id]
+        )
+
+        self._loops.pop(loop_id, None)
+        logger.info("HTTP session pool closed")
+
+    def reset(self):
+        """Close and forget the sessions of every event loop.
+
+        In a forked child the inherited sessions share their sockets and the
+        loop's selector with the parent, which still owns them, so they are
+        only forgotten.
+        """
+        inherited = os.getpid() != self._pid
+        for loop_id in list(self._loops):
+            self._forget_loop(loop_id, close=not inherited)
+        self._pid = os.getpid()
+
+
+# Global pool instance
+_http_pool: Optional[HTTPSessionPool] = None
+
+
+def get_http_pool() -> HTTPSessionPool:
+    """
+    Get or create the global HTTP session pool.
+
+    Returns:
+        HTTPSessionPool instance
+    """
+    global _http_pool
+
+    if _http_pool is None:
+        _http_pool = HTTPSessionPool()
+
+    return _http_pool
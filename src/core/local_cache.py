@@ -0,0 +1,413 @@
+"""
+Bounded In-Process Cache
+
+This module provides the L1 tier used by the cache services. ``LocalCache`` is
+a thread-safe LRU cache bounded by entry count and approximate byte size, with
+per-entry TTLs. Expired entries are evicted before live ones when the cache is
+full, so an outage of the shared tier cannot grow the process without bound.
+
+In front of Redis the local cache acts as a read-through near-cache: entries
+are kept for at most ``near_cache_ttl`` seconds, and writes and deletes are
+broadcast over Redis pub/sub so other processes drop their stale copies.
+Without Redis it is the (bounded) fallback store itself.
+
+Example:
+    local = LocalCache("serp")
+    local.set("keyword", results, ttl=60)
+    results = local.get("keyword")
+"""
+import asyncio
+import heapq
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LocalCacheConfig:
+    """Size limits and near-cache settings for a local cache."""
+
+    max_entries: int = int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", "10000"))
+    max_bytes: int = int(os.getenv("LOCAL_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    near_cache_ttl: float = float(os.getenv("LOCAL_CACHE_NEAR_TTL", "60"))
+    invalidation_channel: str = os.getenv("LOCAL_CACHE_INVALIDATION_CHANNEL", "onside:cache:invalidate")
+
+
+class _Entry:
+    """A cached value with its expiry time and estimated size."""
+
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a value in bytes."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        try:
+            return len(pickle.dumps(value))
+        except Exception:
+            return sys.getsizeof(value)
+
+
+class LocalCache:
+    """Thread-safe, size-bounded LRU cache with TTL-aware eviction."""
+
+    def __init__(self, name: str, config: Optional[LocalCacheConfig] = None):
+        """Initialize the cache.
+
+        Args:
+            name: Cache name, used to route invalidation messages
+            config: Size limits (uses defaults if not provided)
+        """
+        self.name = name
+        self.config = config or LocalCacheConfig()
+        self.node_id = uuid.uuid4().hex
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._listener_task: Optional[asyncio.Task] = None
+        self._listener_thread = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
+        }
+
+    def near_ttl(self, ttl: Optional[float] = None) -> float:
+        """TTL to use when caching a value read from or written to Redis."""
+        if ttl is None or ttl <= 0:
+            return self.config.near_cache_ttl
+        return min(ttl, self.config.near_cache_ttl)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return default
+
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, size: Optional[int] = None):
+        """Store a value, evicting expired and then least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (None = no expiration, <= 0 = do not cache)
+            size: Size in bytes if already known (e.g. the serialized length)
+        """
+        size = size if size is not None else estimate_size(value)
+
+        with self._lock:
+            self._remove(key)
+
+            if (ttl is not None and ttl <= 0) or size > self.config.max_bytes:
+                return
+
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = _Entry(value, expires_at, size)
+            self._bytes += size
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+
+            self._evict()
+
+    def delete(self, *keys: str) -> int:
+        """Remove keys from the cache.
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock:
+            return sum(1 for key in keys if self._remove(key))
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove all keys matching a Redis-style glob pattern.
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if fnmatchcase(key, pattern)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+            return count
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._purge_expired()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (
+                entry.expires_at is None or entry.expires_at > time.monotonic()
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current size and hit/eviction counters."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.config.max_entries,
+            "max_bytes": self.config.max_bytes,
+            **self._stats
+        }
+
+    def _remove(self, key: str) -> bool:
+        """Remove a key (lock must be held). Heap items are dropped lazily."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+    def _purge_expired(self) -> int:
+        """Pop expired entries off the expiry heap (lock must be held)."""
+        now = time.monotonic()
+        removed = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            # Skip heap items left behind by overwritten or deleted keys
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+
+        self._stats["expirations"] += removed
+
+        # Drop stale heap items once they dominate the heap
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for key, entry in self._entries.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        return removed
+
+    def _evict(self):
+        """Bring the cache back within its limits (lock must be held)."""
+        if not self._over_limits():
+            return
+
+        self._purge_expired()
+
+        while self._over_limits() and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats["evictions"] += 1
+
+    def _over_limits(self) -> bool:
+        return len(self._entries) > self.config.max_entries or self._bytes > self.config.max_bytes
+
+    # Invalidation propagation
+
+    def invalidation_message(
+        self,
+        keys: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        clear: bool = False
+    ) -> str:
+        """Build the pub/sub payload telling other processes what to drop."""
+        return json.dumps({
+            "cache": self.name,
+            "node": self.node_id,
+            "keys": list(keys),
+            "patterns": list(patterns),
+            "clear": clear
+        })
+
+    def apply_invalidation(self, data: Any) -> bool:
+        """Apply an invalidation message published by another process.
+
+        Args:
+            data: Raw pub/sub message payload
+
+        Returns:
+            True if the message targeted this cache and was applied
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return False
+
+        if message.get("cache") != self.name or message.get("node") == self.node_id:
+            return False
+
+        if message.get("clear"):
+            self.clear()
+        else:
+            self.delete(*message.get("keys", []))
+            for pattern in message.get("patterns", []):
+                self.delete_pattern(pattern)
+
+        self._stats["invalidations"] += 1
+        return True
+
+    async def publish_invalidation(
+        self,
+        redis_client: Any,
+        keys: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        clear: bool = False
+    ):
+        """Tell other processes to drop keys from their copy of this cache.
+
+        Args:
+            redis_client: redis.asyncio client
+            keys: Keys to drop
+            patterns: Key glob patterns to drop
+            clear: Drop everything
+        """
+        try:
+            await redis_client.publish(
+                self.config.invalidation_channel,
+                self.invalidation_message(keys, patterns, clear)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation for {self.name}: {e}")
+
+    def publish_invalidation_sync(
+        self,
+        redis_client: Any,
+        keys: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        clear: bool = False
+    ):
+        """Synchronous variant of publish_invalidation for redis.Redis clients."""
+        try:
+            redis_client.publish(
+                self.config.invalidation_channel,
+                self.invalidation_message(keys, patterns, clear)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation for {self.name}: {e}")
+
+    async def listen_for_invalidations(self, redis_client: Any, retry_delay: float = 5.0):
+        """Apply invalidations published by other processes until cancelled.
+
+        The near-cache is cleared whenever the subscription is (re)established,
+        since messages may have been missed while it was down.
+
+        Args:
+            redis_client: redis.asyncio client
+            retry_delay: Seconds to wait before resubscribing after an error
+        """
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.config.invalidation_channel)
+                self.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener for {self.name} failed: {e}")
+                self.clear()
+                await asyncio.sleep(retry_delay)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    def start_invalidation_listener(self, redis_client: Any):
+        """Start listening for invalidations in the running event loop."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self.listen_for_invalidations(redis_client))
+
+    def start_invalidation_thread(self, redis_client: Any):
+        """Start listening for invalidations in a background thread (sync clients)."""
+        if self._listener_thread is not None:
+            return
+
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{
+            self.config.invalidation_channel: lambda message: self.apply_invalidation(message["data"])
+        })
+        self._listener_thread = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    async def stop_invalidation_listener(self):
+        """Stop the invalidation listener task."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener_task = None
+
+    def stop_invalidation_thread(self):
+        """Stop the invalidation listener thread."""
+        if self._listener_thread is not None:
+            self._listener_thread.stop()
+            self._listener_thread = None
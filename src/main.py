@@ -10,6 +10,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.security import get_current_user
 from src.models.user import User
 from src.services.cache_service import get_cache_service
+from src.services.caching.cache_manager import get_cache_manager, init_cache_manager
+from src.core.http_pool import get_http_pool
+from src.services.web_scraping.politeness import get_politeness_service
+from src.services.web_scraping.browser_pool import get_browser_pool
+from src.services.content_diff import shutdown_diff_executor
+from src.services.ai.vector_index import get_content_vector_index, register_content_index_hooks
+from src.services.api_monitoring.quota_counter import get_quota_counter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,6 +31,9 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await init_db()
 
+    # Keep the content similarity index in sync with committed content changes
+    register_content_index_hooks()
+
     # Initialize cache service
     logger.info("Initializing cache service...")
     try:
@@ -41,6 +51,15 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize cache service: {e}")
         logger.warning("Application will continue with degraded caching functionality")
 
+    # Keep the cache manager's near-cache in step with other processes' writes
+    try:
+        await init_cache_manager()
+    except Exception as e:
+        logger.error(f"Failed to initialize cache manager: {e}")
+
+    # Persist external API usage counters in the background
+    get_quota_counter().start()
+
     yield  # Application runs here
 
     # Shutdown
@@ -52,6 +71,41 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing cache service: {e}")
 
+    try:
+        await get_cache_manager().close()
+    except Exception as e:
+        logger.error(f"Error closing cache manager: {e}")
+
+    try:
+        # Close pooled HTTP sessions shared by scrapers and API clients
+        await get_http_pool().close()
+    except Exception as e:
+        logger.error(f"Error closing HTTP session pool: {e}")
+
+    try:
+        # Close shared scraping politeness state (robots.txt, throttles)
+        await get_politeness_service().close()
+    except Exception as e:
+        logger.error(f"Error closing politeness service: {e}")
+
+    # Flush unsaved API usage counts
+    await get_quota_counter().close()
+
+    try:
+        # Close the shared Chromium used for JavaScript rendering
+        await get_browser_pool().close()
+    except Exception as e:
+        logger.error(f"Error closing browser pool: {e}")
+
+    # Stop worker processes used for large content diffs
+    shutdown_diff_executor()
+
+    try:
+        # Persist unsaved content vector index changes
+        get_content_vector_index().flush()
+    except Exception as e:
+        logger.error(f"Error saving content vector index: {e}")
+
     try:
         async for db in get_db():
             await db.close()
@@ -23,6 +23,7 @@ from src.models.external_api import (
     GNewsArticle,
     IPInfoRecord,
     WhoisRecord,
+    WhoAPIFacetCache,
     APIUsageRecord,
 )
 from src.models.brand_analysis import (
@@ -63,6 +64,7 @@ __all__ = [
     "GNewsArticle",
     "IPInfoRecord",
     "WhoisRecord",
+    "WhoAPIFacetCache",
     "APIUsageRecord",
     "BrandAnalysisJob",
     "DiscoveredKeyword",
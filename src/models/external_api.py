@@ -3,7 +3,7 @@
 This module contains SQLAlchemy models for storing data retrieved from external APIs:
 - GNews API: News articles data
 - IPInfo API: IP/Domain geolocation data
-- WhoAPI API: Domain WHOIS data
+- WhoAPI API: Domain WHOIS data and cached domain intelligence facets
 - API Usage Tracking: Track API calls and quotas
 """
 from datetime import datetime
@@ -11,8 +11,8 @@ from decimal import Decimal
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Float, DateTime, JSON,
-    ForeignKey, Boolean, Numeric, Index
+    Column, Integer, BigInteger, String, Text, Float, DateTime, JSON,
+    ForeignKey, Boolean, Numeric, Index, UniqueConstraint
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -46,6 +46,7 @@ class GNewsArticle(Base):
         language: Language code of the article
         country: Country code for the article
         competitor_id: FK to associated competitor
+        simhash: 64-bit SimHash of title and description for near-duplicate detection
         created_at: When the record was created
         updated_at: When the record was last updated
     """
@@ -64,6 +65,7 @@ class GNewsArticle(Base):
     query_term: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     country: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    simhash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
 
     # Foreign keys
     competitor_id: Mapped[Optional[int]] = mapped_column(
@@ -333,6 +335,46 @@ class WhoisRecord(Base):
         return 0 < days_until_expiration <= 30
 
 
+class WhoAPIFacetCache(Base):
+    """Model for cached WhoAPI domain intelligence facets.
+
+    Stores one parsed response per domain and facet (whois, ssl, dns, tech)
+    so domain profiles can be rebuilt without calling WhoAPI again. Each
+    facet expires independently because they change at different rates.
+
+    Attributes:
+        id: Primary key
+        domain_name: Normalized domain name
+        facet: Facet name (whois, ssl, dns, tech)
+        data: Parsed facet data as JSON
+        fetched_at: When the facet was fetched from WhoAPI
+        expires_at: When the cached facet should be refetched
+    """
+    __tablename__ = "whoapi_facet_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    domain_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    facet: Mapped[str] = mapped_column(String(20), nullable=False)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint('domain_name', 'facet', name='uq_whoapi_facet_cache_domain_facet'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WhoAPIFacetCache(domain='{self.domain_name}', facet='{self.facet}')>"
+
+
 class APIUsageRecord(Base):
     """Model for tracking API calls and quotas.
 
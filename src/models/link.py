@@ -3,10 +3,11 @@ Models for link search and web scraping functionality
 """
 from datetime import datetime
 from typing import Dict, Optional, List, TYPE_CHECKING, Any
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Boolean
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Boolean, Index
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 from sqlalchemy.sql import func
 from src.database import Base
+from src.utils.url_normalization import normalize_url, url_host
 
 # Handle circular imports properly
 if TYPE_CHECKING:
@@ -20,6 +21,8 @@ class Link(Base):
     Attributes:
         id: Primary key
         url: The full URL of the link
+        normalized_url: The URL after normalization, kept in sync with url
+        host: Host of the normalized URL, used to block dedup candidates
         domain_id: Foreign key to the associated domain
         title: Title of the linked page
         description: Description of the linked page
@@ -30,9 +33,18 @@ class Link(Base):
         meta_data: Additional metadata about the link
     """
     __tablename__ = 'links'
+    __table_args__ = (
+        # Serves host lookups and host + path prefix LIKE queries
+        Index(
+            'ix_links_host_normalized_url', 'host', 'normalized_url',
+            postgresql_ops={'normalized_url': 'varchar_pattern_ops'}
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     url = Column(String, nullable=False, unique=True, index=True)
+    normalized_url = Column(String, nullable=True, index=True)
+    host = Column(String, nullable=True)
     domain_id = Column(Integer, ForeignKey('domains.id', ondelete='CASCADE'), nullable=False)
     title = Column(String, nullable=True)
     description = Column(String, nullable=True)
@@ -63,6 +75,14 @@ class Link(Base):
         lazy="selectin"
     )
     
+    @validates('url')
+    def _set_normalized_url(self, key: str, url: str) -> str:
+        """Keep normalized_url and host in sync with url."""
+        if url is not None:
+            self.normalized_url = normalize_url(url)
+            self.host = url_host(self.normalized_url)
+        return url
+
     def __repr__(self) -> str:
         return f"<Link(id={self.id}, url='{self.url}')>"
     
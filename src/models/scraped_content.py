@@ -8,11 +8,37 @@ import hashlib
 from src.database import Base
 
 
+class ContentBlob(Base):
+    """Model for content-addressed, compressed blobs in object storage.
+
+    Blobs are keyed by the SHA-256 of their uncompressed bytes, so identical
+    HTML, text or screenshots are stored once no matter how many versions
+    reference them.
+    """
+    __tablename__ = "content_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    bucket: Mapped[str] = mapped_column(String(100), nullable=False)
+    storage_path: Mapped[str] = mapped_column(String(1000), nullable=False)
+    compression: Mapped[str] = mapped_column(String(10), default="none", nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    stored_size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    perceptual_hash: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default="now()")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ContentBlob(hash='{self.content_hash[:12]}', kind='{self.kind}', size={self.size_bytes})>"
+
+
 class ScrapedContent(Base):
     """Model for storing scraped web content with versioning.
 
-    This model stores HTML content, screenshots, and metadata from web scraping
-    operations, supporting version tracking and change detection.
+    This model stores metadata from web scraping operations, supporting
+    version tracking and change detection. HTML, text and screenshots live in
+    content-addressed blobs referenced by hash; ``html_content`` and
+    ``text_content`` are only populated on rows written before blob storage.
     """
     __tablename__ = "scraped_content"
 
@@ -34,6 +60,11 @@ class ScrapedContent(Base):
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     scrape_duration_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     content_metadata: Mapped[Optional[Dict]] = mapped_column(JSON, nullable=True)
+    html_blob_hash: Mapped[Optional[str]] = mapped_column(ForeignKey("content_blobs.content_hash"), nullable=True)
+    text_blob_hash: Mapped[Optional[str]] = mapped_column(ForeignKey("content_blobs.content_hash"), nullable=True)
+    screenshot_blob_hash: Mapped[Optional[str]] = mapped_column(ForeignKey("content_blobs.content_hash"), nullable=True)
+    seen_count: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default="now()")
 
     # Relationships
@@ -49,6 +80,25 @@ class ScrapedContent(Base):
         foreign_keys="ContentChange.new_version_id",
         back_populates="new_version"
     )
+    observations = relationship(
+        "ContentObservation",
+        back_populates="scraped_content",
+        cascade="all, delete-orphan"
+    )
+
+    @staticmethod
+    def hash_content(text_content: Optional[str], html_content: Optional[str]) -> str:
+        """Calculate the SHA-256 content hash used for change detection.
+
+        Args:
+            text_content: Extracted text (preferred)
+            html_content: Raw HTML (used when there is no text)
+
+        Returns:
+            str: Hexadecimal hash string
+        """
+        content = text_content or html_content or ""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
     def calculate_content_hash(self) -> str:
         """Calculate SHA-256 hash of the content.
@@ -56,8 +106,7 @@ class ScrapedContent(Base):
         Returns:
             str: Hexadecimal hash string
         """
-        content = self.text_content or self.html_content or ""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return self.hash_content(self.text_content, self.html_content)
 
     def update_hash(self) -> None:
         """Update the content_hash field."""
@@ -79,6 +128,29 @@ class ScrapedContent(Base):
         return f"<ScrapedContent(id={self.id}, url='{self.url}', version={self.version})>"
 
 
+class ContentObservation(Base):
+    """Model for a scrape that found a version unchanged.
+
+    Re-scraping a static page records one of these lightweight rows instead
+    of a new ScrapedContent version.
+    """
+    __tablename__ = "content_observations"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    scraped_content_id: Mapped[int] = mapped_column(ForeignKey("scraped_content.id"), nullable=False, index=True)
+    status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    scrape_duration_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    screenshot_blob_hash: Mapped[Optional[str]] = mapped_column(ForeignKey("content_blobs.content_hash"), nullable=True)
+    seen_at: Mapped[datetime] = mapped_column(DateTime, server_default="now()")
+
+    # Relationships
+    scraped_content = relationship("ScrapedContent", back_populates="observations")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ContentObservation(id={self.id}, scraped_content_id={self.scraped_content_id})>"
+
+
 class ScrapingSchedule(Base):
     """Model for scheduling automated web scraping tasks.
 
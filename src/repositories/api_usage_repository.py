@@ -106,6 +106,103 @@ class APIUsageRepository:
             await self.db.refresh(usage)
             return usage
 
+    async def apply_usage_deltas(self, deltas: List[Dict[str, Any]]) -> int:
+        """Add aggregated usage to period records in one transaction.
+
+        Counts are added with ``request_count = request_count + n`` in SQL,
+        so concurrent writers never overwrite each other. A record is created
+        for any (API, endpoint, period) that does not have one yet.
+
+        Args:
+            deltas: Dictionaries with api_name, endpoint, period_start,
+                period_end, count and cost, plus the quota_limit and
+                cost_per_call to store on newly created records
+
+        Returns:
+            Number of records created
+        """
+        created = 0
+        for delta in deltas:
+            conditions = [
+                APIUsageRecord.api_name == delta["api_name"],
+                APIUsageRecord.period_start == delta["period_start"],
+                APIUsageRecord.period_end == delta["period_end"],
+                APIUsageRecord.endpoint == delta["endpoint"]
+                if delta["endpoint"] else APIUsageRecord.endpoint.is_(None)
+            ]
+            first_record = (
+                select(APIUsageRecord.id)
+                .where(and_(*conditions))
+                .order_by(APIUsageRecord.id)
+                .limit(1)
+                .scalar_subquery()
+            )
+            result = await self.db.execute(
+                update(APIUsageRecord)
+                .where(APIUsageRecord.id == first_record)
+                .values(
+                    request_count=APIUsageRecord.request_count + delta["count"],
+                    total_cost=func.coalesce(APIUsageRecord.total_cost, 0) + delta["cost"]
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                continue
+
+            self.db.add(APIUsageRecord(
+                api_name=delta["api_name"],
+                endpoint=delta["endpoint"],
+                request_count=delta["count"],
+                quota_limit=delta.get("quota_limit"),
+                period_start=delta["period_start"],
+                period_end=delta["period_end"],
+                cost_per_call=delta.get("cost_per_call"),
+                total_cost=delta["cost"]
+            ))
+            created += 1
+
+        await self.db.commit()
+        return created
+
+    async def get_period_totals(
+        self,
+        api_name: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Dict[str, Any]:
+        """Get persisted usage totals of an API for a period.
+
+        Args:
+            api_name: Name of the API
+            period_start: Start of the period
+            period_end: End of the period
+
+        Returns:
+            Dictionary with request_count, total_cost and quota_limit
+            (None if no record sets one)
+        """
+        result = await self.db.execute(
+            select(
+                func.sum(APIUsageRecord.request_count).label("total_requests"),
+                func.max(APIUsageRecord.quota_limit).label("quota_limit"),
+                func.sum(APIUsageRecord.total_cost).label("total_cost")
+            )
+            .where(
+                and_(
+                    APIUsageRecord.api_name == api_name,
+                    APIUsageRecord.period_start == period_start,
+                    APIUsageRecord.period_end == period_end
+                )
+            )
+        )
+        row = result.one_or_none()
+
+        return {
+            "request_count": int(row.total_requests or 0) if row else 0,
+            "total_cost": Decimal(str(row.total_cost or 0)) if row else Decimal("0"),
+            "quota_limit": row.quota_limit if row else None
+        }
+
     async def _get_current_period_record(
         self,
         api_name: str,
@@ -34,6 +34,22 @@ class CompetitorRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_by_ids(self, competitor_ids: List[int]) -> List[Competitor]:
+        """Get competitors by their IDs in one query.
+        
+        Args:
+            competitor_ids: IDs of the competitors to retrieve
+            
+        Returns:
+            List of competitors that exist
+        """
+        if not competitor_ids:
+            return []
+        result = await self.db.execute(
+            select(Competitor).where(Competitor.id.in_(competitor_ids))
+        )
+        return list(result.scalars().all())
+    
     async def get_by_company_id(self, company_id: int) -> List[Competitor]:
         """Get all competitors for a company.
         
@@ -3,14 +3,18 @@
 This module provides database operations for GNews article entities.
 Handles storage, retrieval, and cleanup of news articles from the GNews API.
 """
+import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from sqlalchemy import select, delete, and_
+from sqlalchemy import select, delete, and_, func, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.external_api import GNewsArticle
 
+logger = logging.getLogger(__name__)
+
 
 class GNewsRepository:
     """Repository for GNews article database operations.
@@ -63,6 +67,37 @@ class GNewsRepository:
 
         return articles
 
+    async def bulk_insert_articles(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many articles with a single statement and commit.
+
+        Rows whose article_id is already stored are skipped, so concurrent
+        ingestion runs never fail on the unique article_id constraint.
+
+        Args:
+            rows: Column dictionaries for new GNewsArticle rows
+
+        Returns:
+            Number of inserted articles
+        """
+        for attempt in range(2):
+            existing = await self.get_existing_article_ids([row["article_id"] for row in rows])
+            rows = [row for row in rows if row["article_id"] not in existing]
+            if not rows:
+                return 0
+
+            try:
+                await self.db.execute(insert(GNewsArticle), rows)
+                await self.db.commit()
+                return len(rows)
+            except IntegrityError:
+                # Another run stored some of these articles in the meantime
+                await self.db.rollback()
+                if attempt:
+                    raise
+                logger.debug("Concurrent article insert, retrying without stored articles")
+
+        return 0
+
     async def get_by_id(self, article_id: int) -> Optional[GNewsArticle]:
         """Get an article by its database ID.
 
@@ -91,6 +126,71 @@ class GNewsRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_existing_article_ids(self, article_ids: List[str]) -> Set[str]:
+        """Get which of the given GNews article IDs are already stored.
+
+        Args:
+            article_ids: GNews API article identifiers
+
+        Returns:
+            Set of article IDs that exist in the database
+        """
+        if not article_ids:
+            return set()
+
+        result = await self.db.execute(
+            select(GNewsArticle.article_id).where(
+                GNewsArticle.article_id.in_(set(article_ids))
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_latest_published_at(
+        self,
+        competitor_ids: List[int]
+    ) -> Dict[int, datetime]:
+        """Get the newest stored publish time for each competitor.
+
+        This is the high-water mark for incremental news fetches.
+
+        Args:
+            competitor_ids: IDs of the competitors
+
+        Returns:
+            Dictionary mapping competitor ID to its newest published_at
+        """
+        if not competitor_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(
+                GNewsArticle.competitor_id,
+                func.max(GNewsArticle.published_at).label("latest")
+            )
+            .where(GNewsArticle.competitor_id.in_(competitor_ids))
+            .group_by(GNewsArticle.competitor_id)
+        )
+        return {row.competitor_id: row.latest for row in result.all()}
+
+    async def get_recent_simhashes(self, since: datetime) -> List[int]:
+        """Get SimHashes of articles published since a point in time.
+
+        Args:
+            since: Only include articles published at or after this time
+
+        Returns:
+            List of stored SimHash values
+        """
+        result = await self.db.execute(
+            select(GNewsArticle.simhash).where(
+                and_(
+                    GNewsArticle.published_at >= since,
+                    GNewsArticle.simhash.isnot(None)
+                )
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_articles_by_competitor(
         self,
         competitor_id: int,
@@ -241,8 +341,6 @@ class GNewsRepository:
         Returns:
             Number of articles matching the criteria
         """
-        from sqlalchemy import func
-
         query = select(func.count(GNewsArticle.id)).where(
             GNewsArticle.competitor_id == competitor_id
         )
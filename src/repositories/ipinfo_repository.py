@@ -5,12 +5,26 @@ Handles storage, retrieval, and management of IP geolocation data
 from the IPInfo API.
 """
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, delete, update, and_
+from sqlalchemy import select, delete, update, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.external_api import IPInfoRecord
+from src.services.advanced_filtering import CountMode, paginate
+
+# Columns copied from a fresh API result onto an existing record
+UPSERT_FIELDS = (
+    "hostname",
+    "city",
+    "region",
+    "country",
+    "location",
+    "organization",
+    "postal",
+    "timezone",
+    "domain_id",
+)
 
 
 class IPInfoRepository:
@@ -58,15 +72,9 @@ class IPInfoRepository:
 
         if existing:
             # Update existing record
-            existing.hostname = ip_info.hostname
-            existing.city = ip_info.city
-            existing.region = ip_info.region
-            existing.country = ip_info.country
-            existing.location = ip_info.location
-            existing.organization = ip_info.organization
-            existing.postal = ip_info.postal
-            existing.timezone = ip_info.timezone
-            existing.domain_id = ip_info.domain_id
+            for field in UPSERT_FIELDS:
+                setattr(existing, field, getattr(ip_info, field))
+            existing.updated_at = func.now()
 
             await self.db.commit()
             await self.db.refresh(existing)
@@ -78,6 +86,57 @@ class IPInfoRepository:
             await self.db.refresh(ip_info)
             return ip_info
 
+    async def bulk_create_or_update(
+        self,
+        records: List[IPInfoRecord]
+    ) -> List[IPInfoRecord]:
+        """Create or update many IP info records in one transaction.
+
+        Existing records are looked up with a single IN query and updated in
+        place; new records are added together, so the flush issues one
+        multi-row INSERT and one batched UPDATE. Server-generated columns are
+        reloaded with a single SELECT instead of refreshing each row.
+
+        ON CONFLICT is not used because domain_id is nullable and NULLs never
+        conflict on the (ip_address, domain_id) unique index.
+
+        Args:
+            records: IPInfoRecord instances to create or update (the last
+                record wins when an IP address appears more than once)
+
+        Returns:
+            Created or updated IPInfoRecords, one per IP address
+        """
+        if not records:
+            return []
+
+        latest = {record.ip_address: record for record in records}
+        existing = await self.get_by_ips(list(latest))
+
+        saved: List[IPInfoRecord] = []
+        for ip_address, ip_info in latest.items():
+            current = existing.get(ip_address)
+            if current is None:
+                self.db.add(ip_info)
+                saved.append(ip_info)
+                continue
+            for field in UPSERT_FIELDS:
+                setattr(current, field, getattr(ip_info, field))
+            current.updated_at = func.now()
+            saved.append(current)
+
+        await self.db.flush()
+        record_ids = [record.id for record in saved]
+        await self.db.commit()
+
+        result = await self.db.execute(
+            select(IPInfoRecord)
+            .where(IPInfoRecord.id.in_(record_ids))
+            .execution_options(populate_existing=True)
+        )
+        by_id = {record.id: record for record in result.scalars().all()}
+        return [by_id.get(record_id, record) for record_id, record in zip(record_ids, saved)]
+
     async def get_by_id(self, record_id: int) -> Optional[IPInfoRecord]:
         """Get an IP info record by its database ID.
 
@@ -106,6 +165,34 @@ class IPInfoRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ips(self, ip_addresses: List[str]) -> Dict[str, IPInfoRecord]:
+        """Get IP info records for many IP addresses with a single query.
+
+        When an IP address has several records (one per domain), the most
+        recently refreshed one is returned.
+
+        Args:
+            ip_addresses: IP addresses to look up
+
+        Returns:
+            Dictionary mapping IP addresses to their IPInfoRecord
+        """
+        if not ip_addresses:
+            return {}
+
+        result = await self.db.execute(
+            select(IPInfoRecord)
+            .where(IPInfoRecord.ip_address.in_(set(ip_addresses)))
+            .order_by(
+                func.coalesce(IPInfoRecord.updated_at, IPInfoRecord.created_at).desc()
+            )
+        )
+
+        records: Dict[str, IPInfoRecord] = {}
+        for record in result.scalars().all():
+            records.setdefault(record.ip_address, record)
+        return records
+
     async def get_by_domain(self, domain_id: int) -> List[IPInfoRecord]:
         """Get all IP info records associated with a domain.
 
@@ -248,10 +335,34 @@ class IPInfoRepository:
         Returns:
             List of IPInfoRecord instances
         """
-        result = await self.db.execute(
-            select(IPInfoRecord)
-            .order_by(IPInfoRecord.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        records, _ = await paginate(
+            self.db, select(IPInfoRecord), IPInfoRecord, sort="-created_at",
+            page_size=limit, offset=offset, count=CountMode.NONE
+        )
+        return records
+
+    async def get_page(
+        self,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.NONE
+    ) -> Tuple[List[IPInfoRecord], Dict[str, Any]]:
+        """Get IP info records a keyset page at a time, newest first.
+
+        Unlike get_all, later pages cost the same as the first one.
+
+        Args:
+            page_size: Maximum number of records to return
+            cursor: next_cursor of the previous page
+            count: How the total is computed
+
+        Returns:
+            Tuple of (IPInfoRecord instances, pagination metadata)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        return await paginate(
+            self.db, select(IPInfoRecord), IPInfoRecord, sort="-created_at",
+            page_size=page_size, cursor=cursor, count=count
         )
-        return list(result.scalars().all())
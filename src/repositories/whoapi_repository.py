@@ -2,15 +2,21 @@
 
 This module provides database operations for WHOIS record entities.
 Handles storage, retrieval, and management of domain WHOIS data
-from the WhoAPI service.
+from the WhoAPI service, plus the per-facet cache used to build
+domain profiles.
 """
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple
 
 from sqlalchemy import select, delete, and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.external_api import WhoisRecord
+from src.models.external_api import WhoAPIFacetCache, WhoisRecord
+from src.services.advanced_filtering import CountMode, paginate
+
+logger = logging.getLogger(__name__)
 
 
 class WhoAPIRepository:
@@ -308,10 +314,143 @@ class WhoAPIRepository:
         Returns:
             List of WhoisRecord instances
         """
+        records, _ = await paginate(
+            self.db, select(WhoisRecord), WhoisRecord, sort="-updated_at",
+            page_size=limit, offset=offset, count=CountMode.NONE
+        )
+        return records
+
+    async def get_page(
+        self,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.NONE
+    ) -> Tuple[List[WhoisRecord], Dict[str, Any]]:
+        """Get WHOIS records a keyset page at a time, most recently updated first.
+
+        Unlike get_all, later pages cost the same as the first one.
+
+        Args:
+            page_size: Maximum number of records to return
+            cursor: next_cursor of the previous page
+            count: How the total is computed
+
+        Returns:
+            Tuple of (WhoisRecord instances, pagination metadata)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        return await paginate(
+            self.db, select(WhoisRecord), WhoisRecord, sort="-updated_at",
+            page_size=page_size, cursor=cursor, count=count
+        )
+
+    async def get_cached_facets(
+        self,
+        domain_names: List[str],
+        facets: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get unexpired cached facets for many domains in one query.
+
+        Args:
+            domain_names: Normalized domain names to look up
+            facets: Facet names to include (all facets if None)
+
+        Returns:
+            Dictionary mapping domain name to {facet: data}
+        """
+        if not domain_names:
+            return {}
+
+        query = select(WhoAPIFacetCache).where(
+            and_(
+                WhoAPIFacetCache.domain_name.in_([d.lower() for d in domain_names]),
+                WhoAPIFacetCache.expires_at > datetime.now(timezone.utc)
+            )
+        )
+        if facets:
+            query = query.where(WhoAPIFacetCache.facet.in_(facets))
+
+        result = await self.db.execute(query)
+
+        cached: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for row in result.scalars().all():
+            cached.setdefault(row.domain_name, {})[row.facet] = row.data
+        return cached
+
+    async def save_facets(
+        self,
+        facets: Dict[str, Dict[str, Dict[str, Any]]],
+        ttls: Dict[str, int]
+    ) -> int:
+        """Create or update cached facets for many domains in one commit.
+
+        Each facet expires after its own TTL, so slow-changing facets such
+        as SSL certificates are refetched less often than DNS records.
+
+        Args:
+            facets: Dictionary mapping domain name to {facet: data}
+            ttls: Cache lifetime in seconds for each facet name
+
+        Returns:
+            Number of facet rows written
+        """
+        if not facets:
+            return 0
+
+        facet_names = {facet for domain_facets in facets.values() for facet in domain_facets}
         result = await self.db.execute(
-            select(WhoisRecord)
-            .order_by(WhoisRecord.updated_at.desc())
-            .offset(offset)
-            .limit(limit)
+            select(WhoAPIFacetCache).where(
+                and_(
+                    WhoAPIFacetCache.domain_name.in_(list(facets)),
+                    WhoAPIFacetCache.facet.in_(facet_names)
+                )
+            )
         )
-        return list(result.scalars().all())
+        existing = {(row.domain_name, row.facet): row for row in result.scalars().all()}
+
+        now = datetime.now(timezone.utc)
+        written = 0
+        for domain_name, domain_facets in facets.items():
+            for facet, data in domain_facets.items():
+                expires_at = now + timedelta(seconds=ttls[facet])
+                row = existing.get((domain_name, facet))
+                if row:
+                    row.data = data
+                    row.fetched_at = now
+                    row.expires_at = expires_at
+                else:
+                    self.db.add(WhoAPIFacetCache(
+                        domain_name=domain_name,
+                        facet=facet,
+                        data=data,
+                        fetched_at=now,
+                        expires_at=expires_at
+                    ))
+                written += 1
+
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Another worker cached the same facet first; its copy is as fresh as ours
+            await self.db.rollback()
+            logger.debug("Concurrent WhoAPI facet cache write, keeping existing rows")
+            return 0
+
+        return written
+
+    async def delete_expired_facets(self) -> int:
+        """Delete cached facets whose TTL has passed.
+
+        Returns:
+            Number of deleted facet rows
+        """
+        result = await self.db.execute(
+            delete(WhoAPIFacetCache).where(
+                WhoAPIFacetCache.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+
+        return result.rowcount
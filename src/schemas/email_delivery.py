@@ -38,9 +38,12 @@ class EmailRecipientResponse(EmailRecipientBase):
 class EmailRecipientListResponse(BaseModel):
     """Schema for list of email recipients."""
     recipients: List[EmailRecipientResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class EmailDeliveryBase(BaseModel):
@@ -82,9 +85,12 @@ class EmailDeliveryResponse(EmailDeliveryBase):
 class EmailDeliveryListResponse(BaseModel):
     """Schema for list of email deliveries."""
     deliveries: List[EmailDeliveryResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class EmailDeliveryMetricsResponse(BaseModel):
@@ -58,9 +58,12 @@ class ReportScheduleResponse(ReportScheduleBase):
 class ReportScheduleListResponse(BaseModel):
     """Schema for list of report schedules."""
     schedules: List[ReportScheduleResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ScheduleExecutionResponse(BaseModel):
@@ -83,9 +86,12 @@ class ScheduleExecutionResponse(BaseModel):
 class ScheduleExecutionListResponse(BaseModel):
     """Schema for list of schedule executions."""
     executions: List[ScheduleExecutionResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ScheduleStatsResponse(BaseModel):
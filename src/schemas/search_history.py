@@ -38,9 +38,12 @@ class SearchHistoryResponse(SearchHistoryBase):
 class SearchHistoryListResponse(BaseModel):
     """Schema for list of search history records."""
     searches: List[SearchHistoryResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class SearchAnalyticsResponse(BaseModel):
@@ -39,6 +39,8 @@ class ScrapedContentResponse(BaseModel):
     error_message: Optional[str]
     scrape_duration_ms: Optional[float]
     metadata: Optional[Dict[str, Any]]
+    seen_count: Optional[int] = None
+    last_seen_at: Optional[datetime] = None
     created_at: datetime
 
     class Config:
@@ -55,9 +57,12 @@ class ScrapedContentDetailResponse(ScrapedContentResponse):
 class ScrapedContentListResponse(BaseModel):
     """Schema for list of scraped content."""
     content: List[ScrapedContentResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ContentVersionResponse(BaseModel):
@@ -135,6 +140,9 @@ class ScrapingScheduleResponse(ScrapingScheduleBase):
 class ScrapingScheduleListResponse(BaseModel):
     """Schema for list of scraping schedules."""
     schedules: List[ScrapingScheduleResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    page: Optional[int] = None
     page_size: int
+    has_next: bool = False
+    next_cursor: Optional[str] = None
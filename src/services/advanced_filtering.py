@@ -2,13 +2,45 @@
 
 This module provides comprehensive filtering, sorting, and pagination
 capabilities for all API endpoints, supporting complex query operations.
+
+Deep offset pages make the database walk and discard every skipped row,
+and an exact count scans the whole filtered set again. For large tables,
+pages can instead be fetched with keyset (cursor) pagination: the
+sort-key values of the last row are encoded in an opaque cursor, and the
+next page starts right after them using the sort index. Totals can be
+exact, a planner estimate, or skipped.
+
+Example:
+    stmt = select(SearchHistory).where(SearchHistory.user_id == user_id)
+    items, page_info = await paginate(
+        db, stmt, SearchHistory, sort="-created_at",
+        page_size=20, cursor=cursor, count=CountMode.ESTIMATE
+    )
 """
+import base64
+import binascii
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional, Tuple, Type
-from sqlalchemy import or_, and_, desc, asc, func
+import uuid
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import or_, and_, desc, asc, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
 from sqlalchemy.inspection import inspect
-from datetime import datetime
+from sqlalchemy.sql import Select
+
+from src.services.full_text_search import text_match, text_rank
+
+# Planner estimates below this are replaced by an exact count, which is
+# cheap for small results and avoids showing users a rough total
+EXACT_COUNT_THRESHOLD = int(os.getenv("PAGINATION_EXACT_COUNT_THRESHOLD", "10000"))
+
+# Query parameters consumed by pagination rather than used as filters
+PAGINATION_PARAMS = ['page', 'limit', 'offset', 'sort', 'order', 'search', 'cursor', 'count']
 
 
 class FilterOperator:
@@ -28,6 +60,7 @@ class FilterOperator:
     IS_NULL = "is_null"  # Is NULL
     NOT_NULL = "not_null"  # Is NOT NULL
     BETWEEN = "between"  # Between two values
+    SEARCH = "search"  # Full-text search (word match, index-backed)
 
     @classmethod
     def all(cls) -> List[str]:
@@ -35,10 +68,22 @@ class FilterOperator:
         return [
             cls.EQ, cls.NE, cls.GT, cls.GTE, cls.LT, cls.LTE,
             cls.CONTAINS, cls.ICONTAINS, cls.STARTSWITH, cls.ENDSWITH,
-            cls.IN, cls.NOT_IN, cls.IS_NULL, cls.NOT_NULL, cls.BETWEEN
+            cls.IN, cls.NOT_IN, cls.IS_NULL, cls.NOT_NULL, cls.BETWEEN,
+            cls.SEARCH
         ]
 
 
+class CountMode(str, Enum):
+    """How the total of a paginated listing is computed."""
+    EXACT = "exact"  # COUNT(*) over the filtered query
+    ESTIMATE = "estimate"  # Planner row estimate (PostgreSQL), exact when small
+    NONE = "none"  # No total; use has_next to detect the last page
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the sort."""
+
+
 class FilterParser:
     """Parser for filter query parameters.
 
@@ -101,6 +146,10 @@ class FilterParser:
             # Boolean value for null checks
             return value.lower() in ('true', '1', 'yes')
 
+        if operator == FilterOperator.SEARCH:
+            # Search text is never coerced
+            return value
+
         if operator == FilterOperator.IN or operator == FilterOperator.NOT_IN:
             # Split comma-separated list
             return [v.strip() for v in value.split(',')]
@@ -166,7 +215,7 @@ class AdvancedFilter:
         """
         for key, value in filters.items():
             # Skip pagination and sorting parameters
-            if key in ['page', 'limit', 'offset', 'sort', 'order', 'search']:
+            if key in PAGINATION_PARAMS:
                 continue
 
             # Parse filter expression
@@ -239,6 +288,8 @@ class AdvancedFilter:
         elif operator == FilterOperator.BETWEEN:
             if isinstance(value, tuple) and len(value) == 2:
                 query = query.filter(and_(attr >= value[0], attr <= value[1]))
+        elif operator == FilterOperator.SEARCH:
+            query = query.filter(text_match(str(value), attr))
 
         return query
 
@@ -296,7 +347,8 @@ class AdvancedFilter:
         query: Query,
         page: Optional[int] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        count: CountMode = CountMode.EXACT
     ) -> Tuple[Query, Dict[str, Any]]:
         """Apply pagination to a query.
 
@@ -305,6 +357,7 @@ class AdvancedFilter:
             page: Page number (1-indexed)
             limit: Items per page
             offset: Number of items to skip
+            count: How the total is computed
 
         Returns:
             Tuple of (paginated query, pagination metadata)
@@ -315,7 +368,7 @@ class AdvancedFilter:
         limit = min(limit, 100)  # Max 100 items per page
 
         # Calculate total count
-        total = query.count()
+        total, is_estimate = self._count(query, count)
 
         # Calculate offset
         if offset is None and page is not None:
@@ -329,30 +382,128 @@ class AdvancedFilter:
         # Calculate pagination metadata
         metadata = {
             'total': total,
+            'total_is_estimate': is_estimate,
             'limit': limit,
             'offset': offset,
             'page': (offset // limit) + 1 if limit > 0 else 1,
-            'pages': (total + limit - 1) // limit if limit > 0 else 1,
-            'has_next': offset + limit < total,
+            'pages': (total + limit - 1) // limit if limit > 0 and total is not None else None,
+            'has_next': offset + limit < total if total is not None else None,
             'has_prev': offset > 0
         }
 
         return query, metadata
 
+    def apply_keyset_pagination(
+        self,
+        query: Query,
+        model: Type,
+        sort_by: Optional[str] = None,
+        order: str = 'asc',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[Query, List[Tuple[Any, bool]]]:
+        """Apply keyset (cursor) pagination to a query.
+
+        The query is ordered by the sort fields plus the primary key, and
+        when a cursor is given only rows after it are selected. One extra
+        row is fetched so the caller can tell whether a next page exists;
+        pass the rows and the returned keys to build_page.
+
+        Args:
+            query: SQLAlchemy query (legacy Query or 2.0 select)
+            model: SQLAlchemy model class
+            sort_by: Field(s) to sort by, as for apply_sorting
+            order: Default sort order ('asc' or 'desc')
+            limit: Items per page
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Tuple of (paginated query, sort keys)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for
+                a different sort order
+        """
+        limit = min(limit or 50, 100)
+        keys = sort_keys(model, sort_by, order)
+
+        if cursor:
+            query = query.filter(keyset_condition(keys, decode_cursor(cursor, keys)))
+
+        return query.order_by(None).order_by(*_order_clauses(keys)).limit(limit + 1), keys
+
+    def build_page(
+        self,
+        rows: Sequence[Any],
+        keys: List[Tuple[Any, bool]],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Trim the look-ahead row of a keyset page and build its metadata.
+
+        Args:
+            rows: Rows fetched with apply_keyset_pagination
+            keys: Sort keys returned by apply_keyset_pagination
+            limit: Items per page
+            cursor: Cursor the page was fetched with
+
+        Returns:
+            Tuple of (page items, pagination metadata)
+        """
+        limit = min(limit or 50, 100)
+        items = list(rows[:limit])
+        has_next = len(rows) > limit
+
+        return items, {
+            'limit': limit,
+            'has_next': has_next,
+            'has_prev': cursor is not None,
+            'next_cursor': encode_cursor(items[-1], keys) if has_next else None
+        }
+
+    def _count(self, query: Query, count: CountMode) -> Tuple[Optional[int], bool]:
+        """Count the rows of a legacy query.
+
+        Args:
+            query: SQLAlchemy query
+            count: How the total is computed
+
+        Returns:
+            Tuple of (total or None, whether the total is an estimate)
+        """
+        if count == CountMode.NONE:
+            return None, False
+
+        if count == CountMode.ESTIMATE:
+            connection = query.session.connection()
+            sql, params = _explain_sql(query.statement, connection.dialect)
+            if sql is not None:
+                estimate = _plan_rows(connection.exec_driver_sql(sql, params).scalar())
+                if estimate >= EXACT_COUNT_THRESHOLD:
+                    return estimate, True
+
+        return query.count(), False
+
     def apply_full_text_search(
         self,
         query: Query,
         model: Type,
         search_query: str,
-        search_fields: List[str]
+        search_fields: List[str],
+        rank: bool = False
     ) -> Query:
         """Apply full-text search to specified fields.
 
+        Uses PostgreSQL text search (see src.services.full_text_search), so
+        the query matches whole words rather than substrings and can use
+        the GIN search indexes instead of scanning the table.
+
         Args:
             query: SQLAlchemy query
             model: SQLAlchemy model class
-            search_query: Search string
+            search_query: Search string (websearch syntax)
             search_fields: List of field names to search in
+            rank: Order results by relevance, best match first
 
         Returns:
             Filtered query
@@ -360,17 +511,17 @@ class AdvancedFilter:
         if not search_query or not search_fields:
             return query
 
-        # Build OR conditions for all search fields
-        conditions = []
+        columns = []
         for field_name in search_fields:
             try:
-                attr = getattr(model, field_name)
-                conditions.append(attr.ilike(f'%{search_query}%'))
+                columns.append(getattr(model, field_name))
             except AttributeError:
                 continue
 
-        if conditions:
-            query = query.filter(or_(*conditions))
+        if columns:
+            query = query.filter(text_match(search_query, *columns))
+            if rank:
+                query = query.order_by(text_rank(search_query, *columns).desc())
 
         return query
 
@@ -392,10 +543,11 @@ class AdvancedFilter:
         Returns:
             Tuple of (filtered/sorted/paginated query, pagination metadata)
         """
-        # Apply full-text search
+        # Apply full-text search, ranked unless an explicit sort is given
         if 'search' in params and search_fields:
             query = self.apply_full_text_search(
-                query, model, params['search'], search_fields
+                query, model, params['search'], search_fields,
+                rank=not params.get('sort')
             )
 
         # Apply filters
@@ -413,7 +565,308 @@ class AdvancedFilter:
             query,
             params.get('page'),
             params.get('limit'),
-            params.get('offset')
+            params.get('offset'),
+            CountMode(params.get('count', CountMode.EXACT))
         )
 
         return query, metadata
+
+
+def sort_keys(
+    model: Type,
+    sort_by: Optional[str] = None,
+    order: str = 'asc'
+) -> List[Tuple[Any, bool]]:
+    """Resolve a sort specification into keyset sort keys.
+
+    The primary key is appended as a tie-breaker so every row has a
+    unique position, which keyset pagination requires.
+
+    Args:
+        model: SQLAlchemy model class
+        sort_by: Field(s) to sort by (comma-separated, '-' prefix for desc)
+        order: Default sort order ('asc' or 'desc')
+
+    Returns:
+        List of (column, descending) pairs
+    """
+    keys: List[Tuple[Any, bool]] = []
+    for field in (sort_by or '').split(','):
+        field = field.strip()
+        descending = order == 'desc'
+        if field.startswith('-'):
+            field, descending = field[1:], True
+        elif field.startswith('+'):
+            field, descending = field[1:], False
+
+        attr = getattr(model, field, None) if field else None
+        if attr is not None and all(attr.key != key.key for key, _ in keys):
+            keys.append((attr, descending))
+
+    # Tie-break on the primary key in the direction of the last sort key
+    tie_descending = keys[-1][1] if keys else order == 'desc'
+    for column in model.__table__.primary_key.columns:
+        if all(column.key != key.key for key, _ in keys):
+            keys.append((getattr(model, column.key), tie_descending))
+
+    return keys
+
+
+def _nullable(attr: Any) -> bool:
+    """Check whether a sort key column can hold NULL."""
+    return getattr(attr.expression, 'nullable', True)
+
+
+def _order_clauses(keys: List[Tuple[Any, bool]]) -> List[Any]:
+    """ORDER BY clauses for sort keys, with NULL sorting as the largest value.
+
+    That is PostgreSQL's default ordering, so its btree indexes still apply.
+    """
+    clauses = []
+    for attr, descending in keys:
+        if descending:
+            clauses.append(desc(attr).nulls_first() if _nullable(attr) else desc(attr))
+        else:
+            clauses.append(asc(attr).nulls_last() if _nullable(attr) else asc(attr))
+    return clauses
+
+
+def keyset_condition(keys: List[Tuple[Any, bool]], values: Sequence[Any]) -> Any:
+    """Build the condition selecting rows that sort after the given values.
+
+    When every key is non-nullable and sorts the same way, this is a
+    single row-value comparison that maps onto a composite index range
+    scan. Otherwise it expands to (a > x) OR (a = x AND b > y) ...
+
+    Args:
+        keys: Sort keys as returned by sort_keys
+        values: Sort key values of the last row of the previous page
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1 and None not in values and not any(_nullable(a) for a, _ in keys):
+        columns = tuple_(*[attr for attr, _ in keys])
+        bound = tuple_(*values)
+        return columns < bound if directions.pop() else columns > bound
+
+    clauses = []
+    equal: List[Any] = []
+    for (attr, descending), value in zip(keys, values):
+        if value is None:
+            # NULL sorts last ascending and first descending
+            after = attr.isnot(None) if descending else None
+            same = attr.is_(None)
+        else:
+            if descending:
+                after = attr < value
+            else:
+                after = or_(attr > value, attr.is_(None)) if _nullable(attr) else attr > value
+            same = attr == value
+        if after is not None:
+            clauses.append(and_(*equal, after))
+        equal.append(same)
+
+    return or_(*clauses)
+
+
+def _encode_value(value: Any) -> Any:
+    """Make a sort key value JSON-serializable, tagging non-JSON types."""
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {'uuid': str(value)}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Reverse _encode_value."""
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        if 'uuid' in value:
+            return uuid.UUID(value['uuid'])
+    return value
+
+
+def encode_cursor(row: Any, keys: List[Tuple[Any, bool]]) -> str:
+    """Encode the sort key values of a row as an opaque cursor.
+
+    Args:
+        row: Last row of a page (model instance)
+        keys: Sort keys the page was fetched with
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {
+        'k': [f"{'-' if descending else ''}{attr.key}" for attr, descending in keys],
+        'v': [_encode_value(getattr(row, attr.key)) for attr, _ in keys]
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, keys: List[Tuple[Any, bool]]) -> List[Any]:
+    """Decode a cursor into sort key values.
+
+    Args:
+        cursor: Cursor returned with a previous page
+        keys: Sort keys of the current request
+
+    Returns:
+        Sort key values of the row the cursor points after
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for
+            a different sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        fields, values = payload['k'], [_decode_value(v) for v in payload['v']]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}") from e
+
+    expected = [f"{'-' if descending else ''}{attr.key}" for attr, descending in keys]
+    if fields != expected or len(values) != len(keys):
+        raise InvalidCursorError("Pagination cursor does not match the sort order")
+    return values
+
+
+def _explain_sql(stmt: Any, dialect: Any) -> Tuple[Optional[str], Any]:
+    """Render EXPLAIN for a statement with driver-level parameters.
+
+    Args:
+        stmt: SQLAlchemy selectable
+        dialect: Dialect of the connection it will run on
+
+    Returns:
+        Tuple of (SQL, parameters), or (None, None) if the dialect has no
+        JSON EXPLAIN output
+    """
+    if dialect.name != 'postgresql':
+        return None, None
+
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+
+
+def _plan_rows(plan: Any) -> int:
+    """Read the estimated row count from EXPLAIN (FORMAT JSON) output."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+async def count_rows(
+    db: AsyncSession,
+    stmt: Select,
+    count: CountMode = CountMode.EXACT
+) -> Tuple[Optional[int], bool]:
+    """Count the rows a select statement returns.
+
+    Args:
+        db: Database session
+        stmt: Filtered select statement
+        count: How the total is computed
+
+    Returns:
+        Tuple of (total or None, whether the total is an estimate)
+    """
+    if count == CountMode.NONE:
+        return None, False
+
+    stmt = stmt.order_by(None).limit(None).offset(None)
+
+    if count == CountMode.ESTIMATE:
+        connection = await db.connection()
+        sql, params = _explain_sql(stmt, connection.dialect)
+        if sql is not None:
+            result = await connection.exec_driver_sql(sql, params)
+            estimate = _plan_rows(result.scalar())
+            if estimate >= EXACT_COUNT_THRESHOLD:
+                return estimate, True
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    return result.scalar() or 0, False
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    model: Type,
+    sort: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT,
+    filters: Optional[Dict[str, Any]] = None,
+    offset: Optional[int] = None
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """Fetch one page of a select statement.
+
+    With a cursor the page starts right after the cursor row (keyset
+    pagination) and page and offset are ignored; otherwise the page (or an
+    explicit offset) is skipped.
+    Either way the response carries a next_cursor, so clients can switch
+    to cursors after the first page.
+
+    Args:
+        db: Database session
+        stmt: Select statement with the endpoint's own filters applied
+        model: SQLAlchemy model class being listed
+        sort: Sort fields (comma-separated, '-' prefix for desc); the
+            primary key is always added as a tie-breaker
+        page: Page number (1-indexed), used when no cursor is given
+        page_size: Items per page
+        cursor: Cursor returned with the previous page
+        count: How the total is computed
+        filters: Optional field__operator filters applied with FilterParser
+        offset: Number of rows to skip; overrides page
+
+    Returns:
+        Tuple of (page items, pagination metadata)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for
+            a different sort order
+    """
+    advanced_filter = AdvancedFilter()
+    if filters:
+        stmt = advanced_filter.apply_filters(stmt, model, filters)
+
+    total, is_estimate = await count_rows(db, stmt, count)
+
+    keys = sort_keys(model, sort)
+    if cursor:
+        stmt = stmt.where(keyset_condition(keys, decode_cursor(cursor, keys)))
+    else:
+        if offset is None:
+            offset = (page - 1) * page_size
+        stmt = stmt.offset(offset)
+
+    result = await db.execute(
+        stmt.order_by(None).order_by(*_order_clauses(keys)).limit(page_size + 1)
+    )
+    rows = result.scalars().all()
+
+    items, metadata = advanced_filter.build_page(rows, keys, page_size, cursor)
+    metadata.update({
+        'total': total,
+        'total_is_estimate': is_estimate,
+        'page': None if cursor else offset // page_size + 1,
+        'page_size': page_size,
+        'has_prev': cursor is not None or offset > 0
+    })
+    return items, metadata
@@ -8,7 +8,7 @@ import json
 import re
 import uuid
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -23,6 +23,7 @@ from src.schemas.brand_discovery_chat import (
     FinalizeResponse,
 )
 from src.services.ai.llm_service import LLMService
+from src.services.ai.llm_streaming import JSONFieldStream
 from src.services.llm_provider import FallbackManager
 from src.models.llm_fallback import LLMProvider
 from src.models.report import Report
@@ -186,45 +187,35 @@ class BrandDiscoveryChatService:
         Raises:
             ValueError: If session not found or not active
         """
-        # Get session
-        session = self._get_session(session_id)
-
-        if session.status != 'active':
-            raise ValueError(f"Session {session_id} is not active (status: {session.status})")
-
-        # Add user message
-        self._add_message(session, "user", user_message)
+        session = self._start_turn(session_id, user_message)
 
         # Get AI response with extraction
         ai_response, updated_data = await self._generate_response(session, user_message)
 
-        # Update extracted data
-        session.extracted_data.update(updated_data)
+        return self._complete_turn(session, ai_response, updated_data)
 
-        # Add AI response
-        self._add_message(session, "assistant", ai_response)
-
-        # Calculate progress
-        progress_pct = self._calculate_progress(session.extracted_data)
-        is_complete = self._is_complete(session.extracted_data)
+    def stream_message(self, session_id: uuid.UUID, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+        """Process user message and stream the AI response as it is generated.
 
-        # Mark as completed if done
-        if is_complete:
-            session.status = 'completed'
+        The session is validated before streaming starts, so errors surface
+        before any output is sent. The returned iterator yields:
+        - {"type": "token", "content": ...} for each piece of the AI response
+        - {"type": "reset"} when the text streamed so far must be discarded
+          (the LLM provider failed mid-answer and another one took over)
+        - {"type": "done", "message": ChatMessageResponse} once the turn is stored
 
-        session.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(session)
+        Args:
+            session_id: Chat session ID
+            user_message: User's message
 
-        logger.info(f"Processed message for session {session_id}, progress: {progress_pct}%")
+        Returns:
+            Async iterator of stream events
 
-        return ChatMessageResponse(
-            ai_response=ai_response,
-            progress_pct=progress_pct,
-            extracted_data=ExtractedData(**session.extracted_data),
-            is_complete=is_complete,
-            session_id=session.session_id
-        )
+        Raises:
+            ValueError: If session not found or not active
+        """
+        session = self._start_turn(session_id, user_message)
+        return self._stream_response(session, user_message)
 
     def get_conversation_state(self, session_id: uuid.UUID) -> ConversationState:
         """Get current state of conversation.
@@ -297,6 +288,97 @@ class BrandDiscoveryChatService:
 
     # Private helper methods
 
+    async def _stream_response(
+        self,
+        session: BrandDiscoveryChatSession,
+        user_message: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the AI response of a turn started with _start_turn()."""
+        response_field = JSONFieldStream("response")
+
+        try:
+            content = '{}'
+            async for event in self.llm_service.stream_chat_completion(
+                messages=self._build_llm_messages(session, user_message),
+                tenant_id=session.user_id,
+                temperature=0.7,
+                max_tokens=500,
+                response_format={"type": "json_object"}
+            ):
+                if event["type"] == "delta":
+                    text = response_field.feed(event["content"])
+                    if text:
+                        yield {"type": "token", "content": text}
+                elif event["type"] == "reset":
+                    response_field.reset()
+                    yield {"type": "reset"}
+                elif event["type"] == "done":
+                    content = event["response"].get("content") or '{}'
+
+            ai_response, updated_data = self._parse_llm_content(content)
+
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+
+            # Fallback to simple rule-based extraction
+            ai_response, updated_data = self._fallback_extraction(session.extracted_data, user_message)
+
+        # Replace the streamed text if the final answer differs (e.g. fallback)
+        if response_field.value != ai_response:
+            if response_field.value:
+                yield {"type": "reset"}
+            yield {"type": "token", "content": ai_response}
+
+        yield {"type": "done", "message": self._complete_turn(session, ai_response, updated_data)}
+
+    def _start_turn(self, session_id: uuid.UUID, user_message: str) -> BrandDiscoveryChatSession:
+        """Validate the session and record the user's message."""
+        # Get session
+        session = self._get_session(session_id)
+
+        if session.status != 'active':
+            raise ValueError(f"Session {session_id} is not active (status: {session.status})")
+
+        # Add user message
+        self._add_message(session, "user", user_message)
+
+        return session
+
+    def _complete_turn(
+        self,
+        session: BrandDiscoveryChatSession,
+        ai_response: str,
+        updated_data: Dict[str, Any]
+    ) -> ChatMessageResponse:
+        """Store the AI response and extracted data of a turn."""
+        # Update extracted data
+        session.extracted_data.update(updated_data)
+
+        # Add AI response
+        self._add_message(session, "assistant", ai_response)
+
+        # Calculate progress
+        progress_pct = self._calculate_progress(session.extracted_data)
+        is_complete = self._is_complete(session.extracted_data)
+
+        # Mark as completed if done
+        if is_complete:
+            session.status = 'completed'
+
+        session.updated_at = datetime.utcnow()
+        self.db.commit()
+        self.db.refresh(session)
+
+        logger.info(f"Processed message for session {session.session_id}, progress: {progress_pct}%")
+
+        return ChatMessageResponse(
+            ai_response=ai_response,
+            progress_pct=progress_pct,
+            extracted_data=ExtractedData(**session.extracted_data),
+            is_complete=is_complete,
+            session_id=session.session_id
+        )
+
     def _get_session(self, session_id: uuid.UUID) -> BrandDiscoveryChatSession:
         """Get session by ID or raise error."""
         session = self.db.query(BrandDiscoveryChatSession).filter(
@@ -330,41 +412,17 @@ class BrandDiscoveryChatService:
         Returns:
             Tuple of (AI response text, extracted data dict)
         """
-        # Build conversation history
-        conversation_history = self._build_conversation_context(session)
-
-        # Build prompt for LLM
-        prompt = self._build_extraction_prompt(
-            conversation_history=conversation_history,
-            current_data=session.extracted_data,
-            user_message=user_message
-        )
-
         try:
             # Use LLM service for chat completion with JSON mode
-            messages = [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-
             result = await self.llm_service.chat_completion(
-                messages=messages,
+                messages=self._build_llm_messages(session, user_message),
+                tenant_id=session.user_id,
                 temperature=0.7,
                 max_tokens=500,
                 response_format={"type": "json_object"}
             )
 
-            # Parse response (should be JSON)
-            content = result.get('content', '{}')
-            response_data = json.loads(content)
-
-            ai_response = response_data.get('response', 'Could you tell me more?')
-            extracted = response_data.get('extracted', {})
-
-            # Clean extracted data
-            extracted = self._clean_extracted_data(extracted)
-
-            return ai_response, extracted
+            return self._parse_llm_content(result.get('content', '{}'))
 
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}")
@@ -373,6 +431,35 @@ class BrandDiscoveryChatService:
             ai_response, extracted = self._fallback_extraction(session.extracted_data, user_message)
             return ai_response, extracted
 
+    def _build_llm_messages(self, session: BrandDiscoveryChatSession, user_message: str) -> List[Dict[str, str]]:
+        """Build the LLM chat messages for the user's latest message."""
+        # Build conversation history
+        conversation_history = self._build_conversation_context(session)
+
+        # Build prompt for LLM
+        prompt = self._build_extraction_prompt(
+            conversation_history=conversation_history,
+            current_data=session.extracted_data,
+            user_message=user_message
+        )
+
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_llm_content(self, content: str) -> Tuple[str, Dict[str, Any]]:
+        """Parse the LLM's JSON answer into (AI response text, cleaned extracted data)."""
+        response_data = json.loads(content)
+
+        ai_response = response_data.get('response', 'Could you tell me more?')
+        extracted = response_data.get('extracted', {})
+
+        # Clean extracted data
+        extracted = self._clean_extracted_data(extracted)
+
+        return ai_response, extracted
+
     def _build_conversation_context(self, session: BrandDiscoveryChatSession) -> str:
         """Build conversation history for context."""
         if not session.messages:
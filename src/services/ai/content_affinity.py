@@ -1,4 +1,3 @@
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import json
@@ -9,17 +8,18 @@ from src.models.ai import AIInsight, InsightType
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-import torch
 
 from src.services.ai.llm_service import LLMService, LLMProvider
 from src.services.ai.chain_of_thought import ChainOfThoughtReasoning
+from src.services.ai.embedding_service import get_embedding_service
+from src.services.ai.vector_index import CONTENT_EMBEDDING_MODEL, content_embedding_text, get_content_vector_index
 
 logger = logging.getLogger(__name__)
 
 class ContentAffinityService:
     def __init__(self):
-        # Initialize sentence transformer model for embedding-based similarity
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Shared sentence embedding model and vector cache for embedding-based similarity
+        self.embeddings = get_embedding_service(CONTENT_EMBEDDING_MODEL)
         
         # Initialize LLM service for enhanced semantic comparisons and fallback
         self.llm_service = LLMService()
@@ -84,10 +84,10 @@ class ContentAffinityService:
                         {"status": "text_extracted", "sample": target_text[:100] + "..." if len(target_text) > 100 else target_text}
                     )
                 
-                # Generate embeddings
-                with torch.no_grad():
-                    target_embedding = self.model.encode([target_text])[0]
-                    comparison_embeddings = self.model.encode(comparison_texts)
+                # Generate embeddings (cached texts are not re-encoded)
+                embeddings = await self.embeddings.aencode([target_text] + comparison_texts)
+                target_embedding = embeddings[0]
+                comparison_embeddings = embeddings[1:]
                 
                 if reasoning:
                     reasoning.add_step(
@@ -234,27 +234,38 @@ class ContentAffinityService:
             await db.rollback()
             raise e
             
+    async def find_similar_content(
+        self,
+        target_content: Content,
+        db: AsyncSession,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Find the content most similar to a target within its owner's library
+
+        Uses the per-tenant vector index instead of comparing against every item.
+        """
+        hits = await get_content_vector_index().similar_to(target_content, k=limit, sync=True)
+        if not hits:
+            return []
+
+        result = await db.execute(
+            select(Content).where(Content.id.in_([content_id for content_id, _ in hits]))
+        )
+        contents = {content.id: content for content in result.scalars().all()}
+
+        return [
+            {
+                "content": contents[content_id],
+                "score": max(0.0, min(1.0, score)),
+                "explanation": self._generate_affinity_explanation(target_content, contents[content_id], score)
+            }
+            for content_id, score in hits
+            if content_id in contents
+        ]
+
     def _extract_text(self, content: Content) -> str:
         """Extract text from content based on its type"""
-        if not content:
-            return ""
-            
-        text_parts = []
-        
-        # Add title if present
-        if content.title:
-            text_parts.append(content.title)
-            
-        # Add content text if present
-        if content.content_text:
-            text_parts.append(content.content_text)
-            
-        # Add any additional metadata text if present
-        if content.content_metadata and isinstance(content.content_metadata, dict):
-            metadata_text = " ".join(str(v) for v in content.content_metadata.values())
-            text_parts.append(metadata_text)
-            
-        return " ".join(text_parts)
+        return content_embedding_text(content)
         
     async def _generate_enhanced_scores(self, 
                                       target_content: Content, 
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
 from src.database.utils import get_db_session
+from src.services.ai.vector_index import get_content_vector_index
 from sqlalchemy import select
 
 class RecommendationType(Enum):
@@ -107,27 +108,36 @@ class ContentRecommendationService:
         """Get the current model version."""
         return self.model_version
     
-    async def get_similar_content(self, content_id: int) -> List[ContentSimilarity]:
-        """Get similar content based on content similarity."""
+    async def get_similar_content(self, content_id: int, limit: int = 10) -> List[ContentSimilarity]:
+        """Get similar content from the owner's library using the content vector index."""
         if content_id < 0:
             raise ValueError("Content ID must be positive")
-            
+
         async with get_db_session() as session:
-            result = await session.execute(select(Content))
-            similar_content = result.scalars().all()
-            if not similar_content:
+            result = await session.execute(select(Content).where(Content.id == content_id))
+            target = result.scalar_one_or_none()
+            if not target:
                 return []
-            
-            similarities = []
-            for content in similar_content:
-                if content.id != content_id and content.metadata:
-                    similarities.append(ContentSimilarity(
-                        content_id=content_id,
-                        score=0.8,  # Mock score, in real app would use NLP
-                        similarity_type="category",
-                        metadata=content.metadata
-                    ))
-            return similarities
+
+            hits = await get_content_vector_index().similar_to(target, k=limit, sync=True)
+            if not hits:
+                return []
+
+            result = await session.execute(
+                select(Content).where(Content.id.in_([hit_id for hit_id, _ in hits]))
+            )
+            contents = {content.id: content for content in result.scalars().all()}
+
+            return [
+                ContentSimilarity(
+                    content_id=hit_id,
+                    score=max(0.0, min(1.0, score)),
+                    similarity_type="embedding",
+                    metadata=contents[hit_id].content_metadata or {}
+                )
+                for hit_id, score in hits
+                if hit_id in contents
+            ]
 
     async def get_personalized_recommendations(self, user_id: str) -> List[RecommendationScore]:
         """Get personalized recommendations for a user."""
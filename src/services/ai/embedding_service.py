@@ -0,0 +1,273 @@
+"""
+Shared Embedding Service
+
+This module provides one process-wide sentence embedding service per model so
+that semantic analysis and content affinity share a single loaded model and a
+single vector cache instead of each loading a transformer and re-encoding the
+same text on every call.
+
+- Models are loaded lazily on first use.
+- Inputs are encoded in batches (sentence-transformers pads each batch only to
+  its longest member).
+- Vectors are cached by a hash of the model name and text: in process memory
+  and in a persistent store on local disk or in Redis, so repeated runs over
+  the same corpus skip re-encoding.
+
+Example:
+    embeddings = get_embedding_service("all-MiniLM-L6-v2")
+    vectors = await embeddings.aencode(["first text", "second text"])
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Sequence
+
+import numpy as np
+
+from src.core.local_cache import LocalCache
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+class DiskVectorStore:
+    """Stores vectors as ``.npy`` files sharded by hash prefix."""
+
+    def __init__(self, directory: str):
+        """Initialize the store.
+
+        Args:
+            directory: Root directory for vector files
+        """
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.npy")
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Load the vectors that exist for the given keys."""
+        found = {}
+        for key in keys:
+            try:
+                found[key] = np.load(self._path(key))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"Unreadable cached embedding {key[:12]}: {e}")
+        return found
+
+    def set_many(self, vectors: Dict[str, np.ndarray]):
+        """Write vectors (atomically, so readers never see partial files)."""
+        for key, vector in vectors.items():
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, vector)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not cache embedding {key[:12]}: {e}")
+
+
+class RedisVectorStore:
+    """Stores vectors as raw float32 bytes in Redis."""
+
+    def __init__(self, client, ttl: int = 30 * 86400, prefix: str = "onside:embedding:"):
+        """Initialize the store.
+
+        Args:
+            client: Synchronous redis.Redis client
+            ttl: Expiry of cached vectors in seconds
+            prefix: Key prefix
+        """
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Load the vectors that exist for the given keys with one MGET."""
+        try:
+            values = self.client.mget([self.prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return {}
+
+        return {
+            key: np.frombuffer(value, dtype=np.float32)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    def set_many(self, vectors: Dict[str, np.ndarray]):
+        """Write vectors with one pipelined round trip."""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, vector in vectors.items():
+                pipe.setex(self.prefix + key, self.ttl, vector.astype(np.float32).tobytes())
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+
+class EmbeddingService:
+    """Batched, cached sentence embeddings for one model."""
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        store=None,
+        batch_size: int = 32,
+        model=None
+    ):
+        """Initialize the service.
+
+        Args:
+            model_name: sentence-transformers model name
+            store: Persistent vector store (DiskVectorStore, RedisVectorStore
+                or None for in-process caching only)
+            batch_size: Number of texts per forward pass
+            model: Preloaded model (loaded lazily from model_name if not provided)
+        """
+        self.model_name = model_name
+        self.store = store
+        self.batch_size = batch_size
+        self._model = model
+        self._load_lock = threading.Lock()
+        self._encode_lock = threading.Lock()
+        self._local = LocalCache(f"embeddings:{model_name}")
+        self._stats = {"requested": 0, "cache_hits": 0, "encoded": 0}
+
+    @property
+    def model(self):
+        """The sentence-transformers model, loaded on first use."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+                        raise RuntimeError("sentence-transformers is required for embeddings")
+                    logger.info(f"Loading embedding model {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, encoding only those not already cached.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        keys = [self._key(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+
+        for key in set(keys):
+            vector = self._local.get(key)
+            if vector is not None:
+                vectors[key] = vector
+
+        missing = [key for key in set(keys) if key not in vectors]
+        if missing and self.store is not None:
+            stored = self.store.get_many(missing)
+            for key, vector in stored.items():
+                self._local.set(key, vector, size=vector.nbytes)
+            vectors.update(stored)
+
+        to_encode = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        self._stats["requested"] += len(texts)
+        self._stats["cache_hits"] += len(texts) - sum(1 for key in keys if key in to_encode)
+
+        if to_encode:
+            with self._encode_lock:
+                encoded = self.model.encode(
+                    list(to_encode.values()),
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+            encoded = np.asarray(encoded, dtype=np.float32)
+            new_vectors = dict(zip(to_encode.keys(), encoded))
+
+            for key, vector in new_vectors.items():
+                self._local.set(key, vector, size=vector.nbytes)
+            if self.store is not None:
+                self.store.set_many(new_vectors)
+
+            vectors.update(new_vectors)
+            self._stats["encoded"] += len(new_vectors)
+
+        return np.stack([vectors[key] for key in keys])
+
+    async def aencode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts without blocking the event loop."""
+        return await asyncio.to_thread(self.encode, list(texts))
+
+    def stats(self) -> Dict[str, int]:
+        """Request, cache hit and encode counters."""
+        return dict(self._stats)
+
+
+def _default_vector_store():
+    """Build the persistent vector store selected by EMBEDDING_CACHE_BACKEND."""
+    backend = os.getenv("EMBEDDING_CACHE_BACKEND", "disk").lower()
+
+    if backend == "redis" and REDIS_AVAILABLE:
+        redis_url = os.getenv("EMBEDDING_CACHE_REDIS_URL") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return RedisVectorStore(
+            redis.Redis.from_url(redis_url),
+            ttl=int(os.getenv("EMBEDDING_CACHE_TTL", str(30 * 86400)))
+        )
+
+    if backend == "disk":
+        return DiskVectorStore(
+            os.getenv("EMBEDDING_CACHE_DIR", os.path.expanduser("~/.cache/onside/embeddings"))
+        )
+
+    return None
+
+
+# Global embedding services, one per model
+_embedding_services: Dict[str, EmbeddingService] = {}
+_registry_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: str = DEFAULT_EMBEDDING_MODEL) -> EmbeddingService:
+    """
+    Get or create the shared embedding service for a model.
+
+    Args:
+        model_name: sentence-transformers model name
+
+    Returns:
+        EmbeddingService instance
+    """
+    with _registry_lock:
+        if model_name not in _embedding_services:
+            _embedding_services[model_name] = EmbeddingService(
+                model_name,
+                store=_default_vector_store(),
+                batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+            )
+        return _embedding_services[model_name]
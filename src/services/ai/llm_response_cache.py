@@ -0,0 +1,259 @@
+"""
+LLM Response Cache
+
+This module caches LLM completions so that identical prompts (same normalized
+messages, model, temperature and parameters) are answered from cache instead
+of being sent to the provider again, e.g. when a report is regenerated or
+several users analyze the same competitor.
+
+- Keys are scoped per tenant so cached answers never cross tenants.
+  Requests without a tenant get no key and are neither cached nor
+  coalesced.
+- Responses are stored through the shared AsyncCacheService (Redis with a
+  local near-cache, or memory only) with a TTL.
+- Identical requests already in flight are coalesced (single-flight): only
+  the first caller reaches the provider and the others await its result.
+
+Example:
+    cache = get_llm_response_cache()
+    key = cache.make_key(messages, model="gpt-4o", temperature=0.3, tenant_id=user_id)
+    response = await cache.get_or_call(key, lambda: client.complete(messages))
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from src.services.cache_service import AsyncCacheService, get_cache_service
+
+logger = logging.getLogger(__name__)
+
+CACHE_CATEGORY = "llm"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_text(text: Any) -> str:
+    """Collapse whitespace so formatting-only differences share a key."""
+    return _WHITESPACE.sub(" ", str(text)).strip()
+
+
+def normalize_messages(messages: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, str]]:
+    """Normalize a prompt or chat messages into a canonical message list."""
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    return [
+        {"role": str(message.get("role", "user")), "content": _normalize_text(message.get("content", ""))}
+        for message in messages
+    ]
+
+
+class LLMResponseCache:
+    """Tenant-scoped LLM response cache with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        cache: Optional[AsyncCacheService] = None,
+        ttl: int = int(os.getenv("LLM_CACHE_TTL", "3600")),
+        enabled: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    ):
+        """Initialize the response cache.
+
+        Args:
+            cache: Cache service (global cache service if not provided)
+            ttl: Time to live of cached responses in seconds
+            enabled: Whether responses are cached (coalescing always applies)
+        """
+        self._cache = cache
+        self.ttl = ttl
+        self.enabled = enabled
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "errors": 0
+        }
+
+    @property
+    def cache(self) -> AsyncCacheService:
+        if self._cache is None:
+            self._cache = get_cache_service()
+        return self._cache
+
+    def make_key(
+        self,
+        messages: Union[str, List[Dict[str, Any]]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        tenant_id: Optional[Any] = None,
+        **params
+    ) -> Optional[str]:
+        """Build the cache key for a request.
+
+        Args:
+            messages: Prompt string or chat messages
+            model: Model (or provider) name
+            temperature: Sampling temperature
+            tenant_id: Tenant the response may be shared within
+            **params: Other parameters that change the response (max_tokens, ...)
+
+        Returns:
+            Cache key, or None if there is no tenant to scope the response to
+        """
+        if tenant_id is None:
+            return None
+
+        payload = json.dumps(
+            {
+                "messages": normalize_messages(messages),
+                "model": model,
+                "temperature": round(float(temperature), 3) if temperature is not None else None,
+                "params": params
+            },
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{tenant_id}:{digest}"
+
+    async def get_or_call(
+        self,
+        key: Optional[str],
+        call: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        cacheable: Callable[[Any], bool] = lambda response: True
+    ) -> Any:
+        """Return the cached response for key, or make the call once.
+
+        Args:
+            key: Cache key from make_key(); None makes the call uncached
+            call: Coroutine function performing the upstream request
+            ttl: Time to live in seconds (uses the cache default if None)
+            cacheable: Predicate deciding whether a response may be stored
+
+        Returns:
+            LLM response (a copy when shared, so callers may modify it)
+        """
+        if key is None:
+            return await call()
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return copy.deepcopy(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                # Only make the call ourselves if the leading request was cancelled
+                if not inflight.cancelled():
+                    raise
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so unshared failures are not logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if cacheable(response):
+                await self.set(key, response, ttl=ttl)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get(self, key: Optional[str]) -> Optional[Any]:
+        """Return a copy of the cached response for key, or None.
+
+        Unlike get_or_call() this never calls the provider, e.g. for streamed
+        completions that are produced elsewhere and stored with set().
+        """
+        if key is None:
+            return None
+        cached = await self._lookup(key)
+        if cached is None:
+            self._stats["misses"] += 1
+        return cached
+
+    async def set(self, key: Optional[str], response: Any, ttl: Optional[int] = None) -> bool:
+        """Store a copy of a response.
+
+        Returns:
+            True if the response was stored
+        """
+        if not self.enabled or key is None:
+            return False
+        stored = await self.cache.set(
+            key, copy.deepcopy(response), ttl=ttl if ttl is not None else self.ttl, category=CACHE_CATEGORY
+        )
+        self._stats["stores" if stored else "errors"] += 1
+        return stored
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        cached = await self.cache.get(key, category=CACHE_CATEGORY)
+        if cached is None:
+            return None
+        self._stats["hits"] += 1
+        return copy.deepcopy(cached)
+
+    async def invalidate_tenant(self, tenant_id: Any) -> int:
+        """Drop all cached responses of a tenant.
+
+        Returns:
+            Number of entries removed
+        """
+        return await self.cache.clear_pattern(f"{tenant_id}:*", category=CACHE_CATEGORY)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit, miss and coalescing counters."""
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["coalesced"]
+        return {
+            **self._stats,
+            "in_flight": len(self._inflight),
+            "hit_rate": round((self._stats["hits"] + self._stats["coalesced"]) / lookups, 4) if lookups else 0.0,
+            "enabled": self.enabled,
+            "ttl": self.ttl
+        }
+
+    def reset_stats(self):
+        """Reset the counters."""
+        for name in self._stats:
+            self._stats[name] = 0
+
+
+# Global LLM response cache instance
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """
+    Get or create the global LLM response cache.
+
+    Returns:
+        LLMResponseCache instance
+    """
+    global _llm_response_cache
+
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache()
+
+    return _llm_response_cache
@@ -12,7 +12,7 @@ import random
 import asyncio
 import logging
 from enum import Enum
-from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+from typing import AsyncIterator, Dict, List, Any, Optional, Callable, Union, Tuple
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 import httpx
@@ -27,9 +27,15 @@ from tenacity import (
 )
 
 from src.services.ai.chain_of_thought import ChainOfThoughtReasoning
+from src.services.ai.llm_response_cache import LLMResponseCache, get_llm_response_cache
+from src.services.llm_provider.routing import ProviderUnavailableError, estimate_tokens, get_provider_router
 
 logger = logging.getLogger(__name__)
 
+# Defaults of the OpenAI chat call, also used to key cached responses
+DEFAULT_CHAT_MODEL = "gpt-4o"
+DEFAULT_TEMPERATURE = 0.7
+
 # Config classes for LLM providers
 class LLMProviderConfig(BaseModel):
     """Base configuration for an LLM provider"""
@@ -144,13 +150,18 @@ class LLMService:
     - Multiple LLM provider support
     - Automatic fallback between providers
     - Circuit breaker pattern to prevent cascading failures
+    - Latency-aware provider ordering, adaptive concurrency limits and
+      shared token budgets (see src.services.llm_provider.routing)
     - Retry mechanisms with exponential backoff
     - Chain-of-thought reasoning integration
     - Comprehensive logging
     """
     
-    def __init__(self):
+    def __init__(self, response_cache: Optional[LLMResponseCache] = None):
         """Initialize the LLM service with providers and circuit breakers"""
+        self.response_cache = response_cache or get_llm_response_cache()
+        self.router = get_provider_router()
+        
         # Configure LLM providers
         self.providers = {
             LLMProvider.OPENAI: LLMProviderConfig(
@@ -236,17 +247,30 @@ class LLMService:
         
         return available_providers
     
+    def _route(self, providers: List[LLMProvider]) -> List[LLMProvider]:
+        """Order providers by measured latency and errors, keeping the rule-based fallback last"""
+        routed = [
+            LLMProvider(name)
+            for name in self.router.order([p.value for p in providers if p != LLMProvider.FALLBACK])
+        ]
+        return routed + [p for p in providers if p == LLMProvider.FALLBACK]
+    
     async def _call_with_circuit_breaker(
         self, 
         provider: LLMProvider, 
-        call_func: Callable
+        call_func: Callable,
+        tokens: int = 0
     ) -> Dict[str, Any]:
         """
         Execute a call with circuit breaker protection.
         
+        The call also runs within the provider's adaptive concurrency limit
+        and shared token budget, and its latency is tracked for routing.
+        
         Args:
             provider: LLM provider to use
             call_func: Async function to call the provider
+            tokens: Estimated tokens of the request
             
         Returns:
             Response from the provider
@@ -258,9 +282,12 @@ class LLMService:
             raise Exception(f"Circuit is open for provider {provider.value}")
         
         try:
-            result = await call_func()
+            result = await self.router.run(provider.value, call_func, tokens=tokens)
             self.circuit_breakers[provider].record_success()
             return result
+        except ProviderUnavailableError:
+            # Skipped locally (budget or concurrency limit), not a provider failure
+            raise
         except Exception as e:
             self.circuit_breakers[provider].record_failure()
             logger.error(f"Failed call to {provider.value}: {str(e)}")
@@ -276,8 +303,8 @@ class LLMService:
     async def _call_openai(
         self, 
         messages: List[Dict[str, str]], 
-        model: str = "gpt-4o",
-        temperature: float = 0.7,
+        model: str = DEFAULT_CHAT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: int = 1000,
         **kwargs
     ) -> Dict[str, Any]:
@@ -375,15 +402,24 @@ class LLMService:
         messages: List[Dict[str, str]],
         preferred_provider: Optional[LLMProvider] = None,
         with_reasoning: bool = False,
+        tenant_id: Optional[str] = None,
+        use_cache: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Generate a chat completion with fallback between providers.
         
+        Identical requests (same normalized messages, model, temperature and
+        parameters) within a tenant are answered from the LLM response cache,
+        and concurrent identical requests share one upstream call.
+        
         Args:
             messages: List of message objects
             preferred_provider: Provider to try first
             with_reasoning: Whether to record reasoning chain
+            tenant_id: Tenant the cached response may be shared within
+                (requests without one are not cached)
+            use_cache: Whether to use the response cache
             **kwargs: Additional parameters passed to the LLM
             
         Returns:
@@ -401,8 +437,213 @@ class LLMService:
                 {"status": "initialized"}
             )
         
+        if not use_cache:
+            response = await self._complete_with_fallback(messages, preferred_provider, reasoning, **kwargs)
+        else:
+            cache_key = self._cache_key(messages, tenant_id, kwargs)
+            called = False
+
+            async def call_providers():
+                nonlocal called
+                called = True
+                return await self._complete_with_fallback(messages, preferred_provider, reasoning, **kwargs)
+
+            response = await self.response_cache.get_or_call(
+                cache_key,
+                call_providers,
+                # Rule-based fallback answers are not worth keeping
+                cacheable=lambda result: result.get("provider") != LLMProvider.FALLBACK.value
+            )
+
+            if reasoning and not called:
+                reasoning.add_step(
+                    "Served from LLM response cache",
+                    {"tenant_id": tenant_id},
+                    {"status": "cache_hit", "provider": response.get("provider")}
+                )
+
+        # Add reasoning chain to response if requested
+        if reasoning:
+            response["reasoning_chain"] = reasoning.get_reasoning_chain()
+
+        return response
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        preferred_provider: Optional[LLMProvider] = None,
+        tenant_id: Optional[str] = None,
+        use_cache: bool = True,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a chat completion with fallback between providers.
+        
+        Yields events as the completion is generated:
+        - {"type": "delta", "content": ..., "provider": ...} for each piece of text
+        - {"type": "reset", "provider": ..., "error": ...} when a provider fails
+          after it started answering; the text received so far must be
+          discarded because the next provider answers from the start
+        - {"type": "done", "response": ...} with the complete response, in the
+          same format as chat_completion()
+        
+        A cached response is replayed as a single delta, and completed
+        responses are stored in the response cache.
+        
+        Args:
+            messages: List of message objects
+            preferred_provider: Provider to try first
+            tenant_id: Tenant the cached response may be shared within
+                (requests without one are not cached)
+            use_cache: Whether to use the response cache
+            **kwargs: Additional parameters passed to the LLM
+            
+        Raises:
+            Exception: If all providers fail
+        """
+        cache_key = self._cache_key(messages, tenant_id, kwargs) if use_cache else None
+        if cache_key:
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                yield {"type": "delta", "content": cached.get("content") or "", "provider": cached.get("provider")}
+                yield {"type": "done", "response": cached}
+                return
+        
+        available_providers = self._route(self._get_available_providers())
+        if preferred_provider and preferred_provider in available_providers:
+            available_providers.remove(preferred_provider)
+            available_providers.insert(0, preferred_provider)
+        
+        last_error = None
+        for provider in available_providers:
+            if provider in (LLMProvider.OPENAI, LLMProvider.AZURE_OPENAI):
+                stream = self._stream_with_circuit_breaker(provider, self._stream_openai(messages, **kwargs))
+            elif provider == LLMProvider.FALLBACK:
+                stream = self._stream_response(self._call_fallback_model(messages, **kwargs))
+            else:
+                # Skip providers we don't have implementations for yet
+                continue
+            
+            content = []
+            response = None
+            try:
+                async for piece in stream:
+                    if piece.get("content"):
+                        content.append(piece["content"])
+                        yield {"type": "delta", "content": piece["content"], "provider": provider.value}
+                    if piece.get("response"):
+                        response = piece["response"]
+            except Exception as e:
+                last_error = str(e)
+                logger.warning(f"Provider {provider.value} failed while streaming: {last_error}")
+                if content:
+                    yield {"type": "reset", "provider": provider.value, "error": last_error}
+                continue
+            
+            response = {**response, "content": "".join(content)}
+            if cache_key and provider != LLMProvider.FALLBACK:
+                await self.response_cache.set(cache_key, response)
+            yield {"type": "done", "response": response}
+            return
+        
+        error_msg = f"All LLM providers failed. Last error: {last_error}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+    def _cache_key(self, messages: List[Dict[str, str]], tenant_id: Optional[str], kwargs: Dict[str, Any]) -> Optional[str]:
+        """Build the response cache key of a chat completion request."""
+        return self.response_cache.make_key(
+            messages,
+            model=kwargs.get("model", DEFAULT_CHAT_MODEL),
+            temperature=kwargs.get("temperature", DEFAULT_TEMPERATURE),
+            tenant_id=tenant_id,
+            **{k: v for k, v in kwargs.items() if k not in ("model", "temperature")}
+        )
+
+    async def _stream_with_circuit_breaker(
+        self,
+        provider: LLMProvider,
+        stream: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Forward a provider stream, recording the outcome in its circuit breaker."""
+        if not self.circuit_breakers[provider].allow_request():
+            raise Exception(f"Circuit is open for provider {provider.value}")
+        
+        try:
+            async for piece in stream:
+                yield piece
+        except Exception as e:
+            self.circuit_breakers[provider].record_failure()
+            logger.error(f"Failed stream from {provider.value}: {str(e)}")
+            raise
+        self.circuit_breakers[provider].record_success()
+
+    async def _stream_openai(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = DEFAULT_CHAT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a completion from the OpenAI API.
+        
+        Yields {"content": ...} pieces followed by {"response": ...} with the
+        response metadata (without content).
+        """
+        client = self.clients.get(LLMProvider.OPENAI)
+        if not client:
+            raise Exception("OpenAI client not initialized")
+        
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs
+        )
+        
+        finish_reason = None
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            if choice.delta and choice.delta.content:
+                yield {"content": choice.delta.content}
+        
+        yield {
+            "response": {
+                "provider": LLMProvider.OPENAI.value,
+                "model": model,
+                "finish_reason": finish_reason,
+                # Token usage is not reported for streamed completions
+                "usage": None
+            }
+        }
+
+    @staticmethod
+    async def _stream_response(response: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a complete (awaitable) response as a single piece."""
+        response = await response
+        yield {"content": response.get("content", "")}
+        yield {"response": response}
+
+    async def _complete_with_fallback(
+        self,
+        messages: List[Dict[str, str]],
+        preferred_provider: Optional[LLMProvider],
+        reasoning: Optional[ChainOfThoughtReasoning],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Try each available provider in order until one succeeds."""
         # Determine provider order
-        available_providers = self._get_available_providers()
+        available_providers = self._route(self._get_available_providers())
+        tokens = estimate_tokens(
+            " ".join(str(m.get("content", "")) for m in messages), kwargs.get("max_tokens", 1000)
+        )
         
         if preferred_provider and preferred_provider in available_providers:
             # Move preferred provider to the front
@@ -431,13 +672,15 @@ class LLMService:
                 if provider == LLMProvider.OPENAI:
                     response = await self._call_with_circuit_breaker(
                         provider,
-                        lambda: self._call_openai(messages, **kwargs)
+                        lambda: self._call_openai(messages, **kwargs),
+                        tokens=tokens
                     )
                 elif provider == LLMProvider.AZURE_OPENAI:
                     # Same OpenAI client with different base URL
                     response = await self._call_with_circuit_breaker(
                         provider,
-                        lambda: self._call_openai(messages, **kwargs)
+                        lambda: self._call_openai(messages, **kwargs),
+                        tokens=tokens
                     )
                 # Add other provider methods as implemented
                 elif provider == LLMProvider.FALLBACK:
@@ -456,10 +699,6 @@ class LLMService:
                         }
                     )
                 
-                # Add reasoning chain to response if requested
-                if reasoning:
-                    response["reasoning_chain"] = reasoning.get_reasoning_chain()
-                
                 return response
                 
             except Exception as e:
@@ -0,0 +1,192 @@
+"""
+LLM Streaming Helpers
+
+This module contains incremental parsers for streamed LLM output, so text can
+be forwarded to users while the completion is still being generated, and a
+helper to format Server-Sent Events.
+
+- JSONFieldStream decodes one string field (e.g. "response") of a JSON object
+  as its characters arrive.
+- ChainOfThoughtStream splits REASONING:/ANSWER: formatted output into
+  reasoning and answer text as it arrives.
+
+Example:
+    field = JSONFieldStream("response")
+    async for event in llm_service.stream_chat_completion(messages):
+        if event["type"] == "delta":
+            text = field.feed(event["content"])
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t'
+}
+
+
+class JSONFieldStream:
+    """Incrementally decode a top-level string field of a streamed JSON object."""
+
+    def __init__(self, field: str = "response"):
+        """Initialize the parser.
+
+        Args:
+            field: Name of the string field to decode
+        """
+        self.field = field
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self.reset()
+
+    def reset(self):
+        """Discard all input, e.g. when a provider restarts its answer."""
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self.value = ""
+        self.complete = False
+
+    def feed(self, chunk: str) -> str:
+        """Add streamed text.
+
+        Args:
+            chunk: Next piece of the JSON document
+
+        Returns:
+            Newly decoded characters of the field value
+        """
+        self._buffer += chunk
+        if self.complete:
+            return ""
+
+        if self._pos is None:
+            match = self._key.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        decoded = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.complete = True
+                i += 1
+                break
+            if char != '\\':
+                decoded.append(char)
+                i += 1
+                continue
+
+            # Escape sequences may be split across chunks; wait for the rest
+            if i + 1 >= len(buffer):
+                break
+            escape = buffer[i + 1]
+            if escape != 'u':
+                decoded.append(_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            length = 6
+            if i + 6 <= len(buffer) and 0xD800 <= int(buffer[i + 2:i + 6], 16) <= 0xDBFF:
+                length = 12  # Surrogate pair
+            if i + length > len(buffer):
+                break
+            decoded.append(json.loads('"%s"' % buffer[i:i + length]))
+            i += length
+
+        self._pos = i
+        text = "".join(decoded)
+        self.value += text
+        return text
+
+
+class ChainOfThoughtStream:
+    """Incrementally split REASONING:/ANSWER: formatted output into sections.
+
+    Text before any marker is treated as answer text, so output without
+    chain-of-thought markers streams through unchanged.
+    """
+
+    MARKERS = {"REASONING:": "reasoning", "ANSWER:": "answer"}
+
+    def __init__(self):
+        """Initialize the parser."""
+        self.section = "answer"
+        self.reasoning = ""
+        self.answer = ""
+        self._pending = ""
+        self._section_start = True
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """Add streamed text.
+
+        Args:
+            chunk: Next piece of the completion
+
+        Returns:
+            List of (section, text) pieces ready to be forwarded
+        """
+        self._pending += chunk
+        pieces = []
+
+        while True:
+            found = [(self._pending.find(marker), marker) for marker in self.MARKERS if marker in self._pending]
+            if not found:
+                break
+            index, marker = min(found)
+            self._emit(pieces, self._pending[:index])
+            self.section = self.MARKERS[marker]
+            self._section_start = True
+            self._pending = self._pending[index + len(marker):]
+
+        # Hold back a trailing partial marker until the next chunk decides it
+        hold = max(
+            (n for marker in self.MARKERS for n in range(1, len(marker)) if self._pending.endswith(marker[:n])),
+            default=0
+        )
+        self._emit(pieces, self._pending[:len(self._pending) - hold])
+        self._pending = self._pending[len(self._pending) - hold:]
+        return pieces
+
+    def close(self) -> List[Tuple[str, str]]:
+        """Flush text held back at the end of the stream."""
+        pieces = []
+        self._emit(pieces, self._pending)
+        self._pending = ""
+        return pieces
+
+    def result(self) -> Dict[str, str]:
+        """Reasoning and answer text received so far."""
+        return {"reasoning": self.reasoning.strip(), "answer": self.answer.strip()}
+
+    def _emit(self, pieces: List[Tuple[str, str]], text: str):
+        if self._section_start:
+            text = text.lstrip()
+        if not text:
+            return
+        self._section_start = False
+        if self.section == "reasoning":
+            self.reasoning += text
+        else:
+            self.answer += text
+        pieces.append((self.section, text))
+
+
+def sse_event(event: str, data: Any) -> str:
+    """Format a Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        Event text ready to be written to a text/event-stream response
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -1,33 +1,27 @@
 from typing import Dict, List
 import numpy as np
-from transformers import AutoTokenizer, AutoModel
-import torch
-from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
+from src.services.ai.embedding_service import get_embedding_service
+
 logger = logging.getLogger(__name__)
 
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities"""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.where(norms == 0, 1, norms)
+
+
 class SemanticService:
     def __init__(self):
         self.model_name = "sentence-transformers/all-mpnet-base-v2"
-        self._initialize_model()
-
-    def _initialize_model(self):
-        """Initialize the transformer model and tokenizer"""
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModel.from_pretrained(self.model_name)
-        except Exception as e:
-            logger.error(f"Error initializing semantic model: {str(e)}")
-            raise
+        self.embeddings = get_embedding_service(self.model_name)
 
     def _get_embeddings(self, text: str) -> np.ndarray:
         """Get embeddings for input text"""
         try:
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-            return outputs.last_hidden_state.mean(dim=1).numpy()
+            return self.embeddings.encode([text])
         except Exception as e:
             logger.error(f"Error generating embeddings: {str(e)}")
             return None
@@ -35,27 +29,25 @@ class SemanticService:
     async def analyze_content(self, content: str, keywords: List[str]) -> Dict:
         """Analyze content for semantic relevance"""
         try:
-            content_embedding = self._get_embeddings(content)
-            keyword_embeddings = [self._get_embeddings(keyword) for keyword in keywords]
+            sentences = content.split('.')
+            non_empty_sentences = [sent for sent in sentences if sent.strip()]
+
+            # Embed content, keywords and sentences in one batched call
+            embeddings = _normalize(await self.embeddings.aencode(
+                [content] + list(keywords) + non_empty_sentences
+            ))
+            content_embedding = embeddings[0]
+            keyword_embeddings = embeddings[1:1 + len(keywords)]
+            sentence_embeddings = embeddings[1 + len(keywords):]
 
             # Calculate keyword relevance
-            keyword_similarities = [
-                float(cosine_similarity(content_embedding, keyword_embedding)[0][0])
-                for keyword_embedding in keyword_embeddings
-            ]
+            keyword_similarities = [float(score) for score in keyword_embeddings @ content_embedding]
 
             # Calculate topic coherence
-            sentences = content.split('.')
-            sentence_embeddings = [self._get_embeddings(sent) for sent in sentences if sent.strip()]
-            coherence_scores = []
-            
-            for i in range(len(sentence_embeddings)-1):
-                if sentence_embeddings[i] is not None and sentence_embeddings[i+1] is not None:
-                    score = float(cosine_similarity(
-                        sentence_embeddings[i],
-                        sentence_embeddings[i+1]
-                    )[0][0])
-                    coherence_scores.append(score)
+            coherence_scores = [
+                float(score)
+                for score in np.einsum('ij,ij->i', sentence_embeddings[:-1], sentence_embeddings[1:])
+            ]
 
             # Calculate content depth
             unique_concepts = self._identify_unique_concepts(sentence_embeddings)
@@ -76,31 +68,22 @@ class SemanticService:
             logger.error(f"Error in semantic analysis: {str(e)}")
             return None
 
-    def _identify_unique_concepts(self, embeddings: List[np.ndarray]) -> List[np.ndarray]:
-        """Identify unique concepts in the content"""
+    def _identify_unique_concepts(self, embeddings: np.ndarray) -> List[np.ndarray]:
+        """Identify unique concepts in the content (embeddings must be normalized)"""
         unique_concepts = []
-        
+
         for emb in embeddings:
-            if emb is None:
-                continue
-                
-            is_unique = True
-            for concept in unique_concepts:
-                similarity = float(cosine_similarity(emb, concept)[0][0])
-                if similarity > 0.85:  # Threshold for considering concepts similar
-                    is_unique = False
-                    break
-            
-            if is_unique:
+            # Threshold for considering concepts similar
+            if not unique_concepts or np.max(np.stack(unique_concepts) @ emb) <= 0.85:
                 unique_concepts.append(emb)
-                
+
         return unique_concepts
 
-    def _calculate_intent_alignment(self, content_embedding: np.ndarray, keyword_embeddings: List[np.ndarray]) -> float:
+    def _calculate_intent_alignment(self, content_embedding: np.ndarray, keyword_embeddings: np.ndarray) -> float:
         """Calculate how well the content aligns with intended keywords"""
         try:
-            keyword_space = np.mean(keyword_embeddings, axis=0)
-            return float(cosine_similarity(content_embedding, keyword_space)[0][0])
+            keyword_space = _normalize(np.mean(keyword_embeddings, axis=0))
+            return float(content_embedding @ keyword_space)
         except Exception as e:
             logger.error(f"Error calculating intent alignment: {str(e)}")
             return 0.0
@@ -1,5 +1,5 @@
 """Sentiment analysis service module with LLM-based analysis and fallback mechanisms"""
-from typing import List, Optional, Dict, Union, Any
+from typing import List, Optional, Dict, Union, Any, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -8,20 +8,218 @@ from src.models.content import Content
 from src.models.ai import AIInsight, InsightType
 from textblob import TextBlob
 from fastapi import HTTPException
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import weakref
 
 from src.services.ai.llm_service import LLMService, LLMProvider
 from src.services.ai.chain_of_thought import ChainOfThoughtReasoning
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of text characters sent to the LLM per item
+MAX_TEXT_LENGTH = 4000
+
+# Concurrent LLM requests allowed per provider during batch analysis
+DEFAULT_PROVIDER_CONCURRENCY = {
+    LLMProvider.OPENAI: int(os.getenv("SENTIMENT_OPENAI_CONCURRENCY", "8")),
+    LLMProvider.ANTHROPIC: int(os.getenv("SENTIMENT_ANTHROPIC_CONCURRENCY", "5")),
+    LLMProvider.AZURE_OPENAI: int(os.getenv("SENTIMENT_AZURE_OPENAI_CONCURRENCY", "8")),
+    LLMProvider.HF_INFERENCE: int(os.getenv("SENTIMENT_HF_CONCURRENCY", "2")),
+}
+
+# Per-provider semaphores of each event loop, shared by every engine so the
+# caps hold across the process
+_provider_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+
+# Providers that reliably answer several packed items with a JSON array
+PACKING_PROVIDERS = {LLMProvider.OPENAI, LLMProvider.ANTHROPIC, LLMProvider.AZURE_OPENAI}
+
+
+def _textblob_sentiment(text: str) -> Dict[str, Any]:
+    """Score text with TextBlob (used when no LLM result is available)."""
+    sentiment = TextBlob(text).sentiment
+    return {
+        "score": sentiment.polarity,
+        "confidence": abs(sentiment.polarity),
+        "explanation": "Content appears to have a positive tone" if sentiment.polarity > 0 else "Content appears to have a negative tone",
+        "method": "textblob_fallback"
+    }
+
+
+class SentimentBatchEngine:
+    """Concurrent, deduplicated sentiment analysis for many texts.
+
+    Identical texts are analyzed once. Short texts are packed several to a
+    prompt for providers that support it, and requests run concurrently
+    under a per-provider cap.
+    """
+
+    def __init__(
+        self,
+        service: "SentimentAnalysisService",
+        provider_concurrency: Optional[Dict[LLMProvider, int]] = None,
+        pack_size: int = int(os.getenv("SENTIMENT_PACK_SIZE", "8")),
+        pack_max_chars: int = int(os.getenv("SENTIMENT_PACK_MAX_CHARS", "1000"))
+    ):
+        """Initialize the engine.
+
+        Args:
+            service: Sentiment service used for single-text analysis
+            provider_concurrency: Concurrent requests per provider
+            pack_size: Maximum number of texts per packed prompt (1 disables packing)
+            pack_max_chars: Texts longer than this are always sent on their own
+        """
+        self.service = service
+        self.provider_concurrency = {**DEFAULT_PROVIDER_CONCURRENCY, **(provider_concurrency or {})}
+        self.pack_size = pack_size
+        self.pack_max_chars = pack_max_chars
+
+    def _semaphore(self, provider: LLMProvider) -> asyncio.Semaphore:
+        """Get the process-wide semaphore capping a provider on this event loop."""
+        key = (provider, self.provider_concurrency.get(provider, 4))
+        semaphores = _provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(key[1])
+        return semaphores[key]
+
+    async def analyze_texts(
+        self,
+        texts: Sequence[str],
+        with_reasoning: bool = False,
+        tenant_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Analyze the sentiment of many texts.
+
+        Args:
+            texts: Texts to analyze
+            with_reasoning: Request a reasoning chain per text (disables packing)
+            tenant_id: Owner of the texts, within whom LLM responses are cached
+
+        Returns:
+            Sentiment results in input order
+        """
+        unique: Dict[str, str] = {}
+        keys = []
+        for text in texts:
+            text = self._truncate(text or "")
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            unique.setdefault(key, text)
+            keys.append(key)
+
+        providers = self.service.llm_service._get_available_providers()
+        provider = providers[0] if providers else LLMProvider.FALLBACK
+
+        if provider == LLMProvider.FALLBACK:
+            # The rule-based fallback cannot score sentiment; skip the round trips
+            results = {key: _textblob_sentiment(text) for key, text in unique.items()}
+            return [dict(results[key]) for key in keys]
+
+        packable = []
+        singles = []
+        for key, text in unique.items():
+            if (
+                self.pack_size > 1
+                and not with_reasoning
+                and provider in PACKING_PROVIDERS
+                and len(text) <= self.pack_max_chars
+            ):
+                packable.append((key, text))
+            else:
+                singles.append((key, text))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        semaphore = self._semaphore(provider)
+
+        async def run_single(key: str, text: str):
+            async with semaphore:
+                results[key] = await self.service.get_content_sentiment_text(
+                    text, with_reasoning=with_reasoning, preferred_provider=provider, tenant_id=tenant_id
+                )
+
+        async def run_pack(items: List[Tuple[str, str]]):
+            async with semaphore:
+                packed = await self._analyze_pack([text for _, text in items], provider, tenant_id)
+            for index, (key, text) in enumerate(items):
+                if index in packed:
+                    results[key] = packed[index]
+                else:
+                    # Items the packed answer left out are analyzed on their own
+                    await run_single(key, text)
+
+        tasks = [run_single(key, text) for key, text in singles]
+        tasks.extend(
+            run_pack(packable[i:i + self.pack_size])
+            for i in range(0, len(packable), self.pack_size)
+        )
+        await asyncio.gather(*tasks)
+
+        return [dict(results[key]) for key in keys]
+
+    async def _analyze_pack(
+        self,
+        texts: List[str],
+        provider: LLMProvider,
+        tenant_id: Optional[str] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """Analyze several texts with one prompt.
+
+        Returns:
+            Results keyed by position in texts (missing if the LLM omitted them)
+        """
+        items = "\n\n".join(f"[{index}] {text}" for index, text in enumerate(texts))
+        messages = [
+            {"role": "system", "content": "You are a sentiment analysis expert. Analyze the sentiment of each numbered text independently and respond with a JSON array containing one object per text with 'id' (the text number), 'score' (float between -1 and 1), 'confidence' (float between 0 and 1), and 'explanation' (string describing the sentiment)."},
+            {"role": "user", "content": f"{items}\n\nAnalyze the sentiment of each text and provide the results in the specified JSON format."}
+        ]
+
+        try:
+            response = await self.service.llm_service.chat_completion(
+                messages=messages,
+                preferred_provider=provider,
+                temperature=0.3,
+                max_tokens=150 * len(texts) + 100,
+                tenant_id=tenant_id
+            )
+            content = response.get("content", "")
+            json_start = content.find("[")
+            json_end = content.rfind("]")
+            if json_start == -1 or json_end == -1:
+                raise ValueError("No JSON array found in LLM response")
+
+            packed = {}
+            for entry in json.loads(content[json_start:json_end + 1]):
+                if not isinstance(entry, dict) or not all(k in entry for k in ["id", "score", "confidence", "explanation"]):
+                    continue
+                index = int(entry["id"])
+                if 0 <= index < len(texts):
+                    packed[index] = {
+                        "score": entry["score"],
+                        "confidence": entry["confidence"],
+                        "explanation": entry["explanation"]
+                    }
+            return packed
+        except Exception as e:
+            logger.warning(f"Packed sentiment analysis failed, analyzing {len(texts)} texts individually: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _truncate(text: str) -> str:
+        if len(text) > MAX_TEXT_LENGTH:
+            return text[:MAX_TEXT_LENGTH] + "..."
+        return text
+
+
 class SentimentAnalysisService:
     """Service for analyzing sentiment in content with LLM integration and fallback mechanisms"""
     
     def __init__(self):
         """Initialize the sentiment analysis service with LLM client"""
         self.llm_service = LLMService()
+        self.batch_engine = SentimentBatchEngine(self)
 
     async def analyze_content(self, content_id: int, db: AsyncSession, with_reasoning: bool = False) -> Optional[AIInsight]:
         """Analyze sentiment for a specific content item with LLM fallback"""
@@ -146,7 +344,8 @@ class SentimentAnalysisService:
             response = await self.llm_service.chat_completion(
                 messages=messages,
                 temperature=0.3,  # Lower temperature for more deterministic results
-                with_reasoning=with_reasoning
+                with_reasoning=with_reasoning,
+                tenant_id=content.user_id
             )
             
             # Parse the JSON response
@@ -184,14 +383,73 @@ class SentimentAnalysisService:
         return result.scalar_one_or_none()
         
     async def batch_analyze_content(self, content_ids: List[int], db: AsyncSession) -> List[AIInsight]:
-        """Analyze sentiment for multiple content items"""
-        insights = []
-        for content_id in content_ids:
-            insight = await self.analyze_content(content_id, db)
-            if insight:
-                insights.append(insight)
+        """Analyze sentiment for multiple content items and store the insights in one commit"""
+        result = await db.execute(select(Content).where(Content.id.in_(content_ids)))
+        contents_by_id = {content.id: content for content in result.scalars().all()}
+        contents = [contents_by_id[content_id] for content_id in dict.fromkeys(content_ids) if content_id in contents_by_id]
+        if not contents:
+            return []
+
+        sentiments = await self.analyze_contents(contents, include_title=True)
+
+        insights = [
+            AIInsight(
+                content_id=content.id,
+                user_id=content.user_id,
+                type=InsightType.SENTIMENT,
+                score=sentiment.get("score", 0.0),
+                confidence=sentiment.get("confidence", 0.0),
+                explanation=sentiment.get("explanation", ""),
+                insight_metadata={"method": sentiment.get("method", "llm")}
+            )
+            for content, sentiment in zip(contents, sentiments)
+        ]
+
+        db.add_all(insights)
+        await db.commit()
         return insights
 
+    async def analyze_contents(
+        self,
+        contents: Sequence[Content],
+        include_title: bool = False,
+        with_reasoning: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Analyze sentiment for already loaded content items concurrently
+
+        Args:
+            contents: Content items to analyze
+            include_title: Analyze the title together with the content text
+            with_reasoning: Request a reasoning chain per item
+
+        Returns:
+            Sentiment results in the order of contents
+        """
+        # Contents are analyzed per owner, so no LLM response is shared across tenants
+        by_owner: Dict[Any, List[int]] = {}
+        for index, content in enumerate(contents):
+            by_owner.setdefault(content.user_id, []).append(index)
+
+        def text_of(content: Content) -> str:
+            if include_title and content.content_text:
+                return f"{content.title} {content.content_text}"
+            return content.content_text or content.title or ""
+
+        owner_results = await asyncio.gather(*(
+            self.batch_engine.analyze_texts(
+                [text_of(contents[index]) for index in indexes],
+                with_reasoning=with_reasoning,
+                tenant_id=owner
+            )
+            for owner, indexes in by_owner.items()
+        ))
+
+        results: List[Dict[str, Any]] = [{} for _ in contents]
+        for indexes, sentiments in zip(by_owner.values(), owner_results):
+            for index, sentiment in zip(indexes, sentiments):
+                results[index] = sentiment
+        return results
+
     async def analyze_content_sentiment(
         self,
         content: Union[Content, int],
@@ -255,7 +513,8 @@ class SentimentAnalysisService:
         try:
             sentiment_data = await self.get_content_sentiment_text(
                 content_obj.content_text,
-                with_reasoning=with_reasoning
+                with_reasoning=with_reasoning,
+                tenant_id=content_obj.user_id
             )
             
             if reasoning:
@@ -314,29 +573,46 @@ class SentimentAnalysisService:
         with_reasoning: bool = False
     ) -> List[Dict]:
         """Analyze sentiment for multiple content items"""
+        result = await session.execute(select(Content).where(Content.id.in_(content_ids)))
+        contents_by_id = {content.id: content for content in result.scalars().all()}
+
+        found = [contents_by_id[content_id] for content_id in dict.fromkeys(content_ids) if content_id in contents_by_id]
+        sentiments = dict(zip(
+            [content.id for content in found],
+            await self.analyze_contents(found, with_reasoning=with_reasoning)
+        ))
+
         results = []
         for content_id in content_ids:
-            try:
-                sentiment = await self.analyze_content_sentiment(
-                    content_id, 
-                    session=session,
-                    with_reasoning=with_reasoning
-                )
-                results.append(sentiment)
-            except ValueError as e:
+            if content_id not in sentiments:
                 results.append({
                     "content_id": content_id,
-                    "error": str(e)
+                    "error": "Content not found"
                 })
+                continue
+
+            sentiment = dict(sentiments[content_id])
+            entry = {"content_id": content_id, "sentiment": sentiment}
+            if "reasoning_chain" in sentiment:
+                entry["reasoning_chain"] = sentiment.pop("reasoning_chain")
+            results.append(entry)
         return results
 
-    async def get_content_sentiment_text(self, text: str, with_reasoning: bool = False) -> Dict[str, Any]:
-        """Get sentiment score for text content using LLM with fallback"""
+    async def get_content_sentiment_text(
+        self,
+        text: str,
+        with_reasoning: bool = False,
+        preferred_provider: Optional[LLMProvider] = None,
+        tenant_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get sentiment score for text content using LLM with fallback
+
+        Responses are cached only within tenant_id, the owner of the text.
+        """
         try:
             # Truncate text if needed
-            max_text_length = 4000
-            if len(text) > max_text_length:
-                text = text[:max_text_length] + "..."
+            if len(text) > MAX_TEXT_LENGTH:
+                text = text[:MAX_TEXT_LENGTH] + "..."
             
             # Prepare messages for LLM
             messages = [
@@ -347,8 +623,10 @@ class SentimentAnalysisService:
             # Call LLM with fallback
             response = await self.llm_service.chat_completion(
                 messages=messages,
+                preferred_provider=preferred_provider,
                 temperature=0.3,
-                with_reasoning=with_reasoning
+                with_reasoning=with_reasoning,
+                tenant_id=tenant_id
             )
             
             # Parse response
@@ -372,15 +650,7 @@ class SentimentAnalysisService:
             logger.warning(f"LLM sentiment analysis failed, falling back to TextBlob: {str(e)}")
             
             # Fallback to TextBlob
-            blob = TextBlob(text)
-            sentiment = blob.sentiment
-            
-            return {
-                "score": sentiment.polarity,
-                "confidence": abs(sentiment.polarity),
-                "explanation": "Content appears to have a positive tone" if sentiment.polarity > 0 else "Content appears to have a negative tone",
-                "method": "textblob_fallback"
-            }
+            return _textblob_sentiment(text)
 
     def _adjust_sentiment_with_context(
         self,
@@ -0,0 +1,804 @@
+"""
+Content Vector Index
+
+This module keeps a persistent, per-tenant approximate nearest-neighbour index
+of ``Content`` embeddings so that similar-content lookups do not have to load
+and encode a tenant's whole library on every request.
+
+- Each tenant (content owner) has its own ``VectorIndex``. The database is
+  the source of truth: the first time a process uses a tenant's index (and
+  every ``VECTOR_INDEX_SYNC_INTERVAL`` seconds after that) it is synced with
+  the tenant's ``Content`` rows, embedding only rows that are missing or
+  changed since the last sync. This also backfills content that existed
+  before the index did. Lookups start the sync as a background task and do
+  not wait for it; until it finishes they search the index as it stands.
+- Each process writes its own ``.npz`` snapshot per tenant, so processes
+  never overwrite each other's state; a process starts from the newest
+  snapshot of any process and the sync repairs whatever it lacks.
+- Searches scan a snapshot of the index taken under the lock (copy-on-write),
+  so tenants' searches run concurrently with each other and with updates.
+- Small indexes are searched exactly. Once an index reaches
+  ``VECTOR_INDEX_MIN_TRAIN_SIZE`` vectors it is partitioned IVF-style into
+  k-means clusters and a query only scans the ``nprobe`` closest clusters.
+- Content is re-indexed incrementally: session hooks pick up created, edited
+  and deleted ``Content`` rows after each commit, in the API process and in
+  Celery workers.
+
+Example:
+    index = get_content_vector_index()
+    hits = await index.similar_to(content, k=10, sync=True)  # [(content_id, score), ...]
+"""
+import asyncio
+import glob
+import logging
+import os
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import AsyncContextManager, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from src.models.content import Content
+from src.services.ai.embedding_service import EmbeddingService, get_embedding_service
+
+logger = logging.getLogger(__name__)
+
+# Embedding model used for content similarity (shared with ContentAffinityService)
+CONTENT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Content attributes that change a content item's embedding
+EMBEDDED_ATTRIBUTES = ("title", "content_text", "content_metadata")
+
+# Rows updated this long before the last sync are re-embedded anyway, to
+# allow for clock skew between application and database servers
+SYNC_CLOCK_MARGIN = timedelta(minutes=5)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def content_embedding_text(content: Content) -> str:
+    """Build the text embedded for a content item."""
+    if not content:
+        return ""
+
+    text_parts = []
+
+    if content.title:
+        text_parts.append(content.title)
+
+    if content.content_text:
+        text_parts.append(content.content_text)
+
+    if content.content_metadata and isinstance(content.content_metadata, dict):
+        text_parts.append(" ".join(str(v) for v in content.content_metadata.values()))
+
+    return " ".join(text_parts)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so dot products are cosine similarities."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class VectorIndex:
+    """Cosine-similarity index over integer-keyed vectors (exact or IVF)."""
+
+    def __init__(
+        self,
+        nprobe: Optional[int] = None,
+        min_train_size: Optional[int] = None
+    ):
+        """Initialize an empty index.
+
+        Args:
+            nprobe: Number of clusters scanned per query once partitioned
+            min_train_size: Number of vectors at which the index is partitioned
+        """
+        self.nprobe = nprobe or int(os.getenv("VECTOR_INDEX_NPROBE", "16"))
+        self.min_train_size = min_train_size or int(os.getenv("VECTOR_INDEX_MIN_TRAIN_SIZE", "5000"))
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._size = 0
+        self._positions: Dict[int, int] = {}
+        self.centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        # Whether a snapshot still refers to the backing arrays
+        self._shared = False
+        # When the index was last reconciled with the database (UTC)
+        self.synced_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id: int) -> bool:
+        return int(item_id) in self._positions
+
+    @property
+    def ids(self) -> List[int]:
+        return list(self._positions)
+
+    @property
+    def dimension(self) -> int:
+        return self._vectors.shape[1]
+
+    @property
+    def is_partitioned(self) -> bool:
+        return self.centroids is not None
+
+    def get_vector(self, item_id: int) -> Optional[np.ndarray]:
+        """Get the stored (normalized) vector for an item."""
+        position = self._positions.get(int(item_id))
+        return None if position is None else self._vectors[position].copy()
+
+    def snapshot(self) -> "VectorIndex":
+        """Get a search-only copy of the index that later changes do not affect.
+
+        The copy shares the backing arrays, and the index copies them before
+        its next change, so taking a snapshot is cheap.
+        """
+        snapshot = VectorIndex(nprobe=self.nprobe, min_train_size=self.min_train_size)
+        snapshot._ids = self._ids[:self._size]
+        snapshot._vectors = self._vectors[:self._size]
+        snapshot._assignments = self._assignments[:self._size]
+        snapshot._size = self._size
+        snapshot.centroids = self.centroids
+        snapshot._trained_size = self._trained_size
+        snapshot.synced_at = self.synced_at
+        self._shared = True
+        return snapshot
+
+    def upsert(self, ids: Sequence[int], vectors: np.ndarray):
+        """Add items, replacing the vectors of items already indexed.
+
+        Args:
+            ids: Item IDs
+            vectors: Array of shape (len(ids), dimension)
+        """
+        if not len(ids):
+            return
+
+        vectors = _normalize(vectors)
+        if self._size == 0 and self.dimension != vectors.shape[1]:
+            self._vectors = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+        elif vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected vectors of dimension {self.dimension}, got {vectors.shape[1]}")
+
+        self._unshare()
+        assignments = self._assign(vectors)
+        for item_id, vector, assignment in zip(ids, vectors, assignments):
+            item_id = int(item_id)
+            position = self._positions.get(item_id)
+            if position is None:
+                self._reserve(self._size + 1)
+                position = self._size
+                self._size += 1
+                self._positions[item_id] = position
+                self._ids[position] = item_id
+            self._vectors[position] = vector
+            self._assignments[position] = assignment
+
+        if self._size >= self.min_train_size and self._size >= 2 * self._trained_size:
+            self.train()
+
+    def remove(self, ids: Iterable[int]) -> int:
+        """Remove items from the index.
+
+        Returns:
+            Number of items removed
+        """
+        removed = 0
+        for item_id in ids:
+            position = self._positions.pop(int(item_id), None)
+            if position is None:
+                continue
+
+            self._unshare()
+            # Move the last item into the freed slot
+            last = self._size - 1
+            if position != last:
+                moved_id = int(self._ids[last])
+                self._ids[position] = moved_id
+                self._vectors[position] = self._vectors[last]
+                self._assignments[position] = self._assignments[last]
+                self._positions[moved_id] = position
+            self._size -= 1
+            removed += 1
+
+        return removed
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """Find the items most similar to a query vector.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            exclude: Item IDs to leave out of the results
+
+        Returns:
+            List of (item_id, cosine similarity) pairs, most similar first
+        """
+        if self._size == 0 or k <= 0:
+            return []
+
+        query = _normalize(query).reshape(-1)
+        excluded = {int(item_id) for item_id in exclude}
+
+        candidates = None
+        if self.is_partitioned:
+            nprobe = min(self.nprobe, len(self.centroids))
+            probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+            candidates = np.flatnonzero(np.isin(self._assignments[:self._size], probe))
+            # Scan everything if the probed clusters cannot fill the result
+            if len(candidates) < k + len(excluded):
+                candidates = None
+
+        if candidates is None:
+            scores = self._vectors[:self._size] @ query
+            candidate_ids = self._ids[:self._size]
+        else:
+            scores = self._vectors[candidates] @ query
+            candidate_ids = self._ids[candidates]
+
+        if excluded:
+            keep = ~np.isin(candidate_ids, list(excluded))
+            scores = scores[keep]
+            candidate_ids = candidate_ids[keep]
+
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(candidate_ids[i]), float(scores[i])) for i in top]
+
+    def train(self, iterations: int = 10, sample_size: int = 50000, seed: int = 0):
+        """Partition the index into k-means clusters (spherical k-means)."""
+        if self._size == 0:
+            return
+
+        self._unshare()
+        vectors = self._vectors[:self._size]
+        nlist = max(1, int(np.sqrt(self._size)))
+        rng = np.random.default_rng(seed)
+
+        sample = vectors
+        if self._size > sample_size:
+            sample = vectors[rng.choice(self._size, sample_size, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        self.centroids = centroids
+        self._assignments[:self._size] = self._assign(vectors)
+        self._trained_size = self._size
+
+    def save(self, path: str):
+        """Write the index to a file (atomically)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                ids=self._ids[:self._size],
+                vectors=self._vectors[:self._size],
+                assignments=self._assignments[:self._size],
+                centroids=self.centroids if self.centroids is not None else np.zeros((0, 0), dtype=np.float32),
+                trained_size=np.int64(self._trained_size),
+                synced_at=np.float64(
+                    (self.synced_at - _EPOCH).total_seconds() if self.synced_at else np.nan
+                )
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "VectorIndex":
+        """Read an index written by save()."""
+        index = cls(**kwargs)
+        with np.load(path) as data:
+            index._ids = data["ids"].astype(np.int64)
+            index._vectors = data["vectors"].astype(np.float32)
+            index._assignments = data["assignments"].astype(np.int32)
+            centroids = data["centroids"]
+            index.centroids = centroids if centroids.size else None
+            index._trained_size = int(data["trained_size"])
+            if "synced_at" in data.files and not np.isnan(data["synced_at"]):
+                index.synced_at = _EPOCH + timedelta(seconds=float(data["synced_at"]))
+        index._size = len(index._ids)
+        index._positions = {int(item_id): i for i, item_id in enumerate(index._ids)}
+        return index
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Assign vectors to their nearest cluster."""
+        if self.centroids is None:
+            return np.zeros(len(vectors), dtype=np.int32)
+
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), 4096):
+            chunk = vectors[start:start + 4096]
+            assignments[start:start + 4096] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return assignments
+
+    def _unshare(self):
+        """Copy the backing arrays if a snapshot still refers to them."""
+        if self._shared:
+            self._ids = self._ids.copy()
+            self._vectors = self._vectors.copy()
+            self._assignments = self._assignments.copy()
+            self._shared = False
+
+    def _reserve(self, size: int):
+        """Grow the backing arrays (geometrically) to hold at least size items."""
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+
+        capacity = max(size, 2 * capacity, 64)
+        ids = np.zeros(capacity, dtype=np.int64)
+        vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+        assignments = np.zeros(capacity, dtype=np.int32)
+        ids[:self._size] = self._ids[:self._size]
+        vectors[:self._size] = self._vectors[:self._size]
+        assignments[:self._size] = self._assignments[:self._size]
+        self._ids, self._vectors, self._assignments = ids, vectors, assignments
+
+
+class ContentVectorIndex:
+    """Per-tenant vector indexes of content embeddings, synced with the database."""
+
+    def __init__(
+        self,
+        directory: str,
+        embeddings: Optional[EmbeddingService] = None,
+        save_every: int = 100,
+        sync_interval: float = 300.0,
+        snapshot_name: Optional[str] = None,
+        session_factory: Optional[Callable[[], AsyncContextManager]] = None
+    ):
+        """Initialize the index set.
+
+        Args:
+            directory: Directory holding a subdirectory of snapshots per tenant
+            embeddings: Embedding service (shared MiniLM service if not provided)
+            save_every: Write a tenant's index after this many unsaved changes
+            sync_interval: Seconds before a tenant's index is synced with the
+                database again, picking up changes made by other processes
+            snapshot_name: Name of this process's snapshot files
+                (host and process ID if not provided)
+            session_factory: Opens the async database session used by
+                background syncs (get_db_session if not provided)
+        """
+        self.directory = directory
+        self.embeddings = embeddings or get_embedding_service(CONTENT_EMBEDDING_MODEL)
+        self.save_every = save_every
+        self.sync_interval = sync_interval
+        self.snapshot_name = snapshot_name or f"{socket.gethostname()}-{os.getpid()}"
+        self.session_factory = session_factory
+        self._indexes: Dict[str, VectorIndex] = {}
+        self._unsaved: Dict[str, int] = defaultdict(int)
+        self._loaded_from: Dict[str, float] = {}
+        self._last_sync: Dict[str, float] = {}
+        self._sync_locks: Dict[str, asyncio.Lock] = {}
+        self._sync_tasks: Dict[str, asyncio.Task] = {}
+        self._lock = threading.RLock()
+
+    def _tenant_directory(self, tenant_id: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", str(tenant_id))
+        return os.path.join(self.directory, safe_id)
+
+    def _path(self, tenant_id: str) -> str:
+        """Path of this process's snapshot of a tenant's index."""
+        return os.path.join(self._tenant_directory(tenant_id), f"{self.snapshot_name}.npz")
+
+    def get_index(self, tenant_id: str) -> VectorIndex:
+        """Get a tenant's index, loading the newest snapshot on first use."""
+        tenant_id = str(tenant_id)
+        with self._lock:
+            index = self._indexes.get(tenant_id)
+            if index is None:
+                index = VectorIndex()
+                snapshots = sorted(
+                    glob.glob(os.path.join(self._tenant_directory(tenant_id), "*.npz")),
+                    key=os.path.getmtime,
+                    reverse=True
+                )
+                for path in snapshots:
+                    try:
+                        index = VectorIndex.load(path)
+                        self._loaded_from[tenant_id] = os.path.getmtime(path)
+                        break
+                    except Exception as e:
+                        logger.warning(f"Could not load vector index snapshot {path}: {e}")
+                self._indexes[tenant_id] = index
+            return index
+
+    def upsert(self, tenant_id: str, items: Sequence[Tuple[int, str]]):
+        """Embed and index content items for a tenant.
+
+        Args:
+            tenant_id: Tenant (content owner) ID
+            items: (content_id, embedding text) pairs
+        """
+        if not items:
+            return
+
+        vectors = self.embeddings.encode([text for _, text in items])
+        with self._lock:
+            self.get_index(tenant_id).upsert([content_id for content_id, _ in items], vectors)
+            self._changed(str(tenant_id), len(items))
+
+    def upsert_contents(self, contents: Iterable[Content]):
+        """Embed and index content rows, grouped by tenant."""
+        by_tenant: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for content in contents:
+            by_tenant[str(content.user_id)].append((content.id, content_embedding_text(content)))
+
+        for tenant_id, items in by_tenant.items():
+            self.upsert(tenant_id, items)
+
+    def remove(self, tenant_id: str, content_ids: Iterable[int]) -> int:
+        """Remove content items from a tenant's index.
+
+        Returns:
+            Number of items removed
+        """
+        with self._lock:
+            removed = self.get_index(tenant_id).remove(content_ids)
+            if removed:
+                self._changed(str(tenant_id), removed)
+            return removed
+
+    def search(
+        self,
+        tenant_id: str,
+        query: np.ndarray,
+        k: int = 10,
+        exclude: Iterable[int] = ()
+    ) -> List[Tuple[int, float]]:
+        """Find a tenant's content most similar to a query vector.
+
+        Only taking the snapshot holds the lock; the scan runs outside it.
+
+        Returns:
+            List of (content_id, cosine similarity) pairs, most similar first
+        """
+        with self._lock:
+            index = self.get_index(tenant_id).snapshot()
+        return index.search(query, k, exclude)
+
+    def apply_changes(self, changes: Dict[str, Dict]):
+        """Apply changes collected by the session hooks.
+
+        Args:
+            changes: {"upsert": {tenant_id: {content_id: text}},
+                      "delete": {tenant_id: {content_id, ...}}}
+        """
+        for tenant_id, ids in changes.get("delete", {}).items():
+            self.remove(tenant_id, ids)
+        for tenant_id, items in changes.get("upsert", {}).items():
+            self.upsert(tenant_id, list(items.items()))
+
+    async def similar_to(self, content: Content, k: int = 10, sync: bool = False) -> List[Tuple[int, float]]:
+        """Find the tenant's content most similar to a content item.
+
+        Uses the item's indexed vector if present, otherwise embeds it.
+
+        Args:
+            content: Target content
+            k: Number of results
+            sync: Start a background sync of the index when it is due
+
+        Returns:
+            List of (content_id, cosine similarity) pairs, most similar first
+        """
+        tenant_id = str(content.user_id)
+        if sync:
+            self.schedule_sync(tenant_id)
+        with self._lock:
+            vector = self.get_index(tenant_id).get_vector(content.id)
+
+        if vector is None:
+            vector = (await self.embeddings.aencode([content_embedding_text(content)]))[0]
+
+        return await asyncio.to_thread(self.search, tenant_id, vector, k, [content.id])
+
+    async def search_text(self, tenant_id: str, text: str, k: int = 10, sync: bool = False) -> List[Tuple[int, float]]:
+        """Find a tenant's content most similar to a piece of text."""
+        if sync:
+            self.schedule_sync(tenant_id)
+        vector = (await self.embeddings.aencode([text]))[0]
+        return await asyncio.to_thread(self.search, tenant_id, vector, k)
+
+    def schedule_sync(self, tenant_id: str) -> Optional[asyncio.Task]:
+        """Sync a tenant's index in a background task if it is due.
+
+        The task opens its own database session, so it outlives the request
+        that started it. A tenant has at most one sync task at a time.
+
+        Args:
+            tenant_id: Tenant (content owner) ID
+
+        Returns:
+            The tenant's running sync task, or None if no sync was due
+        """
+        tenant_id = str(tenant_id)
+        task = self._sync_tasks.get(tenant_id)
+        if task is not None and not task.done():
+            return task
+        if not self._sync_due(tenant_id):
+            return None
+
+        task = asyncio.get_running_loop().create_task(self._sync_in_background(tenant_id))
+        self._sync_tasks[tenant_id] = task
+
+        def _done(task: asyncio.Task):
+            if self._sync_tasks.get(tenant_id) is task:
+                del self._sync_tasks[tenant_id]
+            if not task.cancelled() and task.exception():
+                logger.error(f"Failed to sync vector index for tenant {tenant_id}: {task.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _sync_in_background(self, tenant_id: str) -> Optional[int]:
+        session_factory = self.session_factory
+        if session_factory is None:
+            from src.database.utils import get_db_session
+            session_factory = get_db_session
+
+        async with session_factory() as db:
+            return await self.ensure_synced(db, tenant_id)
+
+    def _sync_due(self, tenant_id: str) -> bool:
+        last_sync = self._last_sync.get(tenant_id)
+        return last_sync is None or time.monotonic() - last_sync >= self.sync_interval
+
+    async def ensure_synced(self, db, tenant_id: str) -> Optional[int]:
+        """Sync a tenant's index with the database if it is due.
+
+        An index is due when this process has not synced it yet or the
+        last sync is older than ``sync_interval``.
+
+        Args:
+            db: Async database session
+            tenant_id: Tenant (content owner) ID
+
+        Returns:
+            Number of content items embedded, or None if no sync was due
+        """
+        tenant_id = str(tenant_id)
+        lock = self._sync_locks.setdefault(tenant_id, asyncio.Lock())
+        async with lock:
+            if not self._sync_due(tenant_id):
+                return None
+            return await self.sync(db, tenant_id)
+
+    async def sync(self, db, tenant_id: str, batch_size: int = 500) -> int:
+        """Reconcile a tenant's index with its Content rows.
+
+        Rows missing from the index or updated since the index was last
+        synced are embedded; indexed items without a row are removed.
+
+        Args:
+            db: Async database session
+            tenant_id: Tenant (content owner) ID
+            batch_size: Number of rows embedded per batch
+
+        Returns:
+            Number of content items embedded
+        """
+        tenant_id = str(tenant_id)
+        started_at = datetime.utcnow()
+        index = self.get_index(tenant_id)
+        cutoff = index.synced_at - SYNC_CLOCK_MARGIN if index.synced_at else None
+
+        result = await db.execute(
+            select(Content.id, Content.updated_at).where(Content.user_id == tenant_id)
+        )
+        stale, current = [], set()
+        for content_id, updated_at in result.all():
+            current.add(content_id)
+            if updated_at is not None and updated_at.tzinfo is not None:
+                updated_at = updated_at.replace(tzinfo=None)
+            if content_id not in index or cutoff is None or (updated_at is not None and updated_at >= cutoff):
+                stale.append(content_id)
+
+        with self._lock:
+            removed = [content_id for content_id in index.ids if content_id not in current]
+        if removed:
+            self.remove(tenant_id, removed)
+
+        for start in range(0, len(stale), batch_size):
+            result = await db.execute(
+                select(Content).where(Content.id.in_(stale[start:start + batch_size]))
+            )
+            items = [(row.id, content_embedding_text(row)) for row in result.scalars().all()]
+            await asyncio.to_thread(self.upsert, tenant_id, items)
+
+        with self._lock:
+            index.synced_at = started_at
+            self._last_sync[tenant_id] = time.monotonic()
+        if stale or removed or tenant_id in self._unsaved:
+            self.save(tenant_id)
+
+        logger.debug(f"Synced vector index for tenant {tenant_id}: {len(stale)} embedded, {len(removed)} removed")
+        return len(stale)
+
+    async def rebuild(self, db, tenant_id: str, batch_size: int = 500) -> int:
+        """Rebuild a tenant's index from the database, embedding every row.
+
+        Args:
+            db: Async database session
+            tenant_id: Tenant (content owner) ID
+            batch_size: Number of rows embedded per batch
+
+        Returns:
+            Number of content items indexed
+        """
+        tenant_id = str(tenant_id)
+        with self._lock:
+            self._indexes[tenant_id] = VectorIndex()
+        return await self.sync(db, tenant_id, batch_size)
+
+    def save(self, tenant_id: str):
+        """Write this process's snapshot of a tenant's index to disk.
+
+        Snapshots older than the one this process loaded are superseded and
+        removed.
+        """
+        tenant_id = str(tenant_id)
+        with self._lock:
+            index = self._indexes.get(tenant_id)
+            if index is None:
+                return
+            path = self._path(tenant_id)
+            try:
+                index.save(path)
+                self._unsaved.pop(tenant_id, None)
+            except OSError as e:
+                logger.warning(f"Could not save vector index for tenant {tenant_id}: {e}")
+                return
+
+            loaded_from = self._loaded_from.get(tenant_id)
+            if loaded_from is None:
+                return
+            for other in glob.glob(os.path.join(self._tenant_directory(tenant_id), "*.npz")):
+                try:
+                    if other != path and os.path.getmtime(other) < loaded_from:
+                        os.remove(other)
+                except OSError:
+                    pass
+
+    def flush(self):
+        """Write all indexes with unsaved changes to disk."""
+        with self._lock:
+            for tenant_id in list(self._unsaved):
+                self.save(tenant_id)
+
+    def _changed(self, tenant_id: str, count: int):
+        """Record unsaved changes and save once enough have accumulated."""
+        self._unsaved[tenant_id] += count
+        if self._unsaved[tenant_id] >= self.save_every:
+            self.save(tenant_id)
+
+
+# Global content vector index instance
+_content_vector_index: Optional[ContentVectorIndex] = None
+
+
+def get_content_vector_index() -> ContentVectorIndex:
+    """
+    Get or create the global content vector index.
+
+    Returns:
+        ContentVectorIndex instance
+    """
+    global _content_vector_index
+
+    if _content_vector_index is None:
+        _content_vector_index = ContentVectorIndex(
+            os.getenv("VECTOR_INDEX_DIR", os.path.expanduser("~/.cache/onside/vector_index")),
+            save_every=int(os.getenv("VECTOR_INDEX_SAVE_EVERY", "100")),
+            sync_interval=float(os.getenv("VECTOR_INDEX_SYNC_INTERVAL", "300"))
+        )
+
+    return _content_vector_index
+
+
+# Incremental indexing hooks
+
+_PENDING_CHANGES_KEY = "content_vector_index_changes"
+_hooks_registered = False
+_pending_tasks: Set[asyncio.Task] = set()
+
+
+def _collect_content_changes(session: Session, flush_context):
+    """Record flushed Content changes on the session until it commits."""
+    changes = session.info.setdefault(
+        _PENDING_CHANGES_KEY, {"upsert": defaultdict(dict), "delete": defaultdict(set)}
+    )
+
+    for obj in session.new:
+        if isinstance(obj, Content):
+            changes["upsert"][str(obj.user_id)][obj.id] = content_embedding_text(obj)
+
+    for obj in session.dirty:
+        if isinstance(obj, Content):
+            state = inspect(obj)
+            if any(state.attrs[name].history.has_changes() for name in EMBEDDED_ATTRIBUTES):
+                changes["upsert"][str(obj.user_id)][obj.id] = content_embedding_text(obj)
+
+    for obj in session.deleted:
+        if isinstance(obj, Content):
+            changes["upsert"][str(obj.user_id)].pop(obj.id, None)
+            changes["delete"][str(obj.user_id)].add(obj.id)
+
+
+def _apply_content_changes(session: Session):
+    """Update the vector index with the changes of a committed transaction."""
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not changes:
+        return
+
+    index = get_content_vector_index()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is None:
+        try:
+            index.apply_changes(changes)
+        except Exception as e:
+            logger.error(f"Failed to update content vector index: {e}")
+        return
+
+    # Embed off the event loop without delaying the commit
+    task = loop.create_task(asyncio.to_thread(index.apply_changes, changes))
+    _pending_tasks.add(task)
+
+    def _done(task: asyncio.Task):
+        _pending_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Failed to update content vector index: {task.exception()}")
+
+    task.add_done_callback(_done)
+
+
+def _discard_content_changes(session: Session):
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+def register_content_index_hooks():
+    """Keep the content vector index in sync with committed Content changes."""
+    global _hooks_registered
+
+    if _hooks_registered:
+        return
+
+    event.listen(Session, "after_flush", _collect_content_changes)
+    event.listen(Session, "after_commit", _apply_content_changes)
+    event.listen(Session, "after_soft_rollback", lambda session, previous_transaction: _discard_content_changes(session))
+    _hooks_registered = True
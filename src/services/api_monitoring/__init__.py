@@ -7,11 +7,15 @@ from .usage_tracker import (
     API_QUOTAS,
     get_usage_tracker
 )
+from .quota_counter import QuotaCounter, get_quota_counter, period_bounds
 
 __all__ = [
     'APIUsageTracker',
     'APIName',
     'QuotaPeriod',
     'API_QUOTAS',
-    'get_usage_tracker'
+    'get_usage_tracker',
+    'QuotaCounter',
+    'get_quota_counter',
+    'period_bounds'
 ]
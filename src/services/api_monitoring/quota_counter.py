@@ -0,0 +1,621 @@
+"""
+Atomic API Quota Counters
+
+External API usage is counted in Redis with HINCRBY on period-bucketed keys,
+so recording a call and checking a quota are single round trips without
+read-modify-write races between workers. Every increment is also added to a
+pending hash that a background flusher (and the ``flush_api_usage`` Celery
+task) drains into the ``api_usage_records`` table.
+
+The first time a process uses a period bucket it seeds the Redis counter from
+the database with HSETNX, so counts survive a Redis restart (less any calls
+that had not been flushed yet).
+
+Without Redis the counters are process-local and flushed the same way.
+
+Example:
+    counter = get_quota_counter()
+    start, end = period_bounds("daily")
+    usage = await counter.increment("gnews", start, end, endpoint="search")
+    if usage["limit"] is not None and usage["count"] > usage["limit"]:
+        ...
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from redis import asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# Costs are counted in millionths of a dollar so they can use HINCRBY
+COST_SCALE = 1_000_000
+
+# Add a call to the period totals and to the pending (unflushed) deltas.
+# Returns the new period totals and the period limit.
+INCREMENT_SCRIPT = """
+local count = redis.call('HINCRBY', KEYS[1], 'count', ARGV[1])
+local cost = redis.call('HINCRBY', KEYS[1], 'cost', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('HINCRBY', KEYS[2], ARGV[3], ARGV[1])
+if tonumber(ARGV[2]) ~= 0 then
+    redis.call('HINCRBY', KEYS[3], ARGV[3], ARGV[2])
+end
+return {count, cost, redis.call('HGET', KEYS[1], 'limit') or ''}
+"""
+
+# Take all pending deltas, leaving empty hashes for new increments
+DRAIN_SCRIPT = """
+local counts = redis.call('HGETALL', KEYS[1])
+local costs = redis.call('HGETALL', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2])
+return {counts, costs}
+"""
+
+
+def period_bounds(period: str, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Get the start and end of the quota period containing a time.
+
+    Args:
+        period: "hourly", "daily" or "monthly"
+        now: Time within the period (defaults to the current UTC time)
+
+    Returns:
+        Tuple of (period_start, period_end)
+    """
+    now = now or datetime.utcnow()
+
+    if period == "hourly":
+        period_start = now.replace(minute=0, second=0, microsecond=0)
+        return period_start, period_start + timedelta(hours=1)
+    if period == "daily":
+        period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return period_start, period_start + timedelta(days=1)
+
+    period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if period_start.month == 12:
+        period_end = period_start.replace(year=period_start.year + 1, month=1)
+    else:
+        period_end = period_start.replace(month=period_start.month + 1)
+    return period_start, period_end
+
+
+def period_name(period_start: datetime, period_end: datetime) -> str:
+    """Name the quota period spanning two times.
+
+    Args:
+        period_start: Start of the period
+        period_end: End of the period
+
+    Returns:
+        "hourly", "daily", "monthly", or "custom" for any other span
+    """
+    span = period_end - period_start
+    if span == timedelta(hours=1):
+        return "hourly"
+    if span == timedelta(days=1):
+        return "daily"
+    if period_start.day == 1 and period_bounds("monthly", period_start) == (period_start, period_end):
+        return "monthly"
+    return "custom"
+
+
+class QuotaCounter:
+    """Period-bucketed API usage counters with periodic persistence.
+
+    Each (API, period) bucket holds the total call count, total cost and the
+    quota limit for the period. Pending deltas are keyed by API, endpoint,
+    period and the quota settings to store on a newly created usage record.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        namespace: str = "onside:api_usage",
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_interval: float = 30.0,
+        retention: int = 2 * 24 * 3600
+    ):
+        """Initialize the quota counter.
+
+        Args:
+            redis_url: Redis connection URL (process-local counters if not provided)
+            namespace: Key namespace in Redis
+            session_factory: Async session factory used to seed and flush
+                counters (counters are memory-only if not provided)
+            flush_interval: Seconds between background flushes
+            retention: How long a bucket is kept after its period ends (seconds)
+        """
+        self.redis_url = redis_url
+        self.namespace = namespace
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.retention = retention
+
+        self.redis = None
+        self._increment = None
+        self._drain = None
+        self._initialized = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Buckets this process has already seeded from the database
+        self._seeded: Set[str] = set()
+        self._seed_locks: Dict[str, asyncio.Lock] = {}
+
+        # Process-local counters when Redis is unavailable
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, Optional[int]]] = {}
+        self._pending: Dict[str, List[int]] = {}
+
+    async def initialize(self) -> bool:
+        """Connect to Redis.
+
+        Returns:
+            True if Redis is available, False if using process-local counters
+        """
+        self._bind_loop()
+
+        if self._initialized:
+            return self.redis is not None
+
+        async with self._init_lock:
+            if self._initialized:
+                return self.redis is not None
+
+            if REDIS_AVAILABLE and self.redis_url:
+                try:
+                    self.redis = aioredis.from_url(
+                        self.redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=5,
+                        socket_keepalive=True
+                    )
+                    await self.redis.ping()
+                    self._increment = self.redis.register_script(INCREMENT_SCRIPT)
+                    self._drain = self.redis.register_script(DRAIN_SCRIPT)
+                    logger.info("API quota counters shared through Redis")
+                except Exception as e:
+                    logger.warning(f"Redis unavailable for API quota counters, using local counters: {e}")
+                    self.redis = None
+            else:
+                logger.debug("API quota counters are process-local (no Redis configured)")
+
+            self._initialized = True
+            return self.redis is not None
+
+    def _bind_loop(self):
+        """Rebind loop-bound resources when used from a new event loop.
+
+        Celery tasks run each coroutine in a fresh loop; the Redis connection
+        and locks of the previous loop cannot be reused there.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._init_lock = asyncio.Lock()
+        self._seed_locks = {}
+        self._flush_task = None
+        self.redis = None
+        self._increment = None
+        self._drain = None
+        self._initialized = False
+
+    def start(self):
+        """Start the background flusher in the running event loop."""
+        self._bind_loop()
+        if self.session_factory is None:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Stop the background flusher, flush pending usage and close Redis."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing API usage on shutdown: {e}")
+
+        if self.redis:
+            try:
+                await self.redis.close()
+            except Exception as e:
+                logger.error(f"Error closing API quota Redis connection: {e}")
+            self.redis = None
+        self._initialized = False
+
+    def _key(self, kind: str, *parts: str) -> str:
+        """Build a namespaced Redis key."""
+        return ":".join((self.namespace, kind) + parts)
+
+    def _bucket_key(self, api_name: str, period_start: datetime, period_end: datetime) -> str:
+        """Key of the totals for an API and period.
+
+        Hourly, daily and monthly periods can start at the same instant, so
+        the key names the period and its end as well as its start.
+        """
+        return self._key(
+            "total",
+            api_name,
+            period_name(period_start, period_end),
+            period_start.strftime("%Y%m%dT%H"),
+            period_end.strftime("%Y%m%dT%H")
+        )
+
+    def _ttl(self, period_end: datetime) -> int:
+        """Seconds to keep a bucket: until its period ends, plus retention."""
+        return max(1, int((period_end - datetime.utcnow()).total_seconds()) + self.retention)
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+
+    async def increment(
+        self,
+        api_name: str,
+        period_start: datetime,
+        period_end: datetime,
+        endpoint: Optional[str] = None,
+        count: int = 1,
+        cost: Decimal = Decimal("0"),
+        quota_limit: Optional[int] = None,
+        cost_per_call: Optional[Decimal] = None
+    ) -> Dict[str, Any]:
+        """Atomically record API calls.
+
+        Args:
+            api_name: Name of the API
+            period_start: Start of the quota period
+            period_end: End of the quota period
+            endpoint: Endpoint called (optional)
+            count: Number of calls to add
+            cost: Cost of the calls in USD
+            quota_limit: Quota limit stored on a newly created usage record
+            cost_per_call: Cost per call stored on a newly created usage record
+
+        Returns:
+            Dictionary with the period's count, cost and limit after the increment
+        """
+        await self.initialize()
+        key = self._bucket_key(api_name, period_start, period_end)
+        await self._seed(key, api_name, period_start, period_end)
+
+        field = json.dumps([
+            api_name,
+            endpoint,
+            period_start.isoformat(),
+            period_end.isoformat(),
+            quota_limit,
+            str(cost_per_call) if cost_per_call is not None else None
+        ])
+        cost_units = int(Decimal(cost) * COST_SCALE)
+
+        if self.redis:
+            try:
+                total, total_cost, limit = await self._increment(
+                    keys=[key, self._key("pending"), self._key("pending_cost")],
+                    args=[count, cost_units, field, self._ttl(period_end)]
+                )
+                return self._usage(total, total_cost, limit)
+            except Exception as e:
+                logger.warning(f"Could not count {api_name} usage in Redis, counting locally: {e}")
+
+        with self._lock:
+            bucket = self._totals.setdefault(key, {"count": 0, "cost": 0, "limit": None})
+            bucket["count"] += count
+            bucket["cost"] += cost_units
+            pending = self._pending.setdefault(field, [0, 0])
+            pending[0] += count
+            pending[1] += cost_units
+            return self._usage(bucket["count"], bucket["cost"], bucket["limit"])
+
+    async def get_usage(
+        self,
+        api_name: str,
+        period_start: datetime,
+        period_end: datetime
+    ) -> Dict[str, Any]:
+        """Get usage of an API in a period.
+
+        Args:
+            api_name: Name of the API
+            period_start: Start of the quota period
+            period_end: End of the quota period
+
+        Returns:
+            Dictionary with the period's count, cost (USD) and limit (None if unset)
+        """
+        await self.initialize()
+        key = self._bucket_key(api_name, period_start, period_end)
+        await self._seed(key, api_name, period_start, period_end)
+
+        if self.redis:
+            try:
+                total, total_cost, limit = await self.redis.hmget(key, "count", "cost", "limit")
+                return self._usage(total, total_cost, limit)
+            except Exception as e:
+                logger.warning(f"Could not read {api_name} usage from Redis, using local counters: {e}")
+
+        with self._lock:
+            bucket = self._totals.get(key, {})
+            return self._usage(bucket.get("count"), bucket.get("cost"), bucket.get("limit"))
+
+    async def set_limit(
+        self,
+        api_name: str,
+        period_start: datetime,
+        period_end: datetime,
+        limit: Optional[int]
+    ):
+        """Set the quota limit of an API for a period.
+
+        Args:
+            api_name: Name of the API
+            period_start: Start of the quota period
+            period_end: End of the quota period
+            limit: Maximum number of calls (None removes the limit)
+        """
+        await self.initialize()
+        key = self._bucket_key(api_name, period_start, period_end)
+        await self._seed(key, api_name, period_start, period_end)
+
+        if self.redis:
+            try:
+                if limit is None:
+                    await self.redis.hdel(key, "limit")
+                else:
+                    await self.redis.hset(key, "limit", limit)
+                    await self.redis.expire(key, self._ttl(period_end))
+                return
+            except Exception as e:
+                logger.warning(f"Could not set {api_name} limit in Redis, setting locally: {e}")
+
+        with self._lock:
+            self._totals.setdefault(key, {"count": 0, "cost": 0, "limit": None})["limit"] = limit
+
+    async def reset(self, api_name: str, period_start: datetime, period_end: datetime):
+        """Reset the usage of an API for a period, including unflushed calls.
+
+        Args:
+            api_name: Name of the API
+            period_start: Start of the quota period
+            period_end: End of the quota period
+        """
+        await self.initialize()
+        key = self._bucket_key(api_name, period_start, period_end)
+        start, end = period_start.isoformat(), period_end.isoformat()
+        self._seeded.add(key)
+
+        def matches(field: str) -> bool:
+            parts = json.loads(field)
+            return parts[0] == api_name and parts[2] == start and parts[3] == end
+
+        if self.redis:
+            try:
+                await self.redis.hset(key, mapping={"count": 0, "cost": 0})
+                for pending_key in (self._key("pending"), self._key("pending_cost")):
+                    fields = [f for f in await self.redis.hkeys(pending_key) if matches(f)]
+                    if fields:
+                        await self.redis.hdel(pending_key, *fields)
+                return
+            except Exception as e:
+                logger.warning(f"Could not reset {api_name} usage in Redis, resetting locally: {e}")
+
+        with self._lock:
+            bucket = self._totals.setdefault(key, {"count": 0, "cost": 0, "limit": None})
+            bucket["count"] = bucket["cost"] = 0
+            for field in [f for f in self._pending if matches(f)]:
+                del self._pending[field]
+
+    @staticmethod
+    def _usage(count: Any, cost: Any, limit: Any) -> Dict[str, Any]:
+        """Build a usage dictionary from stored counter values."""
+        return {
+            "count": int(count or 0),
+            "cost": Decimal(int(cost or 0)) / COST_SCALE,
+            "limit": int(limit) if limit not in (None, "") else None
+        }
+
+    async def _seed(self, key: str, api_name: str, period_start: datetime, period_end: datetime):
+        """Initialize a bucket from the database the first time it is used.
+
+        HSETNX keeps counts already recorded by other workers.
+        """
+        if key in self._seeded:
+            return
+
+        lock = self._seed_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key in self._seeded:
+                return
+            try:
+                await self._seed_from_database(key, api_name, period_start, period_end)
+            except Exception as e:
+                logger.warning(f"Could not seed {api_name} usage from the database: {e}")
+            self._seeded.add(key)
+
+    async def _seed_from_database(
+        self,
+        key: str,
+        api_name: str,
+        period_start: datetime,
+        period_end: datetime
+    ):
+        """Copy a period's persisted totals into an empty bucket."""
+        if self.session_factory is None:
+            return
+        if self.redis and await self.redis.hexists(key, "count"):
+            return
+
+        from src.repositories.api_usage_repository import APIUsageRepository
+
+        async with self.session_factory() as session:
+            totals = await APIUsageRepository(session).get_period_totals(
+                api_name, period_start, period_end
+            )
+        values = {
+            "count": totals["request_count"],
+            "cost": int(totals["total_cost"] * COST_SCALE),
+            "limit": totals["quota_limit"]
+        }
+
+        if self.redis:
+            for field, value in values.items():
+                if value is not None:
+                    await self.redis.hsetnx(key, field, value)
+            await self.redis.expire(key, self._ttl(period_end))
+        else:
+            with self._lock:
+                self._totals.setdefault(key, values)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Persist pending usage to the api_usage_records table.
+
+        Pending deltas are taken atomically, so concurrent flushers never
+        write the same calls twice. Deltas are put back if the write fails.
+
+        Returns:
+            Number of usage records written
+        """
+        if self.session_factory is None:
+            return 0
+
+        await self.initialize()
+        pending = await self._take_pending()
+        if not pending:
+            return 0
+
+        deltas = []
+        for field, (count, cost_units) in pending.items():
+            api_name, endpoint, start, end, quota_limit, cost_per_call = json.loads(field)
+            deltas.append({
+                "api_name": api_name,
+                "endpoint": endpoint,
+                "period_start": datetime.fromisoformat(start),
+                "period_end": datetime.fromisoformat(end),
+                "count": count,
+                "cost": Decimal(cost_units) / COST_SCALE,
+                "quota_limit": quota_limit,
+                "cost_per_call": Decimal(cost_per_call) if cost_per_call is not None else None
+            })
+
+        try:
+            from src.repositories.api_usage_repository import APIUsageRepository
+
+            async with self.session_factory() as session:
+                await APIUsageRepository(session).apply_usage_deltas(deltas)
+        except Exception as e:
+            logger.error(f"Could not flush API usage, will retry: {e}")
+            await self._restore_pending(pending)
+            return 0
+
+        logger.debug(f"Flushed {len(deltas)} API usage records")
+        return len(deltas)
+
+    async def _take_pending(self) -> Dict[str, List[int]]:
+        """Atomically remove and return all pending deltas."""
+        pending: Dict[str, List[int]] = {}
+
+        if self.redis:
+            try:
+                counts, costs = await self._drain(
+                    keys=[self._key("pending"), self._key("pending_cost")]
+                )
+                for field, value in zip(counts[::2], counts[1::2]):
+                    pending.setdefault(field, [0, 0])[0] = int(value)
+                for field, value in zip(costs[::2], costs[1::2]):
+                    pending.setdefault(field, [0, 0])[1] = int(value)
+            except Exception as e:
+                logger.warning(f"Could not read pending API usage from Redis: {e}")
+
+        with self._lock:
+            for field, (count, cost_units) in self._pending.items():
+                totals = pending.setdefault(field, [0, 0])
+                totals[0] += count
+                totals[1] += cost_units
+            self._pending = {}
+
+        return pending
+
+    async def _restore_pending(self, pending: Dict[str, List[int]]):
+        """Put deltas back after a failed flush."""
+        if self.redis:
+            try:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    for field, (count, cost_units) in pending.items():
+                        pipe.hincrby(self._key("pending"), field, count)
+                        if cost_units:
+                            pipe.hincrby(self._key("pending_cost"), field, cost_units)
+                    await pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"Could not restore pending API usage in Redis, keeping it locally: {e}")
+
+        with self._lock:
+            for field, (count, cost_units) in pending.items():
+                totals = self._pending.setdefault(field, [0, 0])
+                totals[0] += count
+                totals[1] += cost_units
+
+    async def _flush_loop(self):
+        """Flush pending usage every ``flush_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"API usage flush failed: {e}")
+
+
+# Global quota counter instance
+_quota_counter: Optional[QuotaCounter] = None
+
+
+def get_quota_counter(redis_url: Optional[str] = None) -> QuotaCounter:
+    """
+    Get or create the global API quota counter.
+
+    Args:
+        redis_url: Redis connection URL (defaults to the REDIS_URL env variable)
+
+    Returns:
+        QuotaCounter instance
+    """
+    global _quota_counter
+
+    if _quota_counter is None:
+        from src.database import SessionLocal
+
+        _quota_counter = QuotaCounter(
+            redis_url=redis_url or os.getenv("REDIS_URL"),
+            session_factory=SessionLocal,
+            flush_interval=float(os.getenv("API_USAGE_FLUSH_INTERVAL", "30"))
+        )
+
+    return _quota_counter
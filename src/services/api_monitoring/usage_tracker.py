@@ -11,6 +11,10 @@ Tracks external API usage and manages quotas across all integrated services:
 - YouTube API
 - Google Custom Search API
 
+Calls are counted with atomic Redis counters (see quota_counter), so tracking
+a call and checking a quota never touch the database; aggregates are flushed
+to the api_usage_records table in the background.
+
 Features:
 - Real-time usage tracking
 - Quota management and enforcement
@@ -28,6 +32,7 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 from src.models.external_api import APIUsageRecord
+from src.services.api_monitoring.quota_counter import QuotaCounter, get_quota_counter, period_bounds
 
 logger = logging.getLogger(__name__)
 
@@ -109,13 +114,15 @@ class APIUsageTracker:
     Tracks API usage and manages quotas.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, counter: Optional[QuotaCounter] = None):
         """Initialize usage tracker.
 
         Args:
             db: Database session
+            counter: Quota counter (defaults to the shared counter)
         """
         self.db = db
+        self.counter = counter if counter is not None else get_quota_counter()
 
     async def track_api_call(
         self,
@@ -138,34 +145,28 @@ class APIUsageTracker:
         # Get current period
         period_start, period_end = self._get_current_period(api_name)
 
-        # Get or create usage record
-        usage_record = await self._get_or_create_usage_record(
-            api_name, endpoint, period_start, period_end
-        )
-
-        # Increment request count (only if successful)
-        if success:
-            usage_record.request_count += 1
-
-        # Update cost
         quota_config = API_QUOTAS.get(api_name)
-        if quota_config:
-            cost_per_call = cost_override or quota_config['cost_per_call']
-            if usage_record.total_cost is None:
-                usage_record.total_cost = Decimal('0.0')
-            usage_record.total_cost += cost_per_call
-
-        await self.db.commit()
-        await self.db.refresh(usage_record)
+        cost_per_call = quota_config['cost_per_call'] if quota_config else Decimal('0.0')
+
+        # Count the request (only if successful) and its cost atomically
+        usage = await self.counter.increment(
+            api_name.value,
+            period_start,
+            period_end,
+            endpoint=endpoint,
+            count=1 if success else 0,
+            cost=(cost_override or cost_per_call) if quota_config else Decimal('0.0'),
+            quota_limit=quota_config['limit'] if quota_config else 0,
+            cost_per_call=cost_per_call
+        )
 
-        # Check quota status
-        quota_status = await self.check_quota_status(api_name)
+        quota_status = self._build_quota_status(api_name, usage, period_start, period_end)
 
         return {
             'tracked': True,
             'api_name': api_name.value,
-            'current_count': usage_record.request_count,
-            'quota_limit': usage_record.quota_limit,
+            'current_count': usage['count'],
+            'quota_limit': quota_status['quota_limit'],
             'quota_status': quota_status
         }
 
@@ -179,24 +180,31 @@ class APIUsageTracker:
             Dictionary with quota status
         """
         period_start, period_end = self._get_current_period(api_name)
+        usage = await self.counter.get_usage(api_name.value, period_start, period_end)
+        return self._build_quota_status(api_name, usage, period_start, period_end)
 
-        usage_record = await self._get_usage_record(
-            api_name, None, period_start, period_end
-        )
+    def _build_quota_status(
+        self,
+        api_name: APIName,
+        usage: Dict[str, Any],
+        period_start: datetime,
+        period_end: datetime
+    ) -> Dict[str, Any]:
+        """Build a quota status from counter usage.
 
-        if not usage_record:
-            return {
-                'quota_available': True,
-                'usage_count': 0,
-                'quota_limit': API_QUOTAS.get(api_name, {}).get('limit', 0),
-                'usage_percentage': 0.0,
-                'remaining': API_QUOTAS.get(api_name, {}).get('limit', 0),
-                'period_start': period_start.isoformat(),
-                'period_end': period_end.isoformat()
-            }
-
-        quota_limit = usage_record.quota_limit or 0
-        usage_count = usage_record.request_count
+        Args:
+            api_name: Name of the API
+            usage: Counter usage with count, cost and limit
+            period_start: Period start time
+            period_end: Period end time
+
+        Returns:
+            Dictionary with quota status
+        """
+        quota_limit = usage['limit']
+        if quota_limit is None:
+            quota_limit = API_QUOTAS.get(api_name, {}).get('limit', 0)
+        usage_count = usage['count']
         usage_percentage = (usage_count / quota_limit * 100) if quota_limit > 0 else 0
 
         quota_available = usage_count < quota_limit
@@ -211,7 +219,7 @@ class APIUsageTracker:
             'threshold_status': threshold_status,
             'period_start': period_start.isoformat(),
             'period_end': period_end.isoformat(),
-            'estimated_cost': float(usage_record.total_cost or 0)
+            'estimated_cost': float(usage['cost'])
         }
 
     async def can_make_api_call(self, api_name: APIName) -> bool:
@@ -345,6 +353,7 @@ class APIUsageTracker:
             record.total_cost = Decimal('0.0')
 
         await self.db.commit()
+        await self.counter.reset(api_name.value, period_start, period_end)
 
         return {
             'reset': True,
@@ -368,93 +377,7 @@ class APIUsageTracker:
         else:
             period = quota_config['period']
 
-        now = datetime.utcnow()
-
-        if period == QuotaPeriod.HOURLY:
-            period_start = now.replace(minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(hours=1)
-        elif period == QuotaPeriod.DAILY:
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            period_end = period_start + timedelta(days=1)
-        else:  # MONTHLY
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            # Get first day of next month
-            if now.month == 12:
-                period_end = period_start.replace(year=now.year + 1, month=1)
-            else:
-                period_end = period_start.replace(month=now.month + 1)
-
-        return period_start, period_end
-
-    async def _get_usage_record(
-        self,
-        api_name: APIName,
-        endpoint: Optional[str],
-        period_start: datetime,
-        period_end: datetime
-    ) -> Optional[APIUsageRecord]:
-        """Get usage record for current period.
-
-        Args:
-            api_name: Name of the API
-            endpoint: Optional endpoint
-            period_start: Period start time
-            period_end: Period end time
-
-        Returns:
-            APIUsageRecord or None
-        """
-        query = select(APIUsageRecord).where(
-            and_(
-                APIUsageRecord.api_name == api_name.value,
-                APIUsageRecord.period_start == period_start,
-                APIUsageRecord.period_end == period_end
-            )
-        )
-
-        if endpoint:
-            query = query.where(APIUsageRecord.endpoint == endpoint)
-
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
-
-    async def _get_or_create_usage_record(
-        self,
-        api_name: APIName,
-        endpoint: Optional[str],
-        period_start: datetime,
-        period_end: datetime
-    ) -> APIUsageRecord:
-        """Get or create usage record.
-
-        Args:
-            api_name: Name of the API
-            endpoint: Optional endpoint
-            period_start: Period start time
-            period_end: Period end time
-
-        Returns:
-            APIUsageRecord
-        """
-        record = await self._get_usage_record(api_name, endpoint, period_start, period_end)
-
-        if not record:
-            quota_config = API_QUOTAS.get(api_name)
-            record = APIUsageRecord(
-                api_name=api_name.value,
-                endpoint=endpoint,
-                request_count=0,
-                quota_limit=quota_config['limit'] if quota_config else 0,
-                period_start=period_start,
-                period_end=period_end,
-                cost_per_call=quota_config['cost_per_call'] if quota_config else Decimal('0.0'),
-                total_cost=Decimal('0.0')
-            )
-            self.db.add(record)
-            await self.db.commit()
-            await self.db.refresh(record)
-
-        return record
+        return period_bounds(period.value)
 
     def _get_threshold_status(self, usage_percentage: float) -> str:
         """Get threshold status based on usage percentage.
@@ -17,6 +17,8 @@ from aiohttp import ClientSession, ClientResponse, ClientError
 from pydantic import BaseModel, ValidationError
 from ratelimit import limits, sleep_and_retry
 
+from src.core.http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
@@ -54,22 +56,20 @@ class APIClient(ABC):
         
         Args:
             api_key: API key for authentication
-            session: Optional aiohttp ClientSession for connection pooling
+            session: Optional aiohttp ClientSession (defaults to the shared HTTP pool)
         """
         self.api_key = api_key
         self._session = session
-        self._session_owner = session is None
         self._base_headers = self._get_base_headers()
     
     async def __aenter__(self):
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = get_http_pool().get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session_owner and self._session:
-            await self._session.close()
-            self._session = None
+        # Sessions are either caller-provided or pooled; neither is ours to close
+        pass
     
     def _get_base_headers(self) -> Dict[str, str]:
         """Get base headers for API requests."""
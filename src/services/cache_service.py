@@ -9,6 +9,7 @@ This module provides an async-first caching layer with:
 - Cache statistics and monitoring
 - Pattern-based invalidation
 - Connection pooling
+- Bounded in-process near-cache in front of Redis (also the fallback store)
 - Error handling and fallback strategies
 """
 
@@ -22,6 +23,8 @@ import asyncio
 from functools import wraps
 from contextlib import asynccontextmanager
 
+from src.core.local_cache import LocalCache, LocalCacheConfig
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -50,7 +53,8 @@ class AsyncCacheService:
         self,
         redis_url: Optional[str] = None,
         namespace: str = "onside",
-        default_ttl: int = 300
+        default_ttl: int = 300,
+        local_cache_config: Optional[LocalCacheConfig] = None
     ):
         """
         Initialize async cache service.
@@ -59,12 +63,13 @@ class AsyncCacheService:
             redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
             namespace: Cache key namespace for organization
             default_ttl: Default TTL in seconds (5 minutes)
+            local_cache_config: Limits for the in-process cache tier
         """
         self.redis_url = redis_url
         self.namespace = namespace
         self.default_ttl = default_ttl
         self.redis: Optional[aioredis.Redis] = None
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._local = LocalCache(f"cache_service:{namespace}", local_cache_config)
         self._stats = {
             "hits": 0,
             "misses": 0,
@@ -101,6 +106,7 @@ class AsyncCacheService:
 
             # Test connection
             await self.redis.ping()
+            self._local.start_invalidation_listener(self.redis)
             logger.info(f"Redis cache initialized: {self.redis_url}")
             self._initialized = True
             return True
@@ -114,6 +120,7 @@ class AsyncCacheService:
 
     async def close(self):
         """Close Redis connection."""
+        await self._local.stop_invalidation_listener()
         if self.redis:
             try:
                 await self.redis.close()
@@ -170,6 +177,12 @@ class AsyncCacheService:
             # Fall back to pickle
             return pickle.loads(data)
 
+    def _local_ttl(self, ttl: Optional[int]) -> Optional[float]:
+        """TTL for the local tier: capped when it is a near-cache in front of Redis."""
+        if self.redis:
+            return self._local.near_ttl(ttl)
+        return ttl if ttl and ttl > 0 else None
+
     async def get(
         self,
         key: str,
@@ -179,6 +192,10 @@ class AsyncCacheService:
         """
         Get value from cache.
 
+        The in-process cache is checked first; Redis hits are kept there for
+        a short time so hot keys are served without a network round trip.
+        It holds serialized values, so every caller gets its own copy.
+
         Args:
             key: Cache key
             category: Optional category
@@ -189,6 +206,11 @@ class AsyncCacheService:
         """
         cache_key = self._make_key(key, category)
 
+        data = self._local.get(cache_key)
+        if data is not None:
+            self._stats["hits"] += 1
+            return self._deserialize(data)
+
         try:
             if self.redis:
                 # Redis backend
@@ -198,28 +220,63 @@ class AsyncCacheService:
                     return default
 
                 self._stats["hits"] += 1
+                self._local.set(cache_key, data, ttl=self._local_ttl(None), size=len(data))
                 return self._deserialize(data)
             else:
                 # Memory backend
-                if cache_key not in self._memory_cache:
-                    self._stats["misses"] += 1
-                    return default
+                self._stats["misses"] += 1
+                return default
 
-                item = self._memory_cache[cache_key]
+        except Exception as e:
+            logger.error(f"Error getting cache key {cache_key}: {e}")
+            self._stats["errors"] += 1
+            return default
 
-                # Check expiration
-                if item["expires"] and item["expires"] < datetime.utcnow():
-                    del self._memory_cache[cache_key]
-                    self._stats["misses"] += 1
-                    return default
+    async def get_many(
+        self,
+        keys: List[str],
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get several values from cache in one round trip.
 
-                self._stats["hits"] += 1
-                return item["value"]
+        Args:
+            keys: Cache keys
+            category: Optional category
+
+        Returns:
+            Dictionary of key -> cached value for keys that were found
+        """
+        if not keys:
+            return {}
+
+        found: Dict[str, Any] = {}
+        remote: Dict[str, str] = {}
+
+        for key in keys:
+            cache_key = self._make_key(key, category)
+            data = self._local.get(cache_key)
+            if data is not None:
+                found[key] = self._deserialize(data)
+            else:
+                remote[key] = cache_key
+
+        try:
+            if remote and self.redis:
+                # Redis backend: single MGET
+                values = await self.redis.mget(list(remote.values()))
+                for (key, cache_key), data in zip(remote.items(), values):
+                    if data is not None:
+                        found[key] = self._deserialize(data)
+                        self._local.set(cache_key, data, ttl=self._local_ttl(None), size=len(data))
 
         except Exception as e:
-            logger.error(f"Error getting cache key {cache_key}: {e}")
+            logger.error(f"Error getting {len(keys)} cache keys: {e}")
             self._stats["errors"] += 1
-            return default
+
+        self._stats["hits"] += len(found)
+        self._stats["misses"] += len(keys) - len(found)
+        return found
 
     async def set(
         self,
@@ -244,25 +301,24 @@ class AsyncCacheService:
         ttl = ttl if ttl is not None else self.default_ttl
 
         try:
-            if self.redis:
-                # Redis backend
-                serialized = self._serialize(value)
-                if ttl > 0:
-                    await self.redis.setex(cache_key, ttl, serialized)
-                else:
-                    await self.redis.set(cache_key, serialized)
+            serialized = self._serialize(value)
 
-                self._stats["sets"] += 1
-                return True
-            else:
-                # Memory backend
-                expires = datetime.utcnow() + timedelta(seconds=ttl) if ttl > 0 else None
-                self._memory_cache[cache_key] = {
-                    "value": value,
-                    "expires": expires
-                }
-                self._stats["sets"] += 1
-                return True
+            if self.redis:
+                # Redis backend (write and invalidate other nodes in one round trip)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    if ttl > 0:
+                        pipe.setex(cache_key, ttl, serialized)
+                    else:
+                        pipe.set(cache_key, serialized)
+                    pipe.publish(
+                        self._local.config.invalidation_channel,
+                        self._local.invalidation_message(keys=[cache_key])
+                    )
+                    await pipe.execute()
+
+            self._local.set(cache_key, serialized, ttl=self._local_ttl(ttl), size=len(serialized))
+            self._stats["sets"] += 1
+            return True
 
         except Exception as e:
             logger.error(f"Error setting cache key {cache_key}: {e}")
@@ -285,19 +341,24 @@ class AsyncCacheService:
             True if key was deleted
         """
         cache_key = self._make_key(key, category)
+        deleted_locally = self._local.delete(cache_key) > 0
 
         try:
             if self.redis:
-                deleted = await self.redis.delete(cache_key)
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(cache_key)
+                    pipe.publish(
+                        self._local.config.invalidation_channel,
+                        self._local.invalidation_message(keys=[cache_key])
+                    )
+                    deleted = (await pipe.execute())[0]
                 if deleted > 0:
                     self._stats["deletes"] += 1
                 return deleted > 0
             else:
-                if cache_key in self._memory_cache:
-                    del self._memory_cache[cache_key]
+                if deleted_locally:
                     self._stats["deletes"] += 1
-                    return True
-                return False
+                return deleted_locally
 
         except Exception as e:
             logger.error(f"Error deleting cache key {cache_key}: {e}")
@@ -325,15 +386,7 @@ class AsyncCacheService:
             if self.redis:
                 return await self.redis.exists(cache_key) > 0
             else:
-                if cache_key not in self._memory_cache:
-                    return False
-
-                item = self._memory_cache[cache_key]
-                if item["expires"] and item["expires"] < datetime.utcnow():
-                    del self._memory_cache[cache_key]
-                    return False
-
-                return True
+                return cache_key in self._local
 
         except Exception as e:
             logger.error(f"Error checking existence of {cache_key}: {e}")
@@ -357,30 +410,18 @@ class AsyncCacheService:
         full_pattern = self._make_key(pattern, category)
 
         try:
+            deleted = self._local.delete_pattern(full_pattern)
+
             if self.redis:
                 # Use SCAN for better performance with large keyspaces
                 deleted = 0
                 async for key in self.redis.scan_iter(match=full_pattern, count=100):
                     await self.redis.delete(key)
                     deleted += 1
+                await self._local.publish_invalidation(self.redis, patterns=[full_pattern])
 
-                self._stats["deletes"] += deleted
-                return deleted
-            else:
-                # Memory backend - simple pattern matching
-                deleted = 0
-                pattern_prefix = full_pattern.replace("*", "")
-                keys_to_delete = [
-                    k for k in self._memory_cache.keys()
-                    if k.startswith(pattern_prefix)
-                ]
-
-                for key in keys_to_delete:
-                    del self._memory_cache[key]
-                    deleted += 1
-
-                self._stats["deletes"] += deleted
-                return deleted
+            self._stats["deletes"] += deleted
+            return deleted
 
         except Exception as e:
             logger.error(f"Error clearing pattern {full_pattern}: {e}")
@@ -405,13 +446,14 @@ class AsyncCacheService:
                     await self.redis.delete(key)
                     deleted += 1
 
+                self._local.clear()
+                await self._local.publish_invalidation(self.redis, clear=True)
                 logger.info(f"Cleared {deleted} keys from cache")
                 self._stats["deletes"] += deleted
                 return True
             else:
                 # Clear memory cache
-                count = len(self._memory_cache)
-                self._memory_cache.clear()
+                count = self._local.clear()
                 logger.info(f"Cleared {count} keys from memory cache")
                 self._stats["deletes"] += count
                 return True
@@ -492,7 +534,8 @@ class AsyncCacheService:
                 "errors": self._stats["errors"],
                 "total_operations": total_ops,
                 "hit_rate_percent": round(hit_rate * 100, 2)
-            }
+            },
+            "local_cache": self._local.stats()
         }
 
     def reset_statistics(self):
@@ -8,7 +8,7 @@ Provides a comprehensive caching layer with:
 - Multiple cache invalidation strategies
 - Cache warming for popular keywords
 - Cache statistics and monitoring
-- Graceful fallback to in-memory cache on Redis failure
+- Bounded in-process near-cache in front of Redis (also the fallback on Redis failure)
 """
 import logging
 import json
@@ -21,18 +21,21 @@ import asyncio
 
 try:
     import redis.asyncio as aioredis
+    from redis import Redis as SyncRedis
     from redis.asyncio import Redis, ConnectionPool
     from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     aioredis = None
+    SyncRedis = None
     Redis = None
     ConnectionPool = None
     RedisError = Exception
     RedisConnectionError = Exception
 
 from src.config import get_settings
+from src.core.local_cache import LocalCache, LocalCacheConfig
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -58,7 +61,8 @@ class CacheManager:
         redis_url: Optional[str] = None,
         namespace: str = "onside",
         max_connections: int = 50,
-        enable_fallback: bool = True
+        enable_fallback: bool = True,
+        local_cache_config: Optional[LocalCacheConfig] = None
     ):
         """Initialize cache manager.
 
@@ -67,14 +71,17 @@ class CacheManager:
             namespace: Cache key namespace for multi-tenancy
             max_connections: Maximum Redis connection pool size
             enable_fallback: Enable in-memory fallback on Redis failure
+            local_cache_config: Limits for the in-process cache tier
         """
         self.namespace = namespace
         self.enable_fallback = enable_fallback
+        self.redis_url: Optional[str] = None
         self.redis_client: Optional[Redis] = None
         self.connection_pool: Optional[ConnectionPool] = None
-        self.fallback_cache: Dict[str, Any] = {}
+        self.local_cache = LocalCache(f"cache_manager:{namespace}", local_cache_config)
         self.stats = {
             'hits': 0,
+            'local_hits': 0,
             'misses': 0,
             'sets': 0,
             'deletes': 0,
@@ -84,8 +91,8 @@ class CacheManager:
 
         # Initialize Redis if available
         if REDIS_AVAILABLE and settings.CACHE_ENABLED:
-            redis_url = redis_url or settings.REDIS_URL
-            self._initialize_redis(redis_url, max_connections)
+            self.redis_url = redis_url or settings.REDIS_URL
+            self._initialize_redis(self.redis_url, max_connections)
         else:
             logger.warning("Redis not available or cache disabled, using in-memory fallback")
 
@@ -177,6 +184,19 @@ class CacheManager:
                 logger.error(f"Deserialization error: {e}")
                 return None
 
+    def _local_ttl(self, ttl: Optional[int]) -> Optional[float]:
+        """TTL for the local tier: capped when it is a near-cache in front of Redis."""
+        if self.redis_client:
+            return self.local_cache.near_ttl(ttl)
+        return ttl
+
+    def _publish_invalidation(self, pipe, keys: List[str] = (), patterns: List[str] = ()):
+        """Queue an invalidation message for other processes' local caches on a pipeline."""
+        pipe.publish(
+            self.local_cache.config.invalidation_channel,
+            self.local_cache.invalidation_message(keys=keys, patterns=patterns)
+        )
+
     async def get(
         self,
         key: str,
@@ -185,6 +205,10 @@ class CacheManager:
     ) -> Any:
         """Get value from cache.
 
+        The in-process cache is checked first; Redis hits are kept there for
+        a short time so hot keys are served without a network round trip.
+        It holds serialized values, so every caller gets its own copy.
+
         Args:
             key: Cache key
             category: Optional category
@@ -195,38 +219,36 @@ class CacheManager:
         """
         cache_key = self._generate_key(key, category)
 
+        data = self.local_cache.get(cache_key)
+        value = self._deserialize(data) if data is not None else None
+        if value is not None:
+            self.stats['hits'] += 1
+            self.stats['local_hits'] += 1
+            return value
+
+        if not self.redis_client:
+            self.stats['fallback_ops'] += 1
+            self.stats['misses'] += 1
+            return default
+
         try:
-            if self.redis_client:
-                data = await self.redis_client.get(cache_key)
-                if data is not None:
-                    self.stats['hits'] += 1
-                    return self._deserialize(data)
-                else:
-                    self.stats['misses'] += 1
-                    return default
-            else:
-                # Fallback to in-memory cache
-                self.stats['fallback_ops'] += 1
-                value = self.fallback_cache.get(cache_key)
-                if value is not None:
-                    # Check TTL in fallback
-                    if isinstance(value, dict) and '__ttl__' in value:
-                        if datetime.utcnow() > value['__ttl__']:
-                            del self.fallback_cache[cache_key]
-                            self.stats['misses'] += 1
-                            return default
-                        self.stats['hits'] += 1
-                        return value['__value__']
-                    self.stats['hits'] += 1
-                    return value
+            data = await self.redis_client.get(cache_key)
+            if data is None:
                 self.stats['misses'] += 1
                 return default
 
+            value = self._deserialize(data)
+            if value is None:
+                self.stats['misses'] += 1
+                return default
+
+            self.stats['hits'] += 1
+            self.local_cache.set(cache_key, data, ttl=self._local_ttl(None), size=len(data))
+            return value
+
         except (RedisError, RedisConnectionError) as e:
             logger.warning(f"Redis error in get operation: {e}")
             self.stats['errors'] += 1
-            if self.enable_fallback:
-                return self.fallback_cache.get(cache_key, default)
             return default
         except Exception as e:
             logger.error(f"Unexpected error in get operation: {e}")
@@ -251,43 +273,7 @@ class CacheManager:
         Returns:
             True if successful, False otherwise
         """
-        cache_key = self._generate_key(key, category)
-
-        try:
-            serialized = self._serialize(value)
-
-            if self.redis_client:
-                if ttl:
-                    await self.redis_client.setex(cache_key, ttl, serialized)
-                else:
-                    await self.redis_client.set(cache_key, serialized)
-                self.stats['sets'] += 1
-                return True
-            else:
-                # Fallback to in-memory cache
-                self.stats['fallback_ops'] += 1
-                if ttl:
-                    expiry = datetime.utcnow() + timedelta(seconds=ttl)
-                    self.fallback_cache[cache_key] = {
-                        '__value__': value,
-                        '__ttl__': expiry
-                    }
-                else:
-                    self.fallback_cache[cache_key] = value
-                self.stats['sets'] += 1
-                return True
-
-        except (RedisError, RedisConnectionError) as e:
-            logger.warning(f"Redis error in set operation: {e}")
-            self.stats['errors'] += 1
-            if self.enable_fallback:
-                self.fallback_cache[cache_key] = value
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error in set operation: {e}")
-            self.stats['errors'] += 1
-            return False
+        return await self.set_many({key: value}, ttl=ttl, category=category)
 
     async def delete(
         self,
@@ -303,23 +289,25 @@ class CacheManager:
         Returns:
             Number of keys deleted
         """
+        if not keys:
+            return 0
+
         cache_keys = [self._generate_key(key, category) for key in keys]
+        local_count = self.local_cache.delete(*cache_keys)
 
         try:
             if self.redis_client:
-                count = await self.redis_client.delete(*cache_keys)
-                self.stats['deletes'] += count
-                return count
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.delete(*cache_keys)
+                    self._publish_invalidation(pipe, keys=cache_keys)
+                    count = (await pipe.execute())[0]
             else:
                 # Fallback to in-memory cache
                 self.stats['fallback_ops'] += 1
-                count = 0
-                for key in cache_keys:
-                    if key in self.fallback_cache:
-                        del self.fallback_cache[key]
-                        count += 1
-                self.stats['deletes'] += count
-                return count
+                count = local_count
+
+            self.stats['deletes'] += count
+            return count
 
         except (RedisError, RedisConnectionError) as e:
             logger.warning(f"Redis error in delete operation: {e}")
@@ -330,6 +318,136 @@ class CacheManager:
             self.stats['errors'] += 1
             return 0
 
+    # Batch operations
+
+    async def get_many(
+        self,
+        keys: List[str],
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get several values from cache in a single round trip (MGET).
+
+        Args:
+            keys: Cache keys
+            category: Optional category
+
+        Returns:
+            Dictionary mapping each found key to its cached value
+        """
+        if not keys:
+            return {}
+
+        found: Dict[str, Any] = {}
+        remote: Dict[str, str] = {}
+
+        for key in keys:
+            cache_key = self._generate_key(key, category)
+            data = self.local_cache.get(cache_key)
+            value = self._deserialize(data) if data is not None else None
+            if value is not None:
+                found[key] = value
+            else:
+                remote[key] = cache_key
+
+        self.stats['local_hits'] += len(found)
+
+        try:
+            if remote and self.redis_client:
+                values = await self.redis_client.mget(list(remote.values()))
+                for (key, cache_key), data in zip(remote.items(), values):
+                    if data is None:
+                        continue
+                    value = self._deserialize(data)
+                    if value is not None:
+                        found[key] = value
+                        self.local_cache.set(cache_key, data, ttl=self._local_ttl(None), size=len(data))
+            elif not self.redis_client:
+                self.stats['fallback_ops'] += 1
+
+        except (RedisError, RedisConnectionError) as e:
+            logger.warning(f"Redis error in get_many operation: {e}")
+            self.stats['errors'] += 1
+        except Exception as e:
+            logger.error(f"Unexpected error in get_many operation: {e}")
+            self.stats['errors'] += 1
+
+        self.stats['hits'] += len(found)
+        self.stats['misses'] += len(keys) - len(found)
+        return found
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        category: Optional[str] = None
+    ) -> bool:
+        """Set several values in a single pipelined round trip.
+
+        Args:
+            items: Dictionary mapping cache keys to values
+            ttl: Time to live in seconds applied to every key (None = no expiration)
+            category: Optional category
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items:
+            return True
+
+        try:
+            entries = {
+                self._generate_key(key, category): self._serialize(value)
+                for key, value in items.items()
+            }
+
+            if self.redis_client:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for cache_key, serialized in entries.items():
+                        if ttl:
+                            pipe.setex(cache_key, ttl, serialized)
+                        else:
+                            pipe.set(cache_key, serialized)
+                    self._publish_invalidation(pipe, keys=list(entries))
+                    await pipe.execute()
+            else:
+                # Fallback to in-memory cache
+                self.stats['fallback_ops'] += 1
+
+            for cache_key, serialized in entries.items():
+                self.local_cache.set(cache_key, serialized, ttl=self._local_ttl(ttl), size=len(serialized))
+
+            self.stats['sets'] += len(entries)
+            return True
+
+        except (RedisError, RedisConnectionError) as e:
+            logger.warning(f"Redis error in set operation: {e}")
+            self.stats['errors'] += 1
+            if self.enable_fallback:
+                for cache_key, serialized in entries.items():
+                    self.local_cache.set(cache_key, serialized, ttl=self._local_ttl(ttl), size=len(serialized))
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error in set operation: {e}")
+            self.stats['errors'] += 1
+            return False
+
+    async def delete_many(
+        self,
+        keys: List[str],
+        category: Optional[str] = None
+    ) -> int:
+        """Delete several keys in a single round trip.
+
+        Args:
+            keys: Cache keys
+            category: Optional category
+
+        Returns:
+            Number of keys deleted
+        """
+        return await self.delete(*keys, category=category)
+
     async def invalidate_pattern(
         self,
         pattern: str,
@@ -345,6 +463,7 @@ class CacheManager:
             Number of keys invalidated
         """
         search_pattern = self._generate_key(pattern, category)
+        local_count = self.local_cache.delete_pattern(search_pattern)
 
         try:
             if self.redis_client:
@@ -363,22 +482,15 @@ class CacheManager:
                     if cursor == 0:
                         break
 
+                await self.local_cache.publish_invalidation(self.redis_client, patterns=[search_pattern])
                 self.stats['deletes'] += count
                 logger.info(f"Invalidated {count} keys matching pattern: {pattern}")
                 return count
             else:
                 # Fallback to in-memory cache
                 self.stats['fallback_ops'] += 1
-                pattern_prefix = search_pattern.replace('*', '')
-                keys_to_delete = [
-                    k for k in self.fallback_cache.keys()
-                    if k.startswith(pattern_prefix)
-                ]
-                for key in keys_to_delete:
-                    del self.fallback_cache[key]
-                count = len(keys_to_delete)
-                self.stats['deletes'] += count
-                return count
+                self.stats['deletes'] += local_count
+                return local_count
 
         except (RedisError, RedisConnectionError) as e:
             logger.warning(f"Redis error in pattern invalidation: {e}")
@@ -404,26 +516,40 @@ class CacheManager:
             results: SERP results data
             ttl: TTL in seconds (default: 24 hours)
 
+        Returns:
+            True if successful
+        """
+        return await self.cache_serp_results_many({keyword: results}, ttl)
+
+    async def cache_serp_results_many(
+        self,
+        results_by_keyword: Dict[str, Dict[str, Any]],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Cache SERP results for several keywords in one round trip.
+
+        Args:
+            results_by_keyword: Dictionary mapping keyword to SERP results
+            ttl: TTL in seconds (default: 24 hours)
+
         Returns:
             True if successful
         """
         ttl = ttl or settings.CACHE_TTL_SERP_RESULTS  # Default 24 hours
-        cache_key = hashlib.md5(f"serp:{keyword}".encode()).hexdigest()
+        cached_at = datetime.utcnow().isoformat()
 
         # Add metadata
-        cached_data = {
-            'keyword': keyword,
-            'results': results,
-            'cached_at': datetime.utcnow().isoformat(),
-            'ttl': ttl
+        items = {
+            self._serp_cache_key(keyword): {
+                'keyword': keyword,
+                'results': results,
+                'cached_at': cached_at,
+                'ttl': ttl
+            }
+            for keyword, results in results_by_keyword.items()
         }
 
-        return await self.set(
-            cache_key,
-            cached_data,
-            ttl=ttl,
-            category="serp_results"
-        )
+        return await self.set_many(items, ttl=ttl, category="serp_results")
 
     async def get_cached_serp_results(
         self,
@@ -437,9 +563,7 @@ class CacheManager:
         Returns:
             Cached SERP data or None
         """
-        cache_key = hashlib.md5(f"serp:{keyword}".encode()).hexdigest()
-
-        cached_data = await self.get(cache_key, category="serp_results")
+        cached_data = await self.get(self._serp_cache_key(keyword), category="serp_results")
 
         if cached_data:
             logger.info(f"Cache hit for SERP keyword: {keyword}")
@@ -448,6 +572,34 @@ class CacheManager:
         logger.debug(f"Cache miss for SERP keyword: {keyword}")
         return None
 
+    async def get_cached_serp_results_many(
+        self,
+        keywords: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve cached SERP results for several keywords in one round trip.
+
+        Args:
+            keywords: Search keywords
+
+        Returns:
+            Dictionary mapping each cached keyword to its SERP data
+        """
+        cache_keys = {self._serp_cache_key(keyword): keyword for keyword in keywords}
+        cached = await self.get_many(list(cache_keys), category="serp_results")
+
+        results = {
+            cache_keys[cache_key]: cached_data.get('results')
+            for cache_key, cached_data in cached.items()
+            if cached_data
+        }
+        logger.debug(f"SERP cache hits: {len(results)}/{len(cache_keys)} keywords")
+        return results
+
+    @staticmethod
+    def _serp_cache_key(keyword: str) -> str:
+        """Cache key for a keyword's SERP results."""
+        return hashlib.md5(f"serp:{keyword}".encode()).hexdigest()
+
     # Content scraping cache methods
 
     async def cache_scraped_content(
@@ -563,46 +715,84 @@ class CacheManager:
         logger.debug(f"Cache miss for analysis job: {job_id}")
         return None
 
+    async def get_cached_analyses(
+        self,
+        job_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve cached results for several analysis jobs in one round trip.
+
+        Args:
+            job_ids: Analysis job IDs
+
+        Returns:
+            Dictionary mapping each cached job ID to its results
+        """
+        cached = await self.get_many(job_ids, category="analysis_results")
+
+        return {
+            job_id: cached_data.get('results')
+            for job_id, cached_data in cached.items()
+            if cached_data
+        }
+
+    async def invalidate_analyses(self, job_ids: List[str]) -> int:
+        """Remove cached results for several analysis jobs.
+
+        Args:
+            job_ids: Analysis job IDs
+
+        Returns:
+            Number of entries removed
+        """
+        return await self.delete_many(job_ids, category="analysis_results")
+
     # Cache warming methods
 
     async def warm_cache_for_keywords(
         self,
         keywords: List[str],
         fetch_fn: Callable[[str], Any],
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        max_concurrency: int = 10
     ) -> Dict[str, bool]:
         """Warm cache with SERP data for popular keywords.
 
+        Already-cached keywords are found with one multi-get, missing ones
+        are fetched concurrently and written back with one pipelined set.
+
         Args:
             keywords: List of keywords to warm
             fetch_fn: Async function to fetch SERP data
             ttl: TTL for cached data
+            max_concurrency: Maximum concurrent fetch_fn calls
 
         Returns:
             Dictionary mapping keyword to success status
         """
         logger.info(f"Warming cache for {len(keywords)} keywords")
-        results = {}
+        keywords = list(dict.fromkeys(keywords))
 
-        for keyword in keywords:
-            try:
-                # Check if already cached
-                cached = await self.get_cached_serp_results(keyword)
-                if cached:
-                    results[keyword] = True
-                    continue
-
-                # Fetch and cache
-                data = await fetch_fn(keyword)
-                if data:
-                    success = await self.cache_serp_results(keyword, data, ttl)
-                    results[keyword] = success
-                else:
-                    results[keyword] = False
+        cached = await self.get_cached_serp_results_many(keywords)
+        results = {keyword: True for keyword in cached}
 
-            except Exception as e:
-                logger.error(f"Error warming cache for keyword '{keyword}': {e}")
-                results[keyword] = False
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(keyword: str) -> Any:
+            async with semaphore:
+                try:
+                    return await fetch_fn(keyword)
+                except Exception as e:
+                    logger.error(f"Error warming cache for keyword '{keyword}': {e}")
+                    return None
+
+        missing = [keyword for keyword in keywords if keyword not in cached]
+        fetched = await asyncio.gather(*(fetch(keyword) for keyword in missing))
+
+        to_cache = {keyword: data for keyword, data in zip(missing, fetched) if data}
+        success = await self.cache_serp_results_many(to_cache, ttl) if to_cache else True
+
+        for keyword in missing:
+            results[keyword] = success and keyword in to_cache
 
         success_count = sum(1 for v in results.values() if v)
         logger.info(f"Cache warming complete: {success_count}/{len(keywords)} successful")
@@ -625,6 +815,7 @@ class CacheManager:
             'namespace': self.namespace,
             'statistics': {
                 'hits': self.stats['hits'],
+                'local_hits': self.stats['local_hits'],
                 'misses': self.stats['misses'],
                 'sets': self.stats['sets'],
                 'deletes': self.stats['deletes'],
@@ -633,6 +824,7 @@ class CacheManager:
                 'total_operations': total_ops,
                 'hit_rate_percent': round(hit_rate, 2)
             },
+            'local_cache': self.local_cache.stats(),
             'timestamp': datetime.utcnow().isoformat()
         }
 
@@ -656,7 +848,7 @@ class CacheManager:
             except Exception as e:
                 logger.warning(f"Error fetching Redis stats: {e}")
         else:
-            stats['fallback_cache_size'] = len(self.fallback_cache)
+            stats['fallback_cache_size'] = len(self.local_cache)
 
         return stats
 
@@ -704,8 +896,24 @@ class CacheManager:
 
         return health
 
+    def start_invalidation_listener(self):
+        """Drop local copies of keys written or deleted by other processes."""
+        if self.redis_client:
+            self.local_cache.start_invalidation_listener(self.redis_client)
+
+    def start_invalidation_thread(self):
+        """Drop local copies of keys changed elsewhere, from a background thread.
+
+        Used by Celery workers, whose event loop only runs while a task does,
+        so a listener task there would fall behind between tasks.
+        """
+        if self.redis_client:
+            self.local_cache.start_invalidation_thread(SyncRedis.from_url(self.redis_url))
+
     async def close(self):
         """Close Redis connections gracefully."""
+        await self.local_cache.stop_invalidation_listener()
+        self.local_cache.stop_invalidation_thread()
         if self.redis_client:
             try:
                 await self.redis_client.close()
@@ -739,6 +947,7 @@ async def init_cache_manager() -> CacheManager:
         Initialized CacheManager instance
     """
     manager = get_cache_manager()
+    manager.start_invalidation_listener()
     # Perform health check on startup
     health = await manager.health_check()
     if health['healthy']:
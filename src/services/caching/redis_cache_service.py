@@ -137,27 +137,9 @@ class RedisCacheService:
         full_pattern = self._namespaced_key(pattern, category)
 
         try:
-            if self.cache._backend == 'redis':
-                keys = self.cache._client.keys(full_pattern)
-                if keys:
-                    count = self.cache._client.delete(*keys)
-                    self.stats['deletes'] += count
-                    return count
-                return 0
-            else:
-                # In-memory pattern matching
-                count = 0
-                keys_to_delete = []
-                for key in list(self.cache._client.keys()):
-                    if key.startswith(full_pattern.replace('*', '')):
-                        keys_to_delete.append(key)
-                        count += 1
-
-                for key in keys_to_delete:
-                    del self.cache._client[key]
-
-                self.stats['deletes'] += count
-                return count
+            count = self.cache.delete_pattern(full_pattern)
+            self.stats['deletes'] += count
+            return count
         except Exception as e:
             logger.error(f"Error invalidating pattern {pattern}: {e}")
             self.stats['errors'] += 1
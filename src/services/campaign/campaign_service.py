@@ -14,12 +14,13 @@ import json
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, and_, or_, desc
 from sqlalchemy.orm import joinedload
 
 from src.models.company import Company
 from src.models.competitor import Competitor
 from src.models.report import Report, ReportType, ReportStatus
+from src.services.full_text_search import search_columns, text_match
 
 logger = logging.getLogger(__name__)
 
@@ -155,10 +156,10 @@ class CampaignService:
                 or_(
                     and_(
                         Competitor.company_id != primary_company_id,
-                        func.lower(Competitor.description).contains(industry.lower()) if industry else False
+                        text_match(industry, *search_columns(Competitor)) if industry else False
                     ),
-                    # Match by domain keywords (partial matching)
-                    *[func.lower(Competitor.domain).contains(kw.lower()) for kw in domain_keywords if kw]
+                    # Match by domain keywords (partial matching, ILIKE on the trigram index)
+                    *[Competitor.domain.icontains(kw, autoescape=True) for kw in domain_keywords if kw]
                 )
             ).limit(max_competitors)
             
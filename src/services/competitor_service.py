@@ -10,6 +10,7 @@ from sqlalchemy import select, delete
 from src.models.competitor import Competitor
 from src.schemas.competitor import CompetitorCreate, CompetitorResponse, CompetitorUpdate
 from src.repositories.competitor_repository import CompetitorRepository
+from src.services.full_text_search import search_columns, text_match, text_rank
 
 class CompetitorService:
     """Service for handling competitor-related operations."""
@@ -55,19 +56,28 @@ class CompetitorService:
     async def list_competitors(
         self, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        search: Optional[str] = None
     ) -> List[CompetitorResponse]:
         """List all competitors with pagination.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            search: Optional full-text search over name and description;
+                results are ordered by relevance
             
         Returns:
             List of competitors
         """
+        stmt = select(Competitor)
+        if search:
+            columns = search_columns(Competitor)
+            stmt = stmt.where(text_match(search, *columns)).order_by(
+                text_rank(search, *columns).desc(), Competitor.id
+            )
         result = await self.db.execute(
-            select(Competitor).offset(skip).limit(limit)
+            stmt.offset(skip).limit(limit)
         )
         competitors = result.scalars().all()
         return [CompetitorResponse.from_orm(comp) for comp in competitors]
@@ -0,0 +1,268 @@
+"""Content-addressed blob storage for scraped content.
+
+HTML, text and screenshots are stored once per distinct payload in MinIO,
+keyed by the SHA-256 of the uncompressed bytes and indexed by ContentBlob
+rows. Text payloads are compressed with zstd (zlib when the ``zstandard``
+package is not installed). Screenshots are deduplicated by byte hash and,
+against the previous version of the same page, by perceptual hash so that
+renders differing only in anti-aliasing or a blinking cursor are not stored
+again.
+"""
+import asyncio
+import hashlib
+import io
+import logging
+import zlib
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.scraped_content import ContentBlob
+from src.services.storage_service import StorageService, get_storage_service
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CONTENT_BUCKET = "onside-scraped-content"
+SCREENSHOT_BUCKET = "onside-screenshots"
+
+
+def compute_perceptual_hash(image_data: bytes) -> Optional[str]:
+    """Compute a 64-bit difference hash (dHash) of an image.
+
+    Args:
+        image_data: Encoded image bytes (e.g. PNG)
+
+    Returns:
+        16-character hex string, or None if the image cannot be decoded
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            pixels = list(image.convert('L').resize((9, 8), Image.LANCZOS).getdata())
+    except Exception as e:
+        logger.warning(f"Could not compute perceptual hash: {e}")
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            bits = (bits << 1) | int(left > right)
+
+    return f"{bits:016x}"
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """Number of differing bits between two hex perceptual hashes."""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+
+class ContentBlobStore:
+    """Stores and loads deduplicated, compressed content blobs."""
+
+    def __init__(
+        self,
+        storage_service: Optional[StorageService] = None,
+        compression_level: int = 9,
+        screenshot_max_distance: int = 4
+    ):
+        """Initialize the blob store.
+
+        Args:
+            storage_service: Object storage backend (uses the shared service
+                if not provided)
+            compression_level: zstd/zlib compression level
+            screenshot_max_distance: Maximum perceptual hash distance for a
+                screenshot to count as unchanged
+        """
+        self.storage_service = storage_service or get_storage_service()
+        self.compression = "zstd" if ZSTD_AVAILABLE else "zlib"
+        self.compression_level = compression_level
+        self.screenshot_max_distance = screenshot_max_distance
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress data with the configured codec."""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return zlib.compress(data, min(self.compression_level, 9))
+
+    @staticmethod
+    def _decompress(data: bytes, compression: str) -> bytes:
+        """Decompress data written with the given codec."""
+        if compression == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required to read zstd-compressed blobs")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if compression == "zlib":
+            return zlib.decompress(data)
+        return data
+
+    def find(self, db: Session, content_hash: str) -> Optional[ContentBlob]:
+        """Look up a blob by content hash."""
+        return db.query(ContentBlob).filter(ContentBlob.content_hash == content_hash).first()
+
+    def _insert(self, db: Session, **values) -> ContentBlob:
+        """Insert a blob row unless its hash is already stored.
+
+        Workers storing the same payload at the same time upload identical
+        objects; the first row wins and the others keep it instead of
+        failing on the primary key.
+
+        Returns:
+            The stored ContentBlob
+        """
+        db.execute(
+            insert(ContentBlob)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[ContentBlob.content_hash])
+        )
+        return self.find(db, values["content_hash"])
+
+    async def _upload(self, bucket: str, path: str, data: bytes, content_type: str):
+        """Upload bytes without blocking the event loop."""
+        await asyncio.to_thread(
+            self.storage_service.upload_file,
+            bucket_name=bucket,
+            object_name=path,
+            file_data=io.BytesIO(data),
+            length=len(data),
+            content_type=content_type
+        )
+
+    async def put(
+        self,
+        db: Session,
+        data: bytes,
+        kind: str,
+        content_type: str = "application/octet-stream"
+    ) -> ContentBlob:
+        """Store a compressed blob unless identical bytes already exist.
+
+        Args:
+            db: Database session
+            data: Uncompressed payload
+            kind: Blob kind (``html`` or ``text``)
+            content_type: MIME type of the uncompressed payload
+
+        Returns:
+            New or existing ContentBlob
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+        existing = self.find(db, content_hash)
+        if existing is not None:
+            return existing
+
+        compressed = self._compress(data)
+        path = f"{kind}/{content_hash[:2]}/{content_hash}.{self.compression}"
+        await self._upload(CONTENT_BUCKET, path, compressed, content_type)
+
+        blob = self._insert(
+            db,
+            content_hash=content_hash,
+            kind=kind,
+            bucket=CONTENT_BUCKET,
+            storage_path=path,
+            compression=self.compression,
+            size_bytes=len(data),
+            stored_size_bytes=len(compressed)
+        )
+        logger.debug(f"Stored {kind} blob {content_hash[:12]} ({len(data)} -> {len(compressed)} bytes)")
+        return blob
+
+    async def put_text(self, db: Session, text: str, kind: str) -> ContentBlob:
+        """Store a text payload (HTML or extracted text)."""
+        content_type = "text/html; charset=utf-8" if kind == "html" else "text/plain; charset=utf-8"
+        return await self.put(db, text.encode('utf-8'), kind, content_type)
+
+    async def put_screenshot(
+        self,
+        db: Session,
+        image_data: bytes,
+        previous_hash: Optional[str] = None
+    ) -> ContentBlob:
+        """Store a PNG screenshot unless it duplicates an existing one.
+
+        Args:
+            db: Database session
+            image_data: PNG bytes
+            previous_hash: Blob hash of the previous screenshot of the same
+                page, compared perceptually
+
+        Returns:
+            New or existing (exact or perceptually identical) ContentBlob
+        """
+        content_hash = hashlib.sha256(image_data).hexdigest()
+        existing = self.find(db, content_hash)
+        if existing is not None:
+            return existing
+
+        perceptual_hash = compute_perceptual_hash(image_data)
+        if perceptual_hash and previous_hash:
+            previous = self.find(db, previous_hash)
+            if (
+                previous is not None
+                and previous.perceptual_hash
+                and hamming_distance(perceptual_hash, previous.perceptual_hash) <= self.screenshot_max_distance
+            ):
+                logger.debug(f"Screenshot matches previous render {previous_hash[:12]}; reusing it")
+                return previous
+
+        path = f"screenshot/{content_hash[:2]}/{content_hash}.png"
+        await self._upload(SCREENSHOT_BUCKET, path, image_data, "image/png")
+
+        return self._insert(
+            db,
+            content_hash=content_hash,
+            kind="screenshot",
+            bucket=SCREENSHOT_BUCKET,
+            storage_path=path,
+            compression="none",
+            size_bytes=len(image_data),
+            stored_size_bytes=len(image_data),
+            perceptual_hash=perceptual_hash
+        )
+
+    async def read(self, blob: ContentBlob) -> bytes:
+        """Download and decompress a blob."""
+        data = await asyncio.to_thread(
+            self.storage_service.download_file,
+            bucket_name=blob.bucket,
+            object_name=blob.storage_path
+        )
+        return self._decompress(data, blob.compression)
+
+    async def read_text(self, blob: ContentBlob) -> str:
+        """Download a text blob."""
+        return (await self.read(blob)).decode('utf-8')
+
+    async def get_text(self, db: Session, content_hash: Optional[str]) -> Optional[str]:
+        """Load a text blob by hash.
+
+        Returns:
+            Text, or None if no hash is given or the blob is unknown
+        """
+        if not content_hash:
+            return None
+
+        blob = self.find(db, content_hash)
+        if blob is None:
+            logger.warning(f"Content blob {content_hash[:12]} not found")
+            return None
+
+        return await self.read_text(blob)
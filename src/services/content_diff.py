@@ -0,0 +1,212 @@
+"""Staged text diffing for scraped content change detection.
+
+Comparing two page texts character by character with ``difflib`` is
+quadratic in the worst case. This module diffs in stages instead:
+
+1. Lines (paragraphs and headings in extracted page text) are matched as
+   hashed blocks, which is cheap and usually leaves only a few changed runs.
+2. Only the changed runs are compared at a finer granularity: characters
+   for small runs, tokens for large ones.
+
+The result keeps the fields previously produced by the full-text diff
+(additions, deletions, similarity and a unified-diff sample). Large diffs run
+in a process pool so they never block the event loop.
+"""
+import asyncio
+import difflib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Changed runs up to this many characters per side are compared per character
+CHAR_DIFF_MAX_CHARS = 2000
+
+# Diffs of texts up to this combined size run inline on the event loop
+INLINE_DIFF_MAX_CHARS = 20000
+
+TOKEN_PATTERN = re.compile(r'\w+|\s+|[^\w\s]')
+
+
+@dataclass
+class ContentDiff:
+    """Result of comparing two versions of page text."""
+    additions: int
+    deletions: int
+    similarity: float
+    old_length: int
+    new_length: int
+    sample_diff: List[str] = field(default_factory=list)
+
+    @property
+    def change_percentage(self) -> float:
+        """Percentage of content that changed (0-100)."""
+        return (1 - self.similarity) * 100
+
+
+def _matched_chars(old_lines: Sequence[str], new_lines: Sequence[str]) -> int:
+    """Count matching characters between two changed runs of lines."""
+    old_text = '\n'.join(old_lines)
+    new_text = '\n'.join(new_lines)
+
+    if len(old_text) <= CHAR_DIFF_MAX_CHARS and len(new_text) <= CHAR_DIFF_MAX_CHARS:
+        matcher = difflib.SequenceMatcher(None, old_text, new_text)
+        return sum(block.size for block in matcher.get_matching_blocks())
+
+    old_tokens = TOKEN_PATTERN.findall(old_text)
+    new_tokens = TOKEN_PATTERN.findall(new_text)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    return sum(
+        len(token)
+        for block in matcher.get_matching_blocks()
+        for token in old_tokens[block.a:block.a + block.size]
+    )
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a line range the way ``difflib.unified_diff`` does."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+def compute_content_diff(
+    old_text: str,
+    new_text: str,
+    max_sample_lines: int = 50
+) -> ContentDiff:
+    """Compare two texts block by block, refining only changed blocks.
+
+    Args:
+        old_text: Previous version text
+        new_text: New version text
+        max_sample_lines: Maximum number of unified-diff lines to keep
+
+    Returns:
+        ContentDiff with line additions/deletions and character similarity
+    """
+    old_length = len(old_text)
+    new_length = len(new_text)
+
+    if old_text == new_text:
+        return ContentDiff(0, 0, 1.0, old_length, new_length)
+
+    old_lines = old_text.splitlines()
+    new_lines = new_text.splitlines()
+
+    # Stage 1: match whole lines by hash
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+
+    additions = 0
+    deletions = 0
+    matched = 0
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            # Matching lines plus their line breaks
+            matched += sum(len(line) for line in old_lines[i1:i2]) + (i2 - i1)
+            continue
+
+        deletions += i2 - i1
+        additions += j2 - j1
+
+        # Stage 2: refine only the runs that changed
+        if tag == 'replace':
+            matched += _matched_chars(old_lines[i1:i2], new_lines[j1:j2])
+
+    total = old_length + new_length
+    similarity = min(1.0, 2.0 * matched / total) if total else 1.0
+
+    sample_diff: List[str] = []
+    if max_sample_lines > 0:
+        sample_diff.extend(['--- ', '+++ '])
+        for group in matcher.get_grouped_opcodes(0):
+            if len(sample_diff) >= max_sample_lines:
+                break
+            first, last = group[0], group[-1]
+            sample_diff.append(
+                f'@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@'
+            )
+            for tag, i1, i2, j1, j2 in group:
+                if tag in ('replace', 'delete'):
+                    sample_diff.extend('-' + line for line in old_lines[i1:i2])
+                if tag in ('replace', 'insert'):
+                    sample_diff.extend('+' + line for line in new_lines[j1:j2])
+        sample_diff = sample_diff[:max_sample_lines]
+
+    return ContentDiff(
+        additions=additions,
+        deletions=deletions,
+        similarity=similarity,
+        old_length=old_length,
+        new_length=new_length,
+        sample_diff=sample_diff
+    )
+
+
+# Process pool for large diffs (created lazily, after any worker fork)
+_diff_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_diff_executor() -> ProcessPoolExecutor:
+    """
+    Get or create the process pool used for large diffs.
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _diff_executor
+
+    if _diff_executor is None:
+        _diff_executor = ProcessPoolExecutor(max_workers=int(os.getenv("DIFF_WORKERS", "2")))
+
+    return _diff_executor
+
+
+def shutdown_diff_executor():
+    """Shut down the diff process pool."""
+    global _diff_executor
+
+    if _diff_executor is not None:
+        _diff_executor.shutdown(wait=False, cancel_futures=True)
+        _diff_executor = None
+
+
+async def diff_content(
+    old_text: str,
+    new_text: str,
+    max_sample_lines: int = 50
+) -> ContentDiff:
+    """Diff two texts without blocking the event loop.
+
+    Small diffs run inline; large ones run in the diff process pool.
+
+    Args:
+        old_text: Previous version text
+        new_text: New version text
+        max_sample_lines: Maximum number of unified-diff lines to keep
+
+    Returns:
+        ContentDiff result
+    """
+    if old_text == new_text or len(old_text) + len(new_text) <= INLINE_DIFF_MAX_CHARS:
+        return compute_content_diff(old_text, new_text, max_sample_lines)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            get_diff_executor(), compute_content_diff, old_text, new_text, max_sample_lines
+        )
+    except BrokenProcessPool:
+        logger.warning("Diff process pool is broken; recreating it and diffing in a thread")
+        shutdown_diff_executor()
+        return await asyncio.to_thread(compute_content_diff, old_text, new_text, max_sample_lines)
@@ -36,6 +36,8 @@ import aiohttp
 from aiohttp import ClientSession, ClientTimeout, ClientResponse, ClientError
 from pydantic import BaseModel, Field
 
+from src.core.http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,7 +148,6 @@ class EnGardeAPIClient:
         self.timeout = ClientTimeout(total=timeout)
         self.retry_config = retry_config or RetryConfig()
         self._session: Optional[ClientSession] = session
-        self._session_owned = session is None
 
         logger.info(
             f"Initialized EnGardeAPIClient - URL: {self.api_url}, "
@@ -156,17 +157,12 @@ class EnGardeAPIClient:
     async def __aenter__(self):
         """Async context manager entry."""
         if self._session is None:
-            self._session = ClientSession(
-                timeout=self.timeout,
-                headers=self._get_default_headers()
-            )
+            self._session = get_http_pool().get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._session_owned and self._session:
-            await self._session.close()
-            self._session = None
+        """Async context manager exit (pooled sessions stay open)."""
+        pass
 
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for all requests."""
@@ -222,7 +218,9 @@ class EnGardeAPIClient:
                     method=method,
                     url=url,
                     json=data,
-                    params=params
+                    params=params,
+                    headers=self._get_default_headers(),
+                    timeout=self.timeout
                 ) as response:
                     return await self._handle_response(response)
 
@@ -16,10 +16,13 @@ from typing import Any, Dict, List, Optional
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.http_pool import get_http_pool
 from src.models.external_api import GNewsArticle
 from src.repositories.gnews_repository import GNewsRepository
 from src.repositories.api_usage_repository import APIUsageRepository
 from src.repositories.competitor_repository import CompetitorRepository
+from src.services.api_monitoring.quota_counter import QuotaCounter, get_quota_counter, period_bounds
+from src.services.api_monitoring.usage_tracker import API_QUOTAS, APIName
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +91,8 @@ class GNewsService:
         self,
         db: AsyncSession,
         api_key: Optional[str] = None,
-        http_client: Optional[httpx.AsyncClient] = None
+        http_client: Optional[httpx.AsyncClient] = None,
+        quota_counter: Optional[QuotaCounter] = None
     ):
         """Initialize the GNews service.
 
@@ -96,6 +100,7 @@ class GNewsService:
             db: Async database session for persistence operations
             api_key: GNews API key. If not provided, reads from GNEWS_API_KEY env var
             http_client: Optional httpx client for testing/mocking
+            quota_counter: Usage counter (defaults to the shared API quota counter)
         """
         self.db = db
         self.api_key = api_key or os.getenv("GNEWS_API_KEY")
@@ -106,31 +111,27 @@ class GNewsService:
         self.gnews_repo = GNewsRepository(db)
         self.usage_repo = APIUsageRepository(db)
         self.competitor_repo = CompetitorRepository(db)
+        self.quota_counter = quota_counter if quota_counter is not None else get_quota_counter()
 
     async def __aenter__(self) -> "GNewsService":
         """Async context manager entry."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = get_http_pool().get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Async context manager exit."""
-        if self._owns_client and self._http_client:
-            await self._http_client.aclose()
+        """Async context manager exit (pooled clients stay open)."""
+        if self._owns_client:
             self._http_client = None
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get the HTTP client, creating one if necessary.
+        """Get the HTTP client, borrowing the shared pooled client if necessary.
 
         Returns:
             httpx.AsyncClient instance
-
-        Raises:
-            RuntimeError: If client is not initialized and not in context manager
         """
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
-            self._owns_client = True
+            self._http_client = get_http_pool().get_client()
         return self._http_client
 
     async def _check_rate_limit(self) -> bool:
@@ -139,22 +140,26 @@ class GNewsService:
         Returns:
             True if requests can be made, False if quota exceeded
         """
-        status = await self.usage_repo.get_quota_status("gnews")
+        status = await self.get_usage_status()
         if status.get("is_exceeded"):
             logger.warning("GNews API daily quota exceeded")
             return False
         return True
 
+    @staticmethod
+    def _quota_period():
+        """Get the bounds of the current GNews quota period (see API_QUOTAS)."""
+        return period_bounds(API_QUOTAS[APIName.GNEWS]['period'].value)
+
     async def _record_api_call(self, endpoint: str) -> None:
         """Record an API call for usage tracking.
 
         Args:
             endpoint: The API endpoint that was called
         """
-        await self.usage_repo.record_usage(
-            api_name="gnews",
-            endpoint=endpoint,
-            count=1
+        period_start, period_end = self._quota_period()
+        await self.quota_counter.increment(
+            "gnews", period_start, period_end, endpoint=endpoint
         )
 
     async def _make_request(
@@ -414,8 +419,9 @@ class GNewsService:
     ) -> List[Dict[str, Any]]:
         """Get news articles related to a specific competitor.
 
-        Searches for news using the competitor's name and domain,
-        then associates the articles with the competitor.
+        Fetches only articles published since the newest stored article
+        for the competitor (see NewsIngestionPipeline), then returns the
+        stored articles for the requested window.
 
         Args:
             competitor_id: Database ID of the competitor
@@ -423,70 +429,40 @@ class GNewsService:
             max_results: Maximum number of results
 
         Returns:
-            List of article dictionaries
+            List of article dictionaries, newest first
 
         Raises:
             GNewsAPIError: If the API request fails
             ValueError: If competitor is not found
         """
+        from src.services.external_api.news_ingestion import (
+            NewsIngestionPipeline,
+            competitor_search_terms,
+        )
+
         # Get competitor details
         competitor = await self.competitor_repo.get_by_id(competitor_id)
         if not competitor:
             raise ValueError(f"Competitor with ID {competitor_id} not found")
 
-        # Build search query from competitor name and domain
-        search_terms = []
-        if hasattr(competitor, "name") and competitor.name:
-            search_terms.append(f'"{competitor.name}"')
-        if hasattr(competitor, "domain") and competitor.domain:
-            # Extract company name from domain if possible
-            domain_name = competitor.domain.replace("www.", "").split(".")[0]
-            if domain_name and domain_name not in str(search_terms):
-                search_terms.append(domain_name)
-
-        if not search_terms:
+        if not competitor_search_terms(competitor):
             raise ValueError(f"Competitor {competitor_id} has no searchable name or domain")
 
-        query = " OR ".join(search_terms)
-        from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-
-        params: Dict[str, Any] = {
-            "q": query,
-            "max": min(max_results, 100),
-            "lang": "en",
-            "from": from_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "sortby": "publishedAt"
-        }
-
-        response = await self._make_request("search", params)
-        articles = response.get("articles", [])
-
-        result = []
-        for article_data in articles:
-            article_dict = self._parse_article_to_dict(
-                article_data,
-                query_term=query,
-                competitor_id=competitor_id
-            )
-
-            # Check if article already exists
-            existing = await self.gnews_repo.get_by_article_id(article_dict["article_id"])
-            if not existing:
-                article_model = self._dict_to_model(article_dict)
-                await self.gnews_repo.create_article(article_model)
-            else:
-                # Update competitor_id if not set
-                if existing.competitor_id is None:
-                    existing.competitor_id = competitor_id
-                    await self.db.commit()
+        stats = await NewsIngestionPipeline(self).ingest_competitors(
+            [competitor], days_back=days_back, max_results=max_results, raise_errors=True
+        )
 
-            result.append(article_dict)
+        articles = await self.gnews_repo.get_articles_by_competitor(
+            competitor_id,
+            start_date=datetime.now(timezone.utc) - timedelta(days=days_back),
+            limit=max_results
+        )
 
         logger.info(
-            f"Found {len(result)} articles for competitor {competitor_id} "
-            f"in the last {days_back} days"
+            f"Found {len(articles)} articles for competitor {competitor_id} "
+            f"in the last {days_back} days ({stats['articles_inserted']} new)"
         )
-        return result
+        return [article.to_dict() for article in articles]
 
     async def get_top_headlines(
         self,
@@ -660,7 +636,31 @@ class GNewsService:
             - usage_percentage: Percentage of quota used
             - is_exceeded: Whether quota has been exceeded
         """
-        return await self.usage_repo.get_quota_status("gnews")
+        period_start, period_end = self._quota_period()
+        usage = await self.quota_counter.get_usage("gnews", period_start, period_end)
+
+        request_count = usage["count"]
+        quota_limit = usage["limit"]
+        quota_remaining = None
+        usage_percentage = None
+        is_exceeded = False
+
+        if quota_limit:
+            quota_remaining = max(0, quota_limit - request_count)
+            usage_percentage = (request_count / quota_limit) * 100
+            is_exceeded = request_count >= quota_limit
+
+        return {
+            "api_name": "gnews",
+            "period_start": period_start.isoformat(),
+            "period_end": period_end.isoformat(),
+            "request_count": request_count,
+            "quota_limit": quota_limit,
+            "quota_remaining": quota_remaining,
+            "usage_percentage": usage_percentage,
+            "is_exceeded": is_exceeded,
+            "total_cost": float(usage["cost"])
+        }
 
     async def set_daily_quota(self, quota: int = DAILY_QUOTA) -> bool:
         """Set the daily API quota limit.
@@ -671,4 +671,7 @@ class GNewsService:
         Returns:
             True if quota was set successfully
         """
-        return await self.usage_repo.set_quota_limit("gnews", quota)
+        result = await self.usage_repo.set_quota_limit("gnews", quota)
+        period_start, period_end = self._quota_period()
+        await self.quota_counter.set_limit("gnews", period_start, period_end, quota)
+        return result
@@ -8,17 +8,33 @@ import asyncio
 import logging
 import os
 import socket
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.http_pool import get_http_pool
+from src.core.local_cache import LocalCache, LocalCacheConfig
 from src.models.external_api import IPInfoRecord, APIUsageRecord
 from src.repositories.ipinfo_repository import IPInfoRepository
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU of recent lookups, in front of the ipinfo_records table
+_local_cache: Optional[LocalCache] = None
+
+
+def get_ipinfo_local_cache() -> LocalCache:
+    """Get the process-wide IP info LRU cache."""
+    global _local_cache
+    if _local_cache is None:
+        _local_cache = LocalCache(
+            "ipinfo",
+            LocalCacheConfig(max_entries=int(os.getenv("IPINFO_LOCAL_CACHE_SIZE", "4096")))
+        )
+    return _local_cache
+
 
 class IPInfoError(Exception):
     """Base exception for IPInfo API errors."""
@@ -51,12 +67,14 @@ class IPInfoService:
         RATE_LIMIT: Maximum requests per period
         RATE_PERIOD_SECONDS: Rate limit period in seconds
         CACHE_TTL_HOURS: Cache time-to-live in hours
+        LOCAL_CACHE_TTL_SECONDS: Maximum time a lookup stays in the in-process LRU
     """
 
     BASE_URL: str = "https://ipinfo.io"
     RATE_LIMIT: int = 50000  # Monthly limit for free tier
     RATE_PERIOD_SECONDS: int = 60
     CACHE_TTL_HOURS: int = 24
+    LOCAL_CACHE_TTL_SECONDS: int = 3600
     DEFAULT_TIMEOUT: int = 30
     MAX_BATCH_SIZE: int = 1000
     MAX_RETRIES: int = 3
@@ -66,33 +84,35 @@ class IPInfoService:
         self,
         db: AsyncSession,
         api_key: Optional[str] = None,
-        http_client: Optional[httpx.AsyncClient] = None
+        http_client: Optional[httpx.AsyncClient] = None,
+        local_cache: Optional[LocalCache] = None
     ):
         """Initialize the IPInfo service.
 
         Args:
             db: Async database session for caching and persistence
             api_key: IPInfo API key (defaults to IPINFO_API_KEY env var)
-            http_client: Optional httpx client for connection pooling
+            http_client: Optional httpx client (defaults to the shared HTTP pool)
+            local_cache: In-process LRU for lookups (defaults to the shared one)
         """
         self.db = db
         self.api_key = api_key or os.getenv("IPINFO_API_KEY", "")
         self._client = http_client
         self._client_owner = http_client is None
         self.repository = IPInfoRepository(db)
+        self.local_cache = local_cache if local_cache is not None else get_ipinfo_local_cache()
         self._request_count = 0
         self._period_start = datetime.utcnow()
 
     async def __aenter__(self) -> "IPInfoService":
         """Async context manager entry."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT)
+            self._client = get_http_pool().get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Async context manager exit."""
-        if self._client_owner and self._client:
-            await self._client.aclose()
+        """Async context manager exit (pooled clients stay open)."""
+        if self._client_owner:
             self._client = None
 
     def _get_headers(self) -> Dict[str, str]:
@@ -157,8 +177,7 @@ class IPInfoService:
         headers = self._get_headers()
 
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT)
-            self._client_owner = True
+            self._client = get_http_pool().get_client()
 
         last_exception: Optional[Exception] = None
 
@@ -253,6 +272,64 @@ class IPInfoService:
             domain_id=domain_id
         )
 
+    def _cache_ttl_remaining(self, record: IPInfoRecord) -> float:
+        """Get the seconds until a stored record needs refreshing.
+
+        Args:
+            record: Stored IPInfoRecord
+
+        Returns:
+            Remaining cache lifetime in seconds (<= 0 when stale)
+        """
+        timestamps = [
+            value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+            for value in (record.updated_at, record.created_at)
+            if isinstance(value, datetime)
+        ]
+        if not timestamps:
+            return 0.0
+        age = datetime.now(timezone.utc) - max(timestamps)
+        return self.CACHE_TTL_HOURS * 3600 - age.total_seconds()
+
+    def _remember(
+        self,
+        record: IPInfoRecord,
+        ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Store a record in the in-process LRU.
+
+        Args:
+            record: IPInfoRecord to cache
+            ttl: Remaining cache lifetime in seconds (defaults to the full TTL)
+
+        Returns:
+            Dictionary representation of the record
+        """
+        data = record.to_dict()
+        if ttl is None:
+            ttl = self.CACHE_TTL_HOURS * 3600
+        self.local_cache.set(
+            data["ip_address"], data, ttl=min(ttl, self.LOCAL_CACHE_TTL_SECONDS)
+        )
+        return dict(data)
+
+    def _validate_ip(self, ip_address: str) -> None:
+        """Validate an IP address.
+
+        Args:
+            ip_address: IP address to validate
+
+        Raises:
+            ValueError: For invalid IP addresses
+        """
+        try:
+            socket.inet_pton(
+                socket.AF_INET6 if ":" in ip_address else socket.AF_INET,
+                ip_address
+            )
+        except socket.error as e:
+            raise ValueError(f"Invalid IP address format: {ip_address}") from e
+
     async def _get_cached_ip_info(
         self,
         ip_address: str
@@ -266,10 +343,8 @@ class IPInfoService:
             Cached IPInfoRecord if valid, None otherwise
         """
         record = await self.repository.get_by_ip(ip_address)
-        if record:
-            cache_expiry = datetime.utcnow() - timedelta(hours=self.CACHE_TTL_HOURS)
-            if record.created_at and record.created_at > cache_expiry:
-                return record
+        if record and self._cache_ttl_remaining(record) > 0:
+            return record
         return None
 
     async def get_ip_info(
@@ -292,21 +367,17 @@ class IPInfoService:
             IPInfoError: For API errors
             ValueError: For invalid IP addresses
         """
-        # Validate IP address format
-        try:
-            socket.inet_pton(
-                socket.AF_INET6 if ":" in ip_address else socket.AF_INET,
-                ip_address
-            )
-        except socket.error as e:
-            raise ValueError(f"Invalid IP address format: {ip_address}") from e
+        self._validate_ip(ip_address)
 
-        # Check cache first
+        # Check the in-process LRU, then the database
         if use_cache:
+            cached_data = self.local_cache.get(ip_address)
+            if cached_data is not None:
+                return dict(cached_data)
             cached = await self._get_cached_ip_info(ip_address)
             if cached:
                 logger.debug(f"Cache hit for IP: {ip_address}")
-                return cached.to_dict()
+                return self._remember(cached, self._cache_ttl_remaining(cached))
 
         # Make API request
         logger.info(f"Fetching IP info from API: {ip_address}")
@@ -316,7 +387,7 @@ class IPInfoService:
         record = self._api_response_to_record(data, domain_id)
         saved_record = await self.repository.create_or_update(record)
 
-        return saved_record.to_dict()
+        return self._remember(saved_record)
 
     async def get_batch_ip_info(
         self,
@@ -326,8 +397,10 @@ class IPInfoService:
     ) -> List[Dict[str, Any]]:
         """Get geolocation info for multiple IP addresses.
 
-        Uses batch API endpoint when available, otherwise makes
-        concurrent individual requests.
+        Cached records are read from the in-process LRU and then from the
+        database in a single query. Uses batch API endpoint when available,
+        otherwise makes concurrent individual requests, and stores all
+        fetched records with one bulk upsert.
 
         Args:
             ip_addresses: List of IP addresses to look up
@@ -335,7 +408,8 @@ class IPInfoService:
             domain_id: Optional domain ID for association
 
         Returns:
-            List of dictionaries containing IP geolocation data
+            List of dictionaries containing IP geolocation data, in request
+            order (IPs that could not be looked up are omitted)
 
         Raises:
             IPInfoError: For API errors
@@ -346,39 +420,65 @@ class IPInfoService:
                 f"Batch size {len(ip_addresses)} exceeds maximum of {self.MAX_BATCH_SIZE}"
             )
 
-        results: List[Dict[str, Any]] = []
+        unique_ips = list(dict.fromkeys(ip_addresses))
+        results: Dict[str, Dict[str, Any]] = {}
         uncached_ips: List[str] = []
 
-        # Check cache for each IP
         if use_cache:
-            for ip in ip_addresses:
-                cached = await self._get_cached_ip_info(ip)
-                if cached:
-                    results.append(cached.to_dict())
+            missing: List[str] = []
+            for ip in unique_ips:
+                cached_data = self.local_cache.get(ip)
+                if cached_data is not None:
+                    results[ip] = dict(cached_data)
+                else:
+                    missing.append(ip)
+
+            records = await self.repository.get_by_ips(missing) if missing else {}
+            for ip in missing:
+                record = records.get(ip)
+                ttl = self._cache_ttl_remaining(record) if record else 0
+                if ttl > 0:
+                    results[ip] = self._remember(record, ttl)
                 else:
                     uncached_ips.append(ip)
         else:
-            uncached_ips = list(ip_addresses)
+            uncached_ips = unique_ips
+
+        if uncached_ips:
+            fetched = await self._fetch_ip_data(uncached_ips)
+            saved_records = await self.repository.bulk_create_or_update(
+                [self._api_response_to_record(data, domain_id) for data in fetched]
+            )
+            for saved_record in saved_records:
+                data = self._remember(saved_record)
+                results[data["ip_address"]] = data
 
-        if not uncached_ips:
-            return results
+        return [results[ip] for ip in unique_ips if ip in results]
+
+    async def _fetch_ip_data(self, ip_addresses: List[str]) -> List[Dict[str, Any]]:
+        """Fetch raw API data for IP addresses without touching the cache.
+
+        Args:
+            ip_addresses: IP addresses to fetch
 
+        Returns:
+            List of API response dictionaries (failed lookups are omitted)
+
+        Raises:
+            IPInfoError: For batch API errors other than missing permissions
+        """
         # Try batch API first (available for paid plans)
         if self.api_key:
             try:
                 batch_data = await self._make_request(
                     "batch",
                     method="POST",
-                    data=uncached_ips
+                    data=ip_addresses
                 )
-
-                for ip, data in batch_data.items():
-                    if isinstance(data, dict) and "ip" in data:
-                        record = self._api_response_to_record(data, domain_id)
-                        saved_record = await self.repository.create_or_update(record)
-                        results.append(saved_record.to_dict())
-
-                return results
+                return [
+                    data for data in batch_data.values()
+                    if isinstance(data, dict) and "ip" in data
+                ]
 
             except IPInfoError as e:
                 if e.status_code != 403:  # Not a permission error
@@ -388,18 +488,18 @@ class IPInfoService:
         # Fallback to concurrent individual requests
         async def fetch_single(ip: str) -> Optional[Dict[str, Any]]:
             try:
-                return await self.get_ip_info(ip, use_cache=False, domain_id=domain_id)
+                self._validate_ip(ip)
+                return await self._make_request(f"{ip}/json")
             except (IPInfoError, ValueError) as e:
                 logger.warning(f"Failed to fetch IP info for {ip}: {e}")
                 return None
 
         batch_results = await asyncio.gather(
-            *[fetch_single(ip) for ip in uncached_ips],
+            *[fetch_single(ip) for ip in ip_addresses],
             return_exceptions=False
         )
 
-        results.extend([r for r in batch_results if r is not None])
-        return results
+        return [data for data in batch_results if data is not None]
 
     async def get_domain_ips(
         self,
@@ -471,6 +571,7 @@ class IPInfoService:
             - regions: Dict mapping regions to counts
             - cities: Dict mapping cities to counts
             - total_ips: Total number of IPs
+            - country_regions: Dict mapping country codes to region counts
             - primary_country: Most common country
             - primary_region: Most common region
         """
@@ -481,6 +582,7 @@ class IPInfoService:
                 "countries": {},
                 "regions": {},
                 "cities": {},
+                "country_regions": {},
                 "total_ips": 0,
                 "primary_country": None,
                 "primary_region": None
@@ -489,12 +591,16 @@ class IPInfoService:
         countries: Dict[str, int] = {}
         regions: Dict[str, int] = {}
         cities: Dict[str, int] = {}
+        country_regions: Dict[str, Dict[str, int]] = {}
 
         for record in records:
             if record.country:
                 countries[record.country] = countries.get(record.country, 0) + 1
             if record.region:
                 regions[record.region] = regions.get(record.region, 0) + 1
+                if record.country:
+                    by_region = country_regions.setdefault(record.country, {})
+                    by_region[record.region] = by_region.get(record.region, 0) + 1
             if record.city:
                 cities[record.city] = cities.get(record.city, 0) + 1
 
@@ -505,6 +611,7 @@ class IPInfoService:
             "countries": countries,
             "regions": regions,
             "cities": cities,
+            "country_regions": country_regions,
             "total_ips": len(records),
             "primary_country": primary_country,
             "primary_region": primary_region
@@ -589,15 +696,16 @@ class IPInfoService:
 
         # Build region details
         regions = []
+        country_regions = geo_distribution.get("country_regions", {})
         for country, count in geo_distribution.get("countries", {}).items():
-            country_regions = [
-                r for r in geo_distribution.get("regions", {}).keys()
-            ]
+            region_counts = country_regions.get(country, {})
             regions.append({
                 "country": country,
                 "ip_count": count,
                 "percentage": (count / total_ips * 100) if total_ips > 0 else 0,
-                "regions": country_regions[:5]  # Limit to top 5 regions per country
+                "regions": sorted(
+                    region_counts, key=region_counts.get, reverse=True
+                )[:5]  # Limit to top 5 regions per country
             })
 
         # Sort by IP count descending
@@ -2,22 +2,26 @@
 
 This module provides a service adapter for the WhoAPI service, which offers
 domain WHOIS data, SSL certificate information, DNS records, and domain
-availability checking.
+availability checking. Full domain profiles fetch every facet concurrently
+and cache each one with its own TTL.
 
 API Documentation: https://whoapi.com/documentation/api
 """
 import asyncio
+import json
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
 
 import httpx
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.cache import cache
+from src.core.http_pool import get_http_pool
 from src.models.external_api import WhoisRecord
 from src.repositories.whoapi_repository import WhoAPIRepository
 
@@ -28,10 +32,22 @@ T = TypeVar("T", bound=BaseModel)
 
 # Cache TTL settings (in seconds)
 WHOIS_CACHE_TTL = 86400  # 24 hours - WHOIS data changes infrequently
-SSL_CACHE_TTL = 43200  # 12 hours
+SSL_CACHE_TTL = 604800  # 7 days - certificates are renewed every few months
 DNS_CACHE_TTL = 3600  # 1 hour
 TECH_CACHE_TTL = 86400  # 24 hours
 
+# Facets that make up a domain profile, with their cache lifetimes
+PROFILE_FACETS = ("whois", "ssl", "dns", "tech")
+FACET_CACHE_TTLS = {
+    "whois": WHOIS_CACHE_TTL,
+    "ssl": SSL_CACHE_TTL,
+    "dns": DNS_CACHE_TTL,
+    "tech": TECH_CACHE_TTL,
+}
+
+# Maximum concurrent WhoAPI requests per service instance
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("WHOAPI_MAX_CONCURRENCY", "5"))
+
 
 class WhoAPIError(Exception):
     """Base exception for WhoAPI-related errors."""
@@ -76,6 +92,9 @@ class WhoisData(BaseModel):
     updated_date: Optional[datetime] = Field(
         None, description="Last WHOIS update date"
     )
+    registered: Optional[bool] = Field(
+        None, description="Whether the domain is registered"
+    )
     nameservers: List[str] = Field(
         default_factory=list, description="List of nameservers"
     )
@@ -279,6 +298,43 @@ class DomainAvailability(BaseModel):
         extra = "ignore"
 
 
+class DomainProfile(BaseModel):
+    """Pydantic model for an aggregated domain intelligence profile."""
+
+    domain: str = Field(..., description="Domain name")
+    whois: Optional[WhoisData] = Field(None, description="WHOIS data")
+    ssl: Optional[SSLInfo] = Field(None, description="SSL certificate info")
+    dns: Optional[DNSInfo] = Field(None, description="DNS records")
+    tech_stack: Optional[TechStackInfo] = Field(
+        None, description="Detected technology stack"
+    )
+    age: Optional[DomainAge] = Field(
+        None, description="Domain age derived from WHOIS"
+    )
+    availability: Optional[DomainAvailability] = Field(
+        None, description="Availability derived from WHOIS"
+    )
+    days_until_expiration: Optional[int] = Field(
+        None, description="Days until the registration expires"
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict, description="Errors for facets that failed"
+    )
+
+    class Config:
+        """Pydantic config."""
+
+        extra = "ignore"
+
+
+FACET_MODELS = {
+    "whois": WhoisData,
+    "ssl": SSLInfo,
+    "dns": DNSInfo,
+    "tech": TechStackInfo,
+}
+
+
 class WhoAPIService:
     """Service adapter for WhoAPI.
 
@@ -303,6 +359,7 @@ class WhoAPIService:
         db: Optional[AsyncSession] = None,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize the WhoAPI service.
 
@@ -311,6 +368,7 @@ class WhoAPIService:
             db: Optional async database session for persistence.
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts for failed requests.
+            max_concurrency: Maximum concurrent requests when building profiles.
         """
         self.api_key = api_key or os.environ.get("WHOAPI_API_KEY", "")
         self.db = db
@@ -318,6 +376,8 @@ class WhoAPIService:
         self.max_retries = max_retries
         self._client: Optional[httpx.AsyncClient] = None
         self._repository: Optional[WhoAPIRepository] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limited_until = 0.0
 
         if db:
             self._repository = WhoAPIRepository(db)
@@ -329,18 +389,12 @@ class WhoAPIService:
 
     async def __aenter__(self) -> "WhoAPIService":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=self.timeout,
-            headers={"Accept": "application/json"},
-        )
+        self._client = get_http_pool().get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Async context manager exit (pooled clients stay open)."""
+        self._client = None
 
     def _normalize_domain(self, domain: str) -> str:
         """Normalize a domain name for consistent lookups.
@@ -392,20 +446,18 @@ class WhoAPIService:
         if extra_params:
             params.update(extra_params)
 
-        # Ensure we have a client
-        client = self._client
-        if not client:
-            client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                timeout=self.timeout,
-                headers={"Accept": "application/json"},
-            )
+        client = self._client or get_http_pool().get_client()
 
         last_error: Optional[Exception] = None
 
         for attempt in range(self.max_retries):
             try:
-                response = await client.get("/", params=params)
+                response = await client.get(
+                    f"{self.BASE_URL}/",
+                    params=params,
+                    headers={"Accept": "application/json"},
+                    timeout=self.timeout,
+                )
 
                 # Check for rate limiting
                 if response.status_code == 429:
@@ -468,10 +520,6 @@ class WhoAPIService:
             if attempt < self.max_retries - 1:
                 await asyncio.sleep(self.RETRY_DELAY * (attempt + 1))
 
-        # Clean up client if we created it
-        if not self._client and client:
-            await client.aclose()
-
         raise last_error or WhoAPIError("Request failed after all retries")
 
     async def get_whois_info(self, domain: str) -> WhoisData:
@@ -495,8 +543,26 @@ class WhoAPIService:
             logger.debug(f"Cache hit for WHOIS: {normalized_domain}")
             return WhoisData(**cached)
 
+        whois_data = await self._fetch_whois_info(normalized_domain)
+
+        # Cache the result
+        cache.set(cache_key, whois_data.dict(), ttl=WHOIS_CACHE_TTL)
+
+        await self._store_whois_record(whois_data)
+
+        return whois_data
+
+    async def _fetch_whois_info(self, normalized_domain: str) -> WhoisData:
+        """Request and parse WHOIS data without touching caches.
+
+        Args:
+            normalized_domain: The normalized domain to look up.
+
+        Returns:
+            WhoisData object with WHOIS information.
+        """
         logger.info(f"Fetching WHOIS for: {normalized_domain}")
-        data = await self._make_request("whois", domain)
+        data = await self._make_request("whois", normalized_domain)
 
         # Parse dates
         def parse_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -518,7 +584,9 @@ class WhoAPIService:
             except Exception:
                 return None
 
-        whois_data = WhoisData(
+        registered = data.get("registered")
+
+        return WhoisData(
             domain_name=normalized_domain,
             registrar=data.get("registrar_name") or data.get("registrar"),
             registration_date=parse_date(
@@ -530,6 +598,11 @@ class WhoAPIService:
             updated_date=parse_date(
                 data.get("date_updated") or data.get("updated_date")
             ),
+            registered=(
+                str(registered).lower() in ("1", "true", "yes")
+                if registered is not None
+                else None
+            ),
             nameservers=data.get("nameservers", []) or [],
             status=data.get("status", []) or [],
             dnssec=(
@@ -547,14 +620,16 @@ class WhoAPIService:
             raw_whois=data.get("rawdata") or data.get("raw_whois"),
         )
 
-        # Cache the result
-        cache.set(cache_key, whois_data.dict(), ttl=WHOIS_CACHE_TTL)
+    async def _store_whois_record(self, whois_data: WhoisData) -> None:
+        """Store WHOIS data in the database if a repository is available.
 
-        # Store in database if repository is available
+        Args:
+            whois_data: Parsed WHOIS data to persist.
+        """
         if self._repository:
             try:
                 record = WhoisRecord(
-                    domain_name=normalized_domain,
+                    domain_name=whois_data.domain_name,
                     registrar=whois_data.registrar,
                     registration_date=whois_data.registration_date,
                     expiration_date=whois_data.expiration_date,
@@ -569,8 +644,6 @@ class WhoAPIService:
             except Exception as e:
                 logger.error(f"Failed to store WHOIS record: {e}")
 
-        return whois_data
-
     async def get_domain_age(self, domain: str) -> DomainAge:
         """Calculate domain age from WHOIS data.
 
@@ -581,8 +654,20 @@ class WhoAPIService:
             DomainAge object with age information.
         """
         whois_data = await self.get_whois_info(domain)
-        normalized_domain = self._normalize_domain(domain)
+        return self._build_domain_age(self._normalize_domain(domain), whois_data)
+
+    def _build_domain_age(
+        self, normalized_domain: str, whois_data: WhoisData
+    ) -> DomainAge:
+        """Derive domain age from already fetched WHOIS data.
+
+        Args:
+            normalized_domain: The normalized domain name.
+            whois_data: WHOIS data for the domain.
 
+        Returns:
+            DomainAge object with age information.
+        """
         age_days: Optional[int] = None
         age_months: Optional[int] = None
         age_years: Optional[int] = None
@@ -627,10 +712,26 @@ class WhoAPIService:
         cached = cache.get(cache_key)
         if cached:
             logger.debug(f"Cache hit for SSL: {normalized_domain}")
-            return SSLInfo(**cached)
+            return self._with_current_expiry(SSLInfo(**cached))
+
+        ssl_info = await self._fetch_ssl_info(normalized_domain)
+
+        # Cache the result
+        cache.set(cache_key, ssl_info.dict(), ttl=SSL_CACHE_TTL)
 
+        return ssl_info
+
+    async def _fetch_ssl_info(self, normalized_domain: str) -> SSLInfo:
+        """Request and parse SSL certificate data without touching caches.
+
+        Args:
+            normalized_domain: The normalized domain to check.
+
+        Returns:
+            SSLInfo object with certificate details.
+        """
         logger.info(f"Fetching SSL info for: {normalized_domain}")
-        data = await self._make_request("sslcert", domain)
+        data = await self._make_request("sslcert", normalized_domain)
 
         # Parse dates
         def parse_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -658,7 +759,7 @@ class WhoAPIService:
         if expiry_date:
             days_until_expiry = (expiry_date.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).days
 
-        ssl_info = SSLInfo(
+        return SSLInfo(
             domain=normalized_domain,
             valid=data.get("valid", False),
             issuer=data.get("issuer") or data.get("issuer_cn"),
@@ -675,9 +776,19 @@ class WhoAPIService:
             protocol_version=data.get("protocol_version") or data.get("ssl_version"),
         )
 
-        # Cache the result
-        cache.set(cache_key, ssl_info.dict(), ttl=SSL_CACHE_TTL)
+    def _with_current_expiry(self, ssl_info: SSLInfo) -> SSLInfo:
+        """Recompute days until expiry for SSL info loaded from a cache.
+
+        Args:
+            ssl_info: Cached SSL certificate info.
 
+        Returns:
+            The same SSLInfo with an up-to-date days_until_expiry.
+        """
+        if ssl_info.expiry_date:
+            ssl_info.days_until_expiry = (
+                ssl_info.expiry_date.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+            ).days
         return ssl_info
 
     async def get_dns_records(self, domain: str) -> DNSInfo:
@@ -698,8 +809,24 @@ class WhoAPIService:
             logger.debug(f"Cache hit for DNS: {normalized_domain}")
             return DNSInfo(**cached)
 
+        dns_info = await self._fetch_dns_records(normalized_domain)
+
+        # Cache the result
+        cache.set(cache_key, dns_info.dict(), ttl=DNS_CACHE_TTL)
+
+        return dns_info
+
+    async def _fetch_dns_records(self, normalized_domain: str) -> DNSInfo:
+        """Request and parse DNS records without touching caches.
+
+        Args:
+            normalized_domain: The normalized domain to check.
+
+        Returns:
+            DNSInfo object with DNS records.
+        """
         logger.info(f"Fetching DNS records for: {normalized_domain}")
-        data = await self._make_request("dns", domain)
+        data = await self._make_request("dns", normalized_domain)
 
         records: List[DNSRecord] = []
         a_records: List[str] = []
@@ -746,7 +873,7 @@ class WhoAPIService:
                     elif record_type == "cname":
                         cname_records.append(value)
 
-        dns_info = DNSInfo(
+        return DNSInfo(
             domain=normalized_domain,
             records=records,
             a_records=a_records,
@@ -757,11 +884,6 @@ class WhoAPIService:
             cname_records=cname_records,
         )
 
-        # Cache the result
-        cache.set(cache_key, dns_info.dict(), ttl=DNS_CACHE_TTL)
-
-        return dns_info
-
     async def analyze_tech_stack(self, domain: str) -> TechStackInfo:
         """Detect technologies used by a domain.
 
@@ -780,8 +902,24 @@ class WhoAPIService:
             logger.debug(f"Cache hit for tech stack: {normalized_domain}")
             return TechStackInfo(**cached)
 
+        tech_info = await self._fetch_tech_stack(normalized_domain)
+
+        # Cache the result
+        cache.set(cache_key, tech_info.dict(), ttl=TECH_CACHE_TTL)
+
+        return tech_info
+
+    async def _fetch_tech_stack(self, normalized_domain: str) -> TechStackInfo:
+        """Request and parse technology data without touching caches.
+
+        Args:
+            normalized_domain: The normalized domain to analyze.
+
+        Returns:
+            TechStackInfo object with detected technologies.
+        """
         logger.info(f"Analyzing tech stack for: {normalized_domain}")
-        data = await self._make_request("tech", domain)
+        data = await self._make_request("tech", normalized_domain)
 
         technologies: List[Dict[str, Any]] = []
         analytics: List[str] = []
@@ -801,7 +939,7 @@ class WhoAPIService:
             else:
                 technologies.append({"name": str(tech)})
 
-        tech_info = TechStackInfo(
+        return TechStackInfo(
             domain=normalized_domain,
             technologies=technologies,
             cms=data.get("cms") or data.get("content_management_system"),
@@ -814,11 +952,6 @@ class WhoAPIService:
             ssl_provider=data.get("ssl_provider"),
         )
 
-        # Cache the result
-        cache.set(cache_key, tech_info.dict(), ttl=TECH_CACHE_TTL)
-
-        return tech_info
-
     async def check_domain_availability(
         self, domain: str
     ) -> DomainAvailability:
@@ -845,6 +978,242 @@ class WhoAPIService:
             currency=data.get("currency"),
         )
 
+    async def get_domain_profile(
+        self,
+        domain: str,
+        facets: Iterable[str] = PROFILE_FACETS,
+    ) -> DomainProfile:
+        """Build a full intelligence profile for a domain.
+
+        Facets are fetched concurrently and a single WHOIS response is
+        shared by the age, expiry and availability derivations.
+
+        Args:
+            domain: The domain to profile.
+            facets: Facets to include (whois, ssl, dns, tech).
+
+        Returns:
+            DomainProfile object with every requested facet.
+        """
+        profiles = await self.get_domain_profiles([domain], facets)
+        return profiles[self._normalize_domain(domain)]
+
+    async def get_domain_profiles(
+        self,
+        domains: Iterable[str],
+        facets: Iterable[str] = PROFILE_FACETS,
+    ) -> Dict[str, DomainProfile]:
+        """Build intelligence profiles for many domains.
+
+        Cached facets are loaded in one lookup per cache layer. Missing
+        facets are fetched concurrently, capped by the service concurrency
+        limit and paused for every worker when WhoAPI signals a rate limit.
+        A failing facet is reported in the profile's errors instead of
+        failing the whole batch.
+
+        Args:
+            domains: The domains to profile.
+            facets: Facets to include (whois, ssl, dns, tech).
+
+        Returns:
+            Dictionary mapping normalized domain to its DomainProfile.
+
+        Raises:
+            ValueError: If an unknown facet is requested.
+        """
+        facets = list(dict.fromkeys(facets))
+        unknown = set(facets) - set(PROFILE_FACETS)
+        if unknown:
+            raise ValueError(f"Unknown WhoAPI facets: {sorted(unknown)}")
+
+        normalized_domains = list(dict.fromkeys(self._normalize_domain(d) for d in domains))
+        found = await self._load_cached_facets(normalized_domains, facets)
+
+        missing = [
+            (domain, facet)
+            for domain in normalized_domains
+            for facet in facets
+            if facet not in found[domain]
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_facet(domain, facet) for domain, facet in missing),
+            return_exceptions=True,
+        )
+
+        fetched: Dict[str, Dict[str, BaseModel]] = {}
+        errors: Dict[str, Dict[str, str]] = {}
+        for (domain, facet), result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning(f"WhoAPI {facet} lookup failed for {domain}: {result}")
+                errors.setdefault(domain, {})[facet] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                found[domain][facet] = result
+                fetched.setdefault(domain, {})[facet] = result
+
+        await self._store_facets(fetched)
+
+        return {
+            domain: self._build_profile(domain, found[domain], errors.get(domain, {}))
+            for domain in normalized_domains
+        }
+
+    async def _load_cached_facets(
+        self, domains: List[str], facets: List[str]
+    ) -> Dict[str, Dict[str, BaseModel]]:
+        """Load facets from the cache, then from the repository facet cache.
+
+        Args:
+            domains: Normalized domain names.
+            facets: Facet names to load.
+
+        Returns:
+            Dictionary mapping domain to {facet: model} for cached facets.
+        """
+        found: Dict[str, Dict[str, BaseModel]] = {domain: {} for domain in domains}
+        pending = []
+
+        for domain in domains:
+            for facet in facets:
+                cached = cache.get(f"whoapi:{facet}:{domain}")
+                if cached:
+                    found[domain][facet] = FACET_MODELS[facet](**cached)
+                else:
+                    pending.append((domain, facet))
+
+        if pending and self._repository:
+            try:
+                stored = await self._repository.get_cached_facets(
+                    list({domain for domain, _ in pending}),
+                    list({facet for _, facet in pending}),
+                )
+            except Exception as e:
+                logger.error(f"Failed to load cached WhoAPI facets: {e}")
+                stored = {}
+
+            for domain, facet in pending:
+                data = stored.get(domain, {}).get(facet)
+                if data:
+                    found[domain][facet] = FACET_MODELS[facet](**data)
+
+        for domain_facets in found.values():
+            if "ssl" in domain_facets:
+                self._with_current_expiry(domain_facets["ssl"])
+
+        return found
+
+    async def _fetch_facet(self, domain: str, facet: str) -> BaseModel:
+        """Fetch one facet under the concurrency and rate limits.
+
+        Args:
+            domain: The normalized domain.
+            facet: Facet name to fetch.
+
+        Returns:
+            Parsed facet model.
+
+        Raises:
+            RateLimitError: If WhoAPI keeps rate limiting after all retries.
+        """
+        fetchers = {
+            "whois": self._fetch_whois_info,
+            "ssl": self._fetch_ssl_info,
+            "dns": self._fetch_dns_records,
+            "tech": self._fetch_tech_stack,
+        }
+
+        for attempt in range(self.max_retries):
+            async with self._semaphore:
+                # A 429 seen by any worker pauses all of them
+                delay = self._rate_limited_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    return await fetchers[facet](domain)
+                except RateLimitError as e:
+                    retry_after = e.details.get("retry_after", 60)
+                    self._rate_limited_until = max(
+                        self._rate_limited_until, time.monotonic() + retry_after
+                    )
+                    if attempt == self.max_retries - 1:
+                        raise
+
+        raise WhoAPIError(f"Failed to fetch {facet} for {domain}")
+
+    async def _store_facets(self, fetched: Dict[str, Dict[str, BaseModel]]) -> None:
+        """Write freshly fetched facets to the cache and the repository.
+
+        Args:
+            fetched: Dictionary mapping domain to {facet: model}.
+        """
+        for domain, domain_facets in fetched.items():
+            for facet, model in domain_facets.items():
+                cache.set(f"whoapi:{facet}:{domain}", model.dict(), ttl=FACET_CACHE_TTLS[facet])
+
+        if not self._repository or not fetched:
+            return
+
+        try:
+            await self._repository.save_facets(
+                {
+                    domain: {facet: json.loads(model.json()) for facet, model in domain_facets.items()}
+                    for domain, domain_facets in fetched.items()
+                },
+                FACET_CACHE_TTLS,
+            )
+        except Exception as e:
+            logger.error(f"Failed to store WhoAPI facets: {e}")
+
+        for domain_facets in fetched.values():
+            if "whois" in domain_facets:
+                await self._store_whois_record(domain_facets["whois"])
+
+    def _build_profile(
+        self,
+        normalized_domain: str,
+        facets: Dict[str, BaseModel],
+        errors: Dict[str, str],
+    ) -> DomainProfile:
+        """Assemble a profile and derive WHOIS-based fields.
+
+        Args:
+            normalized_domain: The normalized domain name.
+            facets: Loaded facet models keyed by facet name.
+            errors: Error messages keyed by facet name.
+
+        Returns:
+            DomainProfile for the domain.
+        """
+        whois_data = facets.get("whois")
+        profile = DomainProfile(
+            domain=normalized_domain,
+            whois=whois_data,
+            ssl=facets.get("ssl"),
+            dns=facets.get("dns"),
+            tech_stack=facets.get("tech"),
+            errors=errors,
+        )
+
+        if whois_data:
+            profile.age = self._build_domain_age(normalized_domain, whois_data)
+            registered = whois_data.registered
+            if registered is None:
+                registered = bool(
+                    whois_data.registrar
+                    or whois_data.registration_date
+                    or whois_data.nameservers
+                )
+            profile.availability = DomainAvailability(
+                domain=normalized_domain, available=not registered
+            )
+            if whois_data.expiration_date:
+                profile.days_until_expiration = (
+                    whois_data.expiration_date.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+                ).days
+
+        return profile
+
     async def get_expiring_domains(
         self, days: int = 30
     ) -> List[Dict[str, Any]]:
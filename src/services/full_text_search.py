@@ -0,0 +1,159 @@
+"""Indexed full-text search for SQLAlchemy queries.
+
+``ILIKE '%term%'`` cannot use a btree index, so every search over it scans
+the whole table. Searches use two kinds of PostgreSQL indexes instead:
+
+- Word search: GIN expression indexes on ``to_tsvector(config, document)``,
+  where the document concatenates a table's searchable columns. Queries
+  must build exactly the same expression (search_document) for the
+  planner to use the index. Matches are ranked with ts_rank_cd.
+- Substring search: pg_trgm GIN indexes (gin_trgm_ops) let the planner use
+  an index for ``ILIKE '%term%'`` itself, so substring filters keep their
+  semantics.
+
+The indexes are created by the 20261017_add_full_text_search_indexes
+migration for the columns in SEARCH_FIELDS.
+
+On other dialects (SQLite in tests) text_match compiles to a
+case-insensitive substring match over the same columns and text_rank to 0.
+
+Example:
+    stmt = (
+        select(Link)
+        .where(text_match(query, *search_columns(Link)))
+        .order_by(text_rank(query, *search_columns(Link)).desc())
+    )
+"""
+from typing import Any, List, Sequence, Type, Union
+
+from sqlalchemy import Boolean, Float, String, func, literal, literal_column, or_, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# Text search configuration. The GIN indexes are built with this exact
+# configuration, so changing it requires a migration that rebuilds them.
+SEARCH_CONFIG = "english"
+
+# Searchable columns per table, in index document order
+SEARCH_FIELDS = {
+    "links": ("title", "description"),
+    "scraped_content": ("title", "meta_description", "meta_keywords"),
+    "competitors": ("name", "description"),
+}
+
+Terms = Union[str, Sequence[str]]
+
+
+def search_columns(model: Type) -> List[Any]:
+    """Get the indexed search columns of a model.
+
+    Args:
+        model: SQLAlchemy model class listed in SEARCH_FIELDS
+
+    Returns:
+        Model attributes in index document order
+    """
+    return [getattr(model, field) for field in SEARCH_FIELDS[model.__tablename__]]
+
+
+def search_document(columns: Sequence[Any]) -> Any:
+    """Build the tsvector expression the GIN indexes are defined on.
+
+    Constants are rendered inline rather than as bind parameters, which
+    PostgreSQL would not match against the index expression.
+
+    Args:
+        columns: Text columns in index document order
+
+    Returns:
+        ``to_tsvector(config, coalesce(a, '') || ' ' || coalesce(b, '') ...)``
+    """
+    empty, space = literal_column("''"), literal_column("' '")
+    document = func.coalesce(columns[0], empty)
+    for column in columns[1:]:
+        document = document.op("||")(space).op("||")(func.coalesce(column, empty))
+    return func.to_tsvector(literal_column(f"'{SEARCH_CONFIG}'"), document)
+
+
+class _TextSearchFunction(FunctionElement):
+    """Base for search constructs holding search terms and target columns.
+
+    A single string is parsed with websearch_to_tsquery syntax (words are
+    ANDed, "quoted phrases", ``or``, ``-excluded``). A list of terms
+    matches rows containing any of them.
+    """
+
+    inherit_cache = True
+
+    def __init__(self, terms: Terms, *columns: Any):
+        if isinstance(terms, str):
+            terms = [terms]
+        # Grouped so the terms and columns can be told apart when compiling
+        super().__init__(
+            tuple_(*[literal(term, String) for term in terms]),
+            tuple_(*columns)
+        )
+
+    @property
+    def terms(self) -> List[Any]:
+        return list(self.clauses.clauses[0].clauses)
+
+    @property
+    def search_columns(self) -> List[Any]:
+        return list(self.clauses.clauses[1].clauses)
+
+    def tsquery(self) -> Any:
+        """OR of websearch_to_tsquery over the terms."""
+        config = literal_column(f"'{SEARCH_CONFIG}'")
+        queries = [func.websearch_to_tsquery(config, term) for term in self.terms]
+        query = queries[0]
+        for other in queries[1:]:
+            query = query.op("||")(other)
+        return query
+
+
+class text_match(_TextSearchFunction):
+    """Full-text match of search terms against columns.
+
+    Example:
+        select(Competitor).where(text_match("cloud storage", Competitor.name, Competitor.description))
+    """
+
+    type = Boolean()
+    name = "text_match"
+    inherit_cache = True
+
+
+class text_rank(_TextSearchFunction):
+    """Relevance of a full-text match (higher is better), for ORDER BY."""
+
+    type = Float()
+    name = "text_rank"
+    inherit_cache = True
+
+
+@compiles(text_match, "postgresql")
+def _compile_text_match_postgresql(element, compiler, **kw):
+    document = search_document(element.search_columns)
+    return f"({compiler.process(document.op('@@')(element.tsquery()), **kw)})"
+
+
+@compiles(text_match)
+def _compile_text_match(element, compiler, **kw):
+    condition = or_(*[
+        func.lower(column).contains(func.lower(term))
+        for term in element.terms
+        for column in element.search_columns
+    ])
+    return f"({compiler.process(condition, **kw)})"
+
+
+@compiles(text_rank, "postgresql")
+def _compile_text_rank_postgresql(element, compiler, **kw):
+    document = search_document(element.search_columns)
+    return compiler.process(func.ts_rank_cd(document, element.tsquery()), **kw)
+
+
+@compiles(text_rank)
+def _compile_text_rank(element, compiler, **kw):
+    return compiler.process(literal_column("0.0", Float()), **kw)
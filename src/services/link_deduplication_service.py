@@ -2,19 +2,154 @@
 
 This module provides URL normalization, fuzzy matching, and deduplication
 capabilities for link management.
+
+Links store their normalized URL and host in indexed columns. Duplicate
+detection blocks candidates by host and path prefix (the path up to its
+last segment), so a lookup only reads links under the same directory of
+the same host. The full scan streams the table in host order in chunks
+and finds fuzzy duplicates inside each block with MinHash/LSH over path
+shingles, verifying only the candidates LSH proposes.
 """
+import hashlib
 import logging
-import re
-from typing import List, Dict, Optional, Tuple, Set
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from collections import defaultdict
+from datetime import datetime
 from difflib import SequenceMatcher
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
 
+from src.models.domain import Domain
 from src.models.link import Link
+from src.utils.url_normalization import normalize_url, url_directory, url_host
 
 logger = logging.getLogger(__name__)
 
+# Links are streamed from the database in chunks of this many rows
+DEFAULT_CHUNK_SIZE = 1000
+
+# MinHash signature length and LSH banding. With 32 bands of 4 rows, URL
+# pairs whose path shingle sets have a Jaccard similarity of 0.5 become
+# candidates 87% of the time and pairs at 0.3 about 23% of the time; URLs
+# differing in a character or a short suffix are found practically always.
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 32
+
+# Blocks with at most this many distinct URLs are compared pairwise
+PAIRWISE_BLOCK_SIZE = 32
+
+# Characters per path shingle
+SHINGLE_SIZE = 3
+
+# Weight of the path in the similarity score; the rest is query keys
+PATH_WEIGHT = 0.7
+
+# (netloc, path, query parameter names) of a normalized URL
+UrlFeatures = Tuple[str, str, frozenset]
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer; uint64 arithmetic wraps, which is intended."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class MinHashLSH:
+    """MinHash signatures with a banded locality-sensitive hashing index.
+
+    Items whose signatures agree on every row of at least one band share
+    a bucket, so similar items are found without comparing all pairs.
+
+    Attributes:
+        num_perm: Number of hash functions in a signature
+        bands: Number of LSH bands (must divide num_perm)
+    """
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, bands: int = LSH_BANDS, seed: int = 1):
+        """Initialize the hash family and an empty index.
+
+        Args:
+            num_perm: Number of hash functions in a signature
+            bands: Number of LSH bands (must divide num_perm)
+            seed: Seed for the hash functions
+
+        Raises:
+            ValueError: If bands does not divide num_perm
+        """
+        if num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {num_perm} permutations")
+        self.num_perm = num_perm
+        self.bands = bands
+        self._salts = np.random.default_rng(seed).integers(
+            0, np.iinfo(np.uint64).max, size=num_perm, dtype=np.uint64, endpoint=True
+        )
+        self._band_weights = _mix64(np.arange(1, num_perm // bands + 1, dtype=np.uint64))
+        self._buckets: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+        self._shingle_hashes: Dict[str, int] = {}
+        self._band_keys: Dict[Any, List[Tuple[int, int]]] = {}
+
+    def signatures(self, shingle_sets: List[Iterable[str]]) -> np.ndarray:
+        """Compute the MinHash signatures of several sets of shingles.
+
+        Args:
+            shingle_sets: Non-empty sets of shingles
+
+        Returns:
+            uint64 array of shape (len(shingle_sets), num_perm)
+        """
+        hashes, offsets = [], []
+        for shingles in shingle_sets:
+            offsets.append(len(hashes))
+            for shingle in shingles:
+                value = self._shingle_hashes.get(shingle)
+                if value is None:
+                    digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+                    value = self._shingle_hashes[shingle] = int.from_bytes(digest, "big")
+                hashes.append(value)
+        mixed = _mix64(np.array(hashes, dtype=np.uint64)[:, None] ^ self._salts[None, :])
+        return np.minimum.reduceat(mixed, offsets, axis=0)
+
+    def insert(self, items: Dict[Any, Iterable[str]], chunk_size: int = 1024) -> None:
+        """Add items to the index.
+
+        Args:
+            items: Non-empty set of shingles per hashable item key
+            chunk_size: Items hashed per vectorized batch
+        """
+        keys = list(items)
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            rows = self.signatures([items[key] for key in chunk]).reshape(len(chunk), self.bands, -1)
+            # One 64-bit hash per band stands in for the band's rows
+            band_hashes = _mix64(rows * self._band_weights).sum(axis=2, dtype=np.uint64)
+            for key, hashes in zip(chunk, band_hashes.tolist()):
+                band_keys = list(enumerate(hashes))
+                self._band_keys[key] = band_keys
+                for band_key in band_keys:
+                    self._buckets[band_key].append(key)
+
+    def candidates(self, key: Any) -> Iterator[Any]:
+        """Yield the indexed items sharing a bucket with an indexed item.
+
+        Items sharing several buckets are yielded once per bucket, and
+        the item itself is included.
+
+        Args:
+            key: Key of an inserted item
+
+        Yields:
+            Candidate item keys
+        """
+        for band_key in self._band_keys[key]:
+            yield from self._buckets[band_key]
+
 
 class LinkDeduplicationService:
     """Service for detecting and managing duplicate links.
@@ -34,13 +169,8 @@ class LinkDeduplicationService:
     def normalize_url(self, url: str) -> str:
         """Normalize a URL for comparison.
 
-        Normalization includes:
-        - Converting to lowercase
-        - Removing trailing slashes
-        - Sorting query parameters
-        - Removing common tracking parameters
-        - Removing fragments
-        - Removing www prefix
+        See src.utils.url_normalization.normalize_url, which also fills
+        Link.normalized_url.
 
         Args:
             url: URL to normalize
@@ -48,51 +178,7 @@ class LinkDeduplicationService:
         Returns:
             Normalized URL string
         """
-        try:
-            # Parse URL
-            parsed = urlparse(url.lower().strip())
-
-            # Remove common tracking parameters
-            tracking_params = {
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-                'fbclid', 'gclid', 'msclkid', '_ga', 'mc_cid', 'mc_eid'
-            }
-
-            # Parse and filter query parameters
-            query_params = parse_qs(parsed.query)
-            filtered_params = {
-                k: v for k, v in query_params.items()
-                if k.lower() not in tracking_params
-            }
-
-            # Sort parameters for consistency
-            sorted_query = urlencode(sorted(filtered_params.items()), doseq=True)
-
-            # Remove 'www.' from netloc
-            netloc = parsed.netloc
-            if netloc.startswith('www.'):
-                netloc = netloc[4:]
-
-            # Remove trailing slashes from path
-            path = parsed.path.rstrip('/')
-            if not path:
-                path = '/'
-
-            # Rebuild URL without fragment
-            normalized = urlunparse((
-                parsed.scheme or 'https',
-                netloc,
-                path,
-                parsed.params,
-                sorted_query,
-                ''  # No fragment
-            ))
-
-            return normalized
-
-        except Exception as e:
-            logger.warning(f"Failed to normalize URL {url}: {str(e)}")
-            return url.lower().strip()
+        return normalize_url(url)
 
     def calculate_similarity(self, url1: str, url2: str) -> float:
         """Calculate similarity score between two URLs.
@@ -106,7 +192,6 @@ class LinkDeduplicationService:
         Returns:
             Similarity score between 0 and 1
         """
-        # Normalize URLs
         norm1 = self.normalize_url(url1)
         norm2 = self.normalize_url(url2)
 
@@ -114,160 +199,173 @@ class LinkDeduplicationService:
         if norm1 == norm2:
             return 1.0
 
-        # Parse normalized URLs
-        parsed1 = urlparse(norm1)
-        parsed2 = urlparse(norm2)
-
-        # Domain must match
-        if parsed1.netloc != parsed2.netloc:
-            return 0.0
-
-        # Compare paths using sequence matcher
-        path_similarity = SequenceMatcher(None, parsed1.path, parsed2.path).ratio()
-
-        # Compare query parameters
-        params1 = set(parse_qs(parsed1.query).keys())
-        params2 = set(parse_qs(parsed2.query).keys())
-
-        if params1 or params2:
-            param_similarity = len(params1 & params2) / len(params1 | params2) if (params1 | params2) else 1.0
-        else:
-            param_similarity = 1.0
-
-        # Weight: path is more important than query params
-        overall_similarity = (path_similarity * 0.7) + (param_similarity * 0.3)
-
-        return overall_similarity
+        return self._score(self._features(norm1), self._features(norm2))
 
     def find_duplicates_for_url(
         self,
         db: Session,
         url: str,
         company_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
     ) -> List[Tuple[Link, float]]:
         """Find potential duplicates for a given URL.
 
+        Only links on the same host under the same path prefix are
+        compared, using the indexed host and normalized_url columns.
+
         Args:
             db: Database session
             url: URL to find duplicates for
             company_id: Optional company ID to scope search
             limit: Maximum number of duplicates to return
+            chunk_size: Number of candidate rows fetched per round trip
 
         Returns:
             List of (Link, similarity_score) tuples
         """
-        # Normalize the input URL
         normalized = self.normalize_url(url)
-        parsed = urlparse(normalized)
-        domain = parsed.netloc
-
-        # Query links from the same domain
-        query = db.query(Link).filter(Link.url.ilike(f'%{domain}%'))
-
-        if company_id:
-            query = query.filter(Link.company_id == company_id)
-
-        candidate_links = query.all()
+        host = url_host(normalized)
+        directory = url_directory(normalized)
+        prefixes = sorted({
+            f"{scheme}://{host}{directory}"
+            for scheme in ("http", "https", urlparse(normalized).scheme)
+        })
+
+        query = db.query(Link.id, Link.url, Link.normalized_url).filter(
+            Link.host == host,
+            or_(*(Link.normalized_url.startswith(prefix, autoescape=True) for prefix in prefixes))
+        )
+        query = self._scope(query, company_id)
 
-        # Calculate similarity for each candidate
-        duplicates = []
-        for link in candidate_links:
-            if link.url == url:
+        features = self._features(normalized)
+        scores: Dict[int, float] = {}
+        for row in query.yield_per(chunk_size):
+            if row.url == url:
                 continue  # Skip exact match
-
-            similarity = self.calculate_similarity(url, link.url)
-
-            if similarity >= self.similarity_threshold:
-                duplicates.append((link, similarity))
+            score = self._match(features, self._features(row.normalized_url or self.normalize_url(row.url)))
+            if score is not None:
+                scores[row.id] = score
 
         # Sort by similarity (highest first)
-        duplicates.sort(key=lambda x: x[1], reverse=True)
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        if not best:
+            return []
 
-        return duplicates[:limit]
+        links = {link.id: link for link in db.query(Link).filter(Link.id.in_([i for i, _ in best])).all()}
+        return [(links[link_id], score) for link_id, score in best if link_id in links]
 
     def find_all_duplicates(
         self,
         db: Session,
         company_id: Optional[int] = None,
-        batch_size: int = 100
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        active_only: bool = False
     ) -> List[Dict]:
         """Find all duplicate links in the database.
 
+        Every link in scope is scanned. Each link belongs to at most one
+        group: links whose normalized URLs are fuzzy duplicates form one
+        fuzzy group, otherwise links sharing a normalized URL form an
+        exact group.
+
         Args:
             db: Database session
             company_id: Optional company ID to scope search
-            batch_size: Number of links to process per batch
+            chunk_size: Number of links streamed per round trip
+            active_only: Only consider active links
 
         Returns:
             List of duplicate groups with similarity scores
         """
-        # Query all links
-        query = db.query(Link)
+        groups, _ = self.scan_duplicates(db, company_id, chunk_size, active_only)
+        return self.attach_links(db, groups, chunk_size)
 
-        if company_id:
-            query = query.filter(Link.company_id == company_id)
-
-        all_links = query.all()
-
-        # Group by normalized URL
-        normalized_groups: Dict[str, List[Link]] = {}
-
-        for link in all_links:
-            normalized = self.normalize_url(link.url)
-
-            if normalized not in normalized_groups:
-                normalized_groups[normalized] = []
+    def scan_duplicates(
+        self,
+        db: Session,
+        company_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        active_only: bool = False
+    ) -> Tuple[List[Dict], int]:
+        """Stream all links in scope and group the duplicates.
 
-            normalized_groups[normalized].append(link)
+        Links are read as lightweight rows in host order, one host at a
+        time, so memory is bounded by the largest host rather than the
+        table. Groups hold rows with id, url, normalized_url, host and
+        discovered_at; use attach_links to swap in Link objects.
 
-        # Find groups with duplicates
-        duplicate_groups = []
+        Args:
+            db: Database session
+            company_id: Optional company ID to scope search
+            chunk_size: Number of links streamed per round trip
+            active_only: Only consider active links
 
-        for normalized_url, links in normalized_groups.items():
-            if len(links) > 1:
-                # Sort by creation date (oldest first)
-                links.sort(key=lambda x: x.created_at)
-
-                group = {
-                    'normalized_url': normalized_url,
-                    'count': len(links),
-                    'canonical': links[0],  # Oldest link as canonical
-                    'duplicates': links[1:],
-                    'similarity': 1.0  # Exact match after normalization
-                }
+        Returns:
+            Tuple of (duplicate groups, number of links scanned)
+        """
+        query = db.query(Link.id, Link.url, Link.normalized_url, Link.host, Link.discovered_at)
+        query = self._scope(query, company_id)
+        if active_only:
+            query = query.filter(Link.is_active.is_(True))
+
+        duplicate_groups: List[Dict] = []
+        total_links = 0
+        rows = query.order_by(Link.host, Link.id).yield_per(chunk_size)
+        for _, host_rows in groupby(rows, key=lambda row: row.host):
+            host_rows = list(host_rows)
+            total_links += len(host_rows)
+            duplicate_groups.extend(self._group_host(host_rows))
+
+        logger.info(f"Scanned {total_links} links, found {len(duplicate_groups)} duplicate groups")
+        return duplicate_groups, total_links
+
+    def attach_links(
+        self,
+        db: Session,
+        duplicate_groups: List[Dict],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[Dict]:
+        """Replace the rows in duplicate groups with Link objects.
 
-                duplicate_groups.append(group)
+        Links deleted since the scan are dropped, along with groups left
+        with fewer than two links.
 
-        # Also find fuzzy duplicates (similar but not exact after normalization)
-        # This is computationally expensive, so we limit it
-        processed_urls: Set[str] = set()
+        Args:
+            db: Database session
+            duplicate_groups: Groups returned by scan_duplicates
+            chunk_size: Number of links loaded per query
 
-        for link in all_links[:batch_size]:
-            if link.url in processed_urls:
+        Returns:
+            Duplicate groups holding Link objects
+        """
+        link_ids = [
+            row.id
+            for group in duplicate_groups
+            for row in [group['canonical'], *group['duplicates']]
+        ]
+        links: Dict[int, Link] = {}
+        for start in range(0, len(link_ids), chunk_size):
+            chunk = link_ids[start:start + chunk_size]
+            for link in db.query(Link).filter(Link.id.in_(chunk)).all():
+                links[link.id] = link
+
+        attached = []
+        for group in duplicate_groups:
+            members = [
+                links[row.id]
+                for row in [group['canonical'], *group['duplicates']]
+                if row.id in links
+            ]
+            if len(members) < 2:
                 continue
-
-            fuzzy_dupes = self.find_duplicates_for_url(
-                db, link.url, company_id, limit=5
-            )
-
-            if fuzzy_dupes:
-                processed_urls.add(link.url)
-                for dupe_link, similarity in fuzzy_dupes:
-                    processed_urls.add(dupe_link.url)
-
-                group = {
-                    'normalized_url': self.normalize_url(link.url),
-                    'count': len(fuzzy_dupes) + 1,
-                    'canonical': link,
-                    'duplicates': [d[0] for d in fuzzy_dupes],
-                    'similarity': fuzzy_dupes[0][1] if fuzzy_dupes else 1.0,
-                    'fuzzy': True
-                }
-
-                duplicate_groups.append(group)
-
-        return duplicate_groups
+            attached.append({
+                **group,
+                'count': len(members),
+                'canonical': members[0],
+                'duplicates': members[1:]
+            })
+        return attached
 
     def merge_duplicate_links(
         self,
@@ -354,18 +452,24 @@ class LinkDeduplicationService:
     def generate_duplicate_report(
         self,
         db: Session,
-        company_id: Optional[int] = None
+        company_id: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
     ) -> Dict:
         """Generate a report of duplicate links.
 
+        Statistics and recommendations cover every link in scope; only
+        the 50 largest groups are loaded as Link objects.
+
         Args:
             db: Database session
             company_id: Optional company ID to scope report
+            chunk_size: Number of links streamed per round trip
 
         Returns:
             Dict containing duplicate statistics and recommendations
         """
-        duplicate_groups = self.find_all_duplicates(db, company_id)
+        duplicate_groups, total_links = self.scan_duplicates(db, company_id, chunk_size)
+        duplicate_groups.sort(key=lambda group: group['count'], reverse=True)
 
         total_duplicates = sum(group['count'] - 1 for group in duplicate_groups)
         exact_duplicates = sum(
@@ -379,12 +483,6 @@ class LinkDeduplicationService:
             if group.get('fuzzy', False)
         )
 
-        # Calculate potential savings
-        query = db.query(Link)
-        if company_id:
-            query = query.filter(Link.company_id == company_id)
-        total_links = query.count()
-
         savings_percentage = (total_duplicates / total_links * 100) if total_links > 0 else 0
 
         return {
@@ -396,7 +494,7 @@ class LinkDeduplicationService:
                 'unique_links': total_links - total_duplicates,
                 'savings_percentage': round(savings_percentage, 2)
             },
-            'duplicate_groups': duplicate_groups[:50],  # Top 50 groups
+            'duplicate_groups': self.attach_links(db, duplicate_groups[:50], chunk_size),  # Top 50 groups
             'recommendations': [
                 {
                     'canonical_id': group['canonical'].id,
@@ -410,6 +508,134 @@ class LinkDeduplicationService:
             'generated_at': datetime.utcnow().isoformat()
         }
 
+    def _scope(self, query, company_id: Optional[int]):
+        """Limit a links query to one company's domains."""
+        if company_id:
+            query = query.filter(
+                Link.domain_id.in_(select(Domain.id).where(Domain.company_id == company_id))
+            )
+        return query
+
+    def _group_host(self, rows: List[Any]) -> List[Dict]:
+        """Group the duplicate links of one host.
 
-# Import datetime
-from datetime import datetime
+        Distinct normalized URLs are blocked by host and path prefix.
+        Within a block, the URL of the oldest link leads a fuzzy group and
+        takes in the unassigned URLs similar to it, then the next oldest
+        unassigned URL leads, and so on. Leaders compare against the whole
+        block when it is small, otherwise against their MinHash/LSH
+        candidates. Remaining URLs shared by several links form exact groups.
+
+        Args:
+            rows: Link rows sharing a stored host
+
+        Returns:
+            Duplicate groups holding link rows
+        """
+        by_url: Dict[str, List[Any]] = defaultdict(list)
+        for row in rows:
+            by_url[row.normalized_url or self.normalize_url(row.url)].append(row)
+
+        features = {normalized: self._features(normalized) for normalized in by_url}
+        blocks: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for normalized, (netloc, path, _) in features.items():
+            blocks[(netloc, path[:path.rfind('/') + 1])].append(normalized)
+
+        duplicate_groups = []
+        assigned: Set[str] = set()
+        for block in blocks.values():
+            if len(block) < 2:
+                continue
+            # by_url lists keep stream order, which is id order
+            block.sort(key=lambda normalized: min(link.discovered_at for link in by_url[normalized]))
+
+            if len(block) <= PAIRWISE_BLOCK_SIZE:
+                candidates = lambda leader: block
+            else:
+                lsh = MinHashLSH()
+                lsh.insert({normalized: self._shingles(features[normalized]) for normalized in block})
+                candidates = lsh.candidates
+
+            for leader in block:
+                if leader in assigned:
+                    continue
+                members, lowest = [leader], 1.0
+                compared = {leader}
+                for other in candidates(leader):
+                    if other in compared or other in assigned:
+                        continue
+                    compared.add(other)
+                    score = self._match(features[leader], features[other])
+                    if score is not None:
+                        members.append(other)
+                        lowest = min(lowest, score)
+                if len(members) > 1:
+                    assigned.update(members)
+                    group = self._make_group(
+                        leader, [link for normalized in members for link in by_url[normalized]], lowest
+                    )
+                    group['fuzzy'] = True
+                    duplicate_groups.append(group)
+
+        for normalized, links in by_url.items():
+            if normalized not in assigned and len(links) > 1:
+                duplicate_groups.append(self._make_group(normalized, links, 1.0))
+
+        return duplicate_groups
+
+    def _make_group(self, normalized_url: str, links: List[Any], similarity: float) -> Dict:
+        """Build a duplicate group with the oldest link as canonical."""
+        links = sorted(links, key=lambda link: (link.discovered_at, link.id))
+        return {
+            'normalized_url': normalized_url,
+            'count': len(links),
+            'canonical': links[0],
+            'duplicates': links[1:],
+            'similarity': similarity
+        }
+
+    def _features(self, normalized_url: str) -> UrlFeatures:
+        """Parse the parts of a normalized URL that similarity compares."""
+        parsed = urlparse(normalized_url)
+        return parsed.netloc, parsed.path, frozenset(parse_qs(parsed.query).keys())
+
+    def _shingles(self, features: UrlFeatures) -> Set[str]:
+        """Path character shingles and query parameter names of a URL."""
+        path = features[1]
+        shingles = {path[i:i + SHINGLE_SIZE] for i in range(max(1, len(path) - SHINGLE_SIZE + 1))}
+        shingles.update(f"?{key}" for key in features[2])
+        return shingles
+
+    def _param_similarity(self, features1: UrlFeatures, features2: UrlFeatures) -> float:
+        """Jaccard similarity of query parameter names."""
+        params1, params2 = features1[2], features2[2]
+        if params1 or params2:
+            return len(params1 & params2) / len(params1 | params2)
+        return 1.0
+
+    def _score(self, features1: UrlFeatures, features2: UrlFeatures) -> float:
+        """Similarity of two normalized URLs; the domain must match."""
+        if features1[0] != features2[0]:
+            return 0.0
+
+        path_similarity = SequenceMatcher(None, features1[1], features2[1]).ratio()
+
+        # Weight: path is more important than query params
+        return PATH_WEIGHT * path_similarity + (1 - PATH_WEIGHT) * self._param_similarity(features1, features2)
+
+    def _match(self, features1: UrlFeatures, features2: UrlFeatures) -> Optional[float]:
+        """Similarity of two normalized URLs if it reaches the threshold.
+
+        SequenceMatcher's cheap upper bounds reject most non-matches
+        before the full ratio is computed.
+        """
+        if features1[0] != features2[0]:
+            return None
+
+        param_part = (1 - PATH_WEIGHT) * self._param_similarity(features1, features2)
+        matcher = SequenceMatcher(None, features1[1], features2[1])
+        for bound in (matcher.real_quick_ratio, matcher.quick_ratio, matcher.ratio):
+            score = PATH_WEIGHT * bound() + param_part
+            if score < self.similarity_threshold:
+                return None
+        return score
@@ -1,19 +1,55 @@
 """Service for searching and managing links."""
-from typing import List, Dict, Any, Tuple, Optional
+import asyncio
+import logging
+import os
+from typing import List, Dict, Any, Set, Tuple, Optional
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 
 from src.models.link import Link
 from src.models.domain import Domain
 from src.models.company import Company
+from src.services.full_text_search import search_columns, text_match, text_rank
+from src.services.google_custom_search import GoogleCustomSearchService
+from src.utils.url_normalization import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Google Custom Search returns at most 10 results per request
+RESULTS_PER_REQUEST = 10
+
+# Domains searched at the same time when a search client is configured
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("LINK_SEARCH_MAX_CONCURRENCY", "4"))
+
 
 class LinkSearchService:
-    """Service for searching and managing links."""
+    """Service for searching and managing links.
+
+    Domains are searched concurrently through Google Custom Search when a
+    search client is given, within its remaining daily quota; otherwise
+    links already stored for the domain are used. Results from all
+    domains are stored in bulk: deduplicated by normalized URL, checked
+    against stored links with one query and committed once.
+    """
 
-    def __init__(self, db: AsyncSession):
-        """Initialize the service."""
+    def __init__(
+        self,
+        db: AsyncSession,
+        search_service: Optional[GoogleCustomSearchService] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ):
+        """Initialize the service.
+
+        Args:
+            db: Database session
+            search_service: Optional Google Custom Search client
+            max_concurrency: Maximum concurrent domain searches
+        """
         self.db = db
+        self.search_service = search_service
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
     async def search_links_for_domain(
         self, 
@@ -27,50 +63,9 @@ class LinkSearchService:
         if not domain:
             raise ValueError(f"Domain with ID {domain_id} not found")
 
-        # Search for links
-        try:
-            if keywords:
-                search_results = await self._search_for_domain_with_keywords(domain.domain_name, keywords, max_results)
-            else:
-                search_results = await self._search_for_domain(domain.domain_name, max_results)
-        except Exception as e:
-            return [], [{"error": f"Search failed: {str(e)}", "domain_id": domain_id}]
-
-        # Process search results
-        created_links = []
-        errors = []
-
-        for result in search_results:
-            try:
-                # Check if link already exists
-                existing_link = await self._get_link_by_url(result["link"])
-                if existing_link:
-                    continue
-
-                # Create new link
-                link = Link(
-                    url=result["link"],
-                    domain_id=domain_id,
-                    title=result["title"],
-                    meta={
-                        "snippet": result["snippet"],
-                        "search_score": result["search_score"],
-                        "source": "keyword_search" if keywords else "domain_search",
-                        "keywords": keywords if keywords else None
-                    }
-                )
-                self.db.add(link)
-                created_links.append(link)
-            except Exception as e:
-                errors.append({
-                    "error": f"Failed to create link: {str(e)}",
-                    "url": result["link"]
-                })
-
-        if created_links:
-            await self.db.commit()
-
-        return created_links, errors
+        results, errors = await self._search_domains([domain], max_results, keywords)
+        created_links, store_errors = await self._store_links(results, keywords)
+        return created_links, errors + store_errors
 
     async def search_links_for_company(
         self, 
@@ -78,7 +73,11 @@ class LinkSearchService:
         max_results: int = 20,
         keywords: Optional[List[str]] = None
     ) -> Tuple[List[Link], List[Dict[str, Any]]]:
-        """Search for links across all domains of a company."""
+        """Search for links across all domains of a company.
+
+        All domains are searched before any link is stored, so the company
+        costs one existence check and one commit however many domains it has.
+        """
         # Get company
         company = await self._get_company(company_id)
         if not company:
@@ -89,21 +88,10 @@ class LinkSearchService:
         if not domains:
             raise ValueError(f"No domains found for company with ID {company_id}")
 
-        # Search each domain
-        all_links = []
-        all_errors = []
         max_results_per_domain = max(1, max_results // len(domains))
-
-        for domain in domains:
-            links, errors = await self.search_links_for_domain(
-                domain_id=domain.id,
-                max_results=max_results_per_domain,
-                keywords=keywords
-            )
-            all_links.extend(links)
-            all_errors.extend(errors)
-
-        return all_links, all_errors
+        results, errors = await self._search_domains(domains, max_results_per_domain, keywords)
+        created_links, store_errors = await self._store_links(results, keywords)
+        return created_links, errors + store_errors
 
     async def search_links_by_keywords(
         self, 
@@ -121,6 +109,137 @@ class LinkSearchService:
             keywords=keywords
         )
 
+    async def _search_domains(
+        self,
+        domains: List[Domain],
+        max_results: int,
+        keywords: Optional[List[str]] = None
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """Search several domains.
+
+        With a search client, domains are searched concurrently and only
+        as many as the remaining daily quota can serve in full are
+        searched. Without one, domains are searched one after another,
+        since they share the database session.
+
+        Args:
+            domains: Domains to search
+            max_results: Maximum results per domain
+            keywords: Optional keywords to search for
+
+        Returns:
+            Tuple of ((domain ID, search result) pairs, errors)
+        """
+        errors: List[Dict[str, Any]] = []
+
+        if self.search_service is None:
+            outcomes = [await self._search_domain(domain, max_results, keywords) for domain in domains]
+        else:
+            requests_per_domain = -(-max_results // RESULTS_PER_REQUEST)
+            affordable = self.search_service.rate_limiter.get_remaining_calls() // requests_per_domain
+            for domain in domains[affordable:]:
+                errors.append({
+                    "error": "Search skipped: Google Custom Search daily quota exhausted",
+                    "domain_id": domain.id
+                })
+            outcomes = await asyncio.gather(*(
+                self._search_domain(domain, max_results, keywords)
+                for domain in domains[:affordable]
+            ))
+
+        results = []
+        for domain, search_results, error in outcomes:
+            if error:
+                errors.append({"error": f"Search failed: {error}", "domain_id": domain.id})
+                continue
+            results.extend((domain.id, result) for result in search_results)
+        return results, errors
+
+    async def _search_domain(
+        self,
+        domain: Domain,
+        max_results: int,
+        keywords: Optional[List[str]] = None
+    ) -> Tuple[Domain, List[Dict[str, Any]], Optional[str]]:
+        """Search one domain, capturing the error instead of raising it."""
+        async with self._semaphore:
+            try:
+                if keywords:
+                    search_results = await self._search_for_domain_with_keywords(domain.name, keywords, max_results)
+                else:
+                    search_results = await self._search_for_domain(domain.name, max_results)
+                return domain, search_results, None
+            except Exception as e:
+                logger.warning(f"Link search failed for domain {domain.id}: {str(e)}")
+                return domain, [], str(e)
+
+    async def _store_links(
+        self,
+        results: List[Tuple[int, Dict[str, Any]]],
+        keywords: Optional[List[str]] = None
+    ) -> Tuple[List[Link], List[Dict[str, Any]]]:
+        """Store search results that are not stored yet as new links.
+
+        Results are deduplicated by normalized URL, checked against stored
+        links with one query and committed together. If another session
+        stores one of the URLs first, the check and insert are retried once.
+
+        Args:
+            results: (domain ID, search result) pairs
+            keywords: Keywords the results were searched with
+
+        Returns:
+            Tuple of (created links, errors)
+        """
+        candidates: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for domain_id, result in results:
+            candidates.setdefault(normalize_url(result["link"]), (domain_id, result))
+        if not candidates:
+            return [], []
+
+        for attempt in range(2):
+            stored = await self._get_stored_normalized_urls(list(candidates))
+            created_links = []
+            errors = []
+
+            for normalized, (domain_id, result) in candidates.items():
+                if normalized in stored:
+                    continue
+                try:
+                    link = Link(
+                        url=result["link"],
+                        domain_id=domain_id,
+                        title=result["title"],
+                        meta_data={
+                            "snippet": result["snippet"],
+                            "search_score": result["search_score"],
+                            "source": "keyword_search" if keywords else "domain_search",
+                            "keywords": keywords if keywords else None
+                        }
+                    )
+                    self.db.add(link)
+                    created_links.append(link)
+                except Exception as e:
+                    errors.append({
+                        "error": f"Failed to create link: {str(e)}",
+                        "url": result["link"]
+                    })
+
+            if not created_links:
+                return created_links, errors
+
+            try:
+                await self.db.commit()
+                return created_links, errors
+            except IntegrityError:
+                # Another session stored some of these URLs in the meantime
+                await self.db.rollback()
+                if attempt:
+                    raise
+                logger.debug("Concurrent link insert, retrying without stored links")
+
+        return [], []
+
     async def _get_domain(self, domain_id: int) -> Optional[Domain]:
         """Get a domain by ID."""
         result = await self.db.execute(
@@ -142,29 +261,49 @@ class LinkSearchService:
         )
         return result.scalars().all()
 
-    async def _get_link_by_url(self, url: str) -> Optional[Link]:
-        """Get a link by URL."""
+    async def _get_stored_normalized_urls(self, normalized_urls: List[str]) -> Set[str]:
+        """Get which of the given normalized URLs belong to stored links."""
         result = await self.db.execute(
-            select(Link).where(Link.url == url)
+            select(Link.normalized_url).where(Link.normalized_url.in_(normalized_urls))
         )
-        return result.scalar_one_or_none()
+        return set(result.scalars().all())
 
-    async def _search_for_domain(
-        self, 
-        domain_name: str, 
-        max_results: int = 50
+    async def _search_google(
+        self,
+        domain_name: str,
+        query: str,
+        max_results: int
     ) -> List[Dict[str, Any]]:
-        """Search for links associated with a domain."""
-        return await self._mock_search_results(domain_name, max_results)
+        """Search a domain with Google Custom Search, one page per request.
 
-    async def _search_for_domain_with_keywords(
-        self, 
-        domain_name: str, 
-        keywords: List[str],
-        max_results: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Search for links within a domain using specific keywords."""
-        return await self._mock_search_results_with_keywords(domain_name, keywords, max_results)
+        Args:
+            domain_name: Domain to restrict the search to
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            Search results ranked by position, best first
+        """
+        results: List[Dict[str, Any]] = []
+        while len(results) < max_results:
+            num_results = min(RESULTS_PER_REQUEST, max_results - len(results))
+            response = await self.search_service.search(
+                query=query,
+                site=domain_name,
+                num_results=num_results,
+                start_index=len(results) + 1
+            )
+            page = response.get("results", [])
+            for item in page:
+                results.append({
+                    "title": item.get("title") or "Untitled",
+                    "link": item["link"],
+                    "snippet": item.get("snippet") or "",
+                    "search_score": round(1 - len(results) / max_results, 4)
+                })
+            if len(page) < num_results:
+                break
+        return results
 
     async def _search_for_domain(
         self, 
@@ -172,12 +311,17 @@ class LinkSearchService:
         max_results: int = 50
     ) -> List[Dict[str, Any]]:
         """Search for links associated with a domain.
+
+        Uses Google Custom Search when a search client is configured.
         
         Following OnSide project requirements:
         - Uses actual database instead of mocks
         - Validates against real schema
         - Follows BDD/TDD methodology
         """
+        if self.search_service is not None:
+            return await self._search_google(domain_name, "", max_results)
+
         # Get existing links for the domain
         result = await self.db.execute(
             select(Link)
@@ -205,27 +349,31 @@ class LinkSearchService:
         max_results: int = 50
     ) -> List[Dict[str, Any]]:
         """Search for links within a domain using specific keywords.
+
+        Uses Google Custom Search when a search client is configured.
         
         Following OnSide project requirements:
         - Uses actual database instead of mocks
         - Validates against real schema
         - Follows BDD/TDD methodology
         """
-        # Create SQL LIKE patterns for keyword matching
-        patterns = [f"%{keyword}%" for keyword in keywords]
-        
-        # Search links with keyword matching
-        result = await self.db.execute(
-            select(Link)
-            .join(Domain)
-            .where(
-                Domain.name == domain_name,
-                # Match keywords in title, description, or content
-                (Link.title.ilike(patterns[0]) if patterns else True) |
-                (Link.description.ilike(patterns[0]) if patterns else True)
+        if self.search_service is not None:
+            query = " OR ".join(f'"{keyword}"' for keyword in keywords)
+            results = await self._search_google(domain_name, query, max_results)
+            for result in results:
+                text = f"{result['title']} {result['snippet']}".lower()
+                result["keywords_matched"] = [kw for kw in keywords if kw.lower() in text]
+            return results
+
+        # Match any keyword in the title or description, best match first
+        stmt = select(Link).join(Domain).where(Domain.name == domain_name)
+        if keywords:
+            columns = search_columns(Link)
+            stmt = stmt.where(text_match(keywords, *columns)).order_by(
+                text_rank(keywords, *columns).desc()
             )
-            .order_by(Link.discovered_at.desc())
-            .limit(max_results)
+        result = await self.db.execute(
+            stmt.order_by(Link.discovered_at.desc()).limit(max_results)
         )
         
         links = result.scalars().all()
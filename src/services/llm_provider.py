@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.report import Report
 from src.models.llm_fallback import LLMProvider, FallbackReason, LLMFallback
+from src.services.ai.llm_response_cache import get_llm_response_cache
 
 logger = logging.getLogger("llm_provider")
 
@@ -125,6 +126,10 @@ class FallbackManager:
         """
         Execute an LLM request with automatic fallback handling.
         
+        Identical requests for the same report owner are answered from the
+        LLM response cache, and concurrent identical requests share one
+        upstream call.
+        
         Args:
             prompt: The prompt to send to the LLM
             report: The report instance for tracking fallbacks
@@ -135,6 +140,34 @@ class FallbackManager:
         Returns:
             Tuple of (result dict, successful provider)
         """
+        response_cache = get_llm_response_cache()
+        cache_key = response_cache.make_key(
+            prompt,
+            temperature=kwargs.get("temperature", 0.7),
+            tenant_id=getattr(report, "user_id", None),
+            initial_provider=initial_provider.value,
+            confidence_threshold=confidence_threshold,
+            **{k: v for k, v in kwargs.items() if k != "temperature"}
+        )
+
+        async def execute():
+            result, provider = await self._execute_with_fallback_uncached(
+                prompt, report, initial_provider, confidence_threshold, **kwargs
+            )
+            return {"result": result, "provider": provider.value}
+
+        entry = await response_cache.get_or_call(cache_key, execute)
+        return entry["result"], LLMProvider(entry["provider"])
+
+    async def _execute_with_fallback_uncached(
+        self,
+        prompt: str,
+        report: Report,
+        initial_provider: LLMProvider = LLMProvider.OPENAI,
+        confidence_threshold: Optional[float] = None,
+        **kwargs
+    ) -> Tuple[Dict[str, Any], LLMProvider]:
+        """Execute an LLM request with automatic fallback, bypassing the response cache."""
         # Only use providers in the fallback chain
         if initial_provider not in self.fallback_chain:
             initial_provider = self.fallback_chain[0]
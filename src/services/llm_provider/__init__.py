@@ -6,14 +6,19 @@ following Sprint 4 requirements and Semantic Seed coding standards.
 Features:
 - Multiple LLM provider support (OpenAI, Anthropic)
 - Fallback mechanisms
+- Latency-aware routing with adaptive concurrency and optional hedged requests
 - Confidence scoring
 - Error handling
 """
 from src.models.llm_fallback import LLMProvider, FallbackReason, LLMFallback
 from .fallback_manager import FallbackManager
+from .routing import ProviderRouter, TokenBudget, get_provider_router
 
 __all__ = [
     'FallbackManager',
+    'ProviderRouter',
+    'TokenBudget',
+    'get_provider_router',
     'LLMProvider',
     'FallbackReason',
     'LLMFallback'
@@ -0,0 +1,526 @@
+"""Latency-aware routing for LLM providers.
+
+Tracks per-provider health and uses it to decide which provider answers a
+request:
+
+- EWMA latency and error rate order providers, so a provider that slows
+  down or starts failing is tried after healthier ones instead of making
+  every request wait for its timeout.
+- An AIMD (additive increase, multiplicative decrease) concurrency limit per
+  provider grows slowly while calls succeed and halves on errors, timeouts
+  or latency spikes.
+- Optional hedged requests (off by default): if the first provider has not
+  answered after its p95 latency, the next provider is called as well and
+  the first answer wins.
+- Token-per-minute budgets are shared by all workers through Redis, with a
+  process-local fallback when Redis is not available.
+
+Example:
+    router = get_provider_router()
+    result, provider = await router.execute(["openai", "anthropic"], call_provider, tokens=1500)
+"""
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("llm_provider")
+
+try:
+    from redis import asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+T = TypeVar("T")
+
+# Reserve tokens in the current minute's budget. The first reservation of a
+# window always succeeds so a single large request can't be starved forever.
+CONSUME_TOKENS_SCRIPT = """
+local used = redis.call('INCRBY', KEYS[1], ARGV[1])
+if used > tonumber(ARGV[2]) and used > tonumber(ARGV[1]) then
+    redis.call('DECRBY', KEYS[1], ARGV[1])
+    return 0
+end
+redis.call('EXPIRE', KEYS[1], 120)
+return 1
+"""
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when a provider is skipped without being called (budget or concurrency limit)."""
+
+
+class ProviderHealth:
+    """Latency, error rate and adaptive concurrency limit of one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        alpha: float = 0.2,
+        initial_limit: float = 8,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        window: int = 200,
+        min_samples: int = 20
+    ):
+        """Initialize provider health.
+
+        Args:
+            name: Provider name
+            alpha: EWMA smoothing factor
+            initial_limit: Initial concurrency limit
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            decrease_factor: Multiplicative decrease on errors
+            latency_spike_factor: Latency above this multiple of the EWMA counts as congestion
+            window: Number of recent latencies kept for the p95
+            min_samples: Samples needed before the p95 is used
+        """
+        self.name = name
+        self.alpha = alpha
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.min_samples = min_samples
+
+        self.ewma_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.successes = 0
+        self.failures = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.in_flight < max(1, math.floor(self.limit))
+
+    @property
+    def p95(self) -> Optional[float]:
+        """95th percentile of recent latencies in seconds (None until enough samples)."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def score(self, error_penalty: float = 10.0) -> float:
+        """Expected cost of a call; lower is better, infinite without measurements."""
+        if self.ewma_latency is None:
+            return math.inf
+        return self.ewma_latency * (1 + error_penalty * self.error_rate)
+
+    def record_success(self, latency: float):
+        """Record a successful call: additive increase unless latency spiked."""
+        self.successes += 1
+        spiked = self.ewma_latency is not None and latency > self.latency_spike_factor * self.ewma_latency
+        self.ewma_latency = latency if self.ewma_latency is None else (
+            self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+        )
+        self.error_rate = (1 - self.alpha) * self.error_rate
+        self._latencies.append(latency)
+
+        if spiked:
+            self.limit = max(self.min_limit, self.limit * 0.9)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def record_failure(self, latency: Optional[float] = None):
+        """Record a failed or timed out call: multiplicative decrease."""
+        self.failures += 1
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        if latency is not None:
+            self._latencies.append(latency)
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current health as a dictionary."""
+        p95 = self.p95
+        return {
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1) if self.ewma_latency is not None else None,
+            "p95_latency_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 4),
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "failures": self.failures
+        }
+
+
+class TokenBudget:
+    """Token-per-minute budgets per provider, shared through Redis.
+
+    Budgets are reserved from an estimate before each call. Providers
+    without a configured limit are unlimited.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        redis_url: Optional[str] = None,
+        namespace: str = "onside:llm"
+    ):
+        """Initialize the token budget.
+
+        Args:
+            limits: Tokens per minute by provider name
+            redis_url: Redis connection URL (process-local counters if not provided)
+            namespace: Key namespace in Redis
+        """
+        self.limits = limits or {}
+        self.redis_url = redis_url
+        self.namespace = namespace
+
+        self.redis = None
+        self._consume = None
+        self._initialized = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+
+        # Process-local usage when Redis is unavailable: {provider: (window, used)}
+        self._local: Dict[str, Tuple[int, int]] = {}
+
+    async def initialize(self) -> bool:
+        """Connect to Redis.
+
+        Returns:
+            True if budgets are shared through Redis
+        """
+        await self._bind_loop()
+
+        if self._initialized:
+            return self.redis is not None
+
+        async with self._init_lock:
+            if self._initialized:
+                return self.redis is not None
+
+            if REDIS_AVAILABLE and self.redis_url and self.limits:
+                try:
+                    self.redis = aioredis.from_url(
+                        self.redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=5,
+                        socket_keepalive=True
+                    )
+                    await self.redis.ping()
+                    self._consume = self.redis.register_script(CONSUME_TOKENS_SCRIPT)
+                    logger.info("LLM token budgets shared through Redis")
+                except Exception as e:
+                    logger.warning(f"Redis unavailable for LLM token budgets, using local counters: {e}")
+                    self.redis = None
+
+            self._initialized = True
+            return self.redis is not None
+
+    async def _bind_loop(self):
+        """Rebind the Redis connection when used from a new event loop (e.g. Celery tasks)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._init_lock = asyncio.Lock()
+        stale, self.redis = self.redis, None
+        self._consume = None
+        self._initialized = False
+
+        if stale is not None:
+            try:
+                await stale.close()
+            except Exception as e:
+                logger.debug(f"Error closing Redis connection of a previous event loop: {e}")
+
+    async def try_consume(self, provider: str, tokens: int) -> bool:
+        """Reserve tokens in the provider's budget for the current minute.
+
+        Args:
+            provider: Provider name
+            tokens: Estimated tokens of the request
+
+        Returns:
+            True if the request fits the budget
+        """
+        limit = self.limits.get(provider)
+        if not limit or tokens <= 0:
+            return True
+
+        window = int(time.time() // 60)
+        await self.initialize()
+        if self.redis:
+            try:
+                key = f"{self.namespace}:tpm:{provider}:{window}"
+                return bool(await self._consume(keys=[key], args=[tokens, limit]))
+            except Exception as e:
+                logger.warning(f"Token budget check failed for {provider}, using local counter: {e}")
+
+        current_window, used = self._local.get(provider, (window, 0))
+        if current_window != window:
+            used = 0
+        if used and used + tokens > limit:
+            return False
+        self._local[provider] = (window, used + tokens)
+        return True
+
+
+class ProviderRouter:
+    """Orders, limits and hedges calls to LLM providers."""
+
+    def __init__(
+        self,
+        token_budget: Optional[TokenBudget] = None,
+        hedge_enabled: bool = False,
+        hedge_min_delay: float = 0.05,
+        hedge_max_delay: float = 10.0,
+        queue_timeout: float = 5.0
+    ):
+        """Initialize the router.
+
+        Args:
+            token_budget: Shared token-per-minute budgets (unlimited if not provided)
+            hedge_enabled: Whether requests are hedged by default (hedging
+                spends extra tokens on slow requests, so it is off unless enabled)
+            hedge_min_delay: Shortest delay before a hedged request (seconds)
+            hedge_max_delay: Longest delay before a hedged request (seconds)
+            queue_timeout: How long to wait for a free concurrency slot (seconds)
+        """
+        self.token_budget = token_budget or TokenBudget()
+        self.hedge_enabled = hedge_enabled
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_max_delay = hedge_max_delay
+        self.queue_timeout = queue_timeout
+        self.health: Dict[str, ProviderHealth] = {}
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "fallbacks": 0, "skipped": 0}
+
+    def get_health(self, provider: str) -> ProviderHealth:
+        if provider not in self.health:
+            self.health[provider] = ProviderHealth(provider)
+        return self.health[provider]
+
+    def order(self, providers: List[str]) -> List[str]:
+        """Order providers by health.
+
+        Providers with a free concurrency slot come first, then the lowest
+        expected latency. Providers without measurements keep their given
+        (priority) order after measured ones.
+        """
+        position = {provider: index for index, provider in enumerate(providers)}
+        return sorted(
+            providers,
+            key=lambda p: (not self.get_health(p).has_capacity, self.get_health(p).score(), position[p])
+        )
+
+    def hedge_delay(self, provider: str) -> Optional[float]:
+        """Delay before hedging a call to provider, or None without enough measurements."""
+        p95 = self.get_health(provider).p95
+        if p95 is None:
+            return None
+        return min(self.hedge_max_delay, max(self.hedge_min_delay, p95))
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        timeout: Optional[float] = None
+    ) -> T:
+        """Call one provider within its concurrency limit and token budget.
+
+        Args:
+            provider: Provider name
+            call: Coroutine function performing the call
+            tokens: Estimated tokens of the request
+            timeout: Timeout of the call in seconds
+
+        Returns:
+            Result of the call
+
+        Raises:
+            ProviderUnavailableError: If the budget is exhausted or no slot frees up
+        """
+        health = self.get_health(provider)
+        condition = self._condition(provider)
+        async with condition:
+            try:
+                await asyncio.wait_for(condition.wait_for(lambda: health.has_capacity), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._stats["skipped"] += 1
+                raise ProviderUnavailableError(f"Concurrency limit of {provider} reached")
+            health.in_flight += 1
+
+        try:
+            # Tokens are reserved only once a slot is held, so a request that
+            # times out waiting for one never spends budget
+            if not await self.token_budget.try_consume(provider, tokens):
+                self._stats["skipped"] += 1
+                raise ProviderUnavailableError(f"Token budget of {provider} exhausted")
+
+            start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(call(), timeout) if timeout else await call()
+            except asyncio.CancelledError:
+                # Lost a hedge race or the caller gave up; not the provider's fault
+                raise
+            except Exception:
+                health.record_failure(time.monotonic() - start)
+                raise
+            health.record_success(time.monotonic() - start)
+            return result
+        finally:
+            health.in_flight -= 1
+            async with condition:
+                condition.notify_all()
+
+    async def execute(
+        self,
+        providers: List[str],
+        call: Callable[[str], Awaitable[T]],
+        tokens: int = 0,
+        timeouts: Optional[Dict[str, float]] = None,
+        hedge: Optional[bool] = None
+    ) -> Tuple[T, str]:
+        """Call providers in routed order until one succeeds.
+
+        If hedging is enabled and the first provider has not answered after
+        its p95 latency, the next provider is called as well (at most one
+        hedge per request) and the first successful answer is used.
+
+        Args:
+            providers: Provider names in priority order
+            call: Coroutine function called with the provider name
+            tokens: Estimated tokens of the request
+            timeouts: Timeout in seconds by provider name
+            hedge: Whether to hedge (router default if None)
+
+        Returns:
+            Tuple of (result, provider name)
+
+        Raises:
+            Exception: If all providers fail
+        """
+        self._stats["requests"] += 1
+        hedge = self.hedge_enabled if hedge is None else hedge
+        timeouts = timeouts or {}
+        candidates = self.order(providers)
+        pending: Dict[asyncio.Task, str] = {}
+        hedged_provider = None
+        last_error: Optional[Exception] = None
+        next_index = 0
+
+        def launch():
+            nonlocal next_index
+            provider = candidates[next_index]
+            next_index += 1
+            task = asyncio.ensure_future(
+                self.run(provider, lambda: call(provider), tokens=tokens, timeout=timeouts.get(provider))
+            )
+            pending[task] = provider
+            return provider
+
+        try:
+            while pending or next_index < len(candidates):
+                if not pending:
+                    if next_index > 0:
+                        self._stats["fallbacks"] += 1
+                    launch()
+
+                delay = None
+                if hedge and hedged_provider is None and len(pending) == 1 and next_index < len(candidates):
+                    delay = self.hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if self.get_health(candidates[next_index]).has_capacity:
+                        hedged_provider = launch()
+                        self._stats["hedged"] += 1
+                        logger.info(f"Hedging slow request with provider {hedged_provider}")
+                    else:
+                        hedged_provider = ""
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(f"Provider {provider} failed: {e}")
+                        continue
+                    if provider == hedged_provider:
+                        self._stats["hedge_wins"] += 1
+                    return result, provider
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise Exception(f"All providers failed. Last error: {last_error}") from last_error
+
+    def _condition(self, provider: str) -> asyncio.Condition:
+        """Per-provider slot condition, rebuilt when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._conditions = {}
+            for health in self.health.values():
+                health.in_flight = 0
+        if provider not in self._conditions:
+            self._conditions[provider] = asyncio.Condition()
+        return self._conditions[provider]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Routing counters and health of every provider."""
+        return {
+            **self._stats,
+            "providers": {name: health.snapshot() for name, health in self.health.items()}
+        }
+
+    def reset_stats(self):
+        """Reset the routing counters (provider health is kept)."""
+        for name in self._stats:
+            self._stats[name] = 0
+
+
+def estimate_tokens(prompt: str, max_tokens: int = 0) -> int:
+    """Rough token estimate of a request (about 4 characters per token)."""
+    return len(prompt) // 4 + max_tokens
+
+
+def _token_limits_from_env() -> Dict[str, int]:
+    """Read LLM_<PROVIDER>_TPM token-per-minute limits from the environment."""
+    limits = {}
+    for provider in ("openai", "anthropic", "azure_openai", "cohere", "huggingface"):
+        value = os.getenv(f"LLM_{provider.upper()}_TPM")
+        if value:
+            limits[provider] = int(value)
+    return limits
+
+
+# Global provider router instance
+_provider_router: Optional[ProviderRouter] = None
+
+
+def get_provider_router() -> ProviderRouter:
+    """
+    Get or create the global provider router.
+
+    Returns:
+        ProviderRouter instance
+    """
+    global _provider_router
+
+    if _provider_router is None:
+        _provider_router = ProviderRouter(
+            token_budget=TokenBudget(limits=_token_limits_from_env(), redis_url=os.getenv("REDIS_URL")),
+            hedge_enabled=os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true",
+            hedge_max_delay=float(os.getenv("LLM_HEDGE_MAX_DELAY", "10"))
+        )
+
+    return _provider_router
@@ -19,8 +19,8 @@ from src.services.ai.llm_with_chain_of_thought import LLMWithChainOfThought
 from src.services.ai.competitor_analysis import CompetitorAnalysisService
 from src.services.ai.market_analysis import MarketAnalysisService
 from src.services.ai.audience_analysis import AudienceAnalysisService
+from src.services.ai.sentiment_analysis import SentimentAnalysisService
 # These services are not implemented yet
-# from src.services.ai.sentiment_analysis import SentimentAnalysisService
 # from src.services.ai.temporal_analysis import TemporalAnalysisService
 # from src.services.ai.seo_analysis import SEOAnalysisService
 from src.services.analytics import AnalyticsService
@@ -95,8 +95,9 @@ class ReportGeneratorService:
         self.market_service = market_analysis_service
         self.audience_service = audience_analysis_service
         
+        self.sentiment_service = SentimentAnalysisService()
+
         # These services may not be implemented yet
-        self.sentiment_service = None
         self.temporal_service = None
         self.seo_service = None
         
@@ -953,17 +954,16 @@ class ReportGeneratorService:
             }
         )
         
-        # Process sentiment analysis
-        sentiment_results = []
-        for content in content_items:
-            sentiment = await self.sentiment_service.analyze_content_sentiment(
-                content, with_reasoning=True
-            )
-            sentiment_results.append({
+        # Process sentiment analysis (deduplicated, concurrent and packed into few LLM calls)
+        sentiments = await self.sentiment_service.analyze_contents(content_items)
+        sentiment_results = [
+            {
                 "content_id": content.id,
                 "title": content.title,
                 "sentiment": sentiment
-            })
+            }
+            for content, sentiment in zip(content_items, sentiments)
+        ]
         
         # Log reasoning step
         reasoning.add_step(
@@ -14,7 +14,7 @@ import random
 from typing import Dict, Optional, List, Set
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass, field
 
 import aiohttp
@@ -27,6 +27,9 @@ from tenacity import (
     before_sleep_log
 )
 
+from src.core.http_pool import get_http_pool
+from src.services.web_scraping.politeness import PolitenessService, get_politeness_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,14 +63,6 @@ class ScrapingResult:
     error: Optional[str] = None
 
 
-@dataclass
-class DomainThrottleState:
-    """Track throttling state for a domain."""
-    last_request_time: float = 0.0
-    request_count: int = 0
-    min_delay: float = 1.0  # Minimum delay between requests in seconds
-
-
 class ScrapingService:
     """Enhanced scraping service with retry logic, throttling, and robots.txt compliance.
 
@@ -94,6 +89,7 @@ class ScrapingService:
         max_retries: int = 3,
         respect_robots_txt: bool = True,
         throttle_delay: float = 1.0,
+        politeness: Optional[PolitenessService] = None,
     ):
         """Initialize the scraping service.
 
@@ -102,27 +98,24 @@ class ScrapingService:
             max_retries: Maximum number of retry attempts
             respect_robots_txt: Whether to check and respect robots.txt
             throttle_delay: Minimum delay between requests per domain (seconds)
+            politeness: Shared robots.txt/throttle state (uses the
+                process-wide service if not provided)
         """
         self.default_timeout = default_timeout
         self.max_retries = max_retries
         self.respect_robots_txt = respect_robots_txt
         self.throttle_delay = throttle_delay
 
-        # Domain-specific state
-        self.domain_throttle: Dict[str, DomainThrottleState] = {}
-        self.robots_cache: Dict[str, RobotFileParser] = {}
-        self.robots_cache_expiry: Dict[str, datetime] = {}
+        # Domain-specific state, shared across workers
+        self.politeness = politeness or get_politeness_service()
 
         # Session for connection pooling
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def _ensure_session(self):
-        """Ensure aiohttp session is created."""
+        """Borrow the shared aiohttp session from the HTTP pool."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.default_timeout),
-                connector=aiohttp.TCPConnector(limit_per_host=5)
-            )
+            self.session = get_http_pool().get_session()
 
     def _get_random_user_agent(self) -> str:
         """Get a random user agent from the pool.
@@ -141,45 +134,26 @@ class ScrapingService:
         Returns:
             RobotFileParser instance or None if unavailable
         """
-        # Check cache expiry (refresh every 24 hours)
-        if domain in self.robots_cache_expiry:
-            if datetime.utcnow() > self.robots_cache_expiry[domain]:
-                # Cache expired, remove it
-                self.robots_cache.pop(domain, None)
-                self.robots_cache_expiry.pop(domain, None)
-
-        # Return cached parser if available
-        if domain in self.robots_cache:
-            return self.robots_cache[domain]
-
-        # Fetch and parse robots.txt
-        robots_url = f"https://{domain}/robots.txt"
-        try:
-            await self._ensure_session()
-            async with self.session.get(
-                robots_url,
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={'User-Agent': self._get_random_user_agent()}
-            ) as response:
-                if response.status == 200:
-                    robots_content = await response.text()
-                    parser = RobotFileParser()
-                    parser.parse(robots_content.splitlines())
-
-                    # Cache the parser
-                    self.robots_cache[domain] = parser
-                    self.robots_cache_expiry[domain] = datetime.utcnow() + timedelta(hours=24)
-
-                    logger.info(f"Fetched and cached robots.txt for {domain}")
-                    return parser
-                else:
+        async def fetch_robots() -> Optional[str]:
+            robots_url = f"https://{domain}/robots.txt"
+            try:
+                await self._ensure_session()
+                async with self.session.get(
+                    robots_url,
+                    timeout=aiohttp.ClientTimeout(total=10),
+                    headers={'User-Agent': self._get_random_user_agent()}
+                ) as response:
+                    if response.status == 200:
+                        logger.info(f"Fetched robots.txt for {domain}")
+                        return await response.text()
                     logger.warning(f"robots.txt not found for {domain} (status {response.status})")
-                    return None
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch robots.txt for {domain}: {str(e)}")
+            except Exception as e:
+                logger.warning(f"Failed to fetch robots.txt for {domain}: {str(e)}")
             return None
 
+        # Cached locally and in Redis (refreshed every 24 hours)
+        return await self.politeness.get_robots_parser(domain, fetch_robots)
+
     async def _check_robots_allowed(self, url: str, user_agent: str) -> bool:
         """Check if scraping is allowed by robots.txt.
 
@@ -213,25 +187,12 @@ class ScrapingService:
         Args:
             domain: Domain to throttle
         """
-        if domain not in self.domain_throttle:
-            self.domain_throttle[domain] = DomainThrottleState(min_delay=self.throttle_delay)
-
-        throttle = self.domain_throttle[domain]
-        current_time = time.time()
-
-        # Calculate time since last request
-        time_since_last = current_time - throttle.last_request_time
-
-        # If we need to wait, do so
-        if time_since_last < throttle.min_delay:
-            wait_time = throttle.min_delay - time_since_last
+        # Reserve the next slot across all workers before sleeping
+        wait_time = await self.politeness.reserve_request_slot(domain, self.throttle_delay)
+        if wait_time > 0:
             logger.debug(f"Throttling {domain}: waiting {wait_time:.2f}s")
             await asyncio.sleep(wait_time)
 
-        # Update throttle state
-        throttle.last_request_time = time.time()
-        throttle.request_count += 1
-
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -431,10 +392,8 @@ class ScrapingService:
         return results
 
     async def close(self):
-        """Close the session and cleanup resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """Release the pooled session (the pool owns and closes it)."""
+        self.session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -17,7 +17,7 @@ import logging
 import asyncio
 import time
 import hashlib
-from typing import Dict, List, Any, Optional, Set
+from typing import AsyncIterator, Dict, List, Any, Optional, Set
 from datetime import datetime, timedelta
 from collections import Counter
 import os
@@ -30,6 +30,7 @@ from tenacity import (
     retry_if_exception_type
 )
 
+from src.core.http_pool import get_http_pool
 from src.services.cache_service import AsyncCacheService
 from src.config import get_settings
 
@@ -106,7 +107,8 @@ class SerpAnalyzer:
         api_key: Optional[str] = None,
         cache: Optional[AsyncCacheService] = None,
         rate_limit_requests: int = 5,
-        rate_limit_window: float = 1.0
+        rate_limit_window: float = 1.0,
+        max_concurrency: Optional[int] = None
     ):
         """
         Initialize SERP analyzer.
@@ -116,6 +118,8 @@ class SerpAnalyzer:
             cache: Optional cache service for result caching
             rate_limit_requests: Max requests per time window
             rate_limit_window: Time window in seconds for rate limiting
+            max_concurrency: Max keywords analyzed concurrently in a batch
+                (defaults to SERP_MAX_CONCURRENCY env variable, or 5)
         """
         self.api_key = api_key or os.getenv("SERPAPI_KEY")
         if not self.api_key:
@@ -123,17 +127,17 @@ class SerpAnalyzer:
 
         self.cache = cache
         self.rate_limiter = RateLimiter(rate_limit_requests, rate_limit_window)
+        self.max_concurrency = max_concurrency or int(os.getenv("SERP_MAX_CONCURRENCY", "5"))
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession()
+        self._session = get_http_pool().get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._session:
-            await self._session.close()
+        """Async context manager exit (the pooled session stays open)."""
+        self._session = None
 
     def _generate_cache_key(self, keyword: str, location: str) -> str:
         """Generate cache key for SERP results."""
@@ -165,8 +169,8 @@ class SerpAnalyzer:
         """
         await self.rate_limiter.acquire()
 
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+        if not self._session or self._session.closed:
+            self._session = get_http_pool().get_session()
 
         async with self._session.get(
             self.SERPAPI_BASE_URL,
@@ -214,14 +218,31 @@ class SerpAnalyzer:
                 - metadata: Search metadata
         """
         # Check cache first
-        cache_key = self._generate_cache_key(keyword, location)
-
         if self.cache:
-            cached_result = await self.cache.get(cache_key)
+            cached_result = await self.cache.get(self._generate_cache_key(keyword, location))
             if cached_result:
                 logger.info(f"Cache hit for keyword: {keyword}")
                 return cached_result
 
+        return await self._fetch_serp_results(keyword, location, num_results)
+
+    async def _fetch_serp_results(
+        self,
+        keyword: str,
+        location: str,
+        num_results: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Fetch SERP results from the API (bypassing the cache lookup) and cache them.
+
+        Args:
+            keyword: Search keyword/phrase
+            location: Geographic location for search
+            num_results: Number of results to fetch (max 100)
+
+        Returns:
+            Structured SERP data (mock data if the API is unavailable)
+        """
         # If no API key, return mock data
         if not self.api_key:
             logger.warning(f"No SERPAPI_KEY, returning mock data for: {keyword}")
@@ -247,7 +268,7 @@ class SerpAnalyzer:
             # Cache the results
             if self.cache:
                 await self.cache.set(
-                    cache_key,
+                    self._generate_cache_key(keyword, location),
                     structured_data,
                     ttl=self.CACHE_TTL_SECONDS
                 )
@@ -576,57 +597,129 @@ class SerpAnalyzer:
 
         return features
 
-    async def analyze_keyword_batch(
+    def analyze_serp_data(self, keyword: str, serp_data: Dict[str, Any], search_volume: int) -> Dict[str, Any]:
+        """
+        Build the keyword analysis for already-fetched SERP results.
+
+        Args:
+            keyword: Analyzed keyword
+            serp_data: Structured SERP results
+            search_volume: Estimated monthly search volume
+
+        Returns:
+            Keyword analysis
+        """
+        ranking_domains = self.extract_domains_from_serp(serp_data)
+
+        return {
+            "keyword": keyword,
+            "difficulty": self.calculate_keyword_difficulty(serp_data),
+            "search_volume": search_volume,
+            "ranking_domains": ranking_domains,
+            "serp_features": self.identify_serp_features(serp_data),
+            "top_competitors": [d["domain"] for d in ranking_domains[:5]],
+            "top_urls": [
+                r.get("link", "") for r in serp_data.get("organic_results", [])[:3]
+            ],
+            "analyzed_at": datetime.utcnow().isoformat()
+        }
+
+    async def iter_keyword_analyses(
         self,
         keywords: List[str],
         location: str = "United States"
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Analyze multiple keywords in batch with rate limiting.
+        Analyze keywords concurrently, yielding each analysis as it completes.
+
+        Cached SERP results for all keywords are loaded with a single
+        multi-get; the remaining keywords are fetched concurrently (at most
+        ``max_concurrency`` at a time) within the shared rate limiter.
 
         Args:
             keywords: List of keywords to analyze
             location: Geographic location for searches
 
-        Returns:
-            List of analysis results for each keyword
+        Yields:
+            Analysis for each keyword in completion order (with an ``error``
+            key instead of analysis fields if the keyword failed)
         """
-        results = []
-
-        for keyword in keywords:
-            try:
-                serp_data = await self.get_serp_results(keyword, location)
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return
 
-                analysis = {
-                    "keyword": keyword,
-                    "difficulty": self.calculate_keyword_difficulty(serp_data),
-                    "search_volume": await self.get_search_volume(keyword),
-                    "ranking_domains": self.extract_domains_from_serp(serp_data),
-                    "serp_features": self.identify_serp_features(serp_data),
-                    "top_competitors": [
-                        d["domain"] for d in
-                        self.extract_domains_from_serp(serp_data)[:5]
-                    ],
-                    "analyzed_at": datetime.utcnow().isoformat()
-                }
+        cached: Dict[str, Dict[str, Any]] = {}
+        if self.cache:
+            cache_keys = {keyword: self._generate_cache_key(keyword, location) for keyword in keywords}
+            found = await self.cache.get_many(list(cache_keys.values()))
+            cached = {
+                keyword: found[cache_key]
+                for keyword, cache_key in cache_keys.items()
+                if found.get(cache_key)
+            }
+            if cached:
+                logger.info(f"Cache hit for {len(cached)}/{len(keywords)} keywords")
 
-                results.append(analysis)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
+        async def analyze(keyword: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    if keyword in cached:
+                        serp_data = cached[keyword]
+                        search_volume = await self.get_search_volume(keyword)
+                    else:
+                        serp_data, search_volume = await asyncio.gather(
+                            self._fetch_serp_results(keyword, location),
+                            self.get_search_volume(keyword)
+                        )
+
+                analysis = self.analyze_serp_data(keyword, serp_data, search_volume)
                 logger.info(
                     f"Analyzed keyword '{keyword}': "
                     f"difficulty={analysis['difficulty']:.1f}, "
                     f"volume={analysis['search_volume']}"
                 )
+                return analysis
 
             except Exception as e:
                 logger.error(f"Error analyzing keyword '{keyword}': {str(e)}")
-                results.append({
+                return {
                     "keyword": keyword,
                     "error": str(e),
                     "analyzed_at": datetime.utcnow().isoformat()
-                })
+                }
+
+        tasks = [asyncio.create_task(analyze(keyword)) for keyword in keywords]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding work if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+    async def analyze_keyword_batch(
+        self,
+        keywords: List[str],
+        location: str = "United States"
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze multiple keywords concurrently with rate limiting.
+
+        Args:
+            keywords: List of keywords to analyze
+            location: Geographic location for searches
+
+        Returns:
+            List of analysis results for each keyword, in input order
+        """
+        analyses = {
+            analysis["keyword"]: analysis
+            async for analysis in self.iter_keyword_analyses(keywords, location)
+        }
 
-        return results
+        return [analyses[keyword] for keyword in keywords]
 
 
 # Convenience function for quick analysis
@@ -10,10 +10,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm.attributes import flag_modified
 from unittest.mock import AsyncMock
-from playwright.async_api import async_playwright
 
 from src.models import Link, LinkSnapshot, Domain
 from src.config import settings
+from src.services.web_scraping.browser_pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -299,13 +299,10 @@ class WebScraperService:
         if isinstance(self.session, AsyncMock) or isinstance(self.session.execute, AsyncMock):
             return f"/mock/screenshot_{link_id}.png"
             
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
+        async with get_browser_pool().page() as page:
             await page.goto(url)
             screenshot_path = os.path.join(self.screenshot_dir, f"{link_id}.png")
             await page.screenshot(path=screenshot_path)
-            await browser.close()
             return screenshot_path
     
     async def _get_domain(self, domain_id: int):
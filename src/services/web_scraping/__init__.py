@@ -9,6 +9,9 @@ This package provides enhanced web scraping capabilities including:
 - Retry logic with exponential backoff
 - Rate limiting and robots.txt compliance
 - Circuit breaker pattern for reliability
+- Concurrent frontier-based site crawling
+- Politeness state (robots.txt, throttling, circuit breakers) shared via Redis
+- Bounded, self-recycling browser pool shared by all JS rendering
 """
 
 from .enhanced_scraper import (
@@ -19,8 +22,24 @@ from .enhanced_scraper import (
     BacklinkData,
     ContentAnalysis,
     CircuitBreakerError,
+    CircuitBreakerState,
+    RobotsDisallowedError,
     ScrapingError,
 )
+from .politeness import (
+    PolitenessService,
+    get_politeness_service,
+)
+from .browser_pool import (
+    BrowserPool,
+    BrowserPoolConfig,
+    get_browser_pool,
+)
+from .crawler import (
+    SiteCrawler,
+    CrawlConfig,
+    canonicalize_url,
+)
 
 __all__ = [
     'EnhancedWebScrapingService',
@@ -30,5 +49,15 @@ __all__ = [
     'BacklinkData',
     'ContentAnalysis',
     'CircuitBreakerError',
+    'CircuitBreakerState',
+    'RobotsDisallowedError',
     'ScrapingError',
+    'PolitenessService',
+    'get_politeness_service',
+    'BrowserPool',
+    'BrowserPoolConfig',
+    'get_browser_pool',
+    'SiteCrawler',
+    'CrawlConfig',
+    'canonicalize_url',
 ]
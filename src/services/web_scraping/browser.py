@@ -0,0 +1,140 @@
+"""Playwright page helpers shared by the JavaScript-rendering scrapers.
+
+Extraction runs as a single in-page script that returns one structured
+payload, so a rendered page costs one ``page.evaluate`` round trip instead of
+one per field. Navigation waits for a configurable load state (plus an
+optional selector) rather than always waiting for ``networkidle``, and heavy
+resource types can be aborted before they are downloaded.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional, Union
+
+from playwright.async_api import (
+    BrowserContext,
+    Page,
+    Response,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Resource types that do not affect extracted text or links
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+
+# Load states accepted by page.goto(wait_until=...)
+WAIT_STATES = ('commit', 'domcontentloaded', 'load', 'networkidle')
+
+EXTRACT_PAGE_SCRIPT = '''() => {
+    const doctype = document.doctype
+        ? new XMLSerializer().serializeToString(document.doctype)
+        : '';
+    const html = doctype + document.documentElement.outerHTML;
+
+    const meta = (name) => {
+        const el = document.querySelector(`meta[name="${name}"]`);
+        return el ? el.getAttribute('content') : null;
+    };
+
+    const headings = {h1: [], h2: [], h3: [], h4: [], h5: [], h6: []};
+    document.querySelectorAll('h1, h2, h3, h4, h5, h6').forEach(h => {
+        const text = h.innerText.trim();
+        if (text) headings[h.tagName.toLowerCase()].push(text);
+    });
+
+    const links = Array.from(document.querySelectorAll('a[href]'))
+        .map(a => a.href)
+        .filter(href => href && href.startsWith('http'));
+
+    const images = Array.from(document.querySelectorAll('img[src]'))
+        .map(img => img.src)
+        .filter(src => src && src.startsWith('http'));
+
+    const clone = document.cloneNode(true);
+    clone.querySelectorAll('script, style, noscript').forEach(el => el.remove());
+    const text = clone.body ? clone.body.innerText : '';
+
+    return {
+        html,
+        title: document.title,
+        text,
+        metaDescription: meta('description'),
+        metaKeywords: meta('keywords'),
+        headings,
+        links,
+        images,
+    };
+}'''
+
+
+async def block_resources(
+    target: Union[BrowserContext, Page],
+    resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES
+) -> None:
+    """Abort requests for the given resource types.
+
+    Args:
+        target: Browser context (all its pages) or a single page
+        resource_types: Playwright resource types to block
+    """
+    blocked = frozenset(resource_types)
+    if not blocked:
+        return
+
+    async def handle(route: Route) -> None:
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await target.route('**/*', handle)
+
+
+async def navigate(
+    page: Page,
+    url: str,
+    timeout_ms: int,
+    wait_until: str = 'domcontentloaded',
+    wait_for_selector: Optional[str] = None,
+    selector_timeout_ms: int = 5000
+) -> Optional[Response]:
+    """Navigate to a URL and wait until the page is ready for extraction.
+
+    Args:
+        page: Page to navigate
+        url: URL to load
+        timeout_ms: Navigation timeout in milliseconds
+        wait_until: Load state to wait for (see ``WAIT_STATES``)
+        wait_for_selector: Optional CSS selector to wait for after loading
+        selector_timeout_ms: Timeout for the selector wait in milliseconds
+
+    Returns:
+        Main resource response (None for same-document navigations)
+    """
+    if wait_until not in WAIT_STATES:
+        raise ValueError(f"Invalid wait_until '{wait_until}', expected one of {WAIT_STATES}")
+
+    response = await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
+
+    if wait_for_selector:
+        try:
+            await page.wait_for_selector(wait_for_selector, timeout=selector_timeout_ms)
+        except PlaywrightTimeoutError:
+            logger.warning(f"Timeout waiting for selector '{wait_for_selector}' on {url}")
+
+    return response
+
+
+async def extract_page(page: Page) -> Dict[str, Any]:
+    """Extract HTML, text, metadata, headings, links and images in one call.
+
+    Args:
+        page: Loaded page
+
+    Returns:
+        Dict with ``html``, ``title``, ``text``, ``metaDescription``,
+        ``metaKeywords``, ``headings``, ``links`` and ``images``
+    """
+    return await page.evaluate(EXTRACT_PAGE_SCRIPT)
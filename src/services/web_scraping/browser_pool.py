@@ -0,0 +1,343 @@
+"""Shared Chromium pool for JavaScript rendering.
+
+Every JS-rendering code path borrows pages from one process-wide pool instead
+of launching its own browser. The pool keeps a single Chromium per event loop
+and a bounded set of browser contexts on it:
+
+- At most ``max_contexts * max_pages_per_context`` pages are open at once;
+  further scrapes wait in FIFO order for a free slot.
+- A context is retired after ``max_navigations_per_context`` pages (or when
+  one of its pages crashes) and closed as soon as its last page is released,
+  which returns the renderer memory it accumulated.
+- When the resident memory of the browser processes exceeds ``max_rss_mb``
+  all contexts are retired and Chromium is relaunched once it is idle.
+- If Chromium disconnects (crash, OOM kill), the next borrower relaunches it.
+
+Example:
+    async with get_browser_pool().page() as page:
+        await page.goto("https://example.com")
+        html = await page.content()
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import psutil
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from .browser import block_resources
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Limits for the shared browser pool."""
+
+    max_contexts: int = int(os.getenv("BROWSER_POOL_MAX_CONTEXTS", "4"))
+    max_pages_per_context: int = int(os.getenv("BROWSER_POOL_MAX_PAGES_PER_CONTEXT", "4"))
+    max_navigations_per_context: int = int(os.getenv("BROWSER_POOL_MAX_NAVIGATIONS", "100"))
+    max_rss_mb: float = float(os.getenv("BROWSER_POOL_MAX_RSS_MB", "1536"))
+    rss_check_interval: int = int(os.getenv("BROWSER_POOL_RSS_CHECK_INTERVAL", "20"))
+    headless: bool = True
+
+    @property
+    def max_pages(self) -> int:
+        """Maximum number of pages open at once across all contexts."""
+        return self.max_contexts * self.max_pages_per_context
+
+
+class _PooledContext:
+    """Book-keeping for one browser context."""
+
+    __slots__ = ('context', 'active', 'navigations', 'retired')
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.active = 0
+        self.navigations = 0
+        self.retired = False
+
+
+def _browser_rss_mb() -> float:
+    """Resident memory of the browser processes spawned by this process."""
+    try:
+        children = psutil.Process().children(recursive=True)
+    except psutil.Error:
+        return 0.0
+
+    total = 0
+    for child in children:
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            continue
+
+    return total / (1024 * 1024)
+
+
+class BrowserPool:
+    """Bounded pool of browser contexts on a shared Chromium instance.
+
+    Playwright objects are bound to the event loop that created them, so the
+    pool rebinds (and starts a fresh browser) when used from a new loop.
+    """
+
+    LAUNCH_ARGS = ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage']
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        """Initialize the pool.
+
+        Args:
+            config: Pool limits (uses defaults if not provided)
+        """
+        self.config = config or BrowserPoolConfig()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: List[_PooledContext] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._waiting = 0
+        self._released = 0
+        self._restart_pending = False
+
+    def _bind_loop(self):
+        """Reset loop-bound state when used from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._browser is not None:
+            logger.warning("Browser pool used from a new event loop; dropping the previous browser")
+
+        self._loop = loop
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+        self._slots = asyncio.Semaphore(self.config.max_pages)
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._restart_pending = False
+
+    async def _launch_browser(self) -> Browser:
+        """Start Playwright (once) and launch Chromium."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        return await self._playwright.chromium.launch(
+            headless=self.config.headless,
+            args=self.LAUNCH_ARGS
+        )
+
+    async def _ensure_browser(self) -> Browser:
+        """Return the running browser, relaunching it if needed."""
+        if self._restart_pending and not any(p.active for p in self._contexts):
+            await self._close_browser()
+            self._restart_pending = False
+
+        if self._browser is None or not self._browser.is_connected():
+            self._contexts = []
+            browser = await self._launch_browser()
+            browser.on('disconnected', self._on_disconnected)
+            self._browser = browser
+            logger.info("Launched pooled Chromium browser")
+
+        return self._browser
+
+    def _on_disconnected(self, browser: Browser):
+        """Forget a browser that crashed or was closed underneath us."""
+        if browser is self._browser:
+            logger.warning("Pooled Chromium disconnected; it will be relaunched on next use")
+            self._browser = None
+            self._contexts = []
+
+    async def _acquire_context(self) -> _PooledContext:
+        """Reserve a page slot on a live context, creating one if needed."""
+        async with self._lock:
+            browser = await self._ensure_browser()
+
+            for pooled in self._contexts:
+                if not pooled.retired and pooled.active < self.config.max_pages_per_context:
+                    pooled.active += 1
+                    return pooled
+
+            pooled = _PooledContext(await browser.new_context())
+            pooled.active = 1
+            self._contexts.append(pooled)
+            return pooled
+
+    async def _open_page(self) -> Tuple[_PooledContext, Page]:
+        """Open a page, relaunching the browser once if it has crashed."""
+        for attempt in range(2):
+            pooled = await self._acquire_context()
+            try:
+                return pooled, await pooled.context.new_page()
+            except Exception:
+                pooled.active -= 1
+                pooled.retired = True
+                await self._drain(pooled)
+                if attempt or (self._browser is not None and self._browser.is_connected()):
+                    raise
+                logger.warning("Failed to open page on a dead browser; relaunching")
+
+    async def _drain(self, pooled: _PooledContext):
+        """Close a retired context once it has no open pages."""
+        if not pooled.retired or pooled.active or pooled not in self._contexts:
+            return
+
+        self._contexts.remove(pooled)
+
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+    async def _release(self, pooled: _PooledContext, page: Page):
+        """Close a page and recycle its context when it is worn out."""
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing page: {e}")
+
+        pooled.active -= 1
+        pooled.navigations += 1
+        if pooled.navigations >= self.config.max_navigations_per_context:
+            pooled.retired = True
+
+        self._released += 1
+        if self._released % self.config.rss_check_interval == 0:
+            rss_mb = _browser_rss_mb()
+            if rss_mb > self.config.max_rss_mb:
+                logger.warning(
+                    f"Browser RSS {rss_mb:.0f}MB exceeds {self.config.max_rss_mb:.0f}MB; "
+                    f"recycling contexts and browser"
+                )
+                self._restart_pending = True
+                for other in self._contexts:
+                    other.retired = True
+
+        for candidate in list(self._contexts):
+            await self._drain(candidate)
+
+    @asynccontextmanager
+    async def page(self, block_resource_types: Sequence[str] = ()) -> AsyncIterator[Page]:
+        """Borrow a page from the pool, waiting for a free slot if needed.
+
+        Args:
+            block_resource_types: Resource types to abort on this page
+
+        Yields:
+            Page that is closed (and its context recycled) on exit
+        """
+        self._bind_loop()
+        slots = self._slots
+
+        self._waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            pooled, page = await self._open_page()
+        except BaseException:
+            slots.release()
+            raise
+
+        def on_crash(_page):
+            logger.warning("Page crashed; retiring its browser context")
+            pooled.retired = True
+
+        page.on('crash', on_crash)
+
+        try:
+            if block_resource_types:
+                await block_resources(page, block_resource_types)
+            yield page
+        finally:
+            try:
+                await self._release(pooled, page)
+            finally:
+                slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool usage, for logging and health checks."""
+        return {
+            'browser_running': self._browser is not None,
+            'contexts': len(self._contexts),
+            'active_pages': sum(p.active for p in self._contexts),
+            'waiting': self._waiting,
+            'max_pages': self.config.max_pages,
+        }
+
+    async def _close_browser(self):
+        """Close all contexts and the browser."""
+        contexts, self._contexts = self._contexts, []
+        for pooled in contexts:
+            try:
+                await pooled.context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
+
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        if self._loop is not asyncio.get_running_loop():
+            self.reset()
+            return
+
+        await self._close_browser()
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+            self._playwright = None
+
+        self._loop = None
+        logger.info("Browser pool closed")
+
+    def reset(self):
+        """Forget the browser without closing it.
+
+        Used after a fork, where the browser belongs to the parent.
+        """
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+        self._slots = None
+        self._lock = None
+        self._waiting = 0
+        self._restart_pending = False
+
+
+# Global pool instance
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get or create the global browser pool.
+
+    Returns:
+        BrowserPool instance
+    """
+    global _browser_pool
+
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+
+    return _browser_pool
@@ -0,0 +1,208 @@
+"""Concurrent, frontier-based site crawler.
+
+The crawler walks a site breadth-first using a deque frontier and a
+set-backed seen index, so enqueueing and de-duplicating links is O(1) per
+URL. A small pool of workers drains the frontier concurrently while every
+fetch goes through ``EnhancedWebScrapingService.fetch_page``, which applies
+robots.txt, per-domain throttling and the circuit breaker.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from .enhanced_scraper import (
+    CircuitBreakerError,
+    EnhancedWebScrapingService,
+    RobotsDisallowedError,
+    ScrapedPage,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Query parameters that only carry tracking information
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga', 'ref', 'ref_src',
+}
+
+# Links pointing at these resources are never crawled as pages
+SKIPPED_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.pdf', '.zip',
+    '.gz', '.mp3', '.mp4', '.avi', '.mov', '.css', '.js', '.xml', '.json',
+    '.woff', '.woff2', '.ttf', '.eot',
+)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonicalize_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
+    """Normalize a URL so equivalent links map to the same frontier entry.
+
+    Resolves relative links, lower-cases scheme and host, drops default
+    ports, fragments and tracking parameters, sorts the query string and
+    collapses an empty path to ``/``.
+
+    Args:
+        url: URL or relative link to canonicalize
+        base_url: Base URL to resolve relative links against
+
+    Returns:
+        Canonical absolute URL, or None if the link is not crawlable
+    """
+    if not url:
+        return None
+
+    url = url.strip()
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+
+    host = parsed.hostname.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        return None
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    path = parsed.path or '/'
+
+    query_pairs = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    query = urlencode(sorted(query_pairs))
+
+    return urlunparse((scheme, netloc, path, '', query, ''))
+
+
+@dataclass
+class CrawlConfig:
+    """Configuration for a site crawl."""
+
+    max_pages: int = 10
+    max_depth: Optional[int] = None
+    max_workers: int = 5
+    concurrency_per_domain: int = 2
+    same_domain_only: bool = True
+    allowed_domains: Set[str] = field(default_factory=set)
+
+
+class SiteCrawler:
+    """Breadth-first crawler with a concurrent worker pool.
+
+    Example:
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=50))
+        pages = await crawler.crawl("https://example.com")
+    """
+
+    def __init__(
+        self,
+        scraper: EnhancedWebScrapingService,
+        config: Optional[CrawlConfig] = None
+    ):
+        """Initialize the crawler.
+
+        Args:
+            scraper: Scraping service used for fetching (provides politeness)
+            config: Crawl configuration (uses defaults if not provided)
+        """
+        self.scraper = scraper
+        self.config = config or CrawlConfig()
+
+    def _is_allowed(self, url: str, allowed_domains: Set[str]) -> bool:
+        """Check whether a canonical URL belongs in the frontier."""
+        parsed = urlparse(url)
+        if parsed.path.lower().endswith(SKIPPED_EXTENSIONS):
+            return False
+        if not allowed_domains:
+            return True
+        return parsed.netloc in allowed_domains
+
+    async def crawl(self, start_url: str) -> List[ScrapedPage]:
+        """Crawl a site starting from ``start_url``.
+
+        Args:
+            start_url: URL to start crawling from
+
+        Returns:
+            Successfully fetched pages, in the order they completed
+        """
+        start = canonicalize_url(start_url)
+        if start is None:
+            logger.warning(f"Cannot crawl non-HTTP URL: {start_url}")
+            return []
+
+        allowed_domains = set(self.config.allowed_domains)
+        if self.config.same_domain_only:
+            allowed_domains.add(urlparse(start).netloc)
+
+        # The start URL is fetched exactly as given; canonical forms are only
+        # used as keys in the seen index.
+        frontier: Deque[Tuple[str, int]] = deque([(start_url.strip(), 0)])
+        seen: Set[str] = {start}
+        pages: List[ScrapedPage] = []
+        in_flight = 0
+        wakeup = asyncio.Condition()
+        domain_slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.config.concurrency_per_domain)
+        )
+
+        def budget_exhausted() -> bool:
+            return len(pages) + in_flight >= self.config.max_pages
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while True:
+                async with wakeup:
+                    # Wait while other workers may still produce links or
+                    # free up budget by failing.
+                    while (not frontier or budget_exhausted()) and in_flight:
+                        await wakeup.wait()
+                    if not frontier or budget_exhausted():
+                        wakeup.notify_all()
+                        return
+                    url, depth = frontier.popleft()
+                    in_flight += 1
+
+                page: Optional[ScrapedPage] = None
+                try:
+                    async with domain_slots[urlparse(url).netloc]:
+                        page = await self.scraper.fetch_page(url)
+                except (RobotsDisallowedError, CircuitBreakerError) as e:
+                    logger.debug(f"Skipping {url}: {str(e)}")
+                except Exception as e:
+                    logger.warning(f"Error crawling {url}: {str(e)}")
+
+                async with wakeup:
+                    in_flight -= 1
+                    if page is not None and not page.error:
+                        pages.append(page)
+                        if self.config.max_depth is None or depth < self.config.max_depth:
+                            for link in page.links:
+                                candidate = canonicalize_url(link, url)
+                                if (
+                                    candidate
+                                    and candidate not in seen
+                                    and self._is_allowed(candidate, allowed_domains)
+                                ):
+                                    seen.add(candidate)
+                                    frontier.append((candidate, depth + 1))
+                    wakeup.notify_all()
+
+        worker_count = max(1, min(self.config.max_workers, self.config.max_pages))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+        logger.info(
+            f"Crawl of {start} complete: {len(pages)} pages fetched, "
+            f"{len(seen)} URLs discovered"
+        )
+        return pages
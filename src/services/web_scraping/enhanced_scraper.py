@@ -18,7 +18,7 @@ import re
 import hashlib
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
 from collections import defaultdict, Counter
@@ -26,7 +26,6 @@ from enum import Enum
 
 import aiohttp
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -35,6 +34,11 @@ from tenacity import (
     before_sleep_log
 )
 
+from src.core.http_pool import get_http_pool
+from .browser import DEFAULT_BLOCKED_RESOURCE_TYPES, extract_page, navigate
+from .browser_pool import BrowserPool, get_browser_pool
+from .politeness import PolitenessService, get_politeness_service
+
 # NLP imports
 try:
     import textblob
@@ -89,8 +93,12 @@ class ScrapingConfig:
 
     # JavaScript rendering
     use_playwright: bool = False
+    wait_until: str = 'domcontentloaded'  # commit, domcontentloaded, load or networkidle
     wait_for_selector: Optional[str] = None
     wait_for_timeout: int = 5000
+    block_resource_types: List[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    )
 
     # Batch scraping
     max_concurrent: int = 5
@@ -202,24 +210,29 @@ class EnhancedWebScrapingService:
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     ]
 
-    def __init__(self, config: Optional[ScrapingConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ScrapingConfig] = None,
+        politeness: Optional[PolitenessService] = None,
+        browser_pool: Optional[BrowserPool] = None
+    ):
         """Initialize the enhanced web scraping service.
 
         Args:
             config: Scraping configuration (uses defaults if not provided)
+            politeness: Shared robots.txt/throttle/circuit breaker state
+                (uses the process-wide service if not provided)
+            browser_pool: Pool that JavaScript rendering borrows pages from
+                (uses the process-wide pool if not provided)
         """
         self.config = config or ScrapingConfig()
+        self.politeness = politeness or get_politeness_service()
+        self.browser_pool = browser_pool or get_browser_pool()
 
         # Session management
         self.session: Optional[aiohttp.ClientSession] = None
-        self.browser: Optional[Browser] = None
-
-        # Rate limiting and throttling
-        self.domain_throttle: Dict[str, float] = {}  # domain -> last_request_time
-        self.robots_cache: Dict[str, RobotFileParser] = {}
-        self.robots_cache_expiry: Dict[str, datetime] = {}
 
-        # Circuit breaker state per domain
+        # Local view of the shared circuit breaker state per domain
         self.circuit_breakers: Dict[str, CircuitBreakerStatus] = defaultdict(CircuitBreakerStatus)
 
         # User agents
@@ -237,21 +250,9 @@ class EnhancedWebScrapingService:
                 logger.warning("NLTK punkt tokenizer not found. Run: nltk.download('punkt')")
 
     async def _ensure_session(self):
-        """Ensure aiohttp session is created."""
+        """Borrow the shared aiohttp session from the HTTP pool."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.config.default_timeout),
-                connector=aiohttp.TCPConnector(limit_per_host=self.config.max_concurrent)
-            )
-
-    async def _ensure_browser(self):
-        """Ensure Playwright browser is initialized."""
-        if self.browser is None:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
+            self.session = get_http_pool().get_session()
 
     def _get_random_user_agent(self) -> str:
         """Get a random user agent from the pool."""
@@ -266,6 +267,10 @@ class EnhancedWebScrapingService:
         Raises:
             CircuitBreakerError: If circuit is open
         """
+        shared = await self.politeness.get_circuit_breaker(domain)
+        if shared:
+            self._apply_shared_breaker(domain, shared)
+
         breaker = self.circuit_breakers[domain]
         current_time = time.time()
 
@@ -276,6 +281,9 @@ class EnhancedWebScrapingService:
                 logger.info(f"Circuit breaker for {domain} entering HALF_OPEN state")
                 breaker.state = CircuitBreakerState.HALF_OPEN
                 breaker.success_count = 0
+                await self.politeness.update_circuit_breaker(
+                    domain, state=breaker.state.value, success_count=0
+                )
             else:
                 raise CircuitBreakerError(
                     f"Circuit breaker OPEN for {domain}. "
@@ -288,6 +296,17 @@ class EnhancedWebScrapingService:
                 logger.info(f"Circuit breaker for {domain} returning to CLOSED state")
                 breaker.state = CircuitBreakerState.CLOSED
                 breaker.failure_count = 0
+                await self.politeness.update_circuit_breaker(
+                    domain, state=breaker.state.value, failure_count=0
+                )
+
+    def _apply_shared_breaker(self, domain: str, shared: Dict[str, Any]):
+        """Replace the local breaker view with state shared by all workers."""
+        breaker = self.circuit_breakers[domain]
+        breaker.state = CircuitBreakerState(shared['state'])
+        breaker.failure_count = shared['failure_count']
+        breaker.success_count = shared['success_count']
+        breaker.last_failure_time = shared['last_failure_time']
 
     def _record_success(self, domain: str):
         """Record successful request for circuit breaker."""
@@ -312,6 +331,30 @@ class EnhancedWebScrapingService:
             )
             breaker.state = CircuitBreakerState.OPEN
 
+    async def _report_success(self, domain: str):
+        """Record a successful request locally and in the shared breaker."""
+        breaker = self.circuit_breakers[domain]
+        previous_state = breaker.state
+        had_failures = breaker.failure_count > 0
+
+        self._record_success(domain)
+
+        # Only state changes reach Redis; the common success path stays local
+        if previous_state == CircuitBreakerState.HALF_OPEN:
+            successes = await self.politeness.increment_successes(domain)
+            if successes is not None:
+                breaker.success_count = successes
+        elif had_failures:
+            await self.politeness.update_circuit_breaker(domain, failure_count=0)
+
+    async def _report_failure(self, domain: str):
+        """Record a failed request locally and in the shared breaker."""
+        self._record_failure(domain)
+
+        shared = await self.politeness.record_failure(domain, self.config.failure_threshold)
+        if shared:
+            self._apply_shared_breaker(domain, shared)
+
     async def _get_robots_parser(self, domain: str) -> Optional[RobotFileParser]:
         """Get robots.txt parser for a domain (with caching).
 
@@ -321,40 +364,24 @@ class EnhancedWebScrapingService:
         Returns:
             RobotFileParser instance or None if unavailable
         """
-        # Check cache expiry
-        if domain in self.robots_cache_expiry:
-            if datetime.utcnow() > self.robots_cache_expiry[domain]:
-                self.robots_cache.pop(domain, None)
-                self.robots_cache_expiry.pop(domain, None)
-
-        # Return cached parser
-        if domain in self.robots_cache:
-            return self.robots_cache[domain]
-
-        # Fetch robots.txt
-        robots_url = f"https://{domain}/robots.txt"
-        try:
-            await self._ensure_session()
-            async with self.session.get(
-                robots_url,
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={'User-Agent': self._get_random_user_agent()}
-            ) as response:
-                if response.status == 200:
-                    robots_content = await response.text()
-                    parser = RobotFileParser()
-                    parser.parse(robots_content.splitlines())
-
-                    # Cache the parser
-                    self.robots_cache[domain] = parser
-                    self.robots_cache_expiry[domain] = datetime.utcnow() + timedelta(hours=24)
-
-                    logger.debug(f"Fetched and cached robots.txt for {domain}")
-                    return parser
-        except Exception as e:
-            logger.debug(f"Could not fetch robots.txt for {domain}: {str(e)}")
+        async def fetch_robots() -> Optional[str]:
+            robots_url = f"https://{domain}/robots.txt"
+            try:
+                await self._ensure_session()
+                async with self.session.get(
+                    robots_url,
+                    timeout=aiohttp.ClientTimeout(total=10),
+                    headers={'User-Agent': self._get_random_user_agent()}
+                ) as response:
+                    if response.status == 200:
+                        logger.debug(f"Fetched robots.txt for {domain}")
+                        return await response.text()
+            except Exception as e:
+                logger.debug(f"Could not fetch robots.txt for {domain}: {str(e)}")
+            return None
 
-        return None
+        # Cached locally and in Redis so workers fetch robots.txt only once
+        return await self.politeness.get_robots_parser(domain, fetch_robots)
 
     async def _check_robots_allowed(self, url: str) -> bool:
         """Check if scraping is allowed by robots.txt.
@@ -389,16 +416,145 @@ class EnhancedWebScrapingService:
         Args:
             domain: Domain to throttle
         """
-        if domain in self.domain_throttle:
-            last_request = self.domain_throttle[domain]
-            elapsed = time.time() - last_request
+        # The slot is reserved across all workers before sleeping, so
+        # concurrent callers queue up behind each other
+        wait_time = await self.politeness.reserve_request_slot(
+            domain, self.config.throttle_delay
+        )
+        if wait_time > 0:
+            logger.debug(f"Throttling {domain}: waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+
+    async def fetch_page(self, url: str) -> ScrapedPage:
+        """Fetch and parse a page over plain HTTP, honouring politeness rules.
+
+        Applies the same circuit breaker, robots.txt and per-domain throttle
+        checks as ``scrape_with_javascript`` but without a browser, so it is
+        cheap enough to use for crawling.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            ScrapedPage with parsed content (``error`` is set on failure)
+
+        Raises:
+            RobotsDisallowedError: If robots.txt disallows the URL
+            CircuitBreakerError: If the circuit breaker for the domain is open
+        """
+        start_time = time.time()
+        domain = urlparse(url).netloc
+
+        await self._check_circuit_breaker(domain)
+
+        if not await self._check_robots_allowed(url):
+            raise RobotsDisallowedError(f"Robots.txt disallows scraping {url}")
+
+        await self._throttle_domain_request(domain)
+
+        try:
+            await self._ensure_session()
+            async with self.session.get(
+                url,
+                headers={'User-Agent': self._get_random_user_agent()},
+                timeout=aiohttp.ClientTimeout(total=self.config.default_timeout),
+                allow_redirects=True
+            ) as response:
+                status_code = response.status
+                html = await response.text() if status_code == 200 else ''
+
+            response_time_ms = (time.time() - start_time) * 1000
+
+            if status_code != 200:
+                # Client errors are the site's answer, not a sign it is down
+                if status_code >= 500:
+                    await self._report_failure(domain)
+                return self._empty_page(
+                    url, response_time_ms, f"HTTP {status_code}", status_code
+                )
 
-            if elapsed < self.config.throttle_delay:
-                wait_time = self.config.throttle_delay - elapsed
-                logger.debug(f"Throttling {domain}: waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
+            await self._report_success(domain)
+            return self._parse_html(url, html, status_code, response_time_ms)
 
-        self.domain_throttle[domain] = time.time()
+        except Exception as e:
+            await self._report_failure(domain)
+            response_time_ms = (time.time() - start_time) * 1000
+            logger.warning(f"Failed to fetch {url}: {str(e)}")
+            return self._empty_page(url, response_time_ms, str(e))
+
+    def _parse_html(
+        self,
+        url: str,
+        html: str,
+        status_code: int,
+        response_time_ms: float
+    ) -> ScrapedPage:
+        """Parse raw HTML into a ScrapedPage."""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        title_tag = soup.find('title')
+        title = title_tag.get_text().strip() if title_tag else ''
+
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+
+        headings = {
+            tag: [h.get_text().strip() for h in soup.find_all(tag) if h.get_text().strip()]
+            for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+        }
+
+        links = []
+        for anchor in soup.find_all('a', href=True):
+            href = urljoin(url, anchor['href'])
+            if href.startswith('http'):
+                links.append(href)
+
+        images = []
+        for img in soup.find_all('img', src=True):
+            src = urljoin(url, img['src'])
+            if src.startswith('http'):
+                images.append(src)
+
+        for element in soup(['script', 'style', 'noscript']):
+            element.decompose()
+        text = ' '.join(soup.get_text().split())
+
+        return ScrapedPage(
+            url=url,
+            html=html,
+            text=text,
+            title=title,
+            meta_description=meta_desc['content'] if meta_desc and meta_desc.get('content') else '',
+            meta_keywords=meta_keywords['content'] if meta_keywords and meta_keywords.get('content') else '',
+            headings=headings,
+            links=links,
+            images=images,
+            status_code=status_code,
+            response_time_ms=response_time_ms
+        )
+
+    def _empty_page(
+        self,
+        url: str,
+        response_time_ms: float,
+        error: str,
+        status_code: int = 0
+    ) -> ScrapedPage:
+        """Build an empty ScrapedPage describing a failed fetch."""
+        return ScrapedPage(
+            url=url,
+            html='',
+            text='',
+            title='',
+            meta_description='',
+            meta_keywords='',
+            headings={},
+            links=[],
+            images=[],
+            status_code=status_code,
+            response_time_ms=response_time_ms,
+            error=error
+        )
 
     async def scrape_with_javascript(
         self,
@@ -434,88 +590,31 @@ class EnhancedWebScrapingService:
             # Throttle request
             await self._throttle_domain_request(domain)
 
-            # Ensure browser is initialized
-            await self._ensure_browser()
-
-            # Create new page
-            page = await self.browser.new_page()
-
-            try:
+            # Borrow a page from the shared pool (waits if it is saturated)
+            async with self.browser_pool.page(self.config.block_resource_types) as page:
                 # Set user agent
                 await page.set_extra_http_headers({
                     'User-Agent': self._get_random_user_agent()
                 })
 
-                # Navigate to URL
-                response = await page.goto(
+                # Navigate and wait for the configured load state / selector
+                response = await navigate(
+                    page,
                     url,
-                    timeout=self.config.default_timeout * 1000,
-                    wait_until='networkidle'
+                    timeout_ms=self.config.default_timeout * 1000,
+                    wait_until=self.config.wait_until,
+                    wait_for_selector=wait_for_selector or self.config.wait_for_selector,
+                    selector_timeout_ms=wait_for_timeout or self.config.wait_for_timeout
                 )
                 status_code = response.status if response else 0
 
-                # Wait for specific selector if provided
-                selector = wait_for_selector or self.config.wait_for_selector
-                timeout = wait_for_timeout or self.config.wait_for_timeout
-
-                if selector:
-                    try:
-                        await page.wait_for_selector(selector, timeout=timeout)
-                    except PlaywrightTimeoutError:
-                        logger.warning(f"Timeout waiting for selector '{selector}' on {url}")
-
-                # Extract content
-                html = await page.content()
-                title = await page.title()
-
-                # Extract text content
-                text = await page.evaluate('''() => {
-                    const clone = document.cloneNode(true);
-                    clone.querySelectorAll('script, style, noscript').forEach(el => el.remove());
-                    return clone.body ? clone.body.innerText : '';
-                }''')
-
-                # Extract metadata
-                meta_description = await page.evaluate('''() => {
-                    const meta = document.querySelector('meta[name="description"]');
-                    return meta ? meta.getAttribute('content') : '';
-                }''')
-
-                meta_keywords = await page.evaluate('''() => {
-                    const meta = document.querySelector('meta[name="keywords"]');
-                    return meta ? meta.getAttribute('content') : '';
-                }''')
-
-                # Extract headings
-                headings = await page.evaluate('''() => {
-                    const result = {h1: [], h2: [], h3: [], h4: [], h5: [], h6: []};
-                    ['h1', 'h2', 'h3', 'h4', 'h5', 'h6'].forEach(tag => {
-                        document.querySelectorAll(tag).forEach(h => {
-                            const text = h.innerText.trim();
-                            if (text) result[tag].push(text);
-                        });
-                    });
-                    return result;
-                }''')
-
-                # Extract links
-                links = await page.evaluate('''() => {
-                    return Array.from(document.querySelectorAll('a[href]'))
-                        .map(a => a.href)
-                        .filter(href => href && href.startsWith('http'));
-                }''')
-
-                # Extract images
-                images = await page.evaluate('''() => {
-                    return Array.from(document.querySelectorAll('img[src]'))
-                        .map(img => img.src)
-                        .filter(src => src && src.startsWith('http'));
-                }''')
+                # Extract everything in a single round trip
+                content = await extract_page(page)
 
                 response_time_ms = (time.time() - start_time) * 1000
 
                 # Record success
-                self._record_success(domain)
+                await self._report_success(domain)
 
                 logger.info(
                     f"Successfully scraped {url} with JavaScript "
@@ -524,29 +623,26 @@ class EnhancedWebScrapingService:
 
                 return ScrapedPage(
                     url=url,
-                    html=html,
-                    text=text,
-                    title=title,
-                    meta_description=meta_description,
-                    meta_keywords=meta_keywords,
-                    headings=headings,
-                    links=links,
-                    images=images,
+                    html=content['html'],
+                    text=content['text'],
+                    title=content['title'],
+                    meta_description=content['metaDescription'] or '',
+                    meta_keywords=content['metaKeywords'] or '',
+                    headings=content['headings'],
+                    links=content['links'],
+                    images=content['images'],
                     status_code=status_code,
                     response_time_ms=response_time_ms,
                     is_javascript_rendered=True
                 )
 
-            finally:
-                await page.close()
-
         except (RobotsDisallowedError, CircuitBreakerError):
             # Re-raise these specific errors
             raise
 
         except Exception as e:
             # Record failure
-            self._record_failure(domain)
+            await self._report_failure(domain)
 
             response_time_ms = (time.time() - start_time) * 1000
             error_msg = str(e)
@@ -588,6 +684,17 @@ class EnhancedWebScrapingService:
         max_concurrent = max_concurrent or self.config.max_concurrent
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # One lightweight scraper for the whole batch; robots.txt and
+        # throttle state come from the shared politeness service
+        from src.services.scraping_service import ScrapingService
+        scraper = ScrapingService(
+            default_timeout=self.config.default_timeout,
+            max_retries=self.config.max_retries,
+            respect_robots_txt=self.config.respect_robots_txt,
+            throttle_delay=self.config.throttle_delay,
+            politeness=self.politeness
+        )
+
         async def scrape_with_semaphore(url: str, index: int) -> ScrapedPage:
             async with semaphore:
                 # Add delay between batches
@@ -598,13 +705,6 @@ class EnhancedWebScrapingService:
                     return await self.scrape_with_javascript(url)
                 else:
                     # Use existing ScrapingService logic (lightweight)
-                    from src.services.scraping_service import ScrapingService
-                    scraper = ScrapingService(
-                        default_timeout=self.config.default_timeout,
-                        max_retries=self.config.max_retries,
-                        respect_robots_txt=self.config.respect_robots_txt,
-                        throttle_delay=self.config.throttle_delay
-                    )
                     result = await scraper.scrape_url(url)
 
                     # Convert to ScrapedPage
@@ -1080,14 +1180,9 @@ class EnhancedWebScrapingService:
         return topics
 
     async def close(self):
-        """Close browser and session, cleanup resources."""
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """Release shared resources."""
+        # The browser and session belong to shared pools; just release them
+        self.session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,425 @@
+"""Shared crawl politeness state backed by Redis.
+
+Robots.txt rules, per-domain request pacing and circuit breaker state are
+shared by every scraper in every worker through Redis, so scaling the
+``scraping`` queue does not multiply the load placed on a single domain.
+
+Each process keeps a local cache in front of Redis: parsed robots.txt rules
+are reused until they expire and circuit breaker state is re-read at most
+once per ``breaker_sync_interval``, so only request pacing (which must be
+globally coordinated) costs a Redis round trip per request.
+
+Without Redis the service falls back to process-local state, which matches
+the previous per-instance behaviour.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+try:
+    from redis import asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+# Marker stored when a domain has no usable robots.txt
+NO_ROBOTS = "\x00"
+
+# Reserve the next request slot for a domain. Uses the Redis clock so all
+# workers agree on time. Returns milliseconds to wait before the request.
+RESERVE_SLOT_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local last = tonumber(redis.call('GET', KEYS[1]) or '0')
+local slot = math.max(now, last + interval)
+redis.call('SET', KEYS[1], slot, 'PX', slot - now + interval + 1000)
+return slot - now
+"""
+
+# Atomically count a failure and open the circuit at the threshold
+RECORD_FAILURE_SCRIPT = """
+local failures = redis.call('HINCRBY', KEYS[1], 'failure_count', 1)
+redis.call('HSET', KEYS[1], 'last_failure_time', ARGV[1])
+if failures >= tonumber(ARGV[2]) then
+    redis.call('HSET', KEYS[1], 'state', 'open')
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return redis.call('HGETALL', KEYS[1])
+"""
+
+
+class PolitenessService:
+    """Robots.txt cache, request pacing and circuit breaker state per domain.
+
+    Example:
+        politeness = get_politeness_service()
+        wait = await politeness.reserve_request_slot("example.com", 1.0)
+        await asyncio.sleep(wait)
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        namespace: str = "onside:politeness",
+        robots_ttl: int = 24 * 3600,
+        missing_robots_ttl: int = 3600,
+        breaker_ttl: int = 3600,
+        breaker_sync_interval: float = 2.0
+    ):
+        """Initialize the politeness service.
+
+        Args:
+            redis_url: Redis connection URL (process-local state if not provided)
+            namespace: Key namespace in Redis
+            robots_ttl: How long parsed robots.txt rules are reused (seconds)
+            missing_robots_ttl: How long a missing robots.txt is remembered (seconds)
+            breaker_ttl: Expiry of idle circuit breaker state in Redis (seconds)
+            breaker_sync_interval: Maximum age of the local circuit breaker view (seconds)
+        """
+        self.redis_url = redis_url
+        self.namespace = namespace
+        self.robots_ttl = robots_ttl
+        self.missing_robots_ttl = missing_robots_ttl
+        self.breaker_ttl = breaker_ttl
+        self.breaker_sync_interval = breaker_sync_interval
+
+        self.redis = None
+        self._reserve_slot = None
+        self._record_failure = None
+        self._initialized = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+
+        # Local caches in front of Redis
+        self._robots: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self._breakers: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
+        # Process-local pacing when Redis is unavailable
+        self._next_slot: Dict[str, float] = {}
+
+    async def initialize(self) -> bool:
+        """Connect to Redis.
+
+        Returns:
+            True if Redis is available, False if using process-local state
+        """
+        await self._bind_loop()
+
+        if self._initialized:
+            return self.redis is not None
+
+        async with self._init_lock:
+            if self._initialized:
+                return self.redis is not None
+
+            if REDIS_AVAILABLE and self.redis_url:
+                try:
+                    self.redis = aioredis.from_url(
+                        self.redis_url,
+                        decode_responses=True,
+                        socket_connect_timeout=5,
+                        socket_keepalive=True
+                    )
+                    await self.redis.ping()
+                    self._reserve_slot = self.redis.register_script(RESERVE_SLOT_SCRIPT)
+                    self._record_failure = self.redis.register_script(RECORD_FAILURE_SCRIPT)
+                    logger.info("Politeness state shared through Redis")
+                except Exception as e:
+                    logger.warning(f"Redis unavailable for politeness state, using local state: {e}")
+                    self.redis = None
+            else:
+                logger.debug("Politeness state is process-local (no Redis configured)")
+
+            self._initialized = True
+            return self.redis is not None
+
+    async def _bind_loop(self):
+        """Rebind loop-bound resources when used from a new event loop.
+
+        Celery tasks run each coroutine in a fresh loop; the Redis connection
+        and locks of the previous loop cannot be reused there.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._init_lock = asyncio.Lock()
+        self._robots_locks = {}
+        stale, self.redis = self.redis, None
+        self._reserve_slot = None
+        self._record_failure = None
+        self._initialized = False
+
+        if stale is not None:
+            try:
+                await stale.close()
+            except Exception as e:
+                logger.debug(f"Error closing Redis connection of a previous event loop: {e}")
+
+    async def close(self):
+        """Close the Redis connection."""
+        if self.redis:
+            try:
+                await self.redis.close()
+            except Exception as e:
+                logger.error(f"Error closing politeness Redis connection: {e}")
+            self.redis = None
+        self._initialized = False
+
+    def _key(self, kind: str, domain: str) -> str:
+        """Build a namespaced Redis key."""
+        return f"{self.namespace}:{kind}:{domain}"
+
+    # ------------------------------------------------------------------
+    # robots.txt
+    # ------------------------------------------------------------------
+
+    async def get_robots_parser(
+        self,
+        domain: str,
+        fetch_robots: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[RobotFileParser]:
+        """Get parsed robots.txt rules for a domain.
+
+        Looks in the local cache, then Redis, and only calls ``fetch_robots``
+        when neither has the rules. Concurrent callers in this process share
+        a single fetch.
+
+        Args:
+            domain: Domain to get rules for
+            fetch_robots: Coroutine function returning robots.txt text, or
+                None if the domain has no usable robots.txt
+
+        Returns:
+            RobotFileParser, or None if the domain has no robots.txt
+        """
+        cached = self._robots.get(domain)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        await self._bind_loop()
+        lock = self._robots_locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            cached = self._robots.get(domain)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+
+            await self.initialize()
+            content: Optional[str] = None
+            ttl = self.robots_ttl
+
+            if self.redis:
+                try:
+                    key = self._key("robots", domain)
+                    content, remaining = await asyncio.gather(
+                        self.redis.get(key), self.redis.ttl(key)
+                    )
+                    if content is not None and remaining and remaining > 0:
+                        ttl = remaining
+                except Exception as e:
+                    logger.debug(f"Could not read shared robots.txt for {domain}: {e}")
+
+            if content is None:
+                fetched = await fetch_robots()
+                content = NO_ROBOTS if fetched is None else fetched
+                ttl = self.missing_robots_ttl if fetched is None else self.robots_ttl
+
+                if self.redis:
+                    try:
+                        await self.redis.set(self._key("robots", domain), content, ex=ttl)
+                    except Exception as e:
+                        logger.debug(f"Could not share robots.txt for {domain}: {e}")
+
+            parser = None
+            if content != NO_ROBOTS:
+                parser = RobotFileParser()
+                parser.parse(content.splitlines())
+
+            self._robots[domain] = (parser, time.monotonic() + ttl)
+            return parser
+
+    # ------------------------------------------------------------------
+    # Request pacing
+    # ------------------------------------------------------------------
+
+    async def reserve_request_slot(self, domain: str, min_interval: float) -> float:
+        """Reserve the next request slot for a domain across all workers.
+
+        Args:
+            domain: Domain about to be requested
+            min_interval: Minimum spacing between requests to the domain (seconds)
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        await self.initialize()
+
+        if self.redis:
+            try:
+                wait_ms = await self._reserve_slot(
+                    keys=[self._key("slot", domain)],
+                    args=[int(min_interval * 1000)]
+                )
+                return max(0.0, int(wait_ms) / 1000)
+            except Exception as e:
+                logger.debug(f"Shared throttle unavailable for {domain}, using local: {e}")
+
+        # Reserve before sleeping so concurrent callers queue up behind each other
+        current_time = time.time()
+        next_slot = max(current_time, self._next_slot.get(domain, 0.0) + min_interval)
+        self._next_slot[domain] = next_slot
+        return next_slot - current_time
+
+    # ------------------------------------------------------------------
+    # Circuit breaker
+    # ------------------------------------------------------------------
+
+    def _decode_breaker(self, fields: Any) -> Dict[str, Any]:
+        """Normalize a breaker hash (dict or flat HGETALL list) from Redis."""
+        if isinstance(fields, list):
+            fields = dict(zip(fields[::2], fields[1::2]))
+        return {
+            'state': fields.get('state', 'closed'),
+            'failure_count': int(fields.get('failure_count', 0)),
+            'success_count': int(fields.get('success_count', 0)),
+            'last_failure_time': (
+                float(fields['last_failure_time']) if fields.get('last_failure_time') else None
+            ),
+        }
+
+    def _remember_breaker(self, domain: str, breaker: Dict[str, Any]) -> Dict[str, Any]:
+        self._breakers[domain] = (breaker, time.monotonic())
+        return breaker
+
+    async def get_circuit_breaker(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Get the shared circuit breaker state for a domain.
+
+        Served from the local cache unless it is older than
+        ``breaker_sync_interval``.
+
+        Args:
+            domain: Domain to look up
+
+        Returns:
+            Dict with ``state``, ``failure_count``, ``success_count`` and
+            ``last_failure_time``, or None without Redis
+        """
+        cached = self._breakers.get(domain)
+        if cached and time.monotonic() - cached[1] < self.breaker_sync_interval:
+            return cached[0]
+
+        if not await self.initialize():
+            return None
+
+        try:
+            fields = await self.redis.hgetall(self._key("breaker", domain))
+        except Exception as e:
+            logger.debug(f"Could not read shared circuit breaker for {domain}: {e}")
+            return cached[0] if cached else None
+
+        return self._remember_breaker(domain, self._decode_breaker(fields))
+
+    async def record_failure(self, domain: str, failure_threshold: int) -> Optional[Dict[str, Any]]:
+        """Count a failed request against the shared circuit breaker.
+
+        Args:
+            domain: Domain that failed
+            failure_threshold: Failures after which the circuit opens
+
+        Returns:
+            Updated breaker state, or None without Redis
+        """
+        if not await self.initialize():
+            return None
+
+        try:
+            fields = await self._record_failure(
+                keys=[self._key("breaker", domain)],
+                args=[time.time(), failure_threshold, self.breaker_ttl]
+            )
+        except Exception as e:
+            logger.debug(f"Could not record shared failure for {domain}: {e}")
+            return None
+
+        return self._remember_breaker(domain, self._decode_breaker(fields))
+
+    async def update_circuit_breaker(self, domain: str, **fields: Any) -> None:
+        """Overwrite fields of the shared circuit breaker state.
+
+        Args:
+            domain: Domain to update
+            **fields: Breaker fields to set (``state``, ``failure_count``, ...)
+        """
+        cached = self._breakers.get(domain)
+        if cached:
+            self._remember_breaker(domain, {**cached[0], **fields})
+
+        if not await self.initialize():
+            return
+
+        key = self._key("breaker", domain)
+        mapping = {name: value for name, value in fields.items() if value is not None}
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.breaker_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Could not update shared circuit breaker for {domain}: {e}")
+
+    async def increment_successes(self, domain: str) -> Optional[int]:
+        """Count a successful probe while the shared circuit is half-open.
+
+        Args:
+            domain: Domain that succeeded
+
+        Returns:
+            Shared success count, or None without Redis
+        """
+        if not await self.initialize():
+            return None
+
+        try:
+            successes = await self.redis.hincrby(self._key("breaker", domain), 'success_count', 1)
+        except Exception as e:
+            logger.debug(f"Could not record shared success for {domain}: {e}")
+            return None
+
+        cached = self._breakers.get(domain)
+        if cached:
+            self._remember_breaker(domain, {**cached[0], 'success_count': successes})
+        return successes
+
+
+# Global politeness service instance
+_politeness_service: Optional[PolitenessService] = None
+
+
+def get_politeness_service(redis_url: Optional[str] = None) -> PolitenessService:
+    """
+    Get or create the global politeness service.
+
+    Args:
+        redis_url: Redis connection URL (defaults to the REDIS_URL env variable)
+
+    Returns:
+        PolitenessService instance
+    """
+    global _politeness_service
+
+    if _politeness_service is None:
+        _politeness_service = PolitenessService(
+            redis_url=redis_url or os.getenv("REDIS_URL")
+        )
+
+    return _politeness_service
@@ -5,21 +5,28 @@ This module provides advanced web scraping capabilities including:
 - Screenshot capture
 - Version tracking and diff comparison
 - Change detection
-- Storage integration with MinIO
+- Content-addressed, deduplicated storage in MinIO
 """
 import logging
 import hashlib
 import difflib
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Sequence
 from datetime import datetime
 from urllib.parse import urlparse
 import asyncio
 
-from playwright.async_api import async_playwright, Page, Browser
 from sqlalchemy.orm import Session
 
-from src.models.scraped_content import ScrapedContent, ContentChange
+from src.models.scraped_content import ScrapedContent, ContentChange, ContentBlob, ContentObservation
+from src.services.content_blob_store import ContentBlobStore
+from src.services.content_diff import diff_content
 from src.services.storage_service import get_storage_service, StorageService
+from src.services.web_scraping.browser import (
+    DEFAULT_BLOCKED_RESOURCE_TYPES,
+    extract_page,
+    navigate,
+)
+from src.services.web_scraping.browser_pool import BrowserPool, get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -36,23 +43,28 @@ class WebScrapingService:
     content versioning, and change detection.
     """
 
-    def __init__(self, storage_service: Optional[StorageService] = None):
+    def __init__(
+        self,
+        storage_service: Optional[StorageService] = None,
+        wait_until: str = 'domcontentloaded',
+        block_resource_types: Sequence[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        browser_pool: Optional[BrowserPool] = None
+    ):
         """Initialize the web scraping service.
 
         Args:
-            storage_service: Storage service for saving screenshots
+            storage_service: Storage service for content blobs and screenshots
+            wait_until: Load state to wait for before extracting content
+            block_resource_types: Resource types to skip when no screenshot
+                is captured
+            browser_pool: Pool that pages are borrowed from (uses the
+                process-wide pool if not provided)
         """
         self.storage_service = storage_service or get_storage_service()
-        self.browser: Optional[Browser] = None
-
-    async def _ensure_browser(self):
-        """Ensure browser is initialized."""
-        if not self.browser:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
+        self.blob_store = ContentBlobStore(self.storage_service)
+        self.wait_until = wait_until
+        self.block_resource_types = tuple(block_resource_types)
+        self.browser_pool = browser_pool or get_browser_pool()
 
     async def scrape_url(
         self,
@@ -84,41 +96,26 @@ class WebScrapingService:
         start_time = datetime.utcnow()
 
         try:
-            await self._ensure_browser()
+            # Images are only needed when rendering a screenshot
+            blocked = () if capture_screenshot else self.block_resource_types
 
-            # Create new browser page
-            page = await self.browser.new_page()
-
-            try:
+            # Borrow a page from the shared pool (waits if it is saturated)
+            async with self.browser_pool.page(blocked) as page:
                 # Navigate to URL
-                response = await page.goto(url, timeout=timeout, wait_until='networkidle')
+                response = await navigate(page, url, timeout, wait_until=self.wait_until)
                 status_code = response.status if response else None
 
                 # Wait for specific selector if provided
                 if wait_for_selector:
                     await page.wait_for_selector(wait_for_selector, timeout=5000)
 
-                # Extract content
-                html_content = await page.content()
-                title = await page.title()
-
-                # Extract text content (remove scripts and styles)
-                text_content = await page.evaluate('''() => {
-                    const clone = document.cloneNode(true);
-                    clone.querySelectorAll('script, style, noscript').forEach(el => el.remove());
-                    return clone.body ? clone.body.innerText : '';
-                }''')
-
-                # Extract meta tags
-                meta_description = await page.evaluate('''() => {
-                    const meta = document.querySelector('meta[name="description"]');
-                    return meta ? meta.getAttribute('content') : null;
-                }''')
-
-                meta_keywords = await page.evaluate('''() => {
-                    const meta = document.querySelector('meta[name="keywords"]');
-                    return meta ? meta.getAttribute('content') : null;
-                }''')
+                # Extract content in a single round trip
+                content = await extract_page(page)
+                html_content = content['html']
+                title = content['title']
+                text_content = content['text']
+                meta_description = content['metaDescription']
+                meta_keywords = content['metaKeywords']
 
                 # Extract domain
                 parsed_url = urlparse(url)
@@ -132,8 +129,34 @@ class WebScrapingService:
                     .first()
                 )
 
+                content_hash = ScrapedContent.hash_content(text_content, html_content)
+
+                # Screenshots are deduplicated against the previous render
+                screenshot_blob = None
+                if capture_screenshot:
+                    screenshot_data = await page.screenshot(full_page=True)
+                    screenshot_blob = await self.blob_store.put_screenshot(
+                        db,
+                        screenshot_data,
+                        previous_hash=latest_version.screenshot_blob_hash if latest_version else None
+                    )
+
+                # Unchanged content only records that the version was seen again
+                if latest_version and latest_version.content_hash == content_hash:
+                    return self._record_observation(
+                        db,
+                        latest_version,
+                        status_code=status_code,
+                        scrape_duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+                        screenshot_blob=screenshot_blob
+                    )
+
                 version = (latest_version.version + 1) if latest_version else 1
 
+                # Versions reference content-addressed blobs instead of embedding them
+                html_blob = await self.blob_store.put_text(db, html_content or '', 'html')
+                text_blob = await self.blob_store.put_text(db, text_content or '', 'text')
+
                 # Create scraped content record
                 scraped = ScrapedContent(
                     url=url,
@@ -141,34 +164,22 @@ class WebScrapingService:
                     company_id=company_id,
                     competitor_id=competitor_id,
                     version=version,
-                    html_content=html_content,
-                    text_content=text_content,
+                    html_blob_hash=html_blob.content_hash,
+                    text_blob_hash=text_blob.content_hash,
+                    content_hash=content_hash,
                     title=title,
                     meta_description=meta_description,
                     meta_keywords=meta_keywords,
                     status_code=status_code,
-                    scrape_duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
+                    scrape_duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+                    seen_count=1,
+                    last_seen_at=datetime.utcnow()
                 )
 
-                # Calculate content hash
-                scraped.update_hash()
-
-                # Capture screenshot if requested
-                if capture_screenshot:
-                    screenshot_data = await page.screenshot(full_page=True)
-
-                    # Upload to MinIO
-                    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-                    screenshot_filename = f"screenshots/{domain}/{timestamp}_{version}.png"
-
-                    await self.storage_service.upload_file(
-                        file_data=screenshot_data,
-                        filename=screenshot_filename,
-                        content_type='image/png'
-                    )
-
-                    scraped.screenshot_path = screenshot_filename
-                    scraped.screenshot_url = f"/storage/{screenshot_filename}"
+                if screenshot_blob is not None:
+                    scraped.screenshot_blob_hash = screenshot_blob.content_hash
+                    scraped.screenshot_path = screenshot_blob.storage_path
+                    scraped.screenshot_url = f"/storage/{screenshot_blob.storage_path}"
 
                 # Add to database
                 db.add(scraped)
@@ -177,14 +188,11 @@ class WebScrapingService:
 
                 # Check for changes if there's a previous version
                 if latest_version:
-                    await self._detect_changes(db, latest_version, scraped)
+                    await self._detect_changes(db, latest_version, scraped, new_text=text_content)
 
                 logger.info(f"Successfully scraped {url} (version {version})")
                 return scraped
 
-            finally:
-                await page.close()
-
         except Exception as e:
             logger.error(f"Failed to scrape {url}: {str(e)}")
 
@@ -205,11 +213,79 @@ class WebScrapingService:
 
             raise WebScrapingError(f"Scraping failed for {url}: {str(e)}")
 
+    def _record_observation(
+        self,
+        db: Session,
+        version: ScrapedContent,
+        status_code: Optional[int],
+        scrape_duration_ms: float,
+        screenshot_blob: Optional[ContentBlob] = None
+    ) -> ScrapedContent:
+        """Record that an existing version was seen again unchanged.
+
+        Args:
+            db: Database session
+            version: Latest version whose content matched
+            status_code: HTTP status of this scrape
+            scrape_duration_ms: Duration of this scrape
+            screenshot_blob: Screenshot taken during this scrape, if any
+
+        Returns:
+            The existing ScrapedContent version
+        """
+        observation = ContentObservation(
+            scraped_content_id=version.id,
+            status_code=status_code,
+            scrape_duration_ms=scrape_duration_ms
+        )
+        if screenshot_blob is not None and screenshot_blob.content_hash != version.screenshot_blob_hash:
+            observation.screenshot_blob_hash = screenshot_blob.content_hash
+
+        version.seen_count = (version.seen_count or 1) + 1
+        version.last_seen_at = datetime.utcnow()
+
+        db.add(observation)
+        db.commit()
+
+        logger.info(f"No content changes for {version.url}; version {version.version} seen again")
+        return version
+
+    async def get_version_text(self, db: Session, version: ScrapedContent) -> str:
+        """Get the extracted text of a version.
+
+        Args:
+            db: Database session
+            version: Scraped content version
+
+        Returns:
+            Inline text for legacy rows, otherwise the text blob
+        """
+        if version.text_content is not None:
+            return version.text_content
+
+        return await self.blob_store.get_text(db, version.text_blob_hash) or ""
+
+    async def get_version_html(self, db: Session, version: ScrapedContent) -> str:
+        """Get the raw HTML of a version.
+
+        Args:
+            db: Database session
+            version: Scraped content version
+
+        Returns:
+            Inline HTML for legacy rows, otherwise the HTML blob
+        """
+        if version.html_content is not None:
+            return version.html_content
+
+        return await self.blob_store.get_text(db, version.html_blob_hash) or ""
+
     async def _detect_changes(
         self,
         db: Session,
         old_version: ScrapedContent,
-        new_version: ScrapedContent
+        new_version: ScrapedContent,
+        new_text: Optional[str] = None
     ) -> Optional[ContentChange]:
         """Detect and record changes between content versions.
 
@@ -217,6 +293,7 @@ class WebScrapingService:
             db: Database session
             old_version: Previous version
             new_version: New version
+            new_text: Text of the new version, if already in memory
 
         Returns:
             ContentChange if changes detected, None otherwise
@@ -226,25 +303,16 @@ class WebScrapingService:
             return None
 
         # Calculate text diff
-        old_text = old_version.text_content or ""
-        new_text = new_version.text_content or ""
-
-        # Calculate change percentage
-        differ = difflib.SequenceMatcher(None, old_text, new_text)
-        similarity = differ.ratio()
-        change_percentage = (1 - similarity) * 100
-
-        # Get detailed diff
-        diff = list(difflib.unified_diff(
-            old_text.splitlines(),
-            new_text.splitlines(),
-            lineterm='',
-            n=0  # No context lines
-        ))
-
-        # Count additions and deletions
-        additions = sum(1 for line in diff if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in diff if line.startswith('-') and not line.startswith('---'))
+        old_text = await self.get_version_text(db, old_version)
+        if new_text is None:
+            new_text = await self.get_version_text(db, new_version)
+
+        # Staged block/line diff, offloaded to a worker pool for large pages
+        diff = await diff_content(old_text, new_text, max_sample_lines=50)
+        similarity = diff.similarity
+        change_percentage = diff.change_percentage
+        additions = diff.additions
+        deletions = diff.deletions
 
         # Determine change type
         if abs(len(new_text) - len(old_text)) > len(old_text) * 0.5:
@@ -268,7 +336,7 @@ class WebScrapingService:
                 'similarity': round(similarity, 4),
                 'old_length': len(old_text),
                 'new_length': len(new_text),
-                'sample_diff': diff[:50]  # Store first 50 diff lines
+                'sample_diff': diff.sample_diff  # First 50 diff lines
             }
         )
 
@@ -386,15 +454,15 @@ class WebScrapingService:
             raise WebScrapingError("Versions are for different URLs")
 
         # Calculate diff
-        text1 = v1.text_content or ""
-        text2 = v2.text_content or ""
+        text1 = await self.get_version_text(db, v1)
+        text2 = await self.get_version_text(db, v2)
 
-        differ = difflib.SequenceMatcher(None, text1, text2)
-        similarity = differ.ratio()
+        similarity = (await diff_content(text1, text2, max_sample_lines=0)).similarity
 
-        # Get HTML diff
+        # Get HTML diff (rendering is CPU-bound, keep it off the event loop)
         html_differ = difflib.HtmlDiff()
-        html_diff = html_differ.make_file(
+        html_diff = await asyncio.to_thread(
+            html_differ.make_file,
             text1.splitlines(),
             text2.splitlines(),
             fromdesc=f"Version {v1.version} ({v1.created_at.isoformat()})",
@@ -423,14 +491,14 @@ class WebScrapingService:
         }
 
     async def close(self):
-        """Close browser and cleanup resources."""
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        """Release resources.
+
+        The browser belongs to the shared browser pool, which is closed on
+        application shutdown, so there is nothing to close here.
+        """
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._ensure_browser()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
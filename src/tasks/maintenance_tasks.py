@@ -5,12 +5,13 @@ Celery tasks for system maintenance:
 - Cleanup old data
 - Database optimization
 - Cache maintenance
+- API usage persistence
 """
 import logging
 from typing import Dict, Any
 from datetime import datetime, timedelta
 from celery import Task
-from src.celery_app import celery_app
+from src.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -145,3 +146,31 @@ def clear_expired_cache() -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error during cache cleanup: {e}", exc_info=True)
         raise
+
+
+@celery_app.task(
+    base=MaintenanceTask,
+    name="src.tasks.maintenance_tasks.flush_api_usage",
+    queue="default"
+)
+def flush_api_usage() -> Dict[str, Any]:
+    """
+    Persist API usage counted in Redis to the api_usage_records table.
+
+    Returns:
+        Dict containing flush summary
+    """
+    from src.services.api_monitoring.quota_counter import get_quota_counter
+
+    try:
+        records = run_async(get_quota_counter().flush())
+
+        return {
+            "flush_id": f"api_usage_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            "status": "completed",
+            "records_flushed": records
+        }
+
+    except Exception as e:
+        logger.error(f"Error flushing API usage: {e}", exc_info=True)
+        raise
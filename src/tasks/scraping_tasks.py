@@ -7,15 +7,31 @@ Celery tasks for web scraping and content extraction:
 - Content extraction
 - Screenshot capture
 """
+import io
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from celery import Task
-from src.celery_app import celery_app
+from src.celery_app import celery_app, run_async
 from src.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+async def _capture_screenshot(
+    url: str,
+    viewport_width: int,
+    viewport_height: int,
+    full_page: bool
+) -> bytes:
+    """Render a page in the shared browser pool and capture a PNG."""
+    from src.services.web_scraping.browser import navigate
+    from src.services.web_scraping.browser_pool import get_browser_pool
+
+    async with get_browser_pool().page() as page:
+        await page.set_viewport_size({"width": viewport_width, "height": viewport_height})
+        await navigate(page, url, timeout_ms=30000, wait_until="load")
+        return await page.screenshot(full_page=full_page)
+
 
 class ScrapingTask(Task):
     """Base task class for scraping with error handling and rate limiting."""
@@ -286,24 +302,29 @@ def capture_screenshot_task(
     try:
         logger.info(f"Capturing screenshot for: {url}")
 
-        # TODO: Implement screenshot capture using Playwright
-        # from src.services.screenshot_service import ScreenshotService
-        # screenshot_service = ScreenshotService()
-        # screenshot_path = screenshot_service.capture(url, viewport_width, viewport_height, full_page)
+        screenshot_data = run_async(
+            _capture_screenshot(url, viewport_width, viewport_height, full_page)
+        )
 
-        # TODO: Upload to MinIO
-        # from src.services.storage_service import storage_service
-        # storage_url = storage_service.upload_file(screenshot_path, bucket="onside-screenshots")
+        from src.services.storage_service import get_storage_service
+        screenshot_id = f"screenshot_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        upload = get_storage_service().upload_file(
+            bucket_name="onside-screenshots",
+            object_name=f"{tenant_id}/{screenshot_id}.png",
+            file_data=io.BytesIO(screenshot_data),
+            length=len(screenshot_data),
+            content_type="image/png"
+        )
 
         result = {
-            "screenshot_id": f"screenshot_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+            "screenshot_id": screenshot_id,
             "tenant_id": tenant_id,
             "url": url,
             "viewport": {"width": viewport_width, "height": viewport_height},
             "full_page": full_page,
             "status": "completed",
             "created_at": datetime.utcnow().isoformat(),
-            "storage_url": "placeholder_url"
+            "storage_url": upload["url"]
         }
 
         logger.info(f"Screenshot captured: {url}")
@@ -0,0 +1,99 @@
+"""URL normalization shared by link storage and link deduplication."""
+import logging
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that identify a click, not a page
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', '_ga', 'mc_cid', 'mc_eid'
+}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for comparison.
+
+    Normalization includes:
+    - Converting to lowercase
+    - Removing trailing slashes
+    - Sorting query parameters
+    - Removing common tracking parameters
+    - Removing fragments
+    - Removing www prefix
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL string
+    """
+    try:
+        parsed = urlparse(url.lower().strip())
+
+        # Parse and filter query parameters
+        query_params = parse_qs(parsed.query)
+        filtered_params = {
+            k: v for k, v in query_params.items()
+            if k.lower() not in TRACKING_PARAMS
+        }
+
+        # Sort parameters for consistency
+        sorted_query = urlencode(sorted(filtered_params.items()), doseq=True)
+
+        netloc = parsed.netloc
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+
+        path = parsed.path.rstrip('/')
+        if not path:
+            path = '/'
+
+        # Rebuild URL without fragment
+        return urlunparse((
+            parsed.scheme or 'https',
+            netloc,
+            path,
+            parsed.params,
+            sorted_query,
+            ''
+        ))
+
+    except Exception as e:
+        logger.warning(f"Failed to normalize URL {url}: {str(e)}")
+        return url.lower().strip()
+
+
+def url_host(normalized_url: str) -> str:
+    """Get the host (netloc) of a normalized URL.
+
+    Args:
+        normalized_url: URL returned by normalize_url
+
+    Returns:
+        Host including any port, or an empty string if there is none
+    """
+    try:
+        return urlparse(normalized_url).netloc
+    except ValueError:
+        return ''
+
+
+def url_directory(normalized_url: str) -> str:
+    """Get the path prefix of a normalized URL up to its last segment.
+
+    ``https://example.com/blog/2024/post`` has the directory ``/blog/2024/``.
+    Near-duplicate URLs usually differ only in the last segment or the
+    query string, so the directory is used to block dedup candidates.
+
+    Args:
+        normalized_url: URL returned by normalize_url
+
+    Returns:
+        Path prefix ending in a slash
+    """
+    try:
+        path = urlparse(normalized_url).path
+    except ValueError:
+        return '/'
+    return path[:path.rfind('/') + 1] or '/'
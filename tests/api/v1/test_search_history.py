@@ -296,6 +296,97 @@ class TestSearchHistoryAnalytics:
             assert data["top_queries"][0]["count"] == 5
 
 
+class TestSearchAnalyticsAggregation:
+    """Test suite for SQL-side search analytics and caching."""
+
+    @staticmethod
+    def _result(one=None, rows=None):
+        result = MagicMock()
+        result.one.return_value = one
+        result.all.return_value = rows or []
+        return result
+
+    @pytest.mark.asyncio
+    async def test_analytics_built_from_grouped_rows(self):
+        """Test that aggregate rows are mapped into the response shape."""
+        from src.api.v1.search_history import compute_search_analytics
+
+        db = AsyncMock()
+        db.execute.side_effect = [
+            self._result(one=(6, 2, 120.0, None)),
+            self._result(rows=[("popular query", 5), ("rare query", 1)]),
+            self._result(rows=[("content", 4), ("users", 2)]),
+            self._result(rows=[("2026-10-15", 9, 2), ("2026-10-16", 9, 3), ("2026-10-16", 14, 1)]),
+        ]
+
+        data = await compute_search_analytics(db, "user-1", days=7)
+
+        assert db.execute.await_count == 4
+        assert data["total_searches"] == 6
+        assert data["unique_queries"] == 2
+        assert data["avg_execution_time_ms"] == 120.0
+        assert data["avg_results_count"] == 0.0
+        assert data["top_queries"][0] == {"query": "popular query", "count": 5}
+        assert data["search_types_distribution"] == {"content": 4, "users": 2}
+        assert data["searches_by_hour"] == {9: 5, 14: 1}
+        assert data["searches_by_day"] == {"2026-10-15": 2, "2026-10-16": 4}
+
+    @pytest.mark.asyncio
+    async def test_average_execution_time_ignores_zero(self):
+        """Test that searches without a recorded execution time do not lower the average."""
+        from src.api.v1.search_history import compute_search_analytics
+
+        db = AsyncMock()
+        db.execute.return_value = self._result(one=(0, 0, None, None))
+
+        await compute_search_analytics(db, "user-1")
+
+        avg_execution_time = db.execute.await_args_list[0].args[0].selected_columns[2]
+        assert avg_execution_time.name == "avg"
+        assert [clause.name for clause in avg_execution_time.clauses] == ["nullif"]
+
+    @pytest.mark.asyncio
+    async def test_analytics_without_searches_skips_grouping(self):
+        """Test that an empty window needs only the summary query."""
+        from src.api.v1.search_history import compute_search_analytics
+
+        db = AsyncMock()
+        db.execute.return_value = self._result(one=(0, 0, None, None))
+
+        data = await compute_search_analytics(db, "user-1")
+
+        assert db.execute.await_count == 1
+        assert data["total_searches"] == 0
+        assert data["top_queries"] == []
+
+    @pytest.mark.asyncio
+    async def test_analytics_are_cached(self):
+        """Test that repeated requests are served from the cache."""
+        from src.api.v1 import search_history
+        from src.services.cache_service import AsyncCacheService
+
+        cache = AsyncCacheService()
+        user = MagicMock(id="user-1")
+        analytics = {"total_searches": 3}
+
+        with patch.object(search_history, "get_cache_service", return_value=cache), \
+                patch.object(
+                    search_history, "compute_search_analytics", AsyncMock(return_value=analytics)
+                ) as compute:
+            first = await search_history.get_search_analytics(
+                company_id=None, days=30, use_cache=True, db=AsyncMock(), current_user=user
+            )
+            second = await search_history.get_search_analytics(
+                company_id=None, days=30, use_cache=True, db=AsyncMock(), current_user=user
+            )
+            await search_history.get_search_analytics(
+                company_id=None, days=30, use_cache=False, db=AsyncMock(), current_user=user
+            )
+
+        assert first == second == analytics
+        assert compute.await_count == 2
+
+
 class TestSearchHistoryCleanup:
     """Test suite for DELETE /search-history/cleanup endpoint."""
 
@@ -61,6 +61,7 @@ class MockHTTPSession:
         self.responses = responses or {}
         self.request_history = []
         self.call_count = 0
+        self.closed = False
 
     def get(self, url: str, **kwargs) -> MockHTTPResponse:
         """Mock GET request.
@@ -51,16 +51,21 @@ async def test_get_similar_content(recommendation_service, mock_content):
         )
     ]
     
-    with patch('src.services.ai.content_recommendations.get_db_session') as mock_get_session:
+    vector_index = MagicMock()
+    vector_index.similar_to = AsyncMock(return_value=[(2, 0.92), (3, 0.71)])
+
+    with patch('src.services.ai.content_recommendations.get_db_session') as mock_get_session, \
+            patch('src.services.ai.content_recommendations.get_content_vector_index', return_value=vector_index):
         mock_session = get_mock_db_session()
-        mock_session.execute_result = MockResult(similar_content)
+        mock_session.execute_result = MockResult(mock_content + similar_content)
         mock_get_session.return_value = mock_session
         
         results = await recommendation_service.get_similar_content(mock_content[0].id)
         
-        assert len(results) > 0
+        assert [r.content_id for r in results] == [2, 3]
         assert all(isinstance(r, ContentSimilarity) for r in results)
         assert all(r.score >= 0 and r.score <= 1 for r in results)
+        vector_index.similar_to.assert_awaited_once_with(mock_content[0], k=10, sync=True)
 
 @pytest.mark.asyncio
 async def test_get_personalized_recommendations(recommendation_service):
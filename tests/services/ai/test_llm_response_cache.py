@@ -0,0 +1,157 @@
+"""Tests for the LLM response cache and request coalescing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.ai.llm_response_cache import LLMResponseCache
+from src.services.ai.llm_service import LLMService
+from src.services.cache_service import AsyncCacheService
+
+
+@pytest.fixture
+def response_cache():
+    """Create a response cache backed by an in-memory cache service."""
+    return LLMResponseCache(cache=AsyncCacheService(redis_url=None), ttl=60)
+
+
+class TestCacheKeys:
+    """Test request normalization and scoping."""
+
+    def test_whitespace_differences_share_a_key(self, response_cache):
+        first = response_cache.make_key([{"role": "user", "content": "Analyze  this\n"}], model="m", temperature=0.3, tenant_id="a")
+        second = response_cache.make_key([{"role": "user", "content": "Analyze this"}], model="m", temperature=0.3, tenant_id="a")
+
+        assert first == second
+
+    def test_parameters_and_tenant_change_the_key(self, response_cache):
+        base = response_cache.make_key("prompt", model="m", temperature=0.3, tenant_id="a")
+
+        assert base != response_cache.make_key("prompt", model="m", temperature=0.7, tenant_id="a")
+        assert base != response_cache.make_key("prompt", model="other", temperature=0.3, tenant_id="a")
+        assert base != response_cache.make_key("prompt", model="m", temperature=0.3, tenant_id="b")
+        assert base != response_cache.make_key("prompt", model="m", temperature=0.3, tenant_id="a", max_tokens=10)
+        assert base.startswith("a:")
+
+    def test_requests_without_a_tenant_have_no_key(self, response_cache):
+        assert response_cache.make_key("prompt", model="m", temperature=0.3) is None
+
+
+@pytest.mark.asyncio
+class TestGetOrCall:
+    """Test caching and single-flight behaviour."""
+
+    async def test_second_request_is_served_from_cache(self, response_cache):
+        call = AsyncMock(return_value={"content": "answer"})
+
+        first = await response_cache.get_or_call("key", call)
+        first["content"] = "modified by caller"
+        second = await response_cache.get_or_call("key", call)
+
+        assert second == {"content": "answer"}
+        call.assert_awaited_once()
+        assert response_cache.get_stats()["hits"] == 1
+
+    async def test_concurrent_identical_requests_are_coalesced(self, response_cache):
+        calls = 0
+
+        async def slow_call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"content": "shared"}
+
+        results = await asyncio.gather(*(response_cache.get_or_call("key", slow_call) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result == {"content": "shared"} for result in results)
+        assert response_cache.get_stats()["coalesced"] == 4
+
+    async def test_failures_are_shared_but_not_cached(self, response_cache):
+        async def failing_call():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            response_cache.get_or_call("key", failing_call),
+            response_cache.get_or_call("key", failing_call),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await response_cache.get_or_call("key", AsyncMock(return_value="ok")) == "ok"
+
+    async def test_waiter_retries_when_leader_is_cancelled(self, response_cache):
+        async def slow_call():
+            await asyncio.sleep(10)
+
+        leader = asyncio.create_task(response_cache.get_or_call("key", slow_call))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(response_cache.get_or_call("key", AsyncMock(return_value="own")))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await waiter == "own"
+
+    async def test_uncacheable_responses_are_not_stored(self, response_cache):
+        call = AsyncMock(return_value={"provider": "fallback"})
+        cacheable = lambda response: response["provider"] != "fallback"
+
+        await response_cache.get_or_call("key", call, cacheable=cacheable)
+        await response_cache.get_or_call("key", call, cacheable=cacheable)
+
+        assert call.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestLLMServiceCaching:
+    """Test response caching in LLMService.chat_completion."""
+
+    async def test_chat_completion_is_cached_per_tenant(self, response_cache):
+        service = LLMService(response_cache=response_cache)
+        service._complete_with_fallback = AsyncMock(return_value={"provider": "openai", "content": "hi"})
+        messages = [{"role": "user", "content": "Hello"}]
+
+        await service.chat_completion(messages, tenant_id="a", temperature=0.3)
+        cached = await service.chat_completion(messages, tenant_id="a", temperature=0.3, with_reasoning=True)
+        await service.chat_completion(messages, tenant_id="b", temperature=0.3)
+
+        assert service._complete_with_fallback.await_count == 2
+        assert cached["reasoning_chain"]["steps"][-1]["description"] == "Served from LLM response cache"
+
+    async def test_fallback_answers_are_not_cached(self, response_cache):
+        service = LLMService(response_cache=response_cache)
+        service._complete_with_fallback = AsyncMock(return_value={"provider": "fallback", "content": "later"})
+
+        await service.chat_completion([{"role": "user", "content": "Hello"}], tenant_id="a")
+        await service.chat_completion([{"role": "user", "content": "Hello"}], tenant_id="a")
+
+        assert service._complete_with_fallback.await_count == 2
+
+    async def test_tenants_sending_the_same_prompt_do_not_share_an_entry(self, response_cache):
+        service = LLMService(response_cache=response_cache)
+        service._complete_with_fallback = AsyncMock(side_effect=[
+            {"provider": "openai", "content": "for a"},
+            {"provider": "openai", "content": "for b"}
+        ])
+        messages = [{"role": "user", "content": "Summarize our pipeline"}]
+
+        await service.chat_completion(messages, tenant_id="a")
+        second = await service.chat_completion(messages, tenant_id="b")
+        first_again = await service.chat_completion(messages, tenant_id="a")
+
+        assert second["content"] == "for b"
+        assert first_again["content"] == "for a"
+        assert service._complete_with_fallback.await_count == 2
+
+    async def test_requests_without_a_tenant_are_not_cached(self, response_cache):
+        service = LLMService(response_cache=response_cache)
+        service._complete_with_fallback = AsyncMock(return_value={"provider": "openai", "content": "hi"})
+
+        await service.chat_completion([{"role": "user", "content": "Hello"}])
+        await service.chat_completion([{"role": "user", "content": "Hello"}])
+
+        assert service._complete_with_fallback.await_count == 2
+        assert response_cache.get_stats()["stores"] == 0
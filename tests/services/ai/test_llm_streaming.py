@@ -0,0 +1,197 @@
+"""Tests for streamed LLM responses and the streaming brand discovery chat."""
+
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.llm_fallback import LLMProvider as FallbackProvider
+from src.services.ai.brand_discovery_chat import BrandDiscoveryChatService
+from src.services.ai.llm_response_cache import LLMResponseCache
+from src.services.ai.llm_service import LLMProvider, LLMService
+from src.services.ai.llm_streaming import ChainOfThoughtStream, JSONFieldStream, sse_event
+from src.services.cache_service import AsyncCacheService
+from src.services.llm_provider import FallbackManager
+
+
+def chunks(text: str, size: int = 3):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+@pytest.fixture
+def response_cache():
+    """Create a response cache backed by an in-memory cache service."""
+    return LLMResponseCache(cache=AsyncCacheService(redis_url=None), ttl=60)
+
+
+@pytest.fixture
+def llm_service(response_cache):
+    """Create an LLM service with OpenAI and the rule-based fallback available."""
+    service = LLMService(response_cache=response_cache)
+    service._get_available_providers = lambda: [LLMProvider.OPENAI, LLMProvider.FALLBACK]
+    return service
+
+
+def openai_stream(*pieces, error=None):
+    """Build a replacement for LLMService._stream_openai yielding pieces."""
+    async def stream(messages, **kwargs):
+        for piece in pieces:
+            yield {"content": piece}
+        if error:
+            raise error
+        yield {"response": {"provider": "openai", "model": "gpt-4o", "finish_reason": "stop", "usage": None}}
+    return stream
+
+
+class TestJSONFieldStream:
+    """Test incremental decoding of a JSON string field."""
+
+    def test_decodes_field_across_chunk_boundaries(self):
+        document = json.dumps({"response": 'Say "hi"\né\U0001F600 done', "extracted": {"brand_name": "Acme"}})
+        field = JSONFieldStream("response")
+
+        decoded = "".join(field.feed(chunk) for chunk in chunks(document, 1))
+
+        assert decoded == 'Say "hi"\né\U0001F600 done'
+        assert field.complete
+
+    def test_text_before_the_field_is_ignored(self):
+        field = JSONFieldStream("response")
+
+        assert field.feed('{"extracted": {}, "resp') == ""
+        assert field.feed('onse": "Hello') == "Hello"
+
+
+class TestChainOfThoughtStream:
+    """Test incremental reasoning/answer splitting."""
+
+    def test_splits_sections_with_markers_split_across_chunks(self):
+        parser = ChainOfThoughtStream()
+        text = "REASONING: step one\nstep two\n\nANSWER: the answer"
+
+        pieces = [piece for chunk in chunks(text, 4) for piece in parser.feed(chunk)] + parser.close()
+
+        assert "".join(t for section, t in pieces if section == "reasoning").strip() == "step one\nstep two"
+        assert "".join(t for section, t in pieces if section == "answer") == "the answer"
+        assert parser.result() == {"reasoning": "step one\nstep two", "answer": "the answer"}
+
+    def test_text_without_markers_is_answer(self):
+        parser = ChainOfThoughtStream()
+
+        pieces = parser.feed("plain text") + parser.close()
+
+        assert pieces == [("answer", "plain text")]
+
+
+def test_sse_event_format():
+    assert sse_event("token", {"content": "hi"}) == 'event: token\ndata: {"content": "hi"}\n\n'
+
+
+@pytest.mark.asyncio
+class TestLLMServiceStreaming:
+    """Test streaming chat completions with provider fallback."""
+
+    async def test_streams_deltas_and_caches_the_completion(self, llm_service):
+        llm_service._stream_openai = openai_stream("Hel", "lo")
+        llm_service.circuit_breakers[LLMProvider.OPENAI] = MagicMock()
+
+        events = await collect(llm_service.stream_chat_completion([{"role": "user", "content": "Hi"}], tenant_id="a"))
+
+        assert [e["content"] for e in events if e["type"] == "delta"] == ["Hel", "lo"]
+        assert events[-1]["response"]["content"] == "Hello"
+        llm_service.circuit_breakers[LLMProvider.OPENAI].record_success.assert_called_once()
+
+        replay = await collect(llm_service.stream_chat_completion([{"role": "user", "content": "Hi"}], tenant_id="a"))
+
+        assert replay[0] == {"type": "delta", "content": "Hello", "provider": "openai"}
+
+    async def test_mid_stream_failure_resets_and_falls_back(self, llm_service, response_cache):
+        llm_service._stream_openai = openai_stream("partial", error=RuntimeError("connection lost"))
+
+        events = await collect(llm_service.stream_chat_completion([{"role": "user", "content": "Hi"}]))
+
+        assert [e["type"] for e in events] == ["delta", "reset", "delta", "done"]
+        assert events[-1]["response"]["provider"] == "fallback"
+        assert "fallback mode" in events[-1]["response"]["content"]
+        assert response_cache.get_stats()["stores"] == 0
+
+    async def test_failure_before_output_falls_back_without_reset(self, llm_service):
+        llm_service._stream_openai = openai_stream(error=RuntimeError("unavailable"))
+
+        events = await collect(llm_service.stream_chat_completion([{"role": "user", "content": "Hi"}]))
+
+        assert [e["type"] for e in events] == ["delta", "done"]
+
+
+@pytest.mark.asyncio
+class TestFallbackManagerStreaming:
+    """Test chain-of-thought streaming in the fallback manager."""
+
+    async def test_streams_reasoning_and_answer(self, monkeypatch, response_cache):
+        monkeypatch.setattr(
+            "src.services.llm_provider.fallback_manager.get_llm_response_cache", lambda: response_cache
+        )
+        manager = FallbackManager(providers=[FallbackProvider.OPENAI])
+        report = SimpleNamespace(id=1, user_id="user-1")
+
+        events = await collect(manager.stream_with_fallback("market chain_of_thought analysis", report=report))
+        done = events[-1]
+
+        assert {e["type"] for e in events[:-1]} == {"reasoning", "answer"}
+        assert "".join(e["content"] for e in events if e["type"] == "answer") == done["result"]["response"]
+        assert done["result"]["reasoning"].startswith("Analyzing the real estate services market")
+        assert done["provider"] == FallbackProvider.OPENAI
+
+        result, provider = await manager.execute_with_fallback("market chain_of_thought analysis", report=report)
+
+        assert result == done["result"]
+        assert response_cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+class TestBrandDiscoveryChatStreaming:
+    """Test streaming chat turns."""
+
+    @pytest.fixture
+    def chat(self, llm_service):
+        session = SimpleNamespace(
+            session_id=uuid.uuid4(), user_id="user-1", messages=[], extracted_data={}, status="active"
+        )
+        service = BrandDiscoveryChatService(MagicMock())
+        service.llm_service = llm_service
+        service._get_session = lambda session_id: session
+        return service, session
+
+    async def test_streams_response_field_and_stores_turn(self, chat):
+        service, session = chat
+        answer = json.dumps({"response": "Great! What's your website?", "extracted": {"brand_name": "Acme"}})
+        service.llm_service._stream_openai = openai_stream(*chunks(answer, 5))
+
+        events = await collect(service.stream_message(session.session_id, "Acme"))
+
+        assert "".join(e["content"] for e in events if e["type"] == "token") == "Great! What's your website?"
+        assert events[-1]["message"].extracted_data.brand_name == "Acme"
+        assert [m["role"] for m in session.messages] == ["user", "assistant"]
+        service.db.commit.assert_called_once()
+
+    async def test_all_providers_failing_uses_rule_based_reply(self, chat):
+        service, session = chat
+        service.llm_service._get_available_providers = lambda: []
+
+        events = await collect(service.stream_message(session.session_id, "Acme"))
+
+        assert [e["type"] for e in events] == ["token", "done"]
+        assert events[-1]["message"].extracted_data.brand_name == "Acme"
+
+    async def test_inactive_session_raises_before_streaming(self, chat):
+        service, session = chat
+        session.status = "completed"
+
+        with pytest.raises(ValueError, match="not active"):
+            service.stream_message(session.session_id, "Acme")
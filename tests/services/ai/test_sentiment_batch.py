@@ -0,0 +1,172 @@
+"""Tests for concurrent batch sentiment analysis."""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.ai import sentiment_analysis
+from src.services.ai.llm_service import LLMProvider
+from src.services.ai.sentiment_analysis import SentimentAnalysisService
+from tests.utils import MockContent
+
+
+def llm_reply(messages, **kwargs):
+    """Answer single and packed sentiment prompts like an LLM would."""
+    prompt = messages[-1]["content"]
+    if "each numbered text" in messages[0]["content"]:
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\]", prompt, re.MULTILINE)]
+        answer = [{"id": i, "score": 0.5, "confidence": 0.9, "explanation": "packed"} for i in ids]
+    else:
+        answer = {"score": -0.5, "confidence": 0.8, "explanation": "single"}
+    return {"provider": "openai", "content": json.dumps(answer)}
+
+
+@pytest.fixture
+def service():
+    """Create a sentiment service whose LLM is OpenAI-backed and mocked."""
+    sentiment_service = SentimentAnalysisService()
+    llm = MagicMock()
+    llm._get_available_providers.return_value = [LLMProvider.OPENAI, LLMProvider.FALLBACK]
+    llm.chat_completion = AsyncMock(side_effect=llm_reply)
+    sentiment_service.llm_service = llm
+    return sentiment_service
+
+
+@pytest.mark.asyncio
+class TestSentimentBatchEngine:
+    """Test deduplication, packing and concurrency limits."""
+
+    async def test_short_texts_are_packed_and_deduplicated(self, service):
+        texts = ["great product", "terrible support", "great product", "okay"]
+
+        results = await service.batch_engine.analyze_texts(texts)
+
+        assert service.llm_service.chat_completion.await_count == 1
+        assert [r["explanation"] for r in results] == ["packed"] * 4
+
+    async def test_long_texts_are_sent_individually(self, service):
+        results = await service.batch_engine.analyze_texts(["x" * 2000, "short"])
+
+        assert service.llm_service.chat_completion.await_count == 2
+        assert [r["explanation"] for r in results] == ["single", "packed"]
+
+    async def test_items_missing_from_packed_answer_are_retried(self, service):
+        async def partial_reply(messages, **kwargs):
+            if "each numbered text" in messages[0]["content"]:
+                return {"content": json.dumps([{"id": 0, "score": 1, "confidence": 1, "explanation": "packed"}])}
+            return llm_reply(messages)
+
+        service.llm_service.chat_completion.side_effect = partial_reply
+
+        results = await service.batch_engine.analyze_texts(["first", "second"])
+
+        assert [r["explanation"] for r in results] == ["packed", "single"]
+
+    async def test_fallback_only_uses_textblob_without_llm_calls(self, service):
+        service.llm_service._get_available_providers.return_value = [LLMProvider.FALLBACK]
+
+        results = await service.batch_engine.analyze_texts(["I love this", "I hate this"])
+
+        service.llm_service.chat_completion.assert_not_awaited()
+        assert results[0]["score"] > 0 > results[1]["score"]
+        assert all(r["method"] == "textblob_fallback" for r in results)
+
+    async def test_concurrency_is_capped_per_provider(self, service):
+        active = 0
+        peak = 0
+
+        async def slow_reply(messages, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return llm_reply(messages)
+
+        service.llm_service.chat_completion.side_effect = slow_reply
+        service.batch_engine.pack_size = 1
+        service.batch_engine.provider_concurrency[LLMProvider.OPENAI] = 3
+
+        await service.batch_engine.analyze_texts([f"text {i}" for i in range(12)])
+
+        assert service.llm_service.chat_completion.await_count == 12
+        assert peak == 3
+
+    async def test_concurrency_cap_is_shared_by_all_services(self, service):
+        active = 0
+        peak = 0
+
+        async def slow_reply(messages, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return llm_reply(messages)
+
+        other = SentimentAnalysisService()
+        other.llm_service = service.llm_service
+        service.llm_service.chat_completion.side_effect = slow_reply
+        for engine in (service.batch_engine, other.batch_engine):
+            engine.pack_size = 1
+            engine.provider_concurrency[LLMProvider.OPENAI] = 3
+
+        await asyncio.gather(
+            service.batch_engine.analyze_texts([f"text {i}" for i in range(6)]),
+            other.batch_engine.analyze_texts([f"other {i}" for i in range(6)])
+        )
+
+        assert service.llm_service.chat_completion.await_count == 12
+        assert peak == 3
+
+
+@pytest.mark.asyncio
+class TestBatchContentAnalysis:
+    """Test loading and storing content in bulk."""
+
+    async def test_batch_analyze_content_uses_one_query_and_commit(self, service, monkeypatch):
+        monkeypatch.setattr(sentiment_analysis, "AIInsight", lambda **kwargs: SimpleNamespace(**kwargs))
+        contents = [
+            MockContent(id=1, title="A", text="great", user_id="u"),
+            MockContent(id=2, title="B", text="bad", user_id="u"),
+        ]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = contents
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        db.commit = AsyncMock()
+
+        insights = await service.batch_analyze_content([2, 1, 3], db)
+
+        assert [insight.content_id for insight in insights] == [2, 1]
+        db.execute.assert_awaited_once()
+        db.add_all.assert_called_once()
+        db.commit.assert_awaited_once()
+
+    async def test_analyze_batch_sentiment_reports_missing_content(self, service):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [MockContent(id=1, title="A", text="great", user_id="u")]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        results = await service.analyze_batch_sentiment([1, 2], session)
+
+        assert results[0]["sentiment"]["score"] == 0.5
+        assert results[1] == {"content_id": 2, "error": "Content not found"}
+
+    async def test_contents_are_analyzed_within_their_owner(self, service):
+        contents = [
+            MockContent(id=1, title="A", text="great", user_id="u1"),
+            MockContent(id=2, title="B", text="x" * 2000, user_id="u2"),
+            MockContent(id=3, title="C", text="bad", user_id="u1"),
+        ]
+
+        results = await service.analyze_contents(contents)
+
+        calls = service.llm_service.chat_completion.await_args_list
+        assert sorted(call.kwargs["tenant_id"] for call in calls) == ["u1", "u2"]
+        assert [r["explanation"] for r in results] == ["packed", "single", "packed"]
@@ -0,0 +1,220 @@
+"""Tests for the per-tenant content vector index."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.services.ai.embedding_service import EmbeddingService
+from src.services.ai.vector_index import ContentVectorIndex, VectorIndex
+from tests.utils import MockContent, MockResult
+
+
+def clustered_vectors(n: int, dimension: int = 16, clusters: int = 20, seed: int = 0) -> np.ndarray:
+    """Generate vectors scattered around random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dimension))
+    labels = rng.integers(0, clusters, size=n)
+    return (centres[labels] + 0.1 * rng.normal(size=(n, dimension))).astype(np.float32)
+
+
+def exact_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores)[:k])
+
+
+@pytest.fixture
+def embeddings():
+    """Create an embedding service whose vectors encode the text's words."""
+    vocabulary = ["seo", "marketing", "python", "cooking", "travel", "finance"]
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.array([
+        [text.lower().split().count(word) + 0.01 for word in vocabulary]
+        for text in texts
+    ])
+    return EmbeddingService('test-model', model=model)
+
+
+class TestVectorIndex:
+    """Test exact and partitioned search."""
+
+    def test_exact_search(self):
+        index = VectorIndex()
+        index.upsert([10, 20, 30], np.array([[1, 0], [0.8, 0.2], [0, 1]]))
+
+        results = index.search(np.array([1, 0]), k=2)
+
+        assert [item_id for item_id, _ in results] == [10, 20]
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_upsert_replaces_and_remove_compacts(self):
+        index = VectorIndex()
+        index.upsert([1, 2, 3], np.array([[1, 0], [0, 1], [1, 1]]))
+        index.upsert([1], np.array([[0, 1]]))
+        index.remove([2])
+
+        assert len(index) == 2
+        assert 2 not in index
+        assert index.get_vector(1) == pytest.approx([0, 1])
+        assert [item_id for item_id, _ in index.search(np.array([0, 1]), k=5)] == [1, 3]
+
+    def test_exclude(self):
+        index = VectorIndex()
+        index.upsert([1, 2], np.array([[1, 0], [0.9, 0.1]]))
+
+        assert [item_id for item_id, _ in index.search(np.array([1, 0]), k=1, exclude=[1])] == [2]
+
+    def test_partitioned_search_recall(self):
+        vectors = clustered_vectors(4000)
+        index = VectorIndex(nprobe=8, min_train_size=1000)
+        index.upsert(list(range(len(vectors))), vectors)
+
+        assert index.is_partitioned
+
+        queries = clustered_vectors(50, seed=1)
+        recall = np.mean([
+            len({item_id for item_id, _ in index.search(query, k=10)} & set(exact_top_k(vectors, query, 10))) / 10
+            for query in queries
+        ])
+        assert recall >= 0.9
+
+    def test_snapshot_is_unaffected_by_later_changes(self):
+        index = VectorIndex()
+        index.upsert([1, 2], np.array([[1, 0], [0, 1]]))
+
+        snapshot = index.snapshot()
+        index.remove([1])
+        index.upsert([3], np.array([[1, 0]]))
+
+        assert [item_id for item_id, _ in snapshot.search(np.array([1, 0]), k=5)] == [1, 2]
+        assert [item_id for item_id, _ in index.search(np.array([1, 0]), k=5)] == [3, 2]
+
+    def test_save_and_load(self, tmp_path):
+        vectors = clustered_vectors(1500)
+        index = VectorIndex(min_train_size=1000)
+        index.upsert(list(range(len(vectors))), vectors)
+        path = str(tmp_path / "index.npz")
+
+        index.save(path)
+        loaded = VectorIndex.load(path)
+
+        assert len(loaded) == len(index)
+        assert loaded.is_partitioned
+        assert loaded.search(vectors[7], k=3) == index.search(vectors[7], k=3)
+
+
+@pytest.mark.asyncio
+class TestContentVectorIndex:
+    """Test per-tenant content indexing."""
+
+    async def test_similar_to_stays_within_tenant(self, tmp_path, embeddings):
+        index = ContentVectorIndex(str(tmp_path), embeddings=embeddings)
+        index.upsert_contents([
+            MockContent(id=1, title="SEO marketing", text="seo tips", user_id="a"),
+            MockContent(id=2, title="More SEO", text="seo seo marketing", user_id="a"),
+            MockContent(id=3, title="Cooking", text="cooking travel", user_id="a"),
+            MockContent(id=4, title="SEO", text="seo marketing", user_id="b"),
+        ])
+
+        hits = await index.similar_to(MockContent(id=1, title="SEO marketing", text="seo tips", user_id="a"), k=5)
+
+        assert [content_id for content_id, _ in hits] == [2, 3]
+
+    async def test_changes_persist_across_instances(self, tmp_path, embeddings):
+        index = ContentVectorIndex(str(tmp_path), embeddings=embeddings)
+        index.apply_changes({
+            "upsert": {"a": {1: "python finance", 2: "travel", 3: "python"}},
+            "delete": {}
+        })
+        index.apply_changes({"upsert": {}, "delete": {"a": {2}}})
+        index.flush()
+
+        reloaded = ContentVectorIndex(str(tmp_path), embeddings=embeddings)
+        hits = await reloaded.search_text("a", "python", k=5)
+
+        assert [content_id for content_id, _ in hits] == [3, 1]
+
+    async def test_sync_backfills_and_reconciles_with_database(self, tmp_path, embeddings):
+        index = ContentVectorIndex(str(tmp_path), embeddings=embeddings)
+        index.apply_changes({"upsert": {"a": {9: "deleted elsewhere"}}, "delete": {}})
+        rows = [
+            MockContent(id=1, title="Python", text="python", user_id="a"),
+            MockContent(id=2, title="Travel", text="travel", user_id="a"),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            MockResult([(row.id, row.updated_at) for row in rows]),
+            MockResult(rows)
+        ])
+
+        assert await index.ensure_synced(db, "a") == 2
+        assert await index.ensure_synced(db, "a") is None
+
+        hits = await index.search_text("a", "python", k=5)
+        assert [content_id for content_id, _ in hits] == [1, 2]
+
+    async def test_similar_to_syncs_in_the_background(self, tmp_path, embeddings):
+        rows = [
+            MockContent(id=1, title="Python", text="python", user_id="a"),
+            MockContent(id=2, title="Travel", text="travel", user_id="a"),
+        ]
+        release = asyncio.Event()
+
+        async def execute(statement):
+            await release.wait()
+            return results.pop(0)
+
+        results = [MockResult([(row.id, row.updated_at) for row in rows]), MockResult(rows)]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=execute)
+
+        @asynccontextmanager
+        async def session_factory():
+            yield db
+
+        index = ContentVectorIndex(str(tmp_path), embeddings=embeddings, session_factory=session_factory)
+        index.apply_changes({"upsert": {"a": {2: "travel"}}, "delete": {}})
+
+        # The lookup answers from the index as it stands while the backfill runs
+        hits = await index.similar_to(rows[0], k=5, sync=True)
+        assert [content_id for content_id, _ in hits] == [2]
+
+        task = index.schedule_sync("a")
+        assert task is not None and not task.done()
+
+        release.set()
+        assert await task == 2
+        assert index.schedule_sync("a") is None
+        hits = await index.search_text("a", "python", k=5)
+        assert [content_id for content_id, _ in hits] == [1, 2]
+
+    async def test_sync_only_embeds_rows_changed_since_last_sync(self, tmp_path, embeddings):
+        index = ContentVectorIndex(str(tmp_path), embeddings=embeddings)
+        index.apply_changes({"upsert": {"a": {1: "python", 2: "travel"}}, "delete": {}})
+        index.get_index("a").synced_at = datetime.utcnow()
+        old = datetime.utcnow() - timedelta(days=1)
+        changed = MockContent(id=2, title="Cooking", text="cooking", user_id="a")
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            MockResult([(1, old), (2, changed.updated_at)]),
+            MockResult([changed])
+        ])
+
+        assert await index.sync(db, "a") == 1
+        hits = await index.search_text("a", "cooking", k=1)
+        assert hits[0][0] == 2
+
+    async def test_processes_write_separate_snapshots(self, tmp_path, embeddings):
+        first = ContentVectorIndex(str(tmp_path), embeddings=embeddings, snapshot_name="worker-1")
+        second = ContentVectorIndex(str(tmp_path), embeddings=embeddings, snapshot_name="worker-2")
+        first.apply_changes({"upsert": {"a": {1: "python"}}, "delete": {}})
+        second.apply_changes({"upsert": {"a": {2: "travel"}}, "delete": {}})
+        first.flush()
+        second.flush()
+
+        snapshots = sorted(path.name for path in (tmp_path / "a").iterdir())
+        assert snapshots == ["worker-1.npz", "worker-2.npz"]
@@ -14,6 +14,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
+from src.services.api_monitoring.quota_counter import QuotaCounter, period_bounds
 from src.services.external_api.gnews_service import (
     GNewsService,
     GNewsAPIError,
@@ -46,7 +47,8 @@ def gnews_service(mock_db_session, mock_http_client):
     service = GNewsService(
         db=mock_db_session,
         api_key="test_api_key",
-        http_client=mock_http_client
+        http_client=mock_http_client,
+        quota_counter=QuotaCounter()
     )
     return service
 
@@ -136,7 +138,7 @@ class TestGNewsServiceRateLimiting:
         Then it should return True
         """
         # Arrange
-        gnews_service.usage_repo.get_quota_status = AsyncMock(
+        gnews_service.get_usage_status = AsyncMock(
             return_value={"is_exceeded": False, "quota_remaining": 500}
         )
 
@@ -154,7 +156,7 @@ class TestGNewsServiceRateLimiting:
         Then it should return False
         """
         # Arrange
-        gnews_service.usage_repo.get_quota_status = AsyncMock(
+        gnews_service.get_usage_status = AsyncMock(
             return_value={"is_exceeded": True, "quota_remaining": 0}
         )
 
@@ -169,7 +171,7 @@ class TestGNewsServiceRateLimiting:
         """
         Given an API endpoint call
         When I record the API call
-        Then usage should be tracked in the database
+        Then usage should be counted without a database write
         """
         # Arrange
         gnews_service.usage_repo.record_usage = AsyncMock()
@@ -178,11 +180,9 @@ class TestGNewsServiceRateLimiting:
         await gnews_service._record_api_call("search")
 
         # Assert
-        gnews_service.usage_repo.record_usage.assert_called_once_with(
-            api_name="gnews",
-            endpoint="search",
-            count=1
-        )
+        status = await gnews_service.get_usage_status()
+        assert status["request_count"] == 1
+        gnews_service.usage_repo.record_usage.assert_not_called()
 
 
 class TestGNewsServiceRequestHandling:
@@ -618,23 +618,19 @@ class TestGNewsServiceUsageTracking:
         Then quota information should be returned
         """
         # Arrange
-        expected_status = {
-            "request_count": 100,
-            "quota_limit": 1000,
-            "quota_remaining": 900,
-            "usage_percentage": 10.0,
-            "is_exceeded": False
-        }
-        gnews_service.usage_repo.get_quota_status = AsyncMock(
-            return_value=expected_status
-        )
+        period_start, period_end = period_bounds("daily")
+        await gnews_service.quota_counter.set_limit("gnews", period_start, period_end, 1000)
+        await gnews_service.quota_counter.increment("gnews", period_start, period_end, count=100)
 
         # Act
         result = await gnews_service.get_usage_status()
 
         # Assert
-        assert result == expected_status
-        gnews_service.usage_repo.get_quota_status.assert_called_once_with("gnews")
+        assert result["request_count"] == 100
+        assert result["quota_limit"] == 1000
+        assert result["quota_remaining"] == 900
+        assert result["usage_percentage"] == 10.0
+        assert result["is_exceeded"] is False
 
     @pytest.mark.asyncio
     async def test_set_daily_quota_updates_limit(self, gnews_service):
@@ -13,9 +13,17 @@ from typing import Any, Dict
 from src.services.advanced_filtering import (
     FilterOperator,
     FilterParser,
-    AdvancedFilter
+    AdvancedFilter,
+    CountMode,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    paginate,
+    sort_keys
 )
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
 # Create a test model
@@ -495,6 +503,37 @@ class TestAdvancedFilter:
         )
         assert metadata['pages'] == 10  # Ceiling of 95/10
 
+    def test_apply_pagination_without_count(self, advanced_filter, mock_query):
+        """Test pagination can skip the count query."""
+        result, metadata = advanced_filter.apply_pagination(
+            mock_query, page=2, limit=10, count=CountMode.NONE
+        )
+        assert not mock_query.count.called
+        assert metadata['total'] is None
+        assert metadata['has_prev'] is True
+
+    def test_apply_keyset_pagination_fetches_one_extra_row(self, advanced_filter, mock_query):
+        """Test keyset pagination orders by the sort key and primary key."""
+        result, keys = advanced_filter.apply_keyset_pagination(
+            mock_query, TestModel, sort_by='-created_at', limit=10
+        )
+        assert [(attr.key, descending) for attr, descending in keys] == [
+            ('created_at', True), ('id', True)
+        ]
+        mock_query.limit.assert_called_with(11)
+        assert not mock_query.offset.called
+
+    def test_build_page_encodes_next_cursor(self, advanced_filter):
+        """Test the look-ahead row is trimmed and becomes a cursor."""
+        keys = sort_keys(TestModel, '-created_at')
+        rows = [TestModel(id=i, created_at=datetime(2026, 1, i)) for i in range(1, 4)]
+
+        items, metadata = advanced_filter.build_page(rows, keys, limit=2)
+
+        assert items == rows[:2]
+        assert metadata['has_next'] is True
+        assert decode_cursor(metadata['next_cursor'], keys) == [datetime(2026, 1, 2), 2]
+
     def test_apply_full_text_search_single_field(self, advanced_filter, mock_query):
         """Test full-text search on single field."""
         result = advanced_filter.apply_full_text_search(
@@ -657,3 +696,72 @@ class TestEdgeCases:
         result, metadata = advanced_filter.apply_pagination(mock_query, page=-1)
         # Should handle gracefully
         assert metadata is not None
+
+
+class TestKeysetPagination:
+    """Test suite for cursors, keyset conditions and paginate."""
+
+    def test_cursor_rejects_other_sort_order(self):
+        """Test a cursor only decodes for the sort it was issued for."""
+        row = TestModel(id=7, created_at=datetime(2026, 1, 1))
+        cursor = encode_cursor(row, sort_keys(TestModel, '-created_at'))
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, sort_keys(TestModel, 'created_at'))
+
+    def test_malformed_cursor(self):
+        """Test garbage cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor('not-a-cursor', sort_keys(TestModel))
+
+    def test_non_nullable_keys_use_row_value_comparison(self):
+        """Test uniform non-nullable keys compile to a single tuple comparison."""
+        condition = keyset_condition(sort_keys(TestModel, order='desc'), [5])
+        assert str(condition) == '(test_model.id) < (:param_1)'
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(self):
+        """Test walking cursors visits every row once, in offset order."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            db.add_all([
+                TestModel(
+                    id=i, name=f"user{i}", age=i % 4,
+                    created_at=None if i % 5 == 0 else datetime(2026, 1, 1 + i % 3)
+                )
+                for i in range(1, 51)
+            ])
+            await db.commit()
+
+            for sort in ('-created_at', 'age,-name'):
+                by_offset = []
+                for page in range(1, 8):
+                    items, _ = await paginate(db, select(TestModel), TestModel, sort=sort, page=page, page_size=8)
+                    by_offset += [item.id for item in items]
+
+                by_cursor, cursor = [], None
+                while True:
+                    items, metadata = await paginate(
+                        db, select(TestModel), TestModel, sort=sort,
+                        page_size=8, cursor=cursor, count=CountMode.NONE
+                    )
+                    by_cursor += [item.id for item in items]
+                    cursor = metadata['next_cursor']
+                    if not metadata['has_next']:
+                        break
+
+                assert by_cursor == by_offset
+                assert sorted(by_cursor) == list(range(1, 51))
+
+            items, metadata = await paginate(
+                db, select(TestModel), TestModel, sort='-id', page_size=5,
+                filters={'age__in': '1,2'}
+            )
+            assert metadata['total'] == 26
+            assert metadata['total_is_estimate'] is False
+            assert all(item.age in (1, 2) for item in items)
+
+        await engine.dispose()
@@ -0,0 +1,125 @@
+"""Tests for atomic API quota counters and their database flush."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.api_usage_repository import APIUsageRepository
+from src.services.api_monitoring import APIName, APIUsageTracker
+from src.services.api_monitoring.quota_counter import QuotaCounter, period_bounds
+
+PERIOD = period_bounds("monthly", datetime(2026, 3, 15, 12, 30))
+
+
+@pytest.fixture
+def session():
+    """Create a mock database session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def counter(session):
+    """Create a process-local counter backed by a mock session factory."""
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    return QuotaCounter(session_factory=session_factory)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Replace the repository queries used for seeding and flushing."""
+    totals = AsyncMock(return_value={"request_count": 0, "total_cost": Decimal("0"), "quota_limit": None})
+    deltas = AsyncMock(return_value=1)
+    monkeypatch.setattr(APIUsageRepository, "get_period_totals", totals)
+    monkeypatch.setattr(APIUsageRepository, "apply_usage_deltas", deltas)
+    return totals, deltas
+
+
+def test_period_bounds():
+    assert period_bounds("daily", datetime(2026, 12, 31, 23, 59)) == (
+        datetime(2026, 12, 31), datetime(2027, 1, 1)
+    )
+    assert period_bounds("monthly", datetime(2026, 12, 31, 23, 59)) == (
+        datetime(2026, 12, 1), datetime(2027, 1, 1)
+    )
+
+
+@pytest.mark.asyncio
+class TestQuotaCounter:
+    """Test counting, seeding and flushing."""
+
+    async def test_concurrent_increments_are_not_lost(self, counter, repository):
+        await asyncio.gather(*(
+            counter.increment("gnews", *PERIOD, endpoint="search", cost=Decimal("0.002"))
+            for _ in range(50)
+        ))
+
+        usage = await counter.get_usage("gnews", *PERIOD)
+
+        assert usage["count"] == 50
+        assert usage["cost"] == Decimal("0.1")
+
+    async def test_first_use_seeds_from_database_once(self, counter, repository):
+        totals, _ = repository
+        totals.return_value = {"request_count": 40, "total_cost": Decimal("1.5"), "quota_limit": 100}
+
+        await counter.increment("gnews", *PERIOD)
+        usage = await counter.get_usage("gnews", *PERIOD)
+
+        assert usage == {"count": 41, "cost": Decimal("1.5"), "limit": 100}
+        totals.assert_awaited_once()
+
+    async def test_flush_writes_aggregated_deltas(self, counter, repository):
+        _, deltas = repository
+        for endpoint in ("search", "search", "top-headlines"):
+            await counter.increment("gnews", *PERIOD, endpoint=endpoint, quota_limit=1000)
+
+        assert await counter.flush() == 2
+
+        written = {d["endpoint"]: d for d in deltas.await_args.args[0]}
+        assert written["search"]["count"] == 2
+        assert written["search"]["quota_limit"] == 1000
+        assert written["top-headlines"]["period_start"] == PERIOD[0]
+        assert await counter.flush() == 0
+        assert (await counter.get_usage("gnews", *PERIOD))["count"] == 3
+
+    async def test_failed_flush_keeps_deltas(self, counter, repository):
+        _, deltas = repository
+        await counter.increment("gnews", *PERIOD)
+        deltas.side_effect = RuntimeError("database unavailable")
+
+        assert await counter.flush() == 0
+
+        deltas.side_effect = None
+        assert await counter.flush() == 1
+        assert deltas.await_args.args[0][0]["count"] == 1
+
+    async def test_periods_starting_together_are_counted_separately(self, counter, repository):
+        start = datetime(2026, 3, 1)
+        periods = {name: period_bounds(name, start) for name in ("hourly", "daily", "monthly")}
+
+        for count, name in enumerate(periods, start=1):
+            await counter.increment("gnews", *periods[name], count=count)
+
+        for count, name in enumerate(periods, start=1):
+            assert (await counter.get_usage("gnews", *periods[name]))["count"] == count
+        assert len({counter._bucket_key("gnews", *bounds) for bounds in periods.values()}) == 3
+
+
+@pytest.mark.asyncio
+async def test_tracker_checks_quota_without_database(session, counter, repository):
+    tracker = APIUsageTracker(session, counter=counter)
+
+    for _ in range(100):
+        result = await tracker.track_api_call(APIName.GOOGLE_CUSTOM_SEARCH)
+
+    assert result["quota_status"]["threshold_status"] == "EXCEEDED"
+    assert await tracker.can_make_api_call(APIName.GOOGLE_CUSTOM_SEARCH) is False
+    assert (await tracker.check_quota_status(APIName.GOOGLE_CUSTOM_SEARCH))["estimated_cost"] == 0.5
+    session.execute.assert_not_called()
@@ -0,0 +1,184 @@
+"""Tests for the shared Playwright BrowserPool."""
+
+import asyncio
+from typing import Callable, Dict, List
+
+import pytest
+
+from src.services.web_scraping import BrowserPool, BrowserPoolConfig
+from src.services.web_scraping import browser_pool as browser_pool_module
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright page."""
+
+    def __init__(self, context: 'FakeContext'):
+        self.context = context
+        self.closed = False
+        self.handlers: Dict[str, Callable] = {}
+
+    def on(self, event: str, handler: Callable):
+        self.handlers[event] = handler
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """Minimal stand-in for a Playwright browser context."""
+
+    def __init__(self, browser: 'FakeBrowser'):
+        self.browser = browser
+        self.pages: List[FakePage] = []
+        self.closed = False
+
+    async def new_page(self) -> FakePage:
+        if not self.browser.connected:
+            raise RuntimeError("Target closed")
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Minimal stand-in for a Playwright browser."""
+
+    def __init__(self):
+        self.contexts: List[FakeContext] = []
+        self.connected = True
+        self.handlers: Dict[str, Callable] = {}
+
+    def on(self, event: str, handler: Callable):
+        self.handlers[event] = handler
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self) -> FakeContext:
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+    def crash(self):
+        self.connected = False
+        self.handlers['disconnected'](self)
+
+
+def make_pool(**config) -> tuple:
+    """Build a pool that launches fake browsers."""
+    pool = BrowserPool(BrowserPoolConfig(**config))
+    browsers: List[FakeBrowser] = []
+
+    async def launch():
+        browser = FakeBrowser()
+        browsers.append(browser)
+        return browser
+
+    pool._launch_browser = launch
+    return pool, browsers
+
+
+@pytest.mark.asyncio
+class TestBrowserPool:
+    """Test page limits, recycling and crash recovery of BrowserPool."""
+
+    async def test_shares_contexts_up_to_page_limit(self):
+        pool, browsers = make_pool(max_contexts=2, max_pages_per_context=2)
+        release = asyncio.Event()
+        opened: List[FakePage] = []
+
+        async def borrow():
+            async with pool.page() as page:
+                opened.append(page)
+                await release.wait()
+
+        tasks = [asyncio.create_task(borrow()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert len(browsers) == 1
+        assert len(browsers[0].contexts) == 2
+        assert pool.stats()['active_pages'] == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert all(page.closed for page in opened)
+
+    async def test_queues_scrapes_when_saturated(self):
+        pool, _ = make_pool(max_contexts=1, max_pages_per_context=2)
+        active = 0
+        max_active = 0
+
+        async def borrow():
+            nonlocal active, max_active
+            async with pool.page():
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(borrow() for _ in range(6)))
+
+        assert max_active == 2
+        assert pool.stats()['waiting'] == 0
+
+    async def test_recycles_context_after_max_navigations(self):
+        pool, browsers = make_pool(max_navigations_per_context=2)
+
+        for _ in range(3):
+            async with pool.page():
+                pass
+
+        first, second = browsers[0].contexts
+        assert first.closed
+        assert len(first.pages) == 2
+        assert not second.closed
+
+    async def test_retires_context_when_page_crashes(self):
+        pool, browsers = make_pool()
+
+        async with pool.page() as page:
+            page.handlers['crash'](page)
+
+        async with pool.page():
+            pass
+
+        assert browsers[0].contexts[0].closed
+        assert len(browsers[0].contexts) == 2
+
+    async def test_relaunches_crashed_browser(self):
+        pool, browsers = make_pool()
+
+        async with pool.page():
+            pass
+        browsers[0].crash()
+
+        async with pool.page() as page:
+            assert page.context.browser is browsers[1]
+
+    async def test_restarts_browser_over_rss_limit(self, monkeypatch):
+        pool, browsers = make_pool(max_rss_mb=100, rss_check_interval=1)
+        monkeypatch.setattr(browser_pool_module, '_browser_rss_mb', lambda: 250.0)
+
+        async with pool.page():
+            pass
+        async with pool.page():
+            pass
+
+        assert len(browsers) == 2
+        assert not browsers[0].connected
+
+    async def test_close_shuts_down_browser(self):
+        pool, browsers = make_pool()
+
+        async with pool.page():
+            pass
+        await pool.close()
+
+        assert not browsers[0].connected
+        assert pool.stats()['browser_running'] is False
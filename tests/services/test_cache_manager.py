@@ -0,0 +1,149 @@
+"""Tests for batched CacheManager operations."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.caching import cache_manager as cache_manager_module
+from src.services.caching.cache_manager import CacheManager
+
+
+@pytest.fixture(autouse=True)
+def cache_settings(monkeypatch):
+    """Provide cache settings without connecting to Redis."""
+    monkeypatch.setattr(cache_manager_module, 'settings', SimpleNamespace(
+        CACHE_ENABLED=False,
+        CACHE_TTL_SERP_RESULTS=86400,
+        CACHE_TTL_KEYWORD_DATA=604800
+    ))
+
+
+@pytest.fixture
+def memory_cache():
+    """Create a cache manager using the in-memory fallback."""
+    manager = CacheManager(namespace="test")
+    manager.redis_client = None
+    return manager
+
+
+@pytest.fixture
+def redis_cache():
+    """Create a cache manager with a mocked Redis client."""
+    manager = CacheManager(namespace="test")
+    client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    client.pipeline.return_value = pipe
+    client.mget = AsyncMock()
+    client.get = AsyncMock()
+    client.delete = AsyncMock()
+    manager.redis_client = client
+    manager.pipe = pipe
+    return manager
+
+
+@pytest.mark.asyncio
+class TestMemoryBatchOperations:
+    """Test batch operations against the in-memory fallback."""
+
+    async def test_set_many_then_get_many(self, memory_cache):
+        assert await memory_cache.set_many({"a": 1, "b": {"x": 2}}, ttl=60)
+
+        found = await memory_cache.get_many(["a", "b", "c"])
+
+        assert found == {"a": 1, "b": {"x": 2}}
+        assert memory_cache.stats["sets"] == 2
+        assert memory_cache.stats["hits"] == 2
+        assert memory_cache.stats["misses"] == 1
+
+    async def test_get_many_matches_get(self, memory_cache):
+        await memory_cache.set_many({"a": 1}, category="c")
+
+        assert await memory_cache.get("a", category="c") == 1
+        assert await memory_cache.get_many(["a"], category="c") == {"a": 1}
+
+    async def test_expired_entries_are_misses(self, memory_cache):
+        await memory_cache.set_many({"a": 1}, ttl=-1)
+
+        assert await memory_cache.get_many(["a"]) == {}
+
+    async def test_delete_many(self, memory_cache):
+        await memory_cache.set_many({"a": 1, "b": 2})
+
+        assert await memory_cache.delete_many(["a", "b", "c"]) == 2
+        assert await memory_cache.delete_many([]) == 0
+        assert await memory_cache.get_many(["a", "b"]) == {}
+
+    async def test_serp_helpers_round_trip(self, memory_cache):
+        await memory_cache.cache_serp_results_many({"seo": {"organic_results": [1]}})
+
+        assert await memory_cache.get_cached_serp_results("seo") == {"organic_results": [1]}
+        assert await memory_cache.get_cached_serp_results_many(["seo", "ppc"]) == {
+            "seo": {"organic_results": [1]}
+        }
+
+    async def test_warm_cache_fetches_only_missing_keywords(self, memory_cache):
+        await memory_cache.cache_serp_results("cached", {"r": 0})
+        fetch = AsyncMock(side_effect=lambda keyword: {"r": keyword} if keyword != "empty" else None)
+
+        results = await memory_cache.warm_cache_for_keywords(["cached", "new", "empty"], fetch)
+
+        assert results == {"cached": True, "new": True, "empty": False}
+        assert [call.args[0] for call in fetch.await_args_list] == ["new", "empty"]
+        assert await memory_cache.get_cached_serp_results("new") == {"r": "new"}
+
+
+@pytest.mark.asyncio
+class TestRedisBatchOperations:
+    """Test that batch operations use one round trip against Redis."""
+
+    async def test_get_many_uses_mget(self, redis_cache):
+        redis_cache.redis_client.mget.return_value = [json.dumps({"v": 1}).encode(), None]
+
+        found = await redis_cache.get_many(["a", "b"])
+
+        assert found == {"a": {"v": 1}}
+        redis_cache.redis_client.mget.assert_awaited_once_with(["test:a", "test:b"])
+        assert redis_cache.stats["hits"] == 1
+        assert redis_cache.stats["misses"] == 1
+
+    async def test_set_many_uses_pipeline(self, redis_cache):
+        assert await redis_cache.set_many({"a": 1, "b": 2}, ttl=30)
+
+        redis_cache.redis_client.pipeline.assert_called_once_with(transaction=False)
+        assert redis_cache.pipe.setex.call_count == 2
+        redis_cache.pipe.execute.assert_awaited_once()
+        assert redis_cache.stats["sets"] == 2
+
+    async def test_warm_cache_round_trips(self, redis_cache):
+        redis_cache.redis_client.mget.return_value = [None] * 1000
+        fetch = AsyncMock(return_value={"organic_results": []})
+
+        await redis_cache.warm_cache_for_keywords([f"kw{i}" for i in range(1000)], fetch)
+
+        redis_cache.redis_client.mget.assert_awaited_once()
+        redis_cache.redis_client.get.assert_not_awaited()
+        redis_cache.pipe.execute.assert_awaited_once()
+
+    async def test_near_cache_hands_out_copies(self, redis_cache):
+        await redis_cache.set("serp", {"results": [1]}, ttl=600)
+
+        (await redis_cache.get("serp"))["results"].append(2)
+
+        assert await redis_cache.get("serp") == {"results": [1]}
+        redis_cache.redis_client.get.assert_not_awaited()
+
+    async def test_invalidation_thread_uses_a_sync_client(self, redis_cache, monkeypatch):
+        sync_redis = MagicMock()
+        monkeypatch.setattr(cache_manager_module, 'SyncRedis', sync_redis)
+        redis_cache.redis_url = "redis://cache:6379/0"
+        redis_cache.local_cache.start_invalidation_thread = MagicMock()
+
+        redis_cache.start_invalidation_thread()
+
+        sync_redis.from_url.assert_called_once_with("redis://cache:6379/0")
+        redis_cache.local_cache.start_invalidation_thread.assert_called_once_with(sync_redis.from_url.return_value)
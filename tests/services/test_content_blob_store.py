@@ -0,0 +1,149 @@
+"""Tests for content-addressed blob storage of scraped content."""
+
+import hashlib
+import io
+import zlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+from sqlalchemy.dialects import postgresql
+
+from src.services.content_blob_store import (
+    ContentBlobStore,
+    compute_perceptual_hash,
+    hamming_distance,
+)
+from src.services.storage_service import StorageService
+
+
+def make_png(invert: bool = False, marker: int = 0) -> bytes:
+    """Render a small gradient PNG, optionally with a one-pixel marker."""
+    image = Image.new('L', (64, 64))
+    image.putdata([255 - x * 4 if invert else x * 4 for y in range(64) for x in range(64)])
+    if marker:
+        image.putpixel((marker, marker), 255)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def storage():
+    """Create an in-memory stand-in for the MinIO storage service."""
+    objects = {}
+    service = MagicMock(spec=StorageService)
+
+    def upload_file(bucket_name, object_name, file_data, length, content_type):
+        objects[(bucket_name, object_name)] = file_data.read()
+        return {"url": f"/{bucket_name}/{object_name}"}
+
+    def download_file(bucket_name, object_name):
+        return objects[(bucket_name, object_name)]
+
+    service.upload_file.side_effect = upload_file
+    service.download_file.side_effect = download_file
+    service.objects = objects
+    return service
+
+
+@pytest.fixture
+def db():
+    """Create a session mock backed by a dict of blobs.
+
+    Inserts keep the first row stored for a hash, as ON CONFLICT DO NOTHING does.
+    """
+    blobs = {}
+    session = MagicMock()
+
+    def execute(statement):
+        values = statement.compile(dialect=postgresql.dialect()).params
+        blobs.setdefault(values["content_hash"], SimpleNamespace(**values))
+
+    session.execute.side_effect = execute
+    session.blobs = blobs
+    return session
+
+
+@pytest.fixture
+def store(storage, db, monkeypatch):
+    """Create a blob store whose lookups go through the fake session."""
+    blob_store = ContentBlobStore(storage)
+    monkeypatch.setattr(blob_store, 'find', lambda session, content_hash: db.blobs.get(content_hash))
+    return blob_store
+
+
+@pytest.mark.asyncio
+class TestContentBlobStore:
+    """Test deduplication and compression of content blobs."""
+
+    async def test_put_text_round_trips_compressed(self, store, db, storage):
+        html = "<html><body>" + "repeated content " * 200 + "</body></html>"
+
+        blob = await store.put_text(db, html, 'html')
+
+        assert blob.content_hash == hashlib.sha256(html.encode('utf-8')).hexdigest()
+        assert blob.stored_size_bytes < blob.size_bytes
+        assert await store.read_text(blob) == html
+
+    async def test_identical_content_is_stored_once(self, store, db, storage):
+        first = await store.put_text(db, "same text", 'text')
+        second = await store.put_text(db, "same text", 'text')
+
+        assert second is first
+        assert storage.upload_file.call_count == 1
+
+    async def test_concurrently_stored_blob_is_kept(self, store, db, storage):
+        data = b"stored by two workers"
+        winner = SimpleNamespace(content_hash=hashlib.sha256(data).hexdigest())
+        upload = storage.upload_file.side_effect
+
+        def upload_while_another_worker_inserts(**kwargs):
+            db.blobs.setdefault(winner.content_hash, winner)
+            return upload(**kwargs)
+
+        storage.upload_file.side_effect = upload_while_another_worker_inserts
+
+        assert await store.put(db, data, 'text') is winner
+
+    async def test_get_text_unknown_hash_returns_none(self, store, db):
+        assert await store.get_text(db, None) is None
+        assert await store.get_text(db, "0" * 64) is None
+
+    async def test_perceptually_identical_screenshot_reuses_previous(self, store, db, storage):
+        first = await store.put_screenshot(db, make_png())
+        second = await store.put_screenshot(
+            db, make_png(marker=10), previous_hash=first.content_hash
+        )
+
+        assert second is first
+        assert storage.upload_file.call_count == 1
+
+    async def test_different_screenshot_is_stored(self, store, db, storage):
+        first = await store.put_screenshot(db, make_png())
+        second = await store.put_screenshot(
+            db, make_png(invert=True), previous_hash=first.content_hash
+        )
+
+        assert second is not first
+        assert second.kind == 'screenshot'
+        assert storage.upload_file.call_count == 2
+
+
+class TestPerceptualHash:
+    """Test the dHash helpers."""
+
+    def test_hash_is_stable(self):
+        assert compute_perceptual_hash(make_png()) == compute_perceptual_hash(make_png())
+
+    def test_invalid_image_returns_none(self):
+        assert compute_perceptual_hash(b"not an image") is None
+
+    def test_hamming_distance(self):
+        assert hamming_distance("ff", "0f") == 4
+        assert hamming_distance("abcd", "abcd") == 0
+
+    def test_legacy_zlib_blobs_are_readable(self):
+        data = zlib.compress(b"legacy")
+        assert ContentBlobStore._decompress(data, "zlib") == b"legacy"
@@ -0,0 +1,104 @@
+"""Tests for the staged content diff engine."""
+
+import difflib
+
+import pytest
+
+from src.services import content_diff
+from src.services.content_diff import ContentDiff, compute_content_diff, diff_content
+
+
+def reference_diff(old_text: str, new_text: str):
+    """Full-text diff as previously computed by WebScrapingService."""
+    lines = list(difflib.unified_diff(
+        old_text.splitlines(), new_text.splitlines(), lineterm='', n=0
+    ))
+    additions = sum(1 for line in lines if line.startswith('+') and not line.startswith('+++'))
+    deletions = sum(1 for line in lines if line.startswith('-') and not line.startswith('---'))
+    ratio = difflib.SequenceMatcher(None, old_text, new_text).ratio()
+    return lines, additions, deletions, ratio
+
+
+OLD_PAGE = "\n".join([
+    "Welcome to Example",
+    "Our products",
+    "We build fast widgets for every team.",
+    "Pricing starts at $10 per month.",
+    "Contact us at sales@example.com",
+])
+
+NEW_PAGE = "\n".join([
+    "Welcome to Example",
+    "Our products",
+    "We build fast and reliable widgets for every team.",
+    "Pricing starts at $12 per month.",
+    "Now hiring engineers",
+    "Contact us at sales@example.com",
+])
+
+
+class TestComputeContentDiff:
+    """Test compute_content_diff against the full-text difflib baseline."""
+
+    def test_identical_text(self):
+        diff = compute_content_diff("same\ntext", "same\ntext")
+
+        assert diff.similarity == 1.0
+        assert diff.additions == diff.deletions == 0
+        assert diff.sample_diff == []
+
+    def test_matches_unified_diff_counts_and_sample(self):
+        lines, additions, deletions, _ = reference_diff(OLD_PAGE, NEW_PAGE)
+
+        diff = compute_content_diff(OLD_PAGE, NEW_PAGE)
+
+        assert diff.additions == additions
+        assert diff.deletions == deletions
+        assert diff.sample_diff == lines[:50]
+
+    def test_similarity_close_to_full_text_ratio(self):
+        _, _, _, ratio = reference_diff(OLD_PAGE, NEW_PAGE)
+
+        diff = compute_content_diff(OLD_PAGE, NEW_PAGE)
+
+        assert diff.similarity == pytest.approx(ratio, abs=0.05)
+
+    def test_large_changed_block_uses_token_diff(self):
+        old_text = "intro\n" + " ".join(f"word{i}" for i in range(1000))
+        new_text = "intro\n" + " ".join(f"word{i}" for i in range(1000) if i % 10)
+
+        diff = compute_content_diff(old_text, new_text)
+
+        assert 0.8 < diff.similarity < 1.0
+        assert diff.additions == diff.deletions == 1
+
+    def test_sample_is_truncated(self):
+        old_text = "\n".join(f"line {i}" for i in range(200))
+        new_text = "\n".join(f"changed {i}" for i in range(200))
+
+        diff = compute_content_diff(old_text, new_text, max_sample_lines=50)
+
+        assert len(diff.sample_diff) == 50
+        assert diff.additions == diff.deletions == 200
+
+    def test_change_percentage(self):
+        assert ContentDiff(0, 0, 0.75, 1, 1).change_percentage == pytest.approx(25.0)
+
+
+@pytest.mark.asyncio
+class TestDiffContent:
+    """Test async offloading of large diffs."""
+
+    async def test_small_diff_runs_inline(self):
+        diff = await diff_content(OLD_PAGE, NEW_PAGE)
+
+        assert diff == compute_content_diff(OLD_PAGE, NEW_PAGE)
+
+    async def test_large_diff_runs_in_worker_pool(self, monkeypatch):
+        monkeypatch.setattr(content_diff, 'INLINE_DIFF_MAX_CHARS', 10)
+        try:
+            diff = await diff_content(OLD_PAGE, NEW_PAGE)
+        finally:
+            content_diff.shutdown_diff_executor()
+
+        assert diff == compute_content_diff(OLD_PAGE, NEW_PAGE)
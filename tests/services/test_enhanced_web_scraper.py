@@ -26,6 +26,8 @@ from src.services.web_scraping import (
     ScrapingError,
     RobotsDisallowedError,
     CircuitBreakerState,
+    PolitenessService,
+    BrowserPool,
 )
 
 
@@ -48,7 +50,11 @@ def scraping_config():
 @pytest.fixture
 async def scraper_service(scraping_config):
     """Create EnhancedWebScrapingService instance."""
-    service = EnhancedWebScrapingService(config=scraping_config)
+    service = EnhancedWebScrapingService(
+        config=scraping_config,
+        politeness=PolitenessService(),
+        browser_pool=BrowserPool()
+    )
     yield service
     await service.close()
 
@@ -86,35 +92,37 @@ class TestBasicScraping:
     @pytest.mark.asyncio
     async def test_scrape_with_javascript_success(self, scraper_service, mock_html_response):
         """Test successful JavaScript-based scraping."""
-        with patch('src.services.web_scraping.enhanced_scraper.async_playwright') as mock_playwright:
-            # Mock Playwright components
-            mock_page = AsyncMock()
-            mock_page.goto = AsyncMock(return_value=AsyncMock(status=200))
-            mock_page.title = AsyncMock(return_value="Test Page")
-            mock_page.content = AsyncMock(return_value=mock_html_response)
-            mock_page.evaluate = AsyncMock(side_effect=[
-                "Test content text",  # text content
-                "Test description",   # meta description
-                "",                   # meta keywords
-                {                     # headings
-                    'h1': ['Main Heading'],
-                    'h2': ['Subheading 1', 'Subheading 2'],
-                    'h3': [], 'h4': [], 'h5': [], 'h6': []
-                },
-                ['https://example.com/page1', 'https://example.com/page2'],  # links
-                ['https://example.com/image1.jpg'],  # images
-            ])
-            mock_page.close = AsyncMock()
-            mock_page.set_extra_http_headers = AsyncMock()
-
-            mock_browser = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-
-            mock_pw = AsyncMock()
-            mock_pw.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__ = AsyncMock(return_value=mock_pw)
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
-
+        mock_page = AsyncMock()
+        mock_page.goto = AsyncMock(return_value=AsyncMock(status=200))
+        mock_page.evaluate = AsyncMock(return_value={
+            'html': mock_html_response,
+            'title': 'Test Page',
+            'text': 'Test content text',
+            'metaDescription': 'Test description',
+            'metaKeywords': None,
+            'headings': {
+                'h1': ['Main Heading'],
+                'h2': ['Subheading 1', 'Subheading 2'],
+                'h3': [], 'h4': [], 'h5': [], 'h6': []
+            },
+            'links': ['https://example.com/page1', 'https://example.com/page2'],
+            'images': ['https://example.com/image1.jpg'],
+        })
+        mock_page.close = AsyncMock()
+        mock_page.set_extra_http_headers = AsyncMock()
+        mock_page.on = MagicMock()
+
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+
+        mock_browser = AsyncMock()
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+        mock_browser.on = MagicMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+
+        with patch.object(
+            scraper_service.browser_pool, '_launch_browser', AsyncMock(return_value=mock_browser)
+        ):
             # Perform scraping
             result = await scraper_service.scrape_with_javascript("https://example.com")
 
@@ -126,6 +134,8 @@ class TestBasicScraping:
             assert result.is_javascript_rendered is True
             assert result.error is None
             assert len(result.headings['h2']) == 2
+            mock_page.evaluate.assert_awaited_once()
+            mock_page.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_scrape_with_robots_disallowed(self, scraping_config):
@@ -455,22 +465,24 @@ class TestRateLimiting:
         """Test that robots.txt responses are cached."""
         domain = "example.com"
 
-        with patch.object(scraper_service, 'session', new_callable=AsyncMock) as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.text = AsyncMock(return_value="User-agent: *\nDisallow:")
-            mock_session.get = AsyncMock(return_value=mock_response)
-            mock_session.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_session.__aexit__ = AsyncMock()
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="User-agent: *\nDisallow:")
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+        scraper_service.session = mock_session
 
-            # First call - should fetch
-            await scraper_service._get_robots_parser(domain)
+        # First call - should fetch
+        first = await scraper_service._get_robots_parser(domain)
 
-            # Second call - should use cache
-            await scraper_service._get_robots_parser(domain)
+        # Second call - should use cache
+        second = await scraper_service._get_robots_parser(domain)
 
-            # Should only have called once (cached second time)
-            assert domain in scraper_service.robots_cache
+        # Should only have called once (cached second time)
+        assert mock_session.get.call_count == 1
+        assert first is second
 
 
 class TestErrorHandling:
@@ -479,7 +491,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_scrape_returns_error_on_failure(self, scraper_service):
         """Test that scraping failures return error information."""
-        with patch.object(scraper_service, '_ensure_browser', side_effect=Exception("Browser error")):
+        with patch.object(scraper_service.browser_pool, '_launch_browser', side_effect=Exception("Browser error")):
             result = await scraper_service.scrape_with_javascript("https://example.com")
 
             assert isinstance(result, ScrapedPage)
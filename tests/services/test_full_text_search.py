@@ -0,0 +1,146 @@
+"""
+Unit tests for the full-text search expressions.
+
+Covers the PostgreSQL compilation that the GIN indexes rely on, and the
+substring fallback used on other dialects.
+"""
+import importlib.util
+import re
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, String, column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+
+from src.services.advanced_filtering import AdvancedFilter, FilterParser
+from src.services.full_text_search import (
+    SEARCH_CONFIG,
+    SEARCH_FIELDS,
+    search_columns,
+    search_document,
+    text_match,
+    text_rank
+)
+
+MIGRATION = Path(__file__).parents[2] / "alembic" / "versions" / "20261017_add_full_text_search_indexes.py"
+
+Base = declarative_base()
+
+
+class SearchCompetitor(Base):
+    """Stand-in for Competitor with the same table and search columns."""
+    __tablename__ = 'competitors'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100))
+    description = Column(String(500))
+
+
+def compile_postgresql(clause) -> str:
+    """Compile a clause for PostgreSQL with literal parameters."""
+    return str(clause.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    ))
+
+
+def load_migration():
+    """Import the migration that creates the search indexes."""
+    spec = importlib.util.spec_from_file_location("full_text_search_indexes", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def expression_tokens(sql: str) -> str:
+    """Drop whitespace and grouping parentheses, which do not change the expression."""
+    return re.sub(r"[\s()]", "", sql)
+
+
+def test_queries_match_index_expressions():
+    """Test each searched table's document is exactly its index expression."""
+    migration = load_migration()
+    indexed = {table: document for table, document in migration.SEARCH_DOCUMENTS.values()}
+
+    assert set(indexed) == set(SEARCH_FIELDS)
+    for table, fields in SEARCH_FIELDS.items():
+        index_expression = f"to_tsvector('{migration.SEARCH_CONFIG}', {indexed[table]})"
+        query_expression = compile_postgresql(search_document([column(field) for field in fields]))
+        assert expression_tokens(query_expression) == expression_tokens(index_expression)
+    assert migration.SEARCH_CONFIG == SEARCH_CONFIG
+
+
+class TestPostgreSQLCompilation:
+    """Test the expressions match the index definitions."""
+
+    def test_match_uses_index_document(self):
+        """Test text_match compiles to the indexed tsvector expression."""
+        sql = compile_postgresql(text_match("cloud storage", *search_columns(SearchCompetitor)))
+        # (a || ' ') || b parses the same as the index's a || ' ' || b
+        assert sql == (
+            "(to_tsvector('english', (coalesce(competitors.name, '') || ' ') "
+            "|| coalesce(competitors.description, '')) "
+            "@@ websearch_to_tsquery('english', 'cloud storage'))"
+        )
+
+    def test_multiple_terms_match_any(self):
+        """Test a list of terms is ORed into one tsquery."""
+        sql = compile_postgresql(text_match(["cloud", "storage"], SearchCompetitor.name))
+        assert (
+            "websearch_to_tsquery('english', 'cloud') || "
+            "websearch_to_tsquery('english', 'storage')"
+        ) in sql
+
+    def test_rank(self):
+        """Test text_rank compiles to ts_rank_cd over the same document."""
+        sql = compile_postgresql(text_rank("cloud", *search_columns(SearchCompetitor)))
+        assert sql.startswith("ts_rank_cd(to_tsvector('english', (coalesce(competitors.name, '')")
+
+    def test_search_terms_are_bound(self):
+        """Test search terms are sent as parameters, not inlined."""
+        stmt = select(SearchCompetitor).where(text_match("x'; drop", SearchCompetitor.name))
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "drop" not in str(compiled)
+        assert "x'; drop" in compiled.params.values()
+
+
+class TestSearchFilters:
+    """Test search through AdvancedFilter and the search operator."""
+
+    def test_search_operator_keeps_raw_value(self):
+        """Test field__search values are not coerced."""
+        assert FilterParser().parse_filter("name__search", "2024") == ("name", "search", "2024")
+
+    @pytest.mark.asyncio
+    async def test_fallback_matches_any_term_case_insensitively(self):
+        """Test the non-PostgreSQL fallback matches substrings of any term."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            db.add_all([
+                SearchCompetitor(id=1, name="Acme Cloud", description=None),
+                SearchCompetitor(id=2, name="Initech", description="Storage appliances"),
+                SearchCompetitor(id=3, name="Globex", description="Consulting"),
+            ])
+            await db.commit()
+
+            stmt = AdvancedFilter().apply_full_text_search(
+                select(SearchCompetitor), SearchCompetitor,
+                "cloud", ["name", "description"], rank=True
+            )
+            assert [c.id for c in (await db.execute(stmt)).scalars()] == [1]
+
+            stmt = select(SearchCompetitor).where(
+                text_match(["CLOUD", "storage"], *search_columns(SearchCompetitor))
+            ).order_by(SearchCompetitor.id)
+            assert [c.id for c in (await db.execute(stmt)).scalars()] == [1, 2]
+
+            stmt = AdvancedFilter().apply_filters(
+                select(SearchCompetitor), SearchCompetitor, {"description__search": "consult"}
+            )
+            assert [c.id for c in (await db.execute(stmt)).scalars()] == [3]
+
+        await engine.dispose()
@@ -5,13 +5,41 @@ This module provides extensive test coverage for link deduplication functionalit
 including URL normalization, similarity detection, fuzzy matching, merging,
 and batch scanning capabilities.
 """
+import hashlib
 import pytest
 from unittest.mock import MagicMock, Mock
 from datetime import datetime
+from types import SimpleNamespace
 from typing import List
 
-from src.services.link_deduplication_service import LinkDeduplicationService
+from src.services.link_deduplication_service import LinkDeduplicationService, MinHashLSH
 from src.models.link import Link
+from src.utils.url_normalization import normalize_url, url_host
+
+SLUGS = [hashlib.md5(str(i).encode()).hexdigest()[:12] for i in range(150)]
+
+
+def make_link(link_id, url, discovered_at=datetime(2024, 1, 1)):
+    """Create a mock Link."""
+    return Mock(spec=Link, id=link_id, url=url, discovered_at=discovered_at, title=None)
+
+
+def stream_links(mock_db, links):
+    """Serve links as streamed rows in host order and as loaded Link objects."""
+    rows = []
+    for link in links:
+        normalized = normalize_url(link.url)
+        rows.append(SimpleNamespace(
+            id=link.id,
+            url=link.url,
+            normalized_url=normalized,
+            host=url_host(normalized),
+            discovered_at=link.discovered_at
+        ))
+    mock_db.yield_per.return_value = sorted(rows, key=lambda row: (row.host, row.id))
+    mock_db.all.side_effect = lambda: [
+        link for link in links if link.id in set(mock_db.filter.call_args.args[0].right.value)
+    ]
 
 
 @pytest.fixture
@@ -27,6 +55,7 @@ def mock_db():
     mock.query = MagicMock(return_value=mock)
     mock.filter = MagicMock(return_value=mock)
     mock.order_by = MagicMock(return_value=mock)
+    mock.yield_per = MagicMock(return_value=[])
     mock.first = MagicMock(return_value=None)
     mock.all = MagicMock(return_value=[])
     mock.in_ = MagicMock(return_value=mock)
@@ -193,7 +222,7 @@ class TestFindDuplicatesForURL:
         """Test finding duplicates when no candidates exist."""
         # Arrange
         url = "https://example.com/page"
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        stream_links(mock_db, [])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -208,8 +237,7 @@ class TestFindDuplicatesForURL:
         """Test exact match is excluded from duplicates."""
         # Arrange
         url = "https://example.com/page"
-        link = Mock(spec=Link, url=url)
-        mock_db.query.return_value.filter.return_value.all.return_value = [link]
+        stream_links(mock_db, [make_link(1, url)])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -224,11 +252,8 @@ class TestFindDuplicatesForURL:
         """Test finding similar URLs."""
         # Arrange
         url = "https://example.com/products/item-1"
-        similar_link = Mock(
-            spec=Link,
-            url="https://www.example.com/products/item-1?utm_source=fb"
-        )
-        mock_db.query.return_value.filter.return_value.all.return_value = [similar_link]
+        similar_link = make_link(1, "https://www.example.com/products/item-1?utm_source=fb")
+        stream_links(mock_db, [similar_link])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -245,11 +270,7 @@ class TestFindDuplicatesForURL:
         """Test URLs below threshold are excluded."""
         # Arrange
         url = "https://example.com/products"
-        dissimilar_link = Mock(
-            spec=Link,
-            url="https://example.com/about"
-        )
-        mock_db.query.return_value.filter.return_value.all.return_value = [dissimilar_link]
+        stream_links(mock_db, [make_link(1, "https://example.com/about")])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -264,11 +285,11 @@ class TestFindDuplicatesForURL:
         """Test results are sorted by similarity score."""
         # Arrange
         url = "https://example.com/products/item1"
-        link1 = Mock(spec=Link, url="https://example.com/products/item2")
-        link2 = Mock(spec=Link, url="https://example.com/products/item1-new")
-        link3 = Mock(spec=Link, url="https://example.com/products/item11")
-
-        mock_db.query.return_value.filter.return_value.all.return_value = [link1, link2, link3]
+        stream_links(mock_db, [
+            make_link(1, "https://example.com/products/item2"),
+            make_link(2, "https://example.com/products/item1-new"),
+            make_link(3, "https://example.com/products/item11"),
+        ])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -278,9 +299,27 @@ class TestFindDuplicatesForURL:
         )
 
         # Assert - should be sorted by similarity descending
-        if len(results) > 1:
-            for i in range(len(results) - 1):
-                assert results[i][1] >= results[i + 1][1]
+        assert len(results) == 3
+        for i in range(len(results) - 1):
+            assert results[i][1] >= results[i + 1][1]
+
+    def test_find_duplicates_blocks_by_host_and_path_prefix(self, dedup_service, mock_db):
+        """Test candidates are read by host and path prefix, not a wildcard scan."""
+        # Act
+        dedup_service.find_duplicates_for_url(
+            db=mock_db,
+            url="https://www.Example.com/blog/2024/post?utm_source=x"
+        )
+
+        # Assert
+        criteria = " ".join(
+            str(c.compile(compile_kwargs={"literal_binds": True}))
+            for c in mock_db.filter.call_args.args
+        )
+        assert "links.host = 'example.com'" in criteria
+        # autoescape escapes "/" as "//"
+        assert "LIKE 'https:////example.com//blog//2024//' || '%'" in criteria
+        assert "'%example.com%'" not in criteria
 
     def test_find_duplicates_with_company_filter(self, dedup_service, mock_db):
         """Test filtering by company_id."""
@@ -296,17 +335,17 @@ class TestFindDuplicatesForURL:
         )
 
         # Assert
-        mock_db.query.return_value.filter.assert_called()
+        assert mock_db.filter.call_count == 2
+        assert "domains.company_id" in str(mock_db.filter.call_args.args[0])
 
     def test_find_duplicates_respects_limit(self, dedup_service, mock_db):
         """Test limit parameter is respected."""
         # Arrange
         url = "https://example.com/products/item1"
-        links = [
-            Mock(spec=Link, url=f"https://example.com/products/item{i}")
+        stream_links(mock_db, [
+            make_link(i, f"https://example.com/products/item{i}")
             for i in range(2, 12)  # 10 similar links
-        ]
-        mock_db.query.return_value.filter.return_value.all.return_value = links
+        ])
 
         # Act
         results = dedup_service.find_duplicates_for_url(
@@ -316,7 +355,7 @@ class TestFindDuplicatesForURL:
         )
 
         # Assert
-        assert len(results) <= 5
+        assert len(results) == 5
 
 
 class TestFindAllDuplicates:
@@ -325,7 +364,7 @@ class TestFindAllDuplicates:
     def test_find_all_duplicates_empty_database(self, dedup_service, mock_db):
         """Test finding duplicates in empty database."""
         # Arrange
-        mock_db.query.return_value.all.return_value = []
+        stream_links(mock_db, [])
 
         # Act
         results = dedup_service.find_all_duplicates(db=mock_db)
@@ -336,42 +375,39 @@ class TestFindAllDuplicates:
     def test_find_all_duplicates_no_duplicates(self, dedup_service, mock_db):
         """Test finding duplicates when all URLs are unique."""
         # Arrange
-        links = [
-            Mock(spec=Link, url="https://example.com/page1", created_at=datetime(2024, 1, 1)),
-            Mock(spec=Link, url="https://example.com/page2", created_at=datetime(2024, 1, 2)),
-            Mock(spec=Link, url="https://example.com/page3", created_at=datetime(2024, 1, 3)),
-        ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
+        stream_links(mock_db, [
+            make_link(1, "https://example.com/about"),
+            make_link(2, "https://example.com/pricing"),
+            make_link(3, "https://other.com/about"),
+        ])
 
         # Act
         results = dedup_service.find_all_duplicates(db=mock_db)
 
-        # Assert - may have fuzzy matches or no results
-        assert isinstance(results, list)
+        # Assert
+        assert results == []
 
     def test_find_all_duplicates_exact_duplicates(self, dedup_service, mock_db):
         """Test finding exact duplicates after normalization."""
         # Arrange
         links = [
-            Mock(spec=Link, url="https://example.com/page", created_at=datetime(2024, 1, 1)),
-            Mock(spec=Link, url="https://www.example.com/page/", created_at=datetime(2024, 1, 2)),
-            Mock(spec=Link, url="https://example.com/page?utm_source=fb", created_at=datetime(2024, 1, 3)),
+            make_link(1, "https://example.com/page", datetime(2024, 1, 1)),
+            make_link(2, "https://www.example.com/page/", datetime(2024, 1, 2)),
+            make_link(3, "https://example.com/page?utm_source=fb", datetime(2024, 1, 3)),
         ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
+        stream_links(mock_db, links)
 
         # Act
         results = dedup_service.find_all_duplicates(db=mock_db)
 
         # Assert
-        assert len(results) > 0
-        # First group should have the exact duplicates
-        if results:
-            group = results[0]
-            assert 'canonical' in group
-            assert 'duplicates' in group
-            assert group['count'] >= 2
+        assert len(results) == 1
+        group = results[0]
+        assert group['canonical'] == links[0]
+        assert group['duplicates'] == links[1:]
+        assert group['count'] == 3
+        assert group['similarity'] == 1.0
+        assert 'fuzzy' not in group
 
     def test_find_all_duplicates_canonical_is_oldest(self, dedup_service, mock_db):
         """Test canonical link is the oldest one."""
@@ -379,36 +415,87 @@ class TestFindAllDuplicates:
         old_date = datetime(2024, 1, 1)
         new_date = datetime(2024, 1, 2)
 
+        stream_links(mock_db, [
+            make_link(1, "https://example.com/page", new_date),
+            make_link(2, "https://www.example.com/page/", old_date),
+        ])
+
+        # Act
+        results = dedup_service.find_all_duplicates(db=mock_db)
+
+        # Assert
+        assert results[0]['canonical'].discovered_at == old_date
+
+    def test_find_all_duplicates_fuzzy_group_absorbs_exact_duplicates(self, dedup_service, mock_db):
+        """Test each link lands in a single group."""
+        # Arrange
         links = [
-            Mock(spec=Link, url="https://example.com/page", created_at=new_date, id=2),
-            Mock(spec=Link, url="https://www.example.com/page/", created_at=old_date, id=1),
+            make_link(1, "https://example.com/products/item-1"),
+            make_link(2, "https://www.example.com/products/item-1/"),
+            make_link(3, "https://example.com/products/item-1b"),
+            make_link(4, "https://example.com/about"),
         ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
+        stream_links(mock_db, links)
 
         # Act
         results = dedup_service.find_all_duplicates(db=mock_db)
 
         # Assert
-        if results:
-            group = results[0]
-            assert group['canonical'].created_at == old_date
+        assert len(results) == 1
+        assert results[0]['fuzzy'] is True
+        assert results[0]['canonical'] == links[0]
+        assert results[0]['duplicates'] == links[1:3]
+        assert 0.85 <= results[0]['similarity'] < 1.0
+
+    def test_find_all_duplicates_covers_every_link(self, dedup_service, mock_db):
+        """Test fuzzy detection is not capped, using LSH for large blocks."""
+        # Arrange
+        links = []
+        for i in range(150):
+            links.append(make_link(2 * i, f"https://shop.example.com/catalog/{SLUGS[i]}"))
+            links.append(make_link(2 * i + 1, f"https://shop.example.com/catalog/{SLUGS[i]}-v2"))
+        stream_links(mock_db, links)
+
+        # Act
+        results = dedup_service.find_all_duplicates(db=mock_db, chunk_size=50)
+
+        # Assert
+        assert len(results) == 150
+        assert all(group['fuzzy'] and group['duplicates'][0].id == group['canonical'].id + 1 for group in results)
+        mock_db.yield_per.assert_called_once_with(50)
 
     def test_find_all_duplicates_with_company_filter(self, dedup_service, mock_db):
         """Test filtering by company_id."""
         # Arrange
         company_id = 123
-        links = [
-            Mock(spec=Link, url="https://example.com/page1", created_at=datetime(2024, 1, 1)),
-        ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
+        stream_links(mock_db, [make_link(1, "https://example.com/page1")])
 
         # Act
         dedup_service.find_all_duplicates(db=mock_db, company_id=company_id)
 
         # Assert
-        mock_db.query.return_value.filter.assert_called()
+        assert "domains.company_id" in str(mock_db.filter.call_args_list[0].args[0])
+
+
+class TestMinHashLSH:
+    """Test suite for the MinHash/LSH index."""
+
+    def test_similar_items_share_a_bucket(self):
+        """Test near-identical shingle sets become candidates and distinct ones do not."""
+        lsh = MinHashLSH()
+        lsh.insert({
+            "a": {f"s{i}" for i in range(40)},
+            "b": {f"s{i}" for i in range(1, 41)},
+            "c": {f"t{i}" for i in range(40)},
+        })
+
+        assert "b" in set(lsh.candidates("a"))
+        assert "c" not in set(lsh.candidates("a"))
+
+    def test_bands_must_divide_permutations(self):
+        """Test invalid banding is rejected."""
+        with pytest.raises(ValueError):
+            MinHashLSH(num_perm=64, bands=10)
 
 
 class TestMergeDuplicateLinks:
@@ -569,8 +656,7 @@ class TestGenerateDuplicateReport:
     def test_generate_duplicate_report_empty_database(self, dedup_service, mock_db):
         """Test report generation for empty database."""
         # Arrange
-        mock_db.query.return_value.all.return_value = []
-        mock_db.query.return_value.count.return_value = 0
+        stream_links(mock_db, [])
 
         # Act
         report = dedup_service.generate_duplicate_report(db=mock_db)
@@ -583,13 +669,10 @@ class TestGenerateDuplicateReport:
     def test_generate_duplicate_report_with_duplicates(self, dedup_service, mock_db):
         """Test report generation with duplicates."""
         # Arrange
-        links = [
-            Mock(spec=Link, url="https://example.com/page1", created_at=datetime(2024, 1, 1)),
-            Mock(spec=Link, url="https://www.example.com/page1/", created_at=datetime(2024, 1, 2)),
-        ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
-        mock_db.query.return_value.count.return_value = 2
+        stream_links(mock_db, [
+            make_link(1, "https://example.com/page1", datetime(2024, 1, 1)),
+            make_link(2, "https://www.example.com/page1/", datetime(2024, 1, 2)),
+        ])
 
         # Act
         report = dedup_service.generate_duplicate_report(db=mock_db)
@@ -599,33 +682,50 @@ class TestGenerateDuplicateReport:
         assert 'duplicate_groups' in report
         assert 'recommendations' in report
         assert 'generated_at' in report
+        assert report['recommendations'][0]['duplicate_ids'] == [2]
 
     def test_generate_duplicate_report_calculates_savings(self, dedup_service, mock_db):
         """Test report calculates potential savings percentage."""
         # Arrange
         links = [
-            Mock(spec=Link, url="https://example.com/page1", created_at=datetime(2024, 1, 1)),
-            Mock(spec=Link, url="https://www.example.com/page1/", created_at=datetime(2024, 1, 2)),
+            make_link(1, "https://example.com/page1", datetime(2024, 1, 1)),
+            make_link(2, "https://www.example.com/page1/", datetime(2024, 1, 2)),
         ]
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
-        mock_db.query.return_value.count.return_value = 10
+        links += [make_link(i, f"https://site{i}.com/") for i in range(3, 11)]
+        stream_links(mock_db, links)
+
+        # Act
+        report = dedup_service.generate_duplicate_report(db=mock_db)
+
+        # Assert
+        assert report['summary']['total_links'] == 10
+        assert report['summary']['savings_percentage'] == 10.0
+
+    def test_generate_duplicate_report_loads_only_top_groups(self, dedup_service, mock_db):
+        """Test every group is counted but only the largest 50 are loaded."""
+        # Arrange
+        links = []
+        for i in range(60):
+            links.append(make_link(2 * i, f"https://site{i}.com/page"))
+            links.append(make_link(2 * i + 1, f"https://www.site{i}.com/page/"))
+        links.append(make_link(500, "https://site0.com/page?utm_source=x"))
+        stream_links(mock_db, links)
 
         # Act
         report = dedup_service.generate_duplicate_report(db=mock_db)
 
         # Assert
-        assert 'savings_percentage' in report['summary']
-        assert report['summary']['savings_percentage'] >= 0
+        assert report['summary']['total_duplicates'] == 61
+        assert len(report['recommendations']) == 60
+        assert report['recommendations'][0]['count'] == 3
+        loaded_ids = mock_db.filter.call_args.args[0].right.value
+        assert len(loaded_ids) == 101
 
     def test_generate_duplicate_report_with_company_filter(self, dedup_service, mock_db):
         """Test report generation with company filter."""
         # Arrange
         company_id = 123
-        links = []
-        mock_db.query.return_value.all.return_value = links
-        mock_db.query.return_value.filter.return_value.all.return_value = links
-        mock_db.query.return_value.count.return_value = 0
+        stream_links(mock_db, [])
 
         # Act
         report = dedup_service.generate_duplicate_report(
@@ -634,7 +734,7 @@ class TestGenerateDuplicateReport:
         )
 
         # Assert
-        mock_db.query.return_value.filter.assert_called()
+        assert "domains.company_id" in str(mock_db.filter.call_args_list[0].args[0])
 
 
 class TestEdgeCases:
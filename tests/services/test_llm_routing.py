@@ -0,0 +1,197 @@
+"""Tests for latency-aware LLM provider routing."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.llm_provider import FallbackManager
+from src.services.llm_provider.routing import (
+    ProviderHealth,
+    ProviderRouter,
+    ProviderUnavailableError,
+    TokenBudget,
+)
+from src.models.llm_fallback import LLMProvider
+
+
+def seed_latency(router: ProviderRouter, provider: str, latency: float, samples: int = 20):
+    health = router.get_health(provider)
+    for _ in range(samples):
+        health.record_success(latency)
+
+
+class TestProviderHealth:
+    """Test EWMA tracking and AIMD limits."""
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        health = ProviderHealth("openai", initial_limit=4, min_limit=1)
+
+        for _ in range(4):
+            health.record_success(0.1)
+        assert health.limit == pytest.approx(4.92, abs=0.01)
+
+        health.record_failure()
+        health.record_failure()
+        health.record_failure()
+        assert health.limit == 1
+        assert health.error_rate > 0.4
+
+    def test_latency_spike_decreases_limit(self):
+        health = ProviderHealth("openai", initial_limit=10)
+        health.record_success(0.1)
+
+        health.record_success(1.0)
+
+        assert health.limit < 10
+
+    def test_p95_needs_enough_samples(self):
+        health = ProviderHealth("openai", min_samples=20)
+        for latency in range(19):
+            health.record_success(latency / 100)
+        assert health.p95 is None
+
+        health.record_success(0.19)
+        assert health.p95 == pytest.approx(0.19)
+
+
+class TestRouting:
+    """Test provider ordering."""
+
+    def test_unmeasured_providers_keep_priority_order(self):
+        assert ProviderRouter().order(["openai", "anthropic", "cohere"]) == ["openai", "anthropic", "cohere"]
+
+    def test_slow_or_failing_provider_is_demoted(self):
+        router = ProviderRouter()
+        seed_latency(router, "openai", 2.0)
+        seed_latency(router, "anthropic", 0.5)
+
+        assert router.order(["openai", "anthropic"]) == ["anthropic", "openai"]
+
+        for _ in range(5):
+            router.get_health("anthropic").record_failure()
+        assert router.order(["openai", "anthropic"]) == ["openai", "anthropic"]
+
+
+@pytest.mark.asyncio
+class TestExecute:
+    """Test fallback, hedging and limits."""
+
+    async def test_falls_back_on_failure(self):
+        router = ProviderRouter(hedge_enabled=False)
+
+        async def call(provider):
+            if provider == "openai":
+                raise RuntimeError("down")
+            return provider
+
+        assert await router.execute(["openai", "anthropic"], call) == ("anthropic", "anthropic")
+        assert router.get_stats()["fallbacks"] == 1
+
+    async def test_slow_request_is_hedged(self):
+        router = ProviderRouter(hedge_enabled=True, hedge_min_delay=0.01)
+        seed_latency(router, "openai", 0.02)
+        cancelled = asyncio.Event()
+
+        async def call(provider):
+            if provider == "openai":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return provider
+
+        result = await asyncio.wait_for(router.execute(["openai", "anthropic"], call), 1)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert result == ("anthropic", "anthropic")
+        assert router.get_stats()["hedge_wins"] == 1
+        assert router.get_health("openai").in_flight == 0
+        assert router.get_health("openai").failures == 0
+
+    async def test_concurrency_is_capped_by_limit(self):
+        router = ProviderRouter()
+        router.get_health("openai").limit = 2
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(router.run("openai", call) for _ in range(6)))
+
+        assert peak == 2
+
+    async def test_exhausted_token_budget_skips_provider(self):
+        router = ProviderRouter(token_budget=TokenBudget(limits={"openai": 100}), hedge_enabled=False)
+
+        async def call(provider):
+            return provider
+
+        assert await router.execute(["openai", "anthropic"], call, tokens=80) == ("openai", "openai")
+        assert await router.execute(["openai", "anthropic"], call, tokens=80) == ("anthropic", "anthropic")
+
+        with pytest.raises(ProviderUnavailableError):
+            await router.run("openai", lambda: call("openai"), tokens=80)
+
+
+    async def test_queue_timeout_does_not_spend_token_budget(self):
+        router = ProviderRouter(token_budget=TokenBudget(limits={"openai": 100}), queue_timeout=0.01)
+        router.get_health("openai").limit = 1
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+
+        running = asyncio.ensure_future(router.run("openai", call, tokens=10))
+        await asyncio.sleep(0)
+        with pytest.raises(ProviderUnavailableError):
+            await router.run("openai", call, tokens=80)
+        release.set()
+        await running
+
+        assert router.token_budget._local["openai"][1] == 10
+        assert router.get_health("openai").in_flight == 0
+
+    async def test_hedging_is_off_by_default(self):
+        router = ProviderRouter(hedge_min_delay=0.01)
+        seed_latency(router, "openai", 0.02)
+
+        async def call(provider):
+            await asyncio.sleep(0.05)
+            return provider
+
+        assert await router.execute(["openai", "anthropic"], call) == ("openai", "openai")
+        assert router.get_stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_budget_closes_redis_of_previous_loop():
+    budget = TokenBudget()
+    stale = AsyncMock()
+    budget.redis = stale
+    budget._loop = object()
+
+    await budget.initialize()
+
+    stale.close.assert_awaited_once()
+    assert budget.redis is None
+
+
+@pytest.mark.asyncio
+async def test_fallback_manager_routes_to_healthier_provider(monkeypatch):
+    router = ProviderRouter(hedge_enabled=False)
+    monkeypatch.setattr("src.services.llm_provider.fallback_manager.get_provider_router", lambda: router)
+    manager = FallbackManager(providers=[LLMProvider.OPENAI, LLMProvider.ANTHROPIC])
+    for _ in range(5):
+        router.get_health("openai").record_failure(1.0)
+    seed_latency(router, "anthropic", 0.1)
+
+    result, provider = await manager._execute_with_fallback_uncached("Summarize the audience")
+
+    assert provider == LLMProvider.ANTHROPIC
+    assert manager.get_stats()["routing"]["requests"] == 1
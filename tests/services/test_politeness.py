@@ -0,0 +1,135 @@
+"""Tests for the shared scraping politeness service."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.web_scraping import (
+    CircuitBreakerError,
+    CircuitBreakerState,
+    EnhancedWebScrapingService,
+    PolitenessService,
+    ScrapingConfig,
+)
+
+
+@pytest.fixture
+def politeness():
+    """Create a process-local politeness service (no Redis)."""
+    return PolitenessService()
+
+
+@pytest.mark.asyncio
+class TestRobotsCaching:
+    """Test robots.txt caching."""
+
+    async def test_fetches_robots_once(self, politeness):
+        fetch = AsyncMock(return_value="User-agent: *\nDisallow: /private")
+
+        first = await politeness.get_robots_parser("example.com", fetch)
+        second = await politeness.get_robots_parser("example.com", fetch)
+
+        assert fetch.await_count == 1
+        assert first is second
+        assert not first.can_fetch("bot", "https://example.com/private/page")
+        assert first.can_fetch("bot", "https://example.com/public")
+
+    async def test_concurrent_callers_share_one_fetch(self, politeness):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "User-agent: *\nDisallow:"
+
+        await asyncio.gather(*(politeness.get_robots_parser("example.com", fetch) for _ in range(5)))
+
+        assert calls == 1
+
+    async def test_remembers_missing_robots(self, politeness):
+        fetch = AsyncMock(return_value=None)
+
+        assert await politeness.get_robots_parser("example.com", fetch) is None
+        assert await politeness.get_robots_parser("example.com", fetch) is None
+        assert fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+class TestRequestPacing:
+    """Test per-domain request slot reservation."""
+
+    async def test_reserves_consecutive_slots(self, politeness):
+        waits = [await politeness.reserve_request_slot("example.com", 0.5) for _ in range(3)]
+
+        assert waits[0] == pytest.approx(0.0, abs=0.05)
+        assert waits[1] == pytest.approx(0.5, abs=0.05)
+        assert waits[2] == pytest.approx(1.0, abs=0.05)
+
+    async def test_domains_are_paced_independently(self, politeness):
+        await politeness.reserve_request_slot("a.com", 1.0)
+
+        assert await politeness.reserve_request_slot("b.com", 1.0) == pytest.approx(0.0, abs=0.05)
+
+    async def test_no_shared_breaker_without_redis(self, politeness):
+        assert await politeness.get_circuit_breaker("example.com") is None
+        assert await politeness.record_failure("example.com", 3) is None
+
+    async def test_closes_redis_of_previous_loop(self, politeness):
+        stale = AsyncMock()
+        politeness.redis = stale
+        politeness._loop = object()
+
+        await politeness.initialize()
+
+        stale.close.assert_awaited_once()
+        assert politeness.redis is None
+
+
+@pytest.mark.asyncio
+class TestSharedCircuitBreaker:
+    """Test that the scraper adopts circuit breaker state shared by other workers."""
+
+    async def test_open_circuit_from_other_worker_blocks_requests(self):
+        politeness = PolitenessService()
+        politeness.get_circuit_breaker = AsyncMock(return_value={
+            'state': 'open',
+            'failure_count': 5,
+            'success_count': 0,
+            'last_failure_time': time.time(),
+        })
+        scraper = EnhancedWebScrapingService(ScrapingConfig(), politeness=politeness)
+
+        with pytest.raises(CircuitBreakerError):
+            await scraper._check_circuit_breaker("example.com")
+
+        assert scraper.circuit_breakers["example.com"].state == CircuitBreakerState.OPEN
+
+    async def test_failures_are_reported_to_shared_breaker(self):
+        politeness = PolitenessService()
+        politeness.record_failure = AsyncMock(return_value={
+            'state': 'open',
+            'failure_count': 5,
+            'success_count': 0,
+            'last_failure_time': time.time(),
+        })
+        scraper = EnhancedWebScrapingService(ScrapingConfig(), politeness=politeness)
+
+        await scraper._report_failure("example.com")
+
+        politeness.record_failure.assert_awaited_once_with("example.com", scraper.config.failure_threshold)
+        assert scraper.circuit_breakers["example.com"].failure_count == 5
+        assert scraper.circuit_breakers["example.com"].state == CircuitBreakerState.OPEN
+
+    async def test_success_without_failures_stays_local(self):
+        politeness = PolitenessService()
+        politeness.update_circuit_breaker = AsyncMock()
+        politeness.increment_successes = AsyncMock()
+        scraper = EnhancedWebScrapingService(ScrapingConfig(), politeness=politeness)
+
+        await scraper._report_success("example.com")
+
+        politeness.update_circuit_breaker.assert_not_awaited()
+        politeness.increment_successes.assert_not_awaited()
@@ -0,0 +1,85 @@
+"""Tests for concurrent batch analysis in SerpAnalyzer."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.cache_service import AsyncCacheService
+from src.services.serp_analyzer import SerpAnalyzer
+
+
+def raw_serp(keyword: str) -> dict:
+    """Build a minimal raw SerpAPI response."""
+    return {
+        "organic_results": [
+            {"position": 1, "domain": "example.com", "link": f"https://example.com/{keyword}"},
+            {"position": 2, "domain": "other.com", "link": f"https://other.com/{keyword}"},
+        ],
+        "search_information": {"total_results": 1000},
+    }
+
+
+@pytest.fixture
+def analyzer():
+    """Create an analyzer whose API requests take a short while."""
+    serp_analyzer = SerpAnalyzer(
+        api_key="test-key",
+        cache=AsyncCacheService(),
+        rate_limit_requests=100,
+        max_concurrency=3
+    )
+    state = {"active": 0, "max_active": 0, "calls": []}
+
+    async def make_api_request(params):
+        state["calls"].append(params["q"])
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        if params["q"] == "broken":
+            raise ValueError("boom")
+        return raw_serp(params["q"])
+
+    serp_analyzer._make_api_request = make_api_request
+    serp_analyzer.state = state
+    return serp_analyzer
+
+
+@pytest.mark.asyncio
+class TestKeywordBatch:
+    """Test the concurrent keyword batch pipeline."""
+
+    async def test_fetches_concurrently_up_to_limit(self, analyzer):
+        keywords = [f"keyword {i}" for i in range(9)]
+
+        results = await analyzer.analyze_keyword_batch(keywords)
+
+        assert [r["keyword"] for r in results] == keywords
+        assert analyzer.state["max_active"] == 3
+        assert results[0]["top_competitors"] == ["example.com", "other.com"]
+        assert results[0]["top_urls"][0] == "https://example.com/keyword 0"
+
+    async def test_uses_single_cache_lookup_for_cached_keywords(self, analyzer):
+        await analyzer.analyze_keyword_batch(["alpha", "beta"])
+        analyzer.state["calls"].clear()
+        analyzer.cache.get = AsyncMock(side_effect=AssertionError("per-key lookup"))
+
+        results = await analyzer.analyze_keyword_batch(["alpha", "beta", "gamma"])
+
+        assert analyzer.state["calls"] == ["gamma"]
+        assert all("error" not in r for r in results)
+
+    async def test_streams_results_as_they_complete(self, analyzer):
+        seen = []
+
+        async for analysis in analyzer.iter_keyword_analyses(["one", "two", "two"]):
+            seen.append(analysis["keyword"])
+
+        assert sorted(seen) == ["one", "two"]
+
+    async def test_failed_fetch_falls_back_to_mock_data(self, analyzer):
+        results = await analyzer.analyze_keyword_batch(["broken"])
+
+        assert results[0]["keyword"] == "broken"
+        assert results[0]["ranking_domains"]
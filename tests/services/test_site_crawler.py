@@ -0,0 +1,167 @@
+"""Tests for the concurrent frontier-based SiteCrawler."""
+
+import asyncio
+from typing import Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from src.services.web_scraping import (
+    CrawlConfig,
+    RobotsDisallowedError,
+    ScrapedPage,
+    SiteCrawler,
+    canonicalize_url,
+)
+
+
+def make_page(url: str, links: List[str], error: str = None) -> ScrapedPage:
+    """Build a minimal ScrapedPage for crawler tests."""
+    return ScrapedPage(
+        url=url,
+        html='',
+        text=f'content of {url}',
+        title=url,
+        meta_description='',
+        meta_keywords='',
+        headings={},
+        links=links,
+        images=[],
+        status_code=200 if error is None else 500,
+        response_time_ms=1.0,
+        error=error,
+    )
+
+
+class FakeScraper:
+    """Serves a fixed link graph and records fetch concurrency."""
+
+    def __init__(self, graph: Dict[str, List[str]], delay: float = 0.01):
+        self.graph = graph
+        self.delay = delay
+        self.fetched: List[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def fetch_page(self, url: str) -> ScrapedPage:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            self.fetched.append(url)
+            if url not in self.graph:
+                return make_page(url, [], error='HTTP 404')
+            return make_page(url, self.graph[url])
+        finally:
+            self.active -= 1
+
+
+class TestCanonicalizeUrl:
+    """Test URL canonicalization."""
+
+    def test_resolves_relative_links(self):
+        assert canonicalize_url('/about', 'https://example.com/blog/') == 'https://example.com/about'
+
+    def test_normalizes_host_port_and_fragment(self):
+        assert canonicalize_url('HTTPS://Example.COM:443/Page#top') == 'https://example.com/Page'
+
+    def test_drops_tracking_params_and_sorts_query(self):
+        url = 'https://example.com/p?utm_source=x&b=2&gclid=abc&a=1'
+        assert canonicalize_url(url) == 'https://example.com/p?a=1&b=2'
+
+    def test_empty_path_becomes_root(self):
+        assert canonicalize_url('https://example.com') == 'https://example.com/'
+
+    def test_rejects_non_http_links(self):
+        assert canonicalize_url('mailto:info@example.com') is None
+        assert canonicalize_url('javascript:void(0)') is None
+        assert canonicalize_url('') is None
+
+
+@pytest.mark.asyncio
+class TestSiteCrawler:
+    """Test SiteCrawler frontier and worker pool behaviour."""
+
+    async def test_crawls_same_domain_breadth_first(self):
+        scraper = FakeScraper({
+            'https://example.com': ['/a', '/b', 'https://other.com/x'],
+            'https://example.com/a': ['/b', '/c#section'],
+            'https://example.com/b': ['/a'],
+            'https://example.com/c': [],
+        })
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=10, max_workers=1))
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert [p.url for p in pages] == [
+            'https://example.com',
+            'https://example.com/a',
+            'https://example.com/b',
+            'https://example.com/c',
+        ]
+        assert len(scraper.fetched) == len(set(scraper.fetched))
+        assert not any('other.com' in url for url in scraper.fetched)
+
+    async def test_respects_max_pages(self):
+        graph = {'https://example.com': [f'/page{i}' for i in range(20)]}
+        graph.update({f'https://example.com/page{i}': [] for i in range(20)})
+        scraper = FakeScraper(graph)
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=5, max_workers=4))
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert len(pages) == 5
+        assert len(scraper.fetched) == 5
+
+    async def test_failed_pages_free_up_budget(self):
+        graph = {'https://example.com': ['/missing1', '/missing2', '/ok1', '/ok2']}
+        graph.update({'https://example.com/ok1': [], 'https://example.com/ok2': []})
+        scraper = FakeScraper(graph)
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=3, max_workers=2))
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert len(pages) == 3
+        assert all(page.error is None for page in pages)
+
+    async def test_limits_concurrency_per_domain(self):
+        graph = {'https://example.com': [f'/page{i}' for i in range(10)]}
+        graph.update({f'https://example.com/page{i}': [] for i in range(10)})
+        scraper = FakeScraper(graph)
+        crawler = SiteCrawler(
+            scraper,
+            CrawlConfig(max_pages=11, max_workers=8, concurrency_per_domain=2)
+        )
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert len(pages) == 11
+        assert scraper.max_active == 2
+
+    async def test_respects_max_depth(self):
+        scraper = FakeScraper({
+            'https://example.com': ['/a'],
+            'https://example.com/a': ['/b'],
+            'https://example.com/b': [],
+        })
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=10, max_depth=1))
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert [p.url for p in pages] == ['https://example.com', 'https://example.com/a']
+
+    async def test_skips_robots_disallowed_urls(self):
+        scraper = Mock()
+
+        async def fetch_page(url):
+            if url.endswith('/private'):
+                raise RobotsDisallowedError(url)
+            links = ['/private', '/public'] if url == 'https://example.com' else []
+            return make_page(url, links)
+
+        scraper.fetch_page = fetch_page
+        crawler = SiteCrawler(scraper, CrawlConfig(max_pages=10))
+
+        pages = await crawler.crawl('https://example.com')
+
+        assert sorted(p.url for p in pages) == ['https://example.com', 'https://example.com/public']
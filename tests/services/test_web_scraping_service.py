@@ -12,22 +12,31 @@ from datetime import datetime
 from typing import Dict, Any
 
 from src.services.web_scraping_service import WebScrapingService, WebScrapingError
-from src.models.scraped_content import ScrapedContent, ContentChange
+from src.services.web_scraping.browser_pool import BrowserPool, get_browser_pool
+from src.models.scraped_content import ScrapedContent, ContentChange, ContentObservation
 from src.services.storage_service import StorageService
 
 
 @pytest.fixture
 def mock_storage_service():
     """Create a mock storage service."""
-    mock_service = AsyncMock(spec=StorageService)
-    mock_service.upload_file = AsyncMock(return_value="/storage/test.png")
+    mock_service = MagicMock(spec=StorageService)
+    mock_service.upload_file = MagicMock(return_value={"url": "/storage/test.png"})
     return mock_service
 
 
 @pytest.fixture
-def scraping_service(mock_storage_service):
-    """Create a WebScrapingService instance with mocked storage."""
-    return WebScrapingService(storage_service=mock_storage_service)
+def browser_pool(mock_browser):
+    """Create a BrowserPool that hands out the mocked browser."""
+    pool = BrowserPool()
+    pool._launch_browser = AsyncMock(return_value=mock_browser)
+    return pool
+
+
+@pytest.fixture
+def scraping_service(mock_storage_service, browser_pool):
+    """Create a WebScrapingService instance with mocked storage and browser."""
+    return WebScrapingService(storage_service=mock_storage_service, browser_pool=browser_pool)
 
 
 @pytest.fixture
@@ -52,25 +61,33 @@ def mock_page():
     """Create a mock Playwright page."""
     page = AsyncMock()
     page.goto = AsyncMock(return_value=AsyncMock(status=200))
-    page.content = AsyncMock(return_value="<html><body><h1>Test Page</h1></body></html>")
-    page.title = AsyncMock(return_value="Test Page")
-    page.evaluate = AsyncMock(side_effect=[
-        "Test page content text",  # text_content
-        "Test description",  # meta_description
-        "test, keywords",  # meta_keywords
-    ])
+    page.evaluate = AsyncMock(return_value={
+        "html": "<html><body><h1>Test Page</h1></body></html>",
+        "title": "Test Page",
+        "text": "Test page content text",
+        "metaDescription": "Test description",
+        "metaKeywords": "test, keywords",
+        "headings": {"h1": ["Test Page"], "h2": [], "h3": [], "h4": [], "h5": [], "h6": []},
+        "links": [],
+        "images": [],
+    })
     page.screenshot = AsyncMock(return_value=b"fake_screenshot_data")
     page.wait_for_selector = AsyncMock()
     page.close = AsyncMock()
+    page.on = Mock()
     return page
 
 
 @pytest.fixture
 def mock_browser(mock_page):
     """Create a mock Playwright browser."""
+    context = AsyncMock()
+    context.new_page = AsyncMock(return_value=mock_page)
     browser = AsyncMock()
-    browser.new_page = AsyncMock(return_value=mock_page)
+    browser.new_context = AsyncMock(return_value=context)
     browser.close = AsyncMock()
+    browser.on = Mock()
+    browser.is_connected = Mock(return_value=True)
     return browser
 
 
@@ -81,7 +98,7 @@ class TestWebScrapingServiceInitialization:
         """Test initialization creates default storage service."""
         service = WebScrapingService()
         assert service.storage_service is not None
-        assert service.browser is None
+        assert service.browser_pool is get_browser_pool()
 
     def test_init_with_custom_storage_service(self, mock_storage_service):
         """Test initialization with custom storage service."""
@@ -99,7 +116,6 @@ class TestWebScrapingServiceScrapeURL:
         """Test successful URL scraping without screenshot."""
         # Arrange
         url = "https://example.com/test"
-        scraping_service.browser = mock_browser
 
         # Act
         result = await scraping_service.scrape_url(
@@ -110,8 +126,9 @@ class TestWebScrapingServiceScrapeURL:
 
         # Assert
         assert mock_page.goto.called
-        assert mock_page.content.called
-        assert mock_page.title.called
+        mock_page.evaluate.assert_awaited_once()
+        assert result.title == "Test Page"
+        assert result.meta_description == "Test description"
         assert not mock_page.screenshot.called
         assert mock_db.add.called
         assert mock_db.commit.called
@@ -123,7 +140,6 @@ class TestWebScrapingServiceScrapeURL:
         """Test successful URL scraping with screenshot capture."""
         # Arrange
         url = "https://example.com/test"
-        scraping_service.browser = mock_browser
 
         # Act
         result = await scraping_service.scrape_url(
@@ -135,8 +151,59 @@ class TestWebScrapingServiceScrapeURL:
         # Assert
         assert mock_page.screenshot.called
         assert mock_storage_service.upload_file.called
-        screenshot_call = mock_storage_service.upload_file.call_args
-        assert screenshot_call[1]['content_type'] == 'image/png'
+        content_types = [c[1]['content_type'] for c in mock_storage_service.upload_file.call_args_list]
+        assert 'image/png' in content_types
+        assert result.screenshot_blob_hash is not None
+
+    @pytest.mark.asyncio
+    async def test_scrape_url_stores_content_as_blobs(
+        self, scraping_service, mock_db, mock_storage_service
+    ):
+        """Test that versions reference compressed content blobs."""
+        # Act
+        result = await scraping_service.scrape_url(
+            url="https://example.com/test",
+            db=mock_db,
+            capture_screenshot=False
+        )
+
+        # Assert
+        assert result.html_content is None
+        assert result.text_content is None
+        assert result.html_blob_hash is not None
+        assert result.text_blob_hash is not None
+        buckets = {c[1]['bucket_name'] for c in mock_storage_service.upload_file.call_args_list}
+        assert buckets == {"onside-scraped-content"}
+
+    @pytest.mark.asyncio
+    async def test_scrape_url_unchanged_records_observation(
+        self, scraping_service, mock_db, mock_storage_service
+    ):
+        """Test that re-scraping unchanged content creates no new version."""
+        # Arrange
+        existing_version = MagicMock(spec=ScrapedContent)
+        existing_version.id = 7
+        existing_version.version = 2
+        existing_version.seen_count = 1
+        existing_version.content_hash = ScrapedContent.hash_content(
+            "Test page content text", None
+        )
+        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = existing_version
+
+        # Act
+        result = await scraping_service.scrape_url(
+            url="https://example.com/test",
+            db=mock_db,
+            capture_screenshot=False
+        )
+
+        # Assert
+        assert result is existing_version
+        assert existing_version.seen_count == 2
+        added = mock_db.add.call_args[0][0]
+        assert isinstance(added, ContentObservation)
+        assert added.scraped_content_id == 7
+        assert not mock_storage_service.upload_file.called
 
     @pytest.mark.asyncio
     async def test_scrape_url_with_company_id(
@@ -146,7 +213,6 @@ class TestWebScrapingServiceScrapeURL:
         # Arrange
         url = "https://example.com/test"
         company_id = 123
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -168,7 +234,6 @@ class TestWebScrapingServiceScrapeURL:
         # Arrange
         url = "https://example.com/test"
         competitor_id = 456
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -190,7 +255,6 @@ class TestWebScrapingServiceScrapeURL:
         # Arrange
         url = "https://example.com/test"
         selector = ".dynamic-content"
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -215,7 +279,6 @@ class TestWebScrapingServiceScrapeURL:
         existing_version.content_hash = "old_hash"
 
         mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = existing_version
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -235,7 +298,6 @@ class TestWebScrapingServiceScrapeURL:
         """Test that domain is correctly extracted from URL."""
         # Arrange
         url = "https://www.example.com/path/to/page"
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -256,7 +318,6 @@ class TestWebScrapingServiceScrapeURL:
         # Arrange
         url = "https://example.com/slow"
         mock_page.goto.side_effect = TimeoutError("Page load timeout")
-        scraping_service.browser = mock_browser
 
         # Act & Assert
         with pytest.raises(WebScrapingError) as exc_info:
@@ -278,7 +339,6 @@ class TestWebScrapingServiceScrapeURL:
         # Arrange
         url = "https://invalid-domain-xyz.com"
         mock_page.goto.side_effect = Exception("Network error")
-        scraping_service.browser = mock_browser
 
         # Act & Assert
         with pytest.raises(WebScrapingError):
@@ -294,8 +354,7 @@ class TestWebScrapingServiceScrapeURL:
         """Test that page is closed even when error occurs."""
         # Arrange
         url = "https://example.com"
-        mock_page.content.side_effect = Exception("Content extraction error")
-        scraping_service.browser = mock_browser
+        mock_page.evaluate.side_effect = Exception("Content extraction error")
 
         # Act
         with pytest.raises(WebScrapingError):
@@ -437,7 +496,6 @@ class TestWebScrapingServiceMultipleScraping:
             "https://example.com/page2",
             "https://example.com/page3"
         ]
-        scraping_service.browser = mock_browser
 
         # Act
         results = await scraping_service.scrape_multiple(
@@ -470,7 +528,6 @@ class TestWebScrapingServiceMultipleScraping:
             return AsyncMock(status=200)
 
         mock_page.goto = mock_goto
-        scraping_service.browser = mock_browser
 
         # Act
         results = await scraping_service.scrape_multiple(
@@ -624,17 +681,39 @@ class TestWebScrapingServiceResourceManagement:
     """Test suite for resource management and cleanup."""
 
     @pytest.mark.asyncio
-    async def test_close_browser(self, scraping_service, mock_browser):
-        """Test browser cleanup."""
+    async def test_close_keeps_shared_browser(
+        self, scraping_service, mock_db, mock_browser, browser_pool
+    ):
+        """Test that closing the service leaves the pooled browser running."""
         # Arrange
-        scraping_service.browser = mock_browser
+        await scraping_service.scrape_url(
+            url="https://example.com",
+            db=mock_db,
+            capture_screenshot=False
+        )
 
         # Act
         await scraping_service.close()
 
         # Assert
-        assert mock_browser.close.called
-        assert scraping_service.browser is None
+        assert not mock_browser.close.called
+        assert browser_pool.stats()['browser_running']
+
+    @pytest.mark.asyncio
+    async def test_pages_are_returned_to_pool(
+        self, scraping_service, mock_db, mock_page, browser_pool
+    ):
+        """Test that each scrape closes its page and frees its pool slot."""
+        # Act
+        await scraping_service.scrape_multiple(
+            urls=["https://example.com/1", "https://example.com/2"],
+            db=mock_db,
+            capture_screenshot=False
+        )
+
+        # Assert
+        assert mock_page.close.await_count == 2
+        assert browser_pool.stats()['active_pages'] == 0
 
     @pytest.mark.asyncio
     async def test_async_context_manager(self, mock_storage_service):
@@ -642,20 +721,9 @@ class TestWebScrapingServiceResourceManagement:
         # Arrange
         service = WebScrapingService(storage_service=mock_storage_service)
 
-        # Act
-        async with patch('src.services.web_scraping_service.async_playwright') as mock_playwright:
-            mock_pw_instance = AsyncMock()
-            mock_playwright.return_value.start = AsyncMock(return_value=mock_pw_instance)
-            mock_browser = AsyncMock()
-            mock_pw_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-
-            async with service as svc:
-                assert svc is not None
-                # Browser should be initialized
-                await svc._ensure_browser()
-
-        # Browser should be closed after context exit
-        # (if it was created during the context)
+        # Act / Assert
+        async with service as svc:
+            assert svc is service
 
 
 class TestWebScrapingServiceEdgeCases:
@@ -668,9 +736,10 @@ class TestWebScrapingServiceEdgeCases:
         """Test scraping page with empty content."""
         # Arrange
         url = "https://example.com/empty"
-        mock_page.content = AsyncMock(return_value="")
-        mock_page.evaluate = AsyncMock(return_value="")
-        scraping_service.browser = mock_browser
+        mock_page.evaluate = AsyncMock(return_value={
+            "html": "", "title": "", "text": "", "metaDescription": None,
+            "metaKeywords": None, "headings": {}, "links": [], "images": [],
+        })
 
         # Act
         await scraping_service.scrape_url(
@@ -689,12 +758,16 @@ class TestWebScrapingServiceEdgeCases:
         """Test scraping page without meta tags."""
         # Arrange
         url = "https://example.com/no-meta"
-        mock_page.evaluate = AsyncMock(side_effect=[
-            "Content without meta",  # text_content
-            None,  # meta_description
-            None,  # meta_keywords
-        ])
-        scraping_service.browser = mock_browser
+        mock_page.evaluate = AsyncMock(return_value={
+            "html": "<html><body>Content without meta</body></html>",
+            "title": "",
+            "text": "Content without meta",
+            "metaDescription": None,
+            "metaKeywords": None,
+            "headings": {},
+            "links": [],
+            "images": [],
+        })
 
         # Act
         await scraping_service.scrape_url(
@@ -717,7 +790,6 @@ class TestWebScrapingServiceEdgeCases:
         url = "https://example.com/404"
         mock_response = AsyncMock(status=404)
         mock_page.goto = AsyncMock(return_value=mock_response)
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -738,7 +810,6 @@ class TestWebScrapingServiceEdgeCases:
         # Arrange
         url = "https://example.com/no-response"
         mock_page.goto = AsyncMock(return_value=None)
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -762,7 +833,6 @@ class TestWebScrapingServicePerformance:
         """Test that scrape duration is recorded."""
         # Arrange
         url = "https://example.com"
-        scraping_service.browser = mock_browser
 
         # Act
         await scraping_service.scrape_url(
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sentence_transformers import SentenceTransformer
 
 from src.services.ai.content_affinity import ContentAffinityService
+from src.services.ai.embedding_service import EmbeddingService
 from src.models import Content, AIInsight
 from src.models.ai import InsightType
 
@@ -56,6 +57,7 @@ async def test_content_affinity_calculation(
     """Test the content affinity calculation service."""
     # Setup
     service = ContentAffinityService()
+    service.embeddings = EmbeddingService('all-MiniLM-L6-v2')
     target_content = sample_contents[0]
     comparison_contents = [sample_contents[1]]
 
@@ -67,7 +69,7 @@ async def test_content_affinity_calculation(
 
     # Mock the SentenceTransformer
     with patch(
-        'src.services.ai.content_affinity.SentenceTransformer',
+        'src.services.ai.embedding_service.SentenceTransformer',
         return_value=mock_sentence_transformer
     ):
         insights = await service.calculate_content_affinity(
@@ -93,6 +95,7 @@ async def test_content_affinity_empty_content(
     """Test content affinity calculation with empty content."""
     # Setup
     service = ContentAffinityService()
+    service.embeddings = EmbeddingService('all-MiniLM-L6-v2')
     empty_content = MockContent(
         id=3,
         user_id=1,
@@ -108,7 +111,7 @@ async def test_content_affinity_empty_content(
 
     # Mock the SentenceTransformer
     with patch(
-        'src.services.ai.content_affinity.SentenceTransformer',
+        'src.services.ai.embedding_service.SentenceTransformer',
         return_value=mock_sentence_transformer
     ):
         insights = await service.calculate_content_affinity(
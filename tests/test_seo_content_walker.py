@@ -112,49 +112,6 @@ class TestSEOContentWalkerAgent:
         assert agent.max_keywords == 50
         assert agent.max_competitors == 15
 
-    def test_extract_meta_description(self, agent):
-        """Test meta description extraction from HTML."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><head><meta name="description" content="Test description"></head></html>'
-        soup = BeautifulSoup(html, 'html.parser')
-
-        description = agent._extract_meta_description(soup)
-        assert description == "Test description"
-
-    def test_extract_meta_description_missing(self, agent):
-        """Test meta description extraction when meta tag is missing."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><head></head></html>'
-        soup = BeautifulSoup(html, 'html.parser')
-
-        description = agent._extract_meta_description(soup)
-        assert description == ""
-
-    def test_extract_headings(self, agent):
-        """Test extracting headings from HTML."""
-        from bs4 import BeautifulSoup
-
-        html = '''
-        <html>
-            <body>
-                <h1>Main Heading</h1>
-                <h2>Subheading 1</h2>
-                <h3>Subheading 2</h3>
-                <h2>Another Subheading</h2>
-            </body>
-        </html>
-        '''
-        soup = BeautifulSoup(html, 'html.parser')
-
-        headings = agent._extract_headings(soup)
-        assert len(headings) == 4
-        assert "Main Heading" in headings
-        assert "Subheading 1" in headings
-        assert "Subheading 2" in headings
-        assert "Another Subheading" in headings
-
     def test_extract_brand_name(self, agent):
         """Test extracting brand name from domain."""
         assert agent._extract_brand_name("testcompany.com") == "Testcompany"
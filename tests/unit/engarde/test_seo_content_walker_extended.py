@@ -402,42 +402,6 @@ class TestSEOContentWalkerExtended:
 
     # Helper Method Tests
 
-    def test_extract_meta_description(self, agent):
-        """Test meta description extraction from BeautifulSoup."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><head><meta name="description" content="Test description"></head></html>'
-        soup = BeautifulSoup(html, 'html.parser')
-
-        description = agent._extract_meta_description(soup)
-        assert description == 'Test description'
-
-    def test_extract_meta_description_missing(self, agent):
-        """Test meta description extraction when missing."""
-        from bs4 import BeautifulSoup
-
-        html = '<html><head></head></html>'
-        soup = BeautifulSoup(html, 'html.parser')
-
-        description = agent._extract_meta_description(soup)
-        assert description == ''
-
-    def test_extract_headings(self, agent):
-        """Test heading extraction from BeautifulSoup."""
-        from bs4 import BeautifulSoup
-
-        html = '''
-        <html><body>
-            <h1>Heading 1</h1>
-            <h2>Heading 2</h2>
-            <h3>Heading 3</h3>
-        </body></html>
-        '''
-        soup = BeautifulSoup(html, 'html.parser')
-
-        headings = agent._extract_headings(soup)
-        assert headings == ['Heading 1', 'Heading 2', 'Heading 3']
-
     def test_extract_brand_name(self, agent):
         """Test brand name extraction from domain."""
         assert agent._extract_brand_name('mailchimp.com') == 'Mailchimp'
@@ -564,9 +564,14 @@ class TestEnhancedCompetitorAnalysisService:
         mock_result.scalar_one_or_none.return_value = mock_competitor
         mock_session.execute.return_value = mock_result
 
-        with patch("src.services.analytics.enhanced_competitor_analysis.GNewsRepository") as MockRepo:
+        with patch("src.services.analytics.enhanced_competitor_analysis.GNewsRepository") as MockRepo, \
+                patch("src.services.analytics.enhanced_competitor_analysis.GNewsService"), \
+                patch("src.services.analytics.enhanced_competitor_analysis.NewsIngestionPipeline") as MockPipeline:
             mock_repo = MockRepo.return_value
             mock_repo.count_articles_by_competitor = AsyncMock(return_value=50)
+            MockPipeline.return_value.ingest_competitors = AsyncMock(
+                return_value={"articles_inserted": 4, "errors": []}
+            )
 
             result = await service.refresh_competitor_news(
                 session=mock_session,
@@ -576,8 +581,12 @@ class TestEnhancedCompetitorAnalysisService:
 
             assert result["competitor_id"] == 1
             assert result["competitor_name"] == "Test Company"
-            assert "total_articles" in result
+            assert result["articles_fetched"] == 4
+            assert result["total_articles"] == 50
             assert result["status"] == "success"
+            MockPipeline.return_value.ingest_competitors.assert_awaited_once_with(
+                [mock_competitor], days_back=30
+            )
 
     # Tests for _identify_trending_topics
 
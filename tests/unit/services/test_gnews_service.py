@@ -17,6 +17,7 @@ import httpx
 import pytest
 import pytest_asyncio
 
+from src.services.api_monitoring.quota_counter import QuotaCounter, period_bounds
 from src.services.external_api.gnews_service import (
     GNewsService,
     GNewsAPIError,
@@ -114,6 +115,10 @@ def mock_gnews_repo():
     repo = AsyncMock()
     repo.get_by_article_id.return_value = None
     repo.create_article.return_value = MagicMock(id=1)
+    repo.get_latest_published_at.return_value = {}
+    repo.get_existing_article_ids.return_value = set()
+    repo.get_recent_simhashes.return_value = []
+    repo.bulk_insert_articles.side_effect = lambda rows: len(rows)
     return repo
 
 
@@ -153,7 +158,8 @@ def gnews_service(mock_db, mock_http_client, mock_gnews_repo, mock_usage_repo, m
         service = GNewsService(
             db=mock_db,
             api_key="test-api-key",
-            http_client=mock_http_client
+            http_client=mock_http_client,
+            quota_counter=QuotaCounter()
         )
         service.gnews_repo = mock_gnews_repo
         service.usage_repo = mock_usage_repo
@@ -273,11 +279,8 @@ class TestGetCompetitorNews:
         mock_http_client._mock_response.status_code = 200
         mock_http_client._mock_response.json.return_value = SAMPLE_ARTICLES_RESPONSE
 
-        # Mock the gnews_repo to skip actual DB operations
-        gnews_service.gnews_repo.get_by_article_id = AsyncMock(return_value=None)
-        gnews_service.gnews_repo.create_article = AsyncMock()
-        # Mock _dict_to_model to avoid SQLAlchemy mapper issues
-        gnews_service._dict_to_model = MagicMock(return_value=MagicMock())
+        stored = [MagicMock(), MagicMock()]
+        gnews_service.gnews_repo.get_articles_by_competitor.return_value = stored
 
         async with gnews_service:
             results = await gnews_service.get_competitor_news(
@@ -285,11 +288,27 @@ class TestGetCompetitorNews:
                 days_back=7
             )
 
-        assert len(results) == 2
+        assert results == [article.to_dict.return_value for article in stored]
         # Verify search query was built from competitor data
         call_kwargs = mock_http_client.get.call_args
         params = call_kwargs.kwargs.get("params", {})
         assert "Acme Corp" in params["q"] or "acme" in params["q"]
+        # New articles are stored in one bulk insert
+        rows = gnews_service.gnews_repo.bulk_insert_articles.call_args.args[0]
+        assert [row["competitor_id"] for row in rows] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_get_competitor_news_starts_at_high_water_mark(self, gnews_service, mock_http_client):
+        """Test only articles newer than the newest stored one are requested."""
+        latest = datetime.utcnow() - timedelta(hours=2)
+        gnews_service.gnews_repo.get_latest_published_at.return_value = {1: latest}
+        gnews_service.gnews_repo.get_articles_by_competitor.return_value = []
+
+        async with gnews_service:
+            await gnews_service.get_competitor_news(competitor_id=1, days_back=7)
+
+        params = mock_http_client.get.call_args.kwargs["params"]
+        assert params["from"] == latest.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     @pytest.mark.asyncio
     async def test_get_competitor_news_not_found(self, gnews_service):
@@ -446,11 +465,9 @@ class TestRateLimiting:
     @pytest.mark.asyncio
     async def test_rate_limit_check_exceeded(self, gnews_service, mock_http_client):
         """Test that requests fail when quota is exceeded."""
-        gnews_service.usage_repo.get_quota_status = AsyncMock(return_value={
-            "is_exceeded": True,
-            "request_count": 1000,
-            "quota_limit": 1000
-        })
+        period_start, period_end = period_bounds("daily")
+        await gnews_service.quota_counter.set_limit("gnews", period_start, period_end, 1000)
+        await gnews_service.quota_counter.increment("gnews", period_start, period_end, count=1000)
 
         with pytest.raises(GNewsRateLimitError) as exc_info:
             async with gnews_service:
@@ -479,7 +496,9 @@ class TestRateLimiting:
         async with gnews_service:
             await gnews_service.search_news(query="test", save_to_db=False)
 
-        gnews_service.usage_repo.record_usage.assert_called_once()
+        status = await gnews_service.get_usage_status()
+        assert status["request_count"] == 1
+        gnews_service.usage_repo.record_usage.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_usage_status(self, gnews_service):
@@ -499,6 +518,7 @@ class TestRateLimiting:
 
         assert result is True
         gnews_service.usage_repo.set_quota_limit.assert_called_with("gnews", 500)
+        assert (await gnews_service.get_usage_status())["quota_limit"] == 500
 
 
 # ----- Test: Error Handling -----
@@ -16,6 +16,7 @@ from typing import Dict, Any, List
 
 import httpx
 
+from src.core.local_cache import LocalCache
 from src.services.external_api.ipinfo_service import (
     IPInfoService,
     IPInfoError,
@@ -85,6 +86,8 @@ def mock_repository():
     repo.get_by_ip = AsyncMock(return_value=None)
     repo.get_by_domain = AsyncMock(return_value=[])
     repo.create_or_update = AsyncMock()
+    repo.get_by_ips = AsyncMock(return_value={})
+    repo.bulk_create_or_update = AsyncMock(side_effect=lambda records: records)
     return repo
 
 
@@ -100,7 +103,8 @@ def ipinfo_service(mock_db_session, mock_repository):
     """Create an IPInfoService instance with mocked dependencies."""
     service = IPInfoService(
         db=mock_db_session,
-        api_key="test_api_key"
+        api_key="test_api_key",
+        local_cache=LocalCache("ipinfo-test")
     )
     service.repository = mock_repository
     return service
@@ -232,11 +236,6 @@ class TestIPInfoService:
             }
             return record
 
-        mock_repository.create_or_update.side_effect = [
-            create_mock_record("8.8.8.8", SAMPLE_BATCH_RESPONSE["8.8.8.8"]),
-            create_mock_record("1.1.1.1", SAMPLE_BATCH_RESPONSE["1.1.1.1"])
-        ]
-
         # Mock _api_response_to_record to avoid SQLAlchemy model creation
         with patch.object(
             ipinfo_service, '_api_response_to_record',
@@ -250,8 +249,10 @@ class TestIPInfoService:
             results = await ipinfo_service.get_batch_ip_info(ip_list, use_cache=False)
 
         # Verify
-        assert len(results) == 2
+        assert [r["ip_address"] for r in results] == ip_list
         mock_http_client.post.assert_called_once()
+        mock_repository.bulk_create_or_update.assert_awaited_once()
+        mock_repository.create_or_update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_batch_ip_info_exceeds_limit(self, ipinfo_service):
@@ -281,12 +282,7 @@ class TestIPInfoService:
         }
 
         # First IP is cached, second is not
-        async def mock_get_by_ip(ip: str):
-            if ip == "8.8.8.8":
-                return cached_record
-            return None
-
-        mock_repository.get_by_ip.side_effect = mock_get_by_ip
+        mock_repository.get_by_ips.return_value = {"8.8.8.8": cached_record}
 
         # Setup mock for API call (for uncached IP) - use MagicMock for sync methods
         mock_response = MagicMock()
@@ -305,7 +301,6 @@ class TestIPInfoService:
             "city": "Sydney",
             "country": "AU"
         }
-        mock_repository.create_or_update.return_value = new_record
 
         # Mock _api_response_to_record to avoid SQLAlchemy model creation
         with patch.object(
@@ -317,10 +312,11 @@ class TestIPInfoService:
                 use_cache=True
             )
 
-        # Verify cached result was used
-        assert len(results) >= 1
-        # Verify cache check was performed
-        assert mock_repository.get_by_ip.call_count >= 1
+        # Verify cached result was used and all IPs were checked in one query
+        assert [r["ip_address"] for r in results] == ["8.8.8.8", "1.1.1.1"]
+        mock_repository.get_by_ips.assert_awaited_once_with(["8.8.8.8", "1.1.1.1"])
+        mock_repository.get_by_ip.assert_not_called()
+        assert mock_http_client.post.call_args.kwargs["json"] == ["1.1.1.1"]
 
     @pytest.mark.asyncio
     async def test_get_geographic_distribution_empty(
@@ -601,6 +597,91 @@ class TestIPInfoServiceCaching:
         assert result is valid_record
 
 
+    @pytest.mark.asyncio
+    async def test_cache_uses_latest_timezone_aware_timestamp(
+        self, ipinfo_service, mock_repository
+    ):
+        """Test that refreshed records count from their last update."""
+        from datetime import timezone
+
+        refreshed_record = MagicMock(spec=IPInfoRecord)
+        refreshed_record.created_at = datetime.now(timezone.utc) - timedelta(days=30)
+        refreshed_record.updated_at = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        mock_repository.get_by_ip.return_value = refreshed_record
+
+        result = await ipinfo_service._get_cached_ip_info(SAMPLE_IP)
+        assert result is refreshed_record
+
+    @pytest.mark.asyncio
+    async def test_local_cache_avoids_database(
+        self, ipinfo_service, mock_repository
+    ):
+        """Test that repeated lookups are served from the in-process LRU."""
+        cached_record = MagicMock(spec=IPInfoRecord)
+        cached_record.created_at = datetime.utcnow()
+        cached_record.to_dict.return_value = {"id": 1, "ip_address": SAMPLE_IP}
+        mock_repository.get_by_ip.return_value = cached_record
+
+        first = await ipinfo_service.get_ip_info(SAMPLE_IP)
+        first["city"] = "modified by caller"
+        second = await ipinfo_service.get_batch_ip_info([SAMPLE_IP])
+
+        assert second == [{"id": 1, "ip_address": SAMPLE_IP}]
+        mock_repository.get_by_ip.assert_awaited_once()
+        mock_repository.get_by_ips.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_fallback_saves_with_one_upsert(
+        self, ipinfo_service, mock_repository
+    ):
+        """Test that individual-request fallback does not query per IP."""
+        def make_record(data: Dict[str, Any], domain_id=None) -> MagicMock:
+            record = MagicMock(spec=IPInfoRecord)
+            record.to_dict.return_value = {"ip_address": data["ip"], "domain_id": domain_id}
+            return record
+
+        async def make_request(endpoint, method="GET", params=None, data=None):
+            if endpoint == "batch":
+                raise IPInfoError("Forbidden", status_code=403)
+            ip = endpoint.split("/")[0]
+            return SAMPLE_BATCH_RESPONSE[ip]
+
+        with patch.object(ipinfo_service, "_make_request", side_effect=make_request), \
+                patch.object(ipinfo_service, "_api_response_to_record", side_effect=make_record):
+            results = await ipinfo_service.get_batch_ip_info(
+                ["1.1.1.1", "8.8.8.8", "1.1.1.1"], domain_id=7
+            )
+
+        assert results == [
+            {"ip_address": "1.1.1.1", "domain_id": 7},
+            {"ip_address": "8.8.8.8", "domain_id": 7},
+        ]
+        mock_repository.get_by_ips.assert_awaited_once()
+        mock_repository.bulk_create_or_update.assert_awaited_once()
+        mock_repository.get_by_ip.assert_not_called()
+        mock_repository.create_or_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_regional_presence_groups_regions_by_country(
+        self, ipinfo_service, mock_repository
+    ):
+        """Test that each country only lists its own regions."""
+        mock_repository.get_by_domain.return_value = [
+            MagicMock(country="US", region="California", city="San Jose"),
+            MagicMock(country="US", region="Texas", city="Austin"),
+            MagicMock(country="US", region="Texas", city="Dallas"),
+            MagicMock(country="GB", region="England", city="London"),
+        ]
+
+        result = await ipinfo_service.get_geographic_distribution(domain_id=1)
+
+        assert result["country_regions"] == {
+            "US": {"California": 1, "Texas": 2},
+            "GB": {"England": 1},
+        }
+
+
 class TestIPInfoServiceHeaders:
     """Tests for request header handling."""
 
@@ -0,0 +1,132 @@
+"""Unit tests for incremental competitor news ingestion."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.external_api.gnews_service import GNewsRateLimitError, GNewsService
+from src.services.external_api.news_ingestion import (
+    SIMHASH_MAX_DISTANCE,
+    NewsIngestionPipeline,
+    hamming_distance,
+    simhash,
+)
+
+STORY = (
+    "Acme Corp announces record quarterly revenue as cloud sales surge. "
+    "The company raised its full-year outlook on strong enterprise demand."
+)
+
+
+def article(url, title, description, published="2026-10-16T08:00:00Z"):
+    return {
+        "title": title,
+        "description": description,
+        "url": url,
+        "publishedAt": published,
+        "source": {"name": "Wire", "url": "https://wire.example"},
+    }
+
+
+@pytest.fixture
+def gnews():
+    """Create a GNews service with mocked requests and repositories."""
+    service = GNewsService(db=AsyncMock(), api_key="test-api-key", quota_counter=MagicMock())
+    service.gnews_repo = AsyncMock()
+    service.gnews_repo.get_latest_published_at.return_value = {}
+    service.gnews_repo.get_existing_article_ids.return_value = set()
+    service.gnews_repo.get_recent_simhashes.return_value = []
+    service.gnews_repo.bulk_insert_articles.side_effect = lambda rows: len(rows)
+    service._make_request = AsyncMock(return_value={"articles": []})
+    return service
+
+
+def competitor(competitor_id, name, domain):
+    return SimpleNamespace(id=competitor_id, name=name, domain=domain)
+
+
+class TestSimHash:
+    """Tests for SimHash fingerprints."""
+
+    def test_syndicated_copy_is_close(self):
+        copy = STORY.replace("surge", "surges")
+
+        other = "Acme Corp announces layoffs as cloud sales slow. The company cut its outlook on weak demand."
+
+        assert hamming_distance(simhash(STORY), simhash(copy)) <= SIMHASH_MAX_DISTANCE
+        assert hamming_distance(simhash(STORY), simhash(other)) > SIMHASH_MAX_DISTANCE
+
+    def test_fits_signed_bigint(self):
+        assert all(-(1 << 63) <= simhash(text) < (1 << 63) for text in (STORY, "a", ""))
+
+
+@pytest.mark.asyncio
+class TestNewsIngestionPipeline:
+    """Tests for batching, attribution and deduplication."""
+
+    async def test_competitors_share_or_queries_within_length_limit(self, gnews):
+        competitors = [competitor(i, f"Company {i}", f"company{i}.com") for i in range(10)]
+
+        stats = await NewsIngestionPipeline(gnews, max_query_length=100).ingest_competitors(competitors)
+
+        queries = [c.args[1]["q"] for c in gnews._make_request.await_args_list]
+        assert stats["requests"] == len(queries) < len(competitors)
+        assert all(len(q) <= 100 for q in queries)
+        assert sum(q.count('"Company') for q in queries) == 10
+
+    async def test_fetch_starts_at_oldest_high_water_mark_in_batch(self, gnews):
+        now = datetime.now(timezone.utc)
+        gnews.gnews_repo.get_latest_published_at.return_value = {
+            1: now - timedelta(hours=1), 2: now - timedelta(hours=5)
+        }
+
+        await NewsIngestionPipeline(gnews).ingest_competitors(
+            [competitor(1, "Acme Corp", "acme.com"), competitor(2, "Globex", "globex.com")]
+        )
+
+        params = gnews._make_request.await_args.args[1]
+        assert params["from"] == (now - timedelta(hours=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    async def test_articles_are_attributed_and_deduplicated(self, gnews):
+        gnews.gnews_repo.get_existing_article_ids.return_value = {
+            gnews._generate_article_id({"url": "https://a.example/stored"})
+        }
+        gnews._make_request.return_value = {"articles": [
+            article("https://a.example/1", "Acme Corp beats estimates", STORY),
+            article("https://b.example/1", "Acme Corp beats estimates", STORY.replace("surge", "surges")),
+            article("https://a.example/stored", "Old story", "Already stored"),
+            article("https://c.example/1", "Globex opens a new plant", "Globex expands in Ohio"),
+        ]}
+
+        stats = await NewsIngestionPipeline(gnews).ingest_competitors(
+            [competitor(1, "Acme Corp", "acme.com"), competitor(2, "Globex", "globex.com")]
+        )
+
+        rows = gnews.gnews_repo.bulk_insert_articles.await_args.args[0]
+        assert [(row["url"], row["competitor_id"]) for row in rows] == [
+            ("https://a.example/1", 1), ("https://c.example/1", 2)
+        ]
+        assert stats["duplicates"] == 1
+        assert stats["near_duplicates"] == 1
+        assert stats["inserted_by_competitor"] == {1: 1, 2: 1}
+
+    async def test_stored_near_duplicate_is_skipped(self, gnews):
+        gnews.gnews_repo.get_recent_simhashes.return_value = [simhash(f"Acme Corp beats estimates {STORY}")]
+        gnews._make_request.return_value = {"articles": [
+            article("https://b.example/1", "Acme Corp beats estimates", STORY),
+        ]}
+
+        stats = await NewsIngestionPipeline(gnews).ingest_competitors([competitor(1, "Acme Corp", "acme.com")])
+
+        assert stats["articles_inserted"] == 0
+        assert stats["near_duplicates"] == 1
+
+    async def test_rate_limit_stops_remaining_batches(self, gnews):
+        gnews._make_request.side_effect = GNewsRateLimitError()
+        competitors = [competitor(i, f"Company {i}", f"company{i}.com") for i in range(10)]
+
+        stats = await NewsIngestionPipeline(gnews, max_query_length=50).ingest_competitors(competitors)
+
+        assert gnews._make_request.await_count == 1
+        assert stats["errors"] == ["GNews API rate limit exceeded"]
@@ -10,7 +10,10 @@ These tests verify the functionality of the WhoAPIService class, including:
 - Expiring domains retrieval
 - Error handling and retry logic
 - Caching behavior
+- Concurrent domain profiles
 """
+import asyncio
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -27,6 +30,8 @@ from src.services.external_api.whoapi_service import (
     TechStackInfo,
     DomainAge,
     DomainAvailability,
+    DomainProfile,
+    FACET_CACHE_TTLS,
 )
 
 
@@ -539,3 +544,120 @@ class TestRateLimitStatus:
             status = await service.get_rate_limit_status()
 
             assert status["status"] == "not_configured"
+
+
+FACET_RESPONSES = {
+    "whois": SAMPLE_WHOIS_RESPONSE,
+    "sslcert": SAMPLE_SSL_RESPONSE,
+    "dns": SAMPLE_DNS_RESPONSE,
+    "tech": SAMPLE_TECH_RESPONSE,
+}
+
+
+class TestDomainProfile:
+    """Tests for concurrent domain profiles."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start every profile test with an empty cache."""
+        with patch("src.services.external_api.whoapi_service.cache") as mock_cache:
+            mock_cache.get.return_value = None
+            yield mock_cache
+
+    @pytest.mark.asyncio
+    async def test_profile_shares_one_whois_response(self, whoapi_service):
+        """Test each facet is requested once and WHOIS feeds the derivations."""
+        whoapi_service._make_request = AsyncMock(
+            side_effect=lambda request_type, domain: FACET_RESPONSES[request_type]
+        )
+
+        profile = await whoapi_service.get_domain_profile("https://www.Example.com/about")
+
+        assert isinstance(profile, DomainProfile)
+        assert sorted(c.args[0] for c in whoapi_service._make_request.await_args_list) == [
+            "dns", "sslcert", "tech", "whois"
+        ]
+        assert profile.domain == "example.com"
+        assert profile.age.registration_date == datetime(2020, 1, 15)
+        assert profile.availability.available is False
+        assert profile.days_until_expiration < 0
+        assert profile.tech_stack.cms == "WordPress"
+        assert profile.errors == {}
+
+    @pytest.mark.asyncio
+    async def test_profile_uses_repository_facet_cache(self):
+        """Test cached facets are reused and fetched ones saved with their TTLs."""
+        mock_repo = AsyncMock()
+        mock_repo.get_cached_facets.return_value = {
+            "example.com": {"dns": {"domain": "example.com", "a_records": ["1.2.3.4"]}}
+        }
+        service = WhoAPIService(api_key="test-api-key")
+        service._repository = mock_repo
+        service._make_request = AsyncMock(return_value=SAMPLE_SSL_RESPONSE)
+
+        profile = await service.get_domain_profile("example.com", facets=["ssl", "dns"])
+
+        assert profile.dns.a_records == ["1.2.3.4"]
+        assert profile.ssl.issuer == "Let's Encrypt Authority X3"
+        service._make_request.assert_awaited_once_with("sslcert", "example.com")
+        saved, ttls = mock_repo.save_facets.await_args.args
+        assert list(saved["example.com"]) == ["ssl"]
+        assert saved["example.com"]["ssl"]["expiry_date"] == "2024-04-01T00:00:00"
+        assert ttls == FACET_CACHE_TTLS
+        assert ttls["ssl"] > ttls["dns"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_profiles_respect_concurrency_limit(self):
+        """Test bulk profiling never exceeds the concurrency limit."""
+        service = WhoAPIService(api_key="test-api-key", max_concurrency=2)
+        active = peak = 0
+
+        async def make_request(request_type, domain):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return FACET_RESPONSES[request_type]
+
+        service._make_request = make_request
+
+        profiles = await service.get_domain_profiles(["a.com", "b.com", "www.a.com", "c.com"])
+
+        assert list(profiles) == ["a.com", "b.com", "c.com"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_and_retries(self, whoapi_service):
+        """Test a 429 pauses fetching and the facet is retried."""
+        whoapi_service._make_request = AsyncMock(side_effect=[
+            RateLimitError("Rate limit exceeded", status_code=429, details={"retry_after": 0.01}),
+            SAMPLE_DNS_RESPONSE,
+        ])
+
+        profile = await whoapi_service.get_domain_profile(SAMPLE_DOMAIN, facets=["dns"])
+
+        assert profile.dns.a_records == ["93.184.216.34"]
+        assert whoapi_service._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_facet_is_reported(self, whoapi_service):
+        """Test a failing facet does not fail the whole profile."""
+        async def make_request(request_type, domain):
+            if request_type == "tech":
+                raise WhoAPIError("WhoAPI error: unsupported")
+            return FACET_RESPONSES[request_type]
+
+        whoapi_service._make_request = make_request
+
+        profile = await whoapi_service.get_domain_profile(SAMPLE_DOMAIN)
+
+        assert profile.tech_stack is None
+        assert profile.errors == {"tech": "WhoAPI error: unsupported"}
+        assert profile.whois.registrar == "Example Registrar, Inc."
+
+    @pytest.mark.asyncio
+    async def test_unknown_facet_rejected(self, whoapi_service):
+        """Test unknown facet names raise a ValueError."""
+        with pytest.raises(ValueError):
+            await whoapi_service.get_domain_profile(SAMPLE_DOMAIN, facets=["mx"])
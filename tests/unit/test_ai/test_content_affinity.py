@@ -5,6 +5,7 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.services.ai.content_affinity import ContentAffinityService
+from src.services.ai.embedding_service import EmbeddingService
 from src.models.content import Content
 from src.models.ai import AIInsight, InsightType
 from src.services.ai.llm_service import LLMService
@@ -20,12 +21,11 @@ def mock_db():
 @pytest.fixture
 def content_service():
     """Fixture for content affinity service"""
-    with patch('src.services.ai.content_affinity.SentenceTransformer'):
-        service = ContentAffinityService()
-        service.model.encode = MagicMock(side_effect=lambda x: 
-                                        [np.random.rand(384) for _ in range(len(x))] if isinstance(x, list) 
-                                        else np.random.rand(384))
-        return service
+    service = ContentAffinityService()
+    model = MagicMock()
+    model.encode = MagicMock(side_effect=lambda x, **kwargs: np.random.rand(len(x), 384))
+    service.embeddings = EmbeddingService('test-model', model=model)
+    return service
     
 @pytest.fixture
 def mock_content():
@@ -111,7 +111,7 @@ async def test_embedding_failure_llm_fallback(content_service, mock_db, mock_con
         mock_db.execute.return_value.scalar_one_or_none.return_value = mock_content
         
         # Make the embedding model fail
-        content_service.model.encode.side_effect = Exception("Embedding model failed")
+        content_service.embeddings.model.encode.side_effect = Exception("Embedding model failed")
         
         # Mock the LLM service for fallback
         with patch.object(LLMService, 'generate_response', new_callable=AsyncMock) as mock_llm:
@@ -137,7 +137,7 @@ async def test_total_failure_random_fallback(content_service, mock_db, mock_cont
         mock_db.execute.return_value.scalar_one_or_none.return_value = mock_content
         
         # Make the embedding model fail
-        content_service.model.encode.side_effect = Exception("Embedding model failed")
+        content_service.embeddings.model.encode.side_effect = Exception("Embedding model failed")
         
         # Make the LLM service fail
         with patch.object(LLMService, 'generate_response', new_callable=AsyncMock) as mock_llm:
@@ -0,0 +1,74 @@
+"""Tests for the shared embedding service."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.services.ai.embedding_service import DiskVectorStore, EmbeddingService
+
+
+def make_model():
+    """Create a fake model that embeds a text as its length repeated."""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[len(text), len(text) + 1.0] for text in texts]
+    )
+    return model
+
+
+@pytest.mark.unit
+class TestEmbeddingService:
+    """Test batching and caching of embeddings."""
+
+    def test_encode_preserves_input_order(self):
+        service = EmbeddingService('test-model', model=make_model())
+
+        vectors = service.encode(["a", "abc", "ab"])
+
+        assert vectors.shape == (3, 2)
+        assert vectors[:, 0].tolist() == [1, 3, 2]
+
+    def test_duplicates_are_encoded_once(self):
+        model = make_model()
+        service = EmbeddingService('test-model', model=model)
+
+        vectors = service.encode(["same", "other", "same"])
+
+        assert model.encode.call_count == 1
+        assert model.encode.call_args[0][0] == ["same", "other"]
+        assert np.array_equal(vectors[0], vectors[2])
+
+    def test_cached_texts_are_not_reencoded(self):
+        model = make_model()
+        service = EmbeddingService('test-model', model=model)
+
+        service.encode(["first", "second"])
+        service.encode(["second", "third"])
+
+        assert model.encode.call_args[0][0] == ["third"]
+        assert service.stats() == {"requested": 4, "cache_hits": 1, "encoded": 3}
+
+    def test_persistent_store_is_shared_across_instances(self, tmp_path):
+        store = DiskVectorStore(str(tmp_path))
+        EmbeddingService('test-model', store=store, model=make_model()).encode(["persisted"])
+
+        model = make_model()
+        vectors = EmbeddingService('test-model', store=store, model=model).encode(["persisted"])
+
+        model.encode.assert_not_called()
+        assert vectors[0].tolist() == [9, 10]
+
+    def test_cache_keys_include_model_name(self):
+        first = EmbeddingService('model-a', model=make_model())
+        second = EmbeddingService('model-b', model=make_model())
+
+        assert first._key("text") != second._key("text")
+
+    @pytest.mark.asyncio
+    async def test_aencode(self):
+        service = EmbeddingService('test-model', model=make_model())
+
+        vectors = await service.aencode(["x", "yy"])
+
+        assert vectors[:, 0].tolist() == [1, 2]
@@ -0,0 +1,131 @@
+"""Tests for the shared HTTP session pool."""
+
+import asyncio
+
+import pytest
+
+from src.core.http_pool import HTTPPoolConfig, HTTPSessionPool, get_http_pool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHTTPSessionPool:
+    """Test session reuse and lifecycle of HTTPSessionPool."""
+
+    async def test_reuses_session_within_loop(self):
+        pool = HTTPSessionPool()
+        try:
+            first = pool.get_session()
+            assert pool.get_session() is first
+            assert pool.get_session("isolated") is not first
+        finally:
+            await pool.close()
+
+    async def test_applies_connection_limits(self):
+        pool = HTTPSessionPool(HTTPPoolConfig(max_connections=20, max_connections_per_host=4))
+        try:
+            connector = pool.get_session().connector
+            assert connector.limit == 20
+            assert connector.limit_per_host == 4
+        finally:
+            await pool.close()
+
+    async def test_reuses_httpx_client_within_loop(self):
+        pool = HTTPSessionPool()
+        try:
+            assert pool.get_client() is pool.get_client()
+        finally:
+            await pool.close()
+
+    async def test_close_closes_sessions(self):
+        pool = HTTPSessionPool()
+        session = pool.get_session()
+        client = pool.get_client()
+
+        await pool.close()
+
+        assert session.closed
+        assert client.is_closed
+        assert pool.get_session() is not session
+        await pool.close()
+
+    async def test_recreates_closed_session(self):
+        pool = HTTPSessionPool()
+        session = pool.get_session()
+        await session.close()
+
+        try:
+            assert pool.get_session() is not session
+        finally:
+            await pool.close()
+
+
+@pytest.mark.unit
+def test_sessions_are_bound_to_their_event_loop():
+    pool = HTTPSessionPool()
+
+    async def borrow():
+        session = pool.get_session()
+        await pool.close()
+        return session
+
+    first = asyncio.run(borrow())
+    second = asyncio.run(borrow())
+
+    assert first is not second
+
+
+@pytest.mark.unit
+def test_reset_closes_sessions_of_idle_loop():
+    pool = HTTPSessionPool()
+    loop = asyncio.new_event_loop()
+
+    async def borrow():
+        return pool.get_session(), pool.get_client()
+
+    try:
+        session, client = loop.run_until_complete(borrow())
+        pool.reset()
+
+        assert session.closed
+        assert client.is_closed
+    finally:
+        loop.close()
+
+
+@pytest.mark.unit
+def test_reset_after_fork_only_forgets_inherited_sessions():
+    pool = HTTPSessionPool()
+    loop = asyncio.new_event_loop()
+
+    async def borrow():
+        return pool.get_session()
+
+    try:
+        session = loop.run_until_complete(borrow())
+        pool._pid = -1  # as if the pool was inherited from a parent process
+        pool.reset()
+
+        assert not session.closed
+        assert loop.run_until_complete(borrow()) is not session
+        loop.run_until_complete(session.close())
+        loop.run_until_complete(pool.close())
+    finally:
+        loop.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reset_closes_sessions_of_running_loop():
+    pool = HTTPSessionPool()
+    session = pool.get_session()
+
+    pool.reset()
+    await asyncio.gather(*pool._closing)
+
+    assert session.closed
+
+
+@pytest.mark.unit
+def test_get_http_pool_returns_singleton():
+    assert get_http_pool() is get_http_pool()
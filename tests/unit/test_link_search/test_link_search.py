@@ -1,8 +1,13 @@
 """Tests for the LinkSearchService."""
+import asyncio
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timezone
 
+from sqlalchemy.exc import IntegrityError
+
+from src.services.google_custom_search import GoogleCustomSearchError, RateLimiter
 from src.services.link_search.link_search import LinkSearchService
 
 @pytest.fixture
@@ -11,23 +16,47 @@ def mock_db():
     db = AsyncMock()
     db.execute = AsyncMock()
     db.commit = AsyncMock()
+    db.add = MagicMock()
     return db
 
 @pytest.fixture
 def link_search_service(mock_db):
     """Create a LinkSearchService with a mock database session."""
-    return LinkSearchService(mock_db)
+    service = LinkSearchService(mock_db)
+    service._get_stored_normalized_urls = AsyncMock(return_value=set())
+    return service
+
+
+@pytest.fixture(autouse=True)
+def plain_links():
+    """Build links as plain objects so tests do not need mapped models."""
+    with patch('src.services.link_search.link_search.Link', side_effect=lambda **kw: SimpleNamespace(**kw)):
+        yield
+
+
+def make_domain(domain_id, name):
+    """Create a mock domain."""
+    domain = MagicMock()
+    domain.id = domain_id
+    domain.name = name
+    return domain
+
+
+def make_result(url, score=9):
+    """Create a search result."""
+    return {"title": f"Title of {url}", "link": url, "snippet": "Snippet", "search_score": score}
 
 class TestLinkSearchService:
     """Tests for the LinkSearchService."""
 
+    @pytest.mark.asyncio
     @patch('src.services.link_search.link_search.select')
     async def test_search_links_for_domain(self, mock_select, link_search_service, mock_db):
         """Test searching for links associated with a domain."""
         # Mock domain
         mock_domain = MagicMock()
         mock_domain.id = 1
-        mock_domain.domain_name = "example.com"
+        mock_domain.name = "example.com"
         
         # Mock _get_domain method
         link_search_service._get_domain = AsyncMock(return_value=mock_domain)
@@ -70,17 +99,18 @@ class TestLinkSearchService:
             assert link.url == f"https://example.com/page{i+1}"
             assert link.domain_id == 1
             assert link.title == f"Example Page {i+1}"
-            assert link.meta["snippet"] == f"This is an example page {i+1}."
-            assert link.meta["search_score"] == 9 - i
-            assert link.meta["source"] == "domain_search"
+            assert link.meta_data["snippet"] == f"This is an example page {i+1}."
+            assert link.meta_data["search_score"] == 9 - i
+            assert link.meta_data["source"] == "domain_search"
 
+    @pytest.mark.asyncio
     @patch('src.services.link_search.link_search.select')
     async def test_search_links_for_domain_with_keywords(self, mock_select, link_search_service, mock_db):
         """Test searching for links within a domain using specific keywords."""
         # Mock domain
         mock_domain = MagicMock()
         mock_domain.id = 1
-        mock_domain.domain_name = "example.com"
+        mock_domain.name = "example.com"
         
         # Mock _get_domain method
         link_search_service._get_domain = AsyncMock(return_value=mock_domain)
@@ -120,60 +150,101 @@ class TestLinkSearchService:
         assert mock_db.commit.await_count == 1
         
         # Check link properties
-        assert links[0].meta["source"] == "keyword_search"
-        assert links[0].meta["keywords"] == keywords
+        assert links[0].meta_data["source"] == "keyword_search"
+        assert links[0].meta_data["keywords"] == keywords
 
-    @patch('src.services.link_search.link_search.select')
-    async def test_search_links_for_company(self, mock_select, link_search_service, mock_db):
+    @pytest.mark.asyncio
+    async def test_search_links_for_company(self, link_search_service, mock_db):
         """Test searching for links across all domains of a company."""
-        # Mock company
-        mock_company = MagicMock()
-        mock_company.id = 1
-        mock_company.name = "Example Company"
-        
-        # Mock domains
-        mock_domain1 = MagicMock()
-        mock_domain1.id = 1
-        mock_domain1.domain_name = "example.com"
-        
-        mock_domain2 = MagicMock()
-        mock_domain2.id = 2
-        mock_domain2.domain_name = "example.org"
-        
-        # Mock _get_company method
-        link_search_service._get_company = AsyncMock(return_value=mock_company)
-        
-        # Mock _get_domains_for_company method
-        link_search_service._get_domains_for_company = AsyncMock(return_value=[mock_domain1, mock_domain2])
-        
-        # Mock search_links_for_domain method
-        mock_link1 = MagicMock()
-        mock_link1.id = 1
-        mock_link1.url = "https://example.com/page1"
-        
-        mock_link2 = MagicMock()
-        mock_link2.id = 2
-        mock_link2.url = "https://example.org/page1"
-        
-        link_search_service.search_links_for_domain = AsyncMock(side_effect=[
-            ([mock_link1], []),
-            ([mock_link2], [])
+        link_search_service._get_company = AsyncMock(return_value=MagicMock(id=1))
+        link_search_service._get_domains_for_company = AsyncMock(return_value=[
+            make_domain(1, "example.com"), make_domain(2, "example.org")
         ])
-        
-        # Call the method
-        links, errors = await link_search_service.search_links_for_company(1, max_results=2)
-        
-        # Check results
-        assert len(links) == 2
-        assert len(errors) == 0
-        
-        # Verify that search_links_for_domain was called for each domain
-        assert link_search_service.search_links_for_domain.await_count == 2
-        
-        # Check that the links from both domains are included
-        assert links[0].id == 1
-        assert links[1].id == 2
+        link_search_service._search_for_domain = AsyncMock(side_effect=[
+            [make_result("https://example.com/page1"), make_result("https://www.example.com/page1/?utm_source=x")],
+            [make_result("https://example.org/page1"), make_result("https://example.org/stored")],
+        ])
+        link_search_service._get_stored_normalized_urls.return_value = {"https://example.org/stored"}
+
+        links, errors = await link_search_service.search_links_for_company(1, max_results=4)
+
+        assert [(link.url, link.domain_id) for link in links] == [
+            ("https://example.com/page1", 1), ("https://example.org/page1", 2)
+        ]
+        assert errors == []
+        link_search_service._get_stored_normalized_urls.assert_awaited_once_with([
+            "https://example.com/page1", "https://example.org/page1", "https://example.org/stored"
+        ])
+        assert mock_db.add.call_count == 2
+        assert mock_db.commit.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_company_domains_are_searched_concurrently_within_quota(self, mock_db):
+        """Test Google searches overlap and stop at the remaining quota."""
+        search_service = MagicMock()
+        search_service.rate_limiter = RateLimiter(calls_per_day=5)
+        active = peak = 0
+
+        async def search(query, site, num_results, start_index):
+            nonlocal active, peak
+            assert search_service.rate_limiter.check_and_wait()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"results": [{"title": "Page", "link": f"https://{site}/{start_index + i}"} for i in range(num_results)]}
+
+        search_service.search = search
+        service = LinkSearchService(mock_db, search_service=search_service, max_concurrency=2)
+        service._get_stored_normalized_urls = AsyncMock(return_value=set())
+        service._get_company = AsyncMock(return_value=MagicMock(id=1))
+        service._get_domains_for_company = AsyncMock(return_value=[
+            make_domain(i, f"site{i}.com") for i in range(4)
+        ])
+
+        links, errors = await service.search_links_for_company(1, max_results=60)
+
+        assert peak == 2
+        assert len(links) == 30
+        assert {link.domain_id for link in links} == {0, 1}
+        assert [error["domain_id"] for error in errors] == [2, 3]
+        assert "quota" in errors[0]["error"]
+        assert links[0].meta_data["search_score"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_domain_search_keeps_other_domains(self, link_search_service):
+        """Test a failing domain is reported without losing the rest."""
+        link_search_service._get_company = AsyncMock(return_value=MagicMock(id=1))
+        link_search_service._get_domains_for_company = AsyncMock(return_value=[
+            make_domain(1, "example.com"), make_domain(2, "example.org")
+        ])
+        link_search_service._search_for_domain = AsyncMock(side_effect=[
+            GoogleCustomSearchError("Daily API quota exceeded"),
+            [make_result("https://example.org/page1")],
+        ])
+
+        links, errors = await link_search_service.search_links_for_company(1)
+
+        assert [link.url for link in links] == ["https://example.org/page1"]
+        assert errors == [{"error": "Search failed: Daily API quota exceeded", "domain_id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_insert_is_retried_without_stored_links(self, link_search_service, mock_db):
+        """Test a unique URL race re-checks stored links and commits once more."""
+        link_search_service._get_domain = AsyncMock(return_value=make_domain(1, "example.com"))
+        link_search_service._search_for_domain = AsyncMock(return_value=[
+            make_result("https://example.com/a"), make_result("https://example.com/b")
+        ])
+        link_search_service._get_stored_normalized_urls.side_effect = [set(), {"https://example.com/a"}]
+        mock_db.commit.side_effect = [IntegrityError("INSERT", {}, Exception("duplicate key")), None]
+
+        links, errors = await link_search_service.search_links_for_domain(1)
+
+        assert [link.url for link in links] == ["https://example.com/b"]
+        assert mock_db.rollback.await_count == 1
+        assert mock_db.commit.await_count == 2
 
+    @pytest.mark.asyncio
     @patch('src.services.link_search.link_search.select')
     async def test_search_links_by_keywords(self, mock_select, link_search_service, mock_db):
         """Test searching for links within a domain using specific keywords."""
@@ -198,6 +269,7 @@ class TestLinkSearchService:
             keywords=["test", "example"]
         )
 
+    @pytest.mark.asyncio
     async def test_search_links_by_keywords_empty(self, link_search_service):
         """Test searching with empty keywords."""
         # Call the method with empty keywords
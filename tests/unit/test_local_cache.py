@@ -0,0 +1,192 @@
+"""Tests for the bounded in-process cache tier."""
+
+import time
+
+import pytest
+
+from src.core.local_cache import LocalCache, LocalCacheConfig
+from src.services.cache_service import AsyncCacheService
+
+
+def make_cache(**config) -> LocalCache:
+    return LocalCache("test", LocalCacheConfig(**config))
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Test size bounds, TTLs and LRU eviction."""
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = make_cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_by_byte_size(self):
+        cache = make_cache(max_bytes=100)
+        cache.set("a", b"x" * 60)
+        cache.set("b", b"x" * 60)
+
+        assert "a" not in cache
+        assert cache.stats()["bytes"] == 60
+
+    def test_oversized_value_is_not_cached(self):
+        cache = make_cache(max_bytes=10)
+        cache.set("a", b"x" * 11)
+
+        assert len(cache) == 0
+
+    def test_expired_entries_are_evicted_before_live_ones(self):
+        cache = make_cache(max_entries=2)
+        cache.set("live", 1)
+        cache.set("short", 2, ttl=0.01)
+        time.sleep(0.02)
+        cache.set("new", 3)
+
+        assert cache.get("live") == 1
+        assert cache.get("new") == 3
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["evictions"] == 0
+
+    def test_expired_entry_is_a_miss(self):
+        cache = make_cache()
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a", "default") == "default"
+        assert len(cache) == 0
+
+    def test_delete_pattern_uses_glob_matching(self):
+        cache = make_cache()
+        cache.set("ns:serp:a", 1)
+        cache.set("ns:serp:b", 2)
+        cache.set("ns:other:a", 3)
+
+        assert cache.delete_pattern("ns:serp:*") == 2
+        assert cache.get("ns:other:a") == 3
+
+    def test_near_ttl_is_capped(self):
+        cache = make_cache(near_cache_ttl=30)
+
+        assert cache.near_ttl(None) == 30
+        assert cache.near_ttl(10) == 10
+        assert cache.near_ttl(3600) == 30
+
+
+@pytest.mark.unit
+class TestInvalidation:
+    """Test invalidation messages between processes."""
+
+    def test_applies_messages_from_other_nodes(self):
+        sender = make_cache()
+        receiver = make_cache()
+        receiver.set("a", 1)
+        receiver.set("p:1", 2)
+
+        assert receiver.apply_invalidation(sender.invalidation_message(keys=["a"], patterns=["p:*"]))
+        assert len(receiver) == 0
+
+    def test_ignores_own_and_other_cache_messages(self):
+        cache = make_cache()
+        cache.set("a", 1)
+        other = LocalCache("other")
+
+        assert not cache.apply_invalidation(cache.invalidation_message(keys=["a"]))
+        assert not cache.apply_invalidation(other.invalidation_message(keys=["a"]))
+        assert cache.get("a") == 1
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in that counts GET round trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+        self.published = []
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def setex(self, key, ttl, value):
+                self.ops.append(lambda: redis.data.__setitem__(key, value))
+
+            def set(self, key, value):
+                self.setex(key, None, value)
+
+            def delete(self, key):
+                self.ops.append(lambda: int(redis.data.pop(key, None) is not None))
+
+            def publish(self, channel, message):
+                self.ops.append(lambda: redis.published.append(message))
+
+            async def execute(self):
+                return [op() for op in self.ops]
+
+        return Pipeline()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNearCache:
+    """Test AsyncCacheService serving hot keys from the local tier."""
+
+    async def test_hot_key_is_served_locally(self):
+        service = AsyncCacheService()
+        service.redis = FakeRedis()
+
+        await service.set("serp", {"results": [1]}, ttl=600)
+        assert await service.get("serp") == {"results": [1]}
+        assert service.redis.gets == 0
+
+        service._local.clear()
+        assert await service.get("serp") == {"results": [1]}
+        assert await service.get("serp") == {"results": [1]}
+        assert service.redis.gets == 1
+
+    async def test_callers_get_their_own_copy(self):
+        service = AsyncCacheService()
+        service.redis = FakeRedis()
+
+        await service.set("serp", {"results": [1]}, ttl=600)
+        (await service.get("serp"))["results"].append(2)
+
+        assert await service.get("serp") == {"results": [1]}
+        assert service.redis.gets == 0
+
+    async def test_writes_publish_invalidations(self):
+        service = AsyncCacheService()
+        service.redis = FakeRedis()
+
+        await service.set("a", 1)
+        await service.delete("a")
+
+        assert len(service.redis.published) == 2
+        assert await service.get("a") is None
+
+    async def test_memory_fallback_is_bounded(self):
+        service = AsyncCacheService(local_cache_config=LocalCacheConfig(max_entries=10))
+
+        for i in range(50):
+            await service.set(f"key{i}", i)
+
+        assert service.get_statistics()["local_cache"]["entries"] == 10
+        assert await service.get("key49") == 49
@@ -34,6 +34,9 @@ class MockResult:
             raise self._result
         return self._result
 
+    def scalar_one_or_none(self):
+        return self.all()[0] if self.all() else None
+
 class MockEngagement:
     def __init__(self, **kwargs):
         self.id = kwargs.get('id', 1)